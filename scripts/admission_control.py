@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Token-bucket admission control for agent launches, shared across processes.
+
+Corner case 4.6: launching a fixed number of sessions either over-launches
+(and burns time on 429 retries) or under-launches (and wastes capacity).
+Instead, every scrum-master asks the controller before starting a Claude
+session for a given model (`VALID_MODELS`):
+
+- each model has a token bucket refilled at `rate` launches per second,
+  holding at most `burst` tokens
+- `report_rate_limited` halves the model's effective rate (down to
+  `min_rate`), empties the bucket and pauses the model for the server's
+  retry-after or an exponential backoff; `report_success` grows the rate
+  back towards its limit (additive increase, multiplicative decrease)
+- 429s reported within `decrease_interval` of the last decrease are the
+  same congestion event (e.g. one over-admitted burst) and only empty the
+  bucket, so a burst of failures does not collapse the rate
+
+Bucket state lives in a SQLite file, so every process opening the same
+path shares one budget per model.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from bead_schema import VALID_MODELS
+
+FORMAT_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS admission_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    model TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    rate REAL NOT NULL,
+    backoff_until REAL NOT NULL,
+    failures INTEGER NOT NULL,
+    decreased_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class ModelLimit:
+    """Launch budget for one model."""
+
+    rate: float
+    burst: float
+    min_rate: Optional[float] = None
+    increase: Optional[float] = None
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+
+    @property
+    def floor(self) -> float:
+        """Lowest effective rate after repeated rate limiting."""
+        return self.min_rate if self.min_rate is not None else self.rate / 16
+
+    @property
+    def step(self) -> float:
+        """Rate regained per successful launch."""
+        return self.increase if self.increase is not None else self.rate / 20
+
+
+# Placeholders; set from the account's actual API tier
+DEFAULT_LIMITS: Dict[str, ModelLimit] = {
+    "opus": ModelLimit(rate=0.5, burst=2),
+    "sonnet": ModelLimit(rate=1.0, burst=4),
+    "haiku": ModelLimit(rate=2.0, burst=8),
+}
+
+
+class TokenBucket:
+    """In-memory token bucket (the arithmetic shared with the SQLite store)."""
+
+    def __init__(
+        self, rate: float, burst: float, tokens: Optional[float] = None, now: float = 0.0
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst if tokens is None else tokens
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        """Add tokens earned since the last update."""
+        if now > self.updated_at:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def take(self, now: float, cost: float = 1.0) -> float:
+        """
+        Take `cost` tokens if available.
+
+        Returns:
+            0.0 if taken, otherwise seconds until enough tokens accrue
+        """
+        self.refill(now)
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+
+class _SharedBucket(TokenBucket):
+    """A model's bucket as stored in the shared file."""
+
+    def __init__(self, rate, burst, tokens, now, backoff_until, failures, decreased_at):
+        super().__init__(rate, burst, tokens, now)
+        self.backoff_until = backoff_until
+        self.failures = failures
+        self.decreased_at = decreased_at
+
+
+class AdmissionController:
+    """Per-model launch admission backed by a shared SQLite file."""
+
+    def __init__(
+        self,
+        path: str,
+        limits: Optional[Dict[str, ModelLimit]] = None,
+        clock: Callable[[], float] = time.time,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        decrease_interval: float = 1.0,
+    ):
+        """
+        Open (or create) shared admission state.
+
+        Args:
+            path: SQLite file shared by all scrum-masters
+            limits: Budget per model (default: DEFAULT_LIMITS)
+            clock: Wall-clock source (shared across processes)
+            base_backoff: First backoff after a rate limit without retry-after
+            max_backoff: Backoff ceiling in seconds
+            decrease_interval: Seconds after a rate decrease during which
+                further 429s do not decrease it again
+        """
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        for model in self.limits:
+            if model not in VALID_MODELS:
+                raise ValueError(f"model must be one of {VALID_MODELS}, got: {model}")
+        self.path = os.path.abspath(path)
+        self.clock = clock
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.decrease_interval = decrease_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM admission_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO admission_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported admission store format {row[0]}, expected {FORMAT_VERSION}"
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "AdmissionController":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _limit(self, model: str) -> ModelLimit:
+        limit = self.limits.get(model)
+        if limit is None:
+            raise ValueError(f"no admission limit configured for model: {model}")
+        return limit
+
+    def _update(self, model: str, change: Callable[[_SharedBucket, float], float]) -> float:
+        """Run `change` on the model's bucket inside one write transaction."""
+        limit = self._limit(model)
+        now = self.clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at, rate, backoff_until, failures, decreased_at"
+                    " FROM buckets WHERE model = ?",
+                    (model,),
+                ).fetchone()
+                if row is None:
+                    row = (limit.burst, now, limit.rate, 0.0, 0, float("-inf"))
+                tokens, updated_at, rate, *state = row
+                bucket = _SharedBucket(
+                    min(rate, limit.rate), limit.burst, tokens, updated_at, *state
+                )
+                result = change(bucket, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets"
+                    " (model, tokens, updated_at, rate, backoff_until, failures,"
+                    " decreased_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        model,
+                        bucket.tokens,
+                        bucket.updated_at,
+                        bucket.rate,
+                        bucket.backoff_until,
+                        bucket.failures,
+                        bucket.decreased_at,
+                    ),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return result
+
+    def try_acquire(self, model: str, cost: float = 1.0) -> float:
+        """
+        Take a launch slot for a model without waiting.
+
+        Returns:
+            0.0 if admitted, otherwise seconds to wait before trying again
+
+        Raises:
+            ValueError: If `cost` exceeds the model's burst (it could never
+                be admitted)
+        """
+        burst = self._limit(model).burst
+        if cost > burst:
+            raise ValueError(f"cost {cost} exceeds burst {burst} for model: {model}")
+
+        def take(bucket: _SharedBucket, now: float) -> float:
+            if now < bucket.backoff_until:
+                return bucket.backoff_until - now
+            return bucket.take(now, cost)
+
+        return self._update(model, take)
+
+    def acquire(self, model: str, timeout: Optional[float] = None, cost: float = 1.0) -> bool:
+        """
+        Wait until a launch for `model` is admitted.
+
+        Returns:
+            True if admitted, False if `timeout` seconds passed first
+
+        Raises:
+            ValueError: If `cost` exceeds the model's burst
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(model, cost)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def report_success(self, model: str) -> None:
+        """Record a launch that was not rate limited (additive increase)."""
+        limit = self._limit(model)
+
+        def grow(bucket: _SharedBucket, now: float) -> float:
+            bucket.refill(now)
+            bucket.rate = min(limit.rate, bucket.rate + limit.step)
+            bucket.failures = 0
+            return bucket.rate
+
+        self._update(model, grow)
+
+    def report_rate_limited(self, model: str, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429 (multiplicative decrease plus a pause for the model).
+
+        Args:
+            model: Model that was rate limited
+            retry_after: Server-provided retry-after in seconds, if any
+
+        Returns:
+            Seconds until the model is admitted again
+        """
+        limit = self._limit(model)
+
+        def shrink(bucket: _SharedBucket, now: float) -> float:
+            bucket.refill(now)
+            bucket.tokens = 0.0
+            pause = retry_after
+            if now - bucket.decreased_at >= self.decrease_interval:
+                bucket.rate = max(limit.floor, bucket.rate / 2)
+                bucket.decreased_at = now
+                if pause is None:
+                    pause = min(self.max_backoff, self.base_backoff * 2**bucket.failures)
+                bucket.failures += 1
+            bucket.backoff_until = max(bucket.backoff_until, now + (pause or 0.0))
+            return max(0.0, bucket.backoff_until - now)
+
+        return self._update(model, shrink)
+
+    def rate(self, model: str) -> float:
+        """Current effective launch rate for a model."""
+        return self._update(model, lambda bucket, now: bucket.rate)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Asyncio pipeline validating live beads fetched with `bd show <id> --json`.
+
+Fetches run concurrently as subprocesses (bounded by a fixed-size worker
+pool) while validation runs in an executor, so process launch and database
+latency overlap with CPU work. Results are yielded as they
+complete, not in input order.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+
+from pydantic import ValidationError
+
+from bd_client import BdCommandError
+from validation_engine import DEFAULT_ENGINE, get_validator
+
+
+@dataclass
+class BeadValidationResult:
+    """Outcome of fetching and validating one bead."""
+
+    bead_id: str
+    bead: Optional[Any] = None
+    error: Optional[str] = None
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    fetch_seconds: float = 0.0
+    validate_seconds: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        """True if the bead was fetched and passed validation."""
+        return self.bead is not None
+
+
+def split_show_output(raw: bytes) -> List[bytes]:
+    """
+    Split `bd show --json` output into one JSON document per bead.
+
+    `bd show` prints a JSON array (it accepts several IDs); a bare object
+    is passed through unchanged.
+    """
+    stripped = raw.lstrip()
+    if not stripped.startswith(b"["):
+        return [raw]
+    return [json.dumps(item).encode("utf-8") for item in json.loads(stripped)]
+
+
+def validate_payload(payload: bytes, engine: str = DEFAULT_ENGINE) -> Any:
+    """Validate one bead document (module-level so process pools can pickle it)."""
+    return get_validator("Bead", engine)(payload)
+
+
+async def fetch_bead_json(
+    bead_id: str, bd_command: Sequence[str] = ("bd",), timeout: Optional[float] = None
+) -> bytes:
+    """
+    Run `bd show <id> --json` and return the JSON document for that bead.
+
+    Args:
+        bead_id: Bead ID to fetch
+        bd_command: Command prefix used to invoke bd
+        timeout: Seconds before the subprocess is killed
+
+    Raises:
+        BdCommandError: If bd exits non-zero, times out or returns no bead
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *bd_command,
+        "show",
+        bead_id,
+        "--json",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise BdCommandError(f"bd show {bead_id} timed out after {timeout}s")
+    if proc.returncode != 0:
+        message = stderr.decode("utf-8", "replace").strip()
+        raise BdCommandError(f"bd show {bead_id} exited with {proc.returncode}: {message}")
+    documents = split_show_output(stdout)
+    if len(documents) != 1:
+        raise BdCommandError(f"bd show {bead_id} returned {len(documents)} beads")
+    return documents[0]
+
+
+async def validate_beads(
+    bead_ids: Iterable[str],
+    concurrency: int = 8,
+    bd_command: Sequence[str] = ("bd",),
+    engine: str = DEFAULT_ENGINE,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[BeadValidationResult]:
+    """
+    Fetch and validate beads concurrently, yielding results as they complete.
+
+    Args:
+        bead_ids: Bead IDs to validate
+        concurrency: Maximum concurrent `bd` subprocesses
+        bd_command: Command prefix used to invoke bd
+        engine: Validation engine (see validation_engine.ENGINES)
+        executor: Executor for CPU validation; defaults to one worker thread
+            (pass a ProcessPoolExecutor to validate on several cores)
+        timeout: Per-fetch timeout in seconds
+
+    Yields:
+        BeadValidationResult per bead, in completion order
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bead-validate")
+    validate = partial(validate_payload, engine=engine)
+
+    pending: asyncio.Queue = asyncio.Queue()
+    for bead_id in bead_ids:
+        pending.put_nowait(bead_id)
+    total = pending.qsize()
+    results: asyncio.Queue = asyncio.Queue()
+
+    validations = set()
+
+    async def finish(result: BeadValidationResult, payload: bytes) -> None:
+        start = time.perf_counter()
+        try:
+            result.bead = await loop.run_in_executor(executor, validate, payload)
+        except ValidationError as e:
+            result.error = "validation failed"
+            result.errors = e.errors(include_url=False, include_context=False)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.validate_seconds = time.perf_counter() - start
+        await results.put(result)
+
+    async def worker() -> None:
+        # Each worker holds at most one bd subprocess, so the worker count
+        # is the concurrency bound. Validation is handed off to the executor
+        # and the worker immediately starts the next fetch.
+        while True:
+            try:
+                bead_id = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = BeadValidationResult(bead_id=bead_id)
+            start = time.perf_counter()
+            try:
+                payload = await fetch_bead_json(bead_id, bd_command, timeout)
+            except BdCommandError as e:
+                result.error = str(e)
+            except Exception as e:
+                # E.g. OSError when bd_command cannot be started
+                result.error = f"{type(e).__name__}: {e}"
+            result.fetch_seconds = time.perf_counter() - start
+            if result.error is not None:
+                await results.put(result)
+                continue
+            task = asyncio.create_task(finish(result, payload))
+            validations.add(task)
+            task.add_done_callback(validations.discard)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, total))]
+
+    async def next_result() -> BeadValidationResult:
+        # Wait for a result, but stop waiting once no task can produce one
+        getter = asyncio.ensure_future(results.get())
+        try:
+            while True:
+                running = [task for task in workers if not task.done()]
+                await asyncio.wait(
+                    [getter, *running, *validations], return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter.done():
+                    return getter.result()
+                for task in workers:
+                    if task.done() and not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+                if not running and not validations:
+                    raise RuntimeError("bead workers exited before producing every result")
+        finally:
+            getter.cancel()
+
+    try:
+        for _ in range(total):
+            yield await next_result()
+    finally:
+        tasks = workers + list(validations)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+async def collect(bead_ids: Iterable[str], **kwargs) -> List[BeadValidationResult]:
+    """Run validate_beads and return all results as a list."""
+    return [result async for result in validate_beads(bead_ids, **kwargs)]
+
+
+def validate_beads_sync(bead_ids: Iterable[str], **kwargs) -> List[BeadValidationResult]:
+    """Synchronous wrapper around validate_beads for scripts."""
+    return asyncio.run(collect(bead_ids, **kwargs))
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Pooled, batched client for the `bd` CLI returning validated `Bead` models.
+
+Every `bd` invocation pays process start-up and a database open, so the
+client minimises calls rather than making each one cheaper:
+
+- Reads: `show_many` packs many IDs into each `bd show` call and runs the
+  batches on a small, reused pool of workers. With `db_path` set, reads go
+  straight to the beads SQLite database (read-only) instead.
+- Writes: `update` only queues a change. `flush` coalesces all queued
+  status changes and metadata merge patches per bead, validates the result
+  with `bead_patch.apply_merge_patch`, and issues one `bd update` per bead.
+"""
+
+import json
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+
+from bead_patch import apply_merge_patch, merge_patch
+from bead_schema import Bead
+
+
+SCRUM_MASTER = "beads-ralph-scrum-master"
+
+_BEAD_LIST = TypeAdapter(List[Bead])
+
+
+class BdCommandError(Exception):
+    """A `bd` subprocess failed or timed out."""
+
+
+def parse_beads(raw: bytes) -> List[Bead]:
+    """
+    Validate `bd ... --json` output (an array, or a single object) into beads.
+
+    Raises:
+        ValidationError: If any bead is invalid (locations are prefixed by
+            the bead's index in the output)
+    """
+    stripped = raw.strip()
+    if stripped.startswith(b"{"):
+        stripped = b"[" + stripped + b"]"
+    return _BEAD_LIST.validate_json(stripped or b"[]")
+
+
+class SqliteBeadReader:
+    """Read beads directly from a beads SQLite database, bypassing `bd`."""
+
+    def __init__(self, db_path: str):
+        """
+        Open a beads database read-only.
+
+        Args:
+            db_path: Path to the beads SQLite database (e.g. .beads/beads.db)
+        """
+        self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def _related(self, sql: str, ids: Sequence[str]) -> Dict[str, List[Any]]:
+        related: Dict[str, List[Any]] = {bead_id: [] for bead_id in ids}
+        marks = ",".join("?" * len(ids))
+        for row in self._conn.execute(sql.format(marks=marks), ids):
+            related[row[0]].append(row[1] if len(row) == 2 else dict(row))
+        return related
+
+    def show_many(self, ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return bead JSON objects (as `bd show --json` would) keyed by ID.
+
+        Missing IDs are omitted. Each query fetches all IDs at once.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        marks = ",".join("?" * len(ids))
+        rows = self._conn.execute(
+            "SELECT id, title, description, status, priority, issue_type, assignee, owner,"
+            " metadata, external_ref, created_at, updated_at, closed_at"
+            f" FROM issues WHERE id IN ({marks})",
+            ids,
+        ).fetchall()
+        found = [row["id"] for row in rows]
+        dependencies = self._related(
+            "SELECT issue_id, depends_on_id FROM dependencies"
+            " WHERE issue_id IN ({marks}) ORDER BY depends_on_id",
+            found,
+        )
+        labels = self._related(
+            "SELECT issue_id, label FROM labels WHERE issue_id IN ({marks}) ORDER BY label",
+            found,
+        )
+        comments = self._related(
+            "SELECT issue_id, author, text, created_at FROM comments"
+            " WHERE issue_id IN ({marks}) ORDER BY created_at",
+            found,
+        )
+        beads = {}
+        for row in rows:
+            bead = dict(row)
+            bead["metadata"] = json.loads(bead["metadata"]) if bead["metadata"] else None
+            bead["dependencies"] = dependencies[row["id"]]
+            bead["labels"] = labels[row["id"]]
+            bead["comments"] = [
+                {k: v for k, v in c.items() if k != "issue_id"} for c in comments[row["id"]]
+            ]
+            beads[row["id"]] = {k: v for k, v in bead.items() if v is not None}
+        return beads
+
+
+class BdClient:
+    """Batched `bd` client with write coalescing."""
+
+    def __init__(
+        self,
+        bd_command: Sequence[str] = ("bd",),
+        pool_size: int = 4,
+        batch_size: int = 50,
+        timeout: Optional[float] = 60.0,
+        db_path: Optional[str] = None,
+    ):
+        """
+        Create a client.
+
+        Args:
+            bd_command: Command prefix used to invoke bd
+            pool_size: Maximum concurrent bd subprocesses; the worker pool is
+                created once and reused for every batched call
+            batch_size: Maximum bead IDs per `bd show` call
+            timeout: Per-call timeout in seconds
+            db_path: If set, read beads directly from this SQLite database
+        """
+        if pool_size < 1 or batch_size < 1:
+            raise ValueError("pool_size and batch_size must be >= 1")
+        self.bd_command = tuple(bd_command)
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="bd")
+        self._reader = SqliteBeadReader(db_path) if db_path else None
+        self._status: Dict[str, str] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+
+    def close(self) -> None:
+        """Shut down the worker pool (queued updates are not flushed)."""
+        self._pool.shutdown(wait=True)
+        if self._reader is not None:
+            self._reader.close()
+
+    def __enter__(self) -> "BdClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
+
+    def run(self, *args: str) -> bytes:
+        """
+        Run one bd command and return its stdout.
+
+        Raises:
+            BdCommandError: If bd exits non-zero or times out
+        """
+        with self._calls_lock:
+            self.calls += 1
+        command = " ".join(args[:2])
+        try:
+            proc = subprocess.run(
+                [*self.bd_command, *args], capture_output=True, timeout=self.timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise BdCommandError(f"bd {command} timed out after {self.timeout}s")
+        if proc.returncode != 0:
+            message = proc.stderr.decode("utf-8", "replace").strip()
+            raise BdCommandError(f"bd {command} exited with {proc.returncode}: {message}")
+        return proc.stdout
+
+    # Reading
+
+    def _show_batch(self, ids: List[str]) -> List[Bead]:
+        return parse_beads(self.run("show", *ids, "--json"))
+
+    def show_many(self, bead_ids: Iterable[str]) -> Dict[str, Bead]:
+        """
+        Fetch and validate several beads with as few bd calls as possible.
+
+        Returns:
+            Beads keyed by ID, in request order
+
+        Raises:
+            BdCommandError: If a bead does not exist or bd fails
+            ValidationError: If a bead is invalid
+        """
+        ids = list(dict.fromkeys(bead_ids))
+        if self._reader is not None:
+            rows = self._reader.show_many(ids)
+            missing = [bead_id for bead_id in ids if bead_id not in rows]
+            if missing:
+                raise BdCommandError(f"issue not found: {', '.join(missing)}")
+            return dict(zip(ids, parse_beads(json.dumps([rows[i] for i in ids]).encode())))
+        batches = [ids[i : i + self.batch_size] for i in range(0, len(ids), self.batch_size)]
+        beads: Dict[str, Bead] = {}
+        for batch in self._pool.map(self._show_batch, batches):
+            beads.update((bead.id, bead) for bead in batch)
+        return {bead_id: beads[bead_id] for bead_id in ids}
+
+    def show(self, bead_id: str) -> Bead:
+        """Fetch and validate one bead."""
+        return self.show_many([bead_id])[bead_id]
+
+    def ready(self, assignee: str = SCRUM_MASTER, limit: Optional[int] = None) -> List[Bead]:
+        """Return ready beads (`bd ready --json`) for the assignee."""
+        args = ["ready", "--assignee", assignee, "--json"]
+        if limit is not None:
+            args += ["--limit", str(limit)]
+        return parse_beads(self.run(*args))
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        label: Optional[str] = None,
+        assignee: str = SCRUM_MASTER,
+    ) -> List[Bead]:
+        """Return beads matching `bd list` filters."""
+        args = ["list", f"--assignee={assignee}", "--json"]
+        if status is not None:
+            args.append(f"--status={status}")
+        if label is not None:
+            args.append(f"--label={label}")
+        return parse_beads(self.run(*args))
+
+    # Writing
+
+    def update(
+        self,
+        bead_id: str,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Queue a change for the next flush.
+
+        Args:
+            bead_id: Bead to update
+            status: New status (the last queued status wins)
+            metadata: JSON merge patch for the metadata object; successive
+                patches for the same bead are merged in order
+        """
+        if status is not None:
+            self._status[bead_id] = status
+        if metadata is not None:
+            self._metadata[bead_id] = merge_patch(self._metadata.get(bead_id, {}), metadata)
+
+    @property
+    def pending(self) -> List[str]:
+        """IDs of beads with queued changes."""
+        return list(dict.fromkeys([*self._status, *self._metadata]))
+
+    def _write(self, bead_id: str, updated: Optional[Bead]) -> None:
+        args = ["update", bead_id]
+        status = self._status.get(bead_id)
+        if status is not None:
+            args += ["--status", status]
+        if updated is not None:
+            metadata = updated.metadata.model_dump(mode="json", exclude_none=True)
+            args += ["--metadata", json.dumps(metadata, separators=(",", ":"))]
+        self.run(*args)
+
+    def flush(self) -> Dict[str, Optional[Bead]]:
+        """
+        Apply all queued changes with one `bd update` per bead.
+
+        `bd update --metadata` replaces the whole metadata object, so beads
+        with metadata patches are first fetched (batched), patched and
+        validated; an invalid patch raises before anything is written.
+
+        Returns:
+            Updated beads keyed by ID (None for status-only updates)
+
+        Raises:
+            ValidationError: If a patched bead would be invalid
+            BdCommandError: If a bd call fails
+        """
+        updated: Dict[str, Optional[Bead]] = dict.fromkeys(self.pending)
+        for bead_id, bead in self.show_many(self._metadata).items():
+            patch: Dict[str, Any] = {"metadata": self._metadata[bead_id]}
+            if bead_id in self._status:
+                patch["status"] = self._status[bead_id]
+            updated[bead_id] = apply_merge_patch(bead, patch)
+        try:
+            list(self._pool.map(lambda bead_id: self._write(bead_id, updated[bead_id]), updated))
+        finally:
+            self._status.clear()
+            self._metadata.clear()
+        return updated
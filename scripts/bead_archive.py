@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Compressed, memory-mapped archive of closed beads.
+
+Closed beads keep their full execution history but are rarely read again.
+`archive_closed` streams them out of a bead list into an archive file and
+passes the live beads through. The archive holds beads as canonical JSON
+lines (`bead_delta.canonical_json`), zlib-compressed in blocks of about
+`BLOCK_SIZE` bytes, followed by an ID index sorted by bead ID:
+
+    [block 0][block 1]...[block table][index entries][ID bytes][footer]
+
+`BeadArchive` memory-maps the file and binary-searches the index in place,
+so fetching one bead decompresses one block, not the archive.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from bead_delta import canonical_json
+from bead_schema import Bead
+
+MAGIC = b"BRARC001"
+BLOCK_SIZE = 64 << 10
+COMPRESSION_LEVEL = 6
+
+_FOOTER = struct.Struct("<8sQQQII")  # magic, table, entries, ids offsets, blocks, beads
+_BLOCK = struct.Struct("<QI")  # block offset, compressed length
+_ENTRY = struct.Struct("<IHIH")  # ID offset, ID length, block number, line in block
+
+
+class ArchiveFormatError(ValueError):
+    """The file is not a readable bead archive."""
+
+
+class ArchiveWriter:
+    """Streams beads into a new archive file."""
+
+    def __init__(self, path: str, block_size: int = BLOCK_SIZE, level: int = COMPRESSION_LEVEL):
+        """
+        Start an archive; it is written to `path` atomically on `close`.
+
+        Args:
+            path: Archive file path
+            block_size: Uncompressed bytes per block (larger compresses
+                better, smaller makes single-bead reads cheaper)
+            level: zlib compression level
+        """
+        self.path = path
+        self.block_size = block_size
+        self.level = level
+        self.count = 0
+        self._tmp = f"{path}.tmp"
+        self._out = open(self._tmp, "wb")
+        self._blocks: List[Tuple[int, int]] = []
+        self._ids: List[Tuple[bytes, int, int]] = []
+        self._lines: List[bytes] = []
+        self._buffered = 0
+
+    def add(self, bead: Bead) -> None:
+        """Append a bead."""
+        line = canonical_json(bead).encode()
+        if len(self._lines) == 0xFFFF:
+            self._flush()
+        self._ids.append((bead.id.encode(), len(self._blocks), len(self._lines)))
+        self._lines.append(line)
+        self._buffered += len(line) + 1
+        self.count += 1
+        if self._buffered >= self.block_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._lines:
+            return
+        data = zlib.compress(b"\n".join(self._lines), self.level)
+        self._blocks.append((self._out.tell(), len(data)))
+        self._out.write(data)
+        self._lines = []
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Write the index and footer, and move the archive into place."""
+        if self._out.closed:
+            return
+        self._flush()
+        self._ids.sort()
+        for (a, _, _), (b, _, _) in zip(self._ids, self._ids[1:]):
+            if a == b:
+                self.abort()
+                raise ValueError(f"duplicate bead ID in archive: {a.decode()}")
+        table = self._out.tell()
+        for offset, length in self._blocks:
+            self._out.write(_BLOCK.pack(offset, length))
+        entries = self._out.tell()
+        id_offset = 0
+        for bead_id, block, line in self._ids:
+            self._out.write(_ENTRY.pack(id_offset, len(bead_id), block, line))
+            id_offset += len(bead_id)
+        ids = self._out.tell()
+        for bead_id, _, _ in self._ids:
+            self._out.write(bead_id)
+        self._out.write(
+            _FOOTER.pack(MAGIC, table, entries, ids, len(self._blocks), len(self._ids))
+        )
+        self._out.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        """Discard the partial archive."""
+        if not self._out.closed:
+            self._out.close()
+        if os.path.exists(self._tmp):
+            os.unlink(self._tmp)
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class BeadArchive:
+    """Read-only, memory-mapped view of an archive."""
+
+    def __init__(self, path: str):
+        """
+        Open an archive.
+
+        Raises:
+            ArchiveFormatError: If the file is not an archive
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _FOOTER.size:
+                raise ArchiveFormatError(f"{path}: too small to be a bead archive")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._table, self._entries, self._ids, self.blocks, self._count = (
+            _FOOTER.unpack_from(self._mm, size - _FOOTER.size)
+        )
+        if magic != MAGIC:
+            self._mm.close()
+            raise ArchiveFormatError(f"{path}: not a bead archive")
+        self._cached: Tuple[int, List[bytes]] = (-1, [])
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
+
+    def __enter__(self) -> "BeadArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, index: int) -> Tuple[bytes, int, int]:
+        id_offset, id_length, block, line = _ENTRY.unpack_from(
+            self._mm, self._entries + index * _ENTRY.size
+        )
+        start = self._ids + id_offset
+        return self._mm[start : start + id_length], block, line
+
+    def _block(self, block: int) -> List[bytes]:
+        if self._cached[0] != block:
+            offset, length = _BLOCK.unpack_from(self._mm, self._table + block * _BLOCK.size)
+            lines = zlib.decompress(self._mm[offset : offset + length]).split(b"\n")
+            self._cached = (block, lines)
+        return self._cached[1]
+
+    def _find(self, bead_id: str) -> Optional[Tuple[int, int]]:
+        key = bead_id.encode()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            found, block, line = self._entry(lo)
+            if found == key:
+                return block, line
+        return None
+
+    def __contains__(self, bead_id: str) -> bool:
+        return self._find(bead_id) is not None
+
+    def get_json(self, bead_id: str) -> Optional[bytes]:
+        """Canonical JSON of one bead, or None if it is not archived."""
+        location = self._find(bead_id)
+        if location is None:
+            return None
+        block, line = location
+        return self._block(block)[line]
+
+    def get(self, bead_id: str) -> Optional[Bead]:
+        """One validated bead, or None if it is not archived."""
+        data = self.get_json(bead_id)
+        return None if data is None else Bead.model_validate_json(data)
+
+    def ids(self) -> Iterator[str]:
+        """Archived bead IDs in sorted order."""
+        for index in range(self._count):
+            yield self._entry(index)[0].decode()
+
+    def __iter__(self) -> Iterator[Bead]:
+        """All beads in archive order, one block in memory at a time."""
+        for block in range(self.blocks):
+            offset, length = _BLOCK.unpack_from(self._mm, self._table + block * _BLOCK.size)
+            for line in zlib.decompress(self._mm[offset : offset + length]).split(b"\n"):
+                yield Bead.model_validate_json(line)
+
+
+def archive_closed(beads: Iterable[Bead], writer: ArchiveWriter) -> Iterator[Bead]:
+    """
+    Write closed beads to `writer` and yield every other bead.
+
+    The writer is not closed, so several sources can feed one archive.
+    """
+    for bead in beads:
+        if bead.status == "closed":
+            writer.add(bead)
+        else:
+            yield bead
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Canonical serialization, content hashing and delta export for beads.
+
+`canonical_json` renders a `Bead` the same way every time: keys sorted, no
+whitespace, every field present (defaults included) and datetimes
+normalized (aware values converted to UTC with a `Z` suffix, microseconds
+only when non-zero). `bead_hash` is a BLAKE2b-128 digest of that text and
+suits the base schema's `content_hash` column.
+
+`export_delta` compares bead hashes against a `HashSnapshot` and writes
+one JSON line per bead that changed. A snapshot also keeps a hash per
+part (each top-level field, and each `metadata` field as
+`metadata.<name>`) so a changed bead ships only its changed parts:
+
+    {"bead": {...}, "hash": "...", "id": "bd-1", "op": "add"}
+    {"hash": "...", "id": "bd-2", "op": "patch", "patch": {"metadata": {...}}}
+    {"id": "bd-3", "op": "delete"}
+
+A patch is an RFC 7386 merge patch holding only the changed parts, so
+`apply_delta` (or `bead_patch.apply_merge_patch`) rebuilds the new bead
+from the old one, and the result is checked against the shipped hash.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, MutableMapping, TextIO, Tuple, Union
+
+from bead_patch import apply_merge_patch
+from bead_schema import Bead, BeadMetadata
+
+FORMAT_VERSION = "1"
+
+METADATA_PREFIX = "metadata."
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS delta_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bead_hashes (
+    bead_id TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    parts TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Part names in a fixed order; a snapshot stores part hashes in this order
+PARTS: Tuple[str, ...] = tuple(
+    name for name in Bead.model_fields if name != "metadata"
+) + tuple(METADATA_PREFIX + name for name in BeadMetadata.model_fields)
+
+# Hex digits kept per part hash in a snapshot
+PART_HASH_CHARS = 16
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default
+)
+_dumps = _ENCODER.encode
+
+
+def _object(members: Iterable[Tuple[str, str]]) -> str:
+    """JSON object text from (key, serialized value) pairs, keys sorted."""
+    return "{" + ",".join(f"{_dumps(key)}:{text}" for key, text in sorted(members)) + "}"
+
+
+def _hash(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def serialize_parts(bead: Bead) -> Dict[str, str]:
+    """Canonical JSON text of every part of a bead, keyed by part name."""
+    data = bead.model_dump()
+    metadata = data.pop("metadata")
+    parts = {name: _dumps(value) for name, value in data.items()}
+    for name, value in metadata.items():
+        parts[METADATA_PREFIX + name] = _dumps(value)
+    return parts
+
+
+def _assemble(parts: Dict[str, str]) -> str:
+    core: List[Tuple[str, str]] = []
+    metadata: List[Tuple[str, str]] = []
+    for name, text in parts.items():
+        if name.startswith(METADATA_PREFIX):
+            metadata.append((name[len(METADATA_PREFIX) :], text))
+        else:
+            core.append((name, text))
+    if metadata:
+        core.append(("metadata", _object(metadata)))
+    return _object(core)
+
+
+def canonical_json(bead: Bead) -> str:
+    """Canonical JSON text of a bead (sorted keys, normalized datetimes)."""
+    return _dumps(bead.model_dump())
+
+
+def bead_hash(bead: Bead) -> str:
+    """Content hash of a bead: BLAKE2b-128 of its canonical JSON, as hex."""
+    return _hash(canonical_json(bead))
+
+
+def part_hashes(parts: Dict[str, str]) -> str:
+    """Concatenated, truncated hashes of serialized parts in `PARTS` order."""
+    return "".join(_hash(parts[name])[:PART_HASH_CHARS] for name in PARTS)
+
+
+class HashSnapshot:
+    """SQLite store of the bead and part hashes last exported."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a snapshot.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM delta_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO delta_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(f"unsupported snapshot format {row[0]}, expected {FORMAT_VERSION}")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "HashSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def load(self) -> Dict[str, Tuple[str, str]]:
+        """Return {bead_id: (bead hash, part hashes)} for every bead."""
+        with self._lock:
+            rows = self._conn.execute("SELECT bead_id, hash, parts FROM bead_hashes").fetchall()
+        return {bead_id: (digest, parts) for bead_id, digest, parts in rows}
+
+    def update(self, changed: Iterable[Tuple[str, str, str]], deleted: Iterable[str] = ()) -> None:
+        """
+        Record exported hashes in one transaction.
+
+        Args:
+            changed: (bead_id, bead hash, part hashes) for added/patched beads
+            deleted: IDs of beads no longer present
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO bead_hashes (bead_id, hash, parts) VALUES (?, ?, ?)",
+                    changed,
+                )
+                self._conn.executemany(
+                    "DELETE FROM bead_hashes WHERE bead_id = ?", ((i,) for i in deleted)
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+
+@dataclass
+class DeltaStats:
+    """Counts and sizes for one delta export."""
+
+    beads: int = 0
+    added: int = 0
+    patched: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    delta_bytes: int = 0
+    full_bytes: int = 0  # size of a full canonical export of the same beads
+
+
+def export_delta(
+    beads: Iterable[Bead],
+    snapshot: HashSnapshot,
+    out: TextIO,
+    complete: bool = True,
+    commit: bool = True,
+) -> DeltaStats:
+    """
+    Write the changes since the snapshot as JSON lines.
+
+    Args:
+        beads: Current beads, streamed
+        snapshot: Hashes from the previous export
+        out: Text stream receiving one JSON line per change
+        complete: `beads` is the whole store, so snapshot IDs missing from
+            it are emitted as deletions
+        commit: Record the new hashes in the snapshot afterwards (pass False
+            to commit only once the delta has been delivered)
+
+    Returns:
+        Export statistics
+    """
+    previous = snapshot.load()
+    seen = set()
+    changed: List[Tuple[str, str, str]] = []
+    stats = DeltaStats()
+    for bead in beads:
+        stats.beads += 1
+        seen.add(bead.id)
+        text = canonical_json(bead)
+        stats.full_bytes += len(text.encode()) + 1
+        digest = _hash(text)
+        old = previous.get(bead.id)
+        if old is not None and old[0] == digest:
+            stats.unchanged += 1
+            continue
+        parts = serialize_parts(bead)
+        hashes = part_hashes(parts)
+        if old is None:
+            line = _object(
+                [("bead", text), ("hash", _dumps(digest)), ("id", _dumps(bead.id)),
+                 ("op", '"add"')]
+            )
+            stats.added += 1
+        else:
+            old_hashes = old[1]
+            patch = {
+                name: parts[name]
+                for i, name in enumerate(PARTS)
+                if hashes[i * PART_HASH_CHARS : (i + 1) * PART_HASH_CHARS]
+                != old_hashes[i * PART_HASH_CHARS : (i + 1) * PART_HASH_CHARS]
+            }
+            line = _object(
+                [("hash", _dumps(digest)), ("id", _dumps(bead.id)), ("op", '"patch"'),
+                 ("patch", _assemble(patch))]
+            )
+            stats.patched += 1
+        out.write(line + "\n")
+        stats.delta_bytes += len(line.encode()) + 1
+        changed.append((bead.id, digest, hashes))
+    deleted = sorted(set(previous) - seen) if complete else []
+    for bead_id in deleted:
+        line = _object([("id", _dumps(bead_id)), ("op", '"delete"')])
+        out.write(line + "\n")
+        stats.delta_bytes += len(line.encode()) + 1
+    stats.deleted = len(deleted)
+    if commit:
+        snapshot.update(changed, deleted)
+    return stats
+
+
+def apply_delta(
+    records: Iterable[Union[str, Dict[str, Any]]], beads: MutableMapping[str, Bead]
+) -> int:
+    """
+    Apply delta lines to a mapping of beads, in place.
+
+    Args:
+        records: JSON lines (or parsed records) from `export_delta`
+        beads: {bead_id: Bead} as of the snapshot the delta was taken against
+
+    Returns:
+        Number of records applied
+
+    Raises:
+        ValueError: If a record is malformed, patches an unknown bead, or
+            does not reproduce its content hash
+    """
+    applied = 0
+    for record in records:
+        if isinstance(record, str):
+            if not record.strip():
+                continue
+            record = json.loads(record)
+        op, bead_id = record.get("op"), record.get("id")
+        if op == "delete":
+            beads.pop(bead_id, None)
+        elif op == "add":
+            beads[bead_id] = Bead.model_validate_json(json.dumps(record["bead"]))
+        elif op == "patch":
+            if bead_id not in beads:
+                raise ValueError(f"delta patches unknown bead {bead_id}")
+            beads[bead_id] = apply_merge_patch(beads[bead_id], record["patch"])
+        else:
+            raise ValueError(f"unknown delta op {op!r} for bead {bead_id}")
+        if op != "delete" and bead_hash(beads[bead_id]) != record["hash"]:
+            raise ValueError(f"delta for bead {bead_id} does not reproduce its content hash")
+        applied += 1
+    return applied
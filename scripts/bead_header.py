@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Header-only bead parsing: decode a declared field subset, skip the rest.
+
+The ready queue, grouping and dashboards read a handful of fields, but
+`Bead.model_validate_json` builds and validates descriptions, comments,
+prompts, QA output schemas and whole execution histories. A projection
+decodes raw bead JSON into a small frozen Struct holding only its fields;
+msgspec skips every other value while tokenizing, without building it.
+
+    parse = header_parser()                 # DEFAULT_FIELDS
+    header = parse(raw)
+    header.id, header.priority, header.metadata.phase
+
+    parse = header_parser(["id", "status", "metadata.dev_model"])
+
+Projected fields keep the rules of `bead_schema_msgspec` (enums, bounds,
+patterns, the title check); fields outside the projection are not
+validated. Headers have the same attribute paths as `Bead`,
+so code reading only those attributes accepts either. As in
+`validation_engine`, input the fast path rejects is re-validated with
+pydantic, which raises the canonical `ValidationError` or, for input only
+pydantic's parsers accept, yields the header.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type, Union
+
+import msgspec
+from pydantic import TypeAdapter
+
+import bead_schema
+import bead_schema_msgspec
+
+DEFAULT_FIELDS: Tuple[str, ...] = (
+    "id",
+    "status",
+    "priority",
+    "issue_type",
+    "dependencies",
+    "metadata.phase",
+    "metadata.sprint",
+)
+
+METADATA_PREFIX = "metadata."
+
+HeaderParser = Callable[[Union[str, bytes]], Any]
+
+_BEAD_LIST = TypeAdapter(List[bead_schema.Bead])
+
+_parsers: Dict[Tuple[Tuple[str, ...], bool], HeaderParser] = {}
+
+
+def _field_spec(struct: Type[msgspec.Struct], name: str) -> Tuple[Any, ...]:
+    """defstruct field spec copying type and default from a bead Struct."""
+    for info in msgspec.structs.fields(struct):
+        if info.name == name:
+            if info.default_factory is not msgspec.NODEFAULT:
+                return (name, info.type, msgspec.field(default_factory=info.default_factory))
+            if info.default is not msgspec.NODEFAULT:
+                return (name, info.type, info.default)
+            return (name, info.type)
+    prefix = METADATA_PREFIX if struct is bead_schema_msgspec.BeadMetadata else ""
+    raise ValueError(f"unknown bead field: {prefix}{name}")
+
+
+def header_type(fields: Sequence[str] = DEFAULT_FIELDS) -> Type[msgspec.Struct]:
+    """
+    Build a frozen header Struct for a projection.
+
+    Args:
+        fields: Top-level `Bead` fields and `metadata.<field>` paths
+
+    Raises:
+        ValueError: If a field is not a bead field
+    """
+    top: List[Tuple[Any, ...]] = []
+    nested: List[Tuple[Any, ...]] = []
+    for path in fields:
+        if path.startswith(METADATA_PREFIX):
+            name = path[len(METADATA_PREFIX) :]
+            nested.append(_field_spec(bead_schema_msgspec.BeadMetadata, name))
+        elif path == "metadata":
+            raise ValueError("project metadata fields as metadata.<field>")
+        else:
+            top.append(_field_spec(bead_schema_msgspec.Bead, path))
+    if nested:
+        metadata = msgspec.defstruct(
+            "MetadataHeader", nested, kw_only=True, frozen=True, module=__name__
+        )
+        top.append(("metadata", metadata))
+    namespace = {}
+    if "title" in fields:
+        namespace["__post_init__"] = bead_schema_msgspec.Bead.__post_init__
+    return msgspec.defstruct(
+        "BeadHeader", top, kw_only=True, frozen=True, module=__name__, namespace=namespace
+    )
+
+
+def _include(fields: Sequence[str]) -> Dict[str, Any]:
+    include: Dict[str, Any] = {}
+    for path in fields:
+        if path.startswith(METADATA_PREFIX):
+            include.setdefault("metadata", {})[path[len(METADATA_PREFIX) :]] = True
+        else:
+            include[path] = True
+    return include
+
+
+def header_parser(fields: Sequence[str] = DEFAULT_FIELDS, many: bool = False) -> HeaderParser:
+    """
+    Return a function decoding bead JSON into headers of `fields`.
+
+    Args:
+        fields: Projection (see `header_type`)
+        many: Decode `bd list --json` output (an array, or a single
+            object) into a list of headers instead of one bead
+
+    Raises:
+        ValueError: If a field is not a bead field
+    """
+    key = (tuple(fields), many)
+    parser = _parsers.get(key)
+    if parser is not None:
+        return parser
+    header = header_type(fields)
+    decoder = msgspec.json.Decoder(List[header] if many else header)
+    fast_errors = (msgspec.ValidationError, msgspec.DecodeError)
+    include = _include(fields)
+
+    def parse(data: Union[str, bytes]) -> Any:
+        if many:
+            stripped = data.strip()
+            if not stripped:
+                return []
+            if stripped[:1] in ("{", b"{"):
+                data = b"[" + stripped + b"]" if isinstance(stripped, bytes) else f"[{stripped}]"
+        try:
+            return decoder.decode(data)
+        except fast_errors:
+            # Authoritative check; raises the canonical ValidationError
+            if many:
+                beads = _BEAD_LIST.validate_json(data)
+                return [msgspec.convert(b.model_dump(include=include), header) for b in beads]
+            bead = bead_schema.Bead.model_validate_json(data)
+            return msgspec.convert(bead.model_dump(include=include), header)
+
+    _parsers[key] = parse
+    return parse
+
+
+def parse_header(data: Union[str, bytes], fields: Sequence[str] = DEFAULT_FIELDS) -> Any:
+    """Decode one bead's JSON into a header of `fields`."""
+    return header_parser(fields)(data)
+
+
+def parse_headers(data: Union[str, bytes], fields: Sequence[str] = DEFAULT_FIELDS) -> List[Any]:
+    """Decode `bd ... --json` output into a list of headers of `fields`."""
+    return header_parser(fields, many=True)(data)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Patch-level validation for incremental bead updates.
+
+Applies an RFC 7386 JSON merge patch (plus optional list appends) to an
+already-validated `Bead`, validating only the touched subtrees. Untouched
+nested models and history entries are reused as-is; every model on the
+path to a change is re-checked once so its field and model validators see
+the final state.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from bead_schema import Bead
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_STRICT = ConfigDict(strict=True)
+_ABSENT = object()  # field not mentioned in the merge patch
+_REMOVE = object()  # field removed by the merge patch (null member)
+
+# (model class, field name) -> strict TypeAdapter over the field annotation
+_field_adapters: Dict[Tuple[type, str], TypeAdapter] = {}
+
+
+class _PatchErrors(Exception):
+    """Collected line errors (with absolute locations) for one patch."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Apply an RFC 7386 JSON merge patch to plain JSON data.
+
+    Args:
+        target: JSON value being patched (not modified)
+        patch: Merge patch; null members remove keys, arrays replace
+
+    Returns:
+        Patched JSON value
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the BaseModel class of `Model` or `Optional[Model]` annotations."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) is not None and get_origin(annotation) not in (list, dict):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return _model_type(members[0])
+    return None
+
+
+def _list_item_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the item model class of `List[Model]` annotations."""
+    if get_origin(annotation) is list:
+        args = get_args(annotation)
+        if args:
+            return _model_type(args[0])
+    return None
+
+
+def _field_adapter(cls: Type[BaseModel], name: str) -> TypeAdapter:
+    key = (cls, name)
+    adapter = _field_adapters.get(key)
+    if adapter is None:
+        adapter = TypeAdapter(cls.model_fields[name].annotation, config=_STRICT)
+        _field_adapters[key] = adapter
+    return adapter
+
+
+def _shift(errors: List[Dict[str, Any]], prefix: Tuple, index_offset: int = 0) -> List[Dict[str, Any]]:
+    """Prefix error locations; optionally shift a leading list index."""
+    shifted = []
+    for error in errors:
+        loc = tuple(error["loc"])
+        if index_offset and loc and isinstance(loc[0], int):
+            loc = (loc[0] + index_offset,) + loc[1:]
+        line = {"type": error["type"], "loc": prefix + loc, "input": error["input"]}
+        if "ctx" in error:
+            line["ctx"] = error["ctx"]
+        shifted.append(line)
+    return shifted
+
+
+def _validate_json_value(validate, value: Any, loc: Tuple, index_offset: int = 0) -> Any:
+    """Validate a JSON-compatible value in strict JSON mode."""
+    try:
+        return validate(json.dumps(value))
+    except ValidationError as e:
+        raise _PatchErrors(_shift(e.errors(), loc, index_offset))
+
+
+def _patch_list(
+    current: List[BaseModel], value: List[Any], item_cls: Type[BaseModel], loc: Tuple
+) -> List[BaseModel]:
+    """Replace a list of models, reusing entries identical to the current ones."""
+    result = []
+    errors = []
+    for index, raw in enumerate(value):
+        if index < len(current) and current[index].model_dump(mode="json") == raw:
+            result.append(current[index])
+            continue
+        try:
+            result.append(
+                _validate_json_value(item_cls.model_validate_json, raw, loc + (index,))
+            )
+        except _PatchErrors as e:
+            errors.extend(e.errors)
+    if errors:
+        raise _PatchErrors(errors)
+    return result
+
+
+def _patched_value(
+    model: BaseModel, name: str, value: Any, items: Optional[List[Any]], loc: Tuple
+) -> Any:
+    """Return the new validated value for one touched field (or _REMOVE)."""
+    cls = type(model)
+    annotation = cls.model_fields[name].annotation
+    current = getattr(model, name)
+
+    if value is None:
+        if items is None:
+            return _REMOVE
+        current = cls.model_fields[name].get_default(call_default_factory=True)
+    elif value is not _ABSENT:
+        sub_cls = _model_type(annotation)
+        item_cls = _list_item_model(annotation)
+        if sub_cls is not None and isinstance(value, dict):
+            if isinstance(current, sub_cls):
+                current = _patch_model(current, value, {}, loc)
+            else:
+                current = _validate_json_value(
+                    sub_cls.model_validate_json, merge_patch({}, value), loc
+                )
+        elif item_cls is not None and isinstance(value, list) and isinstance(current, list):
+            current = _patch_list(current, value, item_cls, loc)
+        elif isinstance(value, dict) and isinstance(current, dict):
+            # Free-form JSON objects (e.g. details) merge recursively
+            current = _validate_json_value(
+                _field_adapter(cls, name).validate_json, merge_patch(current, value), loc
+            )
+        else:
+            current = _validate_json_value(
+                _field_adapter(cls, name).validate_json, value, loc
+            )
+
+    if items is not None:
+        if not isinstance(current, list):
+            raise TypeError(f"cannot append to non-list field: {'.'.join(map(str, loc))}")
+        new_items = _validate_json_value(
+            _field_adapter(cls, name).validate_json, items, loc, index_offset=len(current)
+        )
+        current = current + new_items
+    return current
+
+
+def _patch_model(
+    model: ModelT, patch: Dict[str, Any], appends: Dict[str, Any], loc: Tuple
+) -> ModelT:
+    """Apply a merge patch and appends to one model level."""
+    cls = type(model)
+    values = dict(model.__dict__)
+    fields_set = set(model.model_fields_set)
+    errors = []
+
+    for name in list(patch) + [key for key in appends if key not in patch]:
+        field = cls.model_fields.get(name)
+        if field is None:
+            # Unknown keys are ignored, as in full validation
+            continue
+        value = patch.get(name, _ABSENT)
+        nested_appends = appends.get(name)
+        try:
+            if isinstance(nested_appends, dict):
+                # Appends inside a nested model, e.g. metadata.dev_agent_executions
+                current = getattr(model, name)
+                if value is not _ABSENT and not isinstance(value, dict):
+                    raise TypeError(f"cannot append below replaced field: {name}")
+                if not isinstance(current, BaseModel):
+                    raise TypeError(f"cannot append below unset field: {name}")
+                sub_patch = value if isinstance(value, dict) else {}
+                new_value = _patch_model(current, sub_patch, nested_appends, loc + (name,))
+            else:
+                new_value = _patched_value(model, name, value, nested_appends, loc + (name,))
+        except _PatchErrors as e:
+            errors.extend(e.errors)
+            continue
+        if new_value is _REMOVE:
+            values.pop(name, None)
+            fields_set.discard(name)
+        else:
+            values[name] = new_value
+            fields_set.add(name)
+
+    # Re-run field and model validators for this level; nested instances and
+    # already-typed values are accepted without re-validating their contents.
+    # Fields that failed above keep their old value so the remaining errors
+    # are still reported, as full validation would.
+    try:
+        result = cls.model_validate(values)
+    except ValidationError as e:
+        errors.extend(_shift(e.errors(), loc))
+    if errors:
+        raise _PatchErrors(errors)
+    object.__setattr__(result, "__pydantic_fields_set__", fields_set)
+    return result
+
+
+def _nest_appends(append: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Turn {"metadata.dev_agent_executions": [...]} into nested dicts."""
+    nested: Dict[str, Any] = {}
+    for path, items in append.items():
+        if not isinstance(items, list):
+            raise TypeError(f"append items must be a list: {path}")
+        parts = path.split(".")
+        node = nested
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+            if not isinstance(node, dict):
+                raise ValueError(f"conflicting append paths at: {path}")
+        node[parts[-1]] = items
+    return nested
+
+
+def apply_merge_patch(
+    bead: Bead,
+    patch: Dict[str, Any],
+    append: Optional[Dict[str, List[Any]]] = None,
+) -> Bead:
+    """
+    Apply a JSON merge patch to a known-valid bead, validating only what changed.
+
+    Merge patch semantics follow RFC 7386: objects merge recursively, null
+    removes a member (optional fields fall back to their defaults), and
+    arrays replace the whole list. When a replaced list of executions or QA
+    agents starts with the current entries, those entries are reused rather
+    than re-validated. To add entries without resending the history, pass
+    them through `append`, keyed by dotted field path.
+
+    Args:
+        bead: Already-validated bead (not modified)
+        patch: Merge patch as parsed JSON, e.g. {"status": "closed",
+            "metadata": {"pr_url": "https://..."}}
+        append: Items to append to list fields, e.g.
+            {"metadata.dev_agent_executions": [{...}]}
+
+    Returns:
+        New validated bead with the patch applied
+
+    Raises:
+        ValidationError: If the patched bead would be invalid; error locations
+            and messages match those of full `Bead` validation
+    """
+    if not isinstance(patch, dict):
+        raise TypeError("patch must be a JSON object")
+    try:
+        return _patch_model(bead, patch, _nest_appends(append or {}), ())
+    except _PatchErrors as e:
+        raise ValidationError.from_exception_data(type(bead).__name__, e.errors)
+
+
+def apply_merge_patch_json(bead: Bead, patch_json: str) -> Bead:
+    """Apply a merge patch given as JSON text (see apply_merge_patch)."""
+    return apply_merge_patch(bead, json.loads(patch_json))
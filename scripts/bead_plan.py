@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Shared inputs for the bead-plan tools.
+
+`load_beads` reads a validated bead corpus (e.g. `bd list --json`) for the
+command-line tools, and `DurationModel` holds per-`issue_type` dev/QA
+stage-duration models fitted from recorded executions. The simulator
+(`loop_simulator.py`) samples these models; `critical_path.py` uses their
+expectations as bead weights.
+"""
+
+import json
+import math
+import random
+import statistics
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bead_schema import Bead
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """Lognormal duration distribution in seconds."""
+
+    mu: float
+    sigma: float = 0.0
+
+    @classmethod
+    def from_median(cls, median: float, sigma: float = 0.5) -> "LogNormal":
+        """Build a distribution from its median and log-space spread."""
+        return cls(math.log(median), sigma)
+
+    @classmethod
+    def fit(cls, samples: Sequence[float]) -> "LogNormal":
+        """Maximum-likelihood fit to positive duration samples."""
+        logs = [math.log(s) for s in samples if s > 0]
+        if not logs:
+            raise ValueError("need at least one positive sample")
+        return cls(statistics.fmean(logs), statistics.pstdev(logs) if len(logs) > 1 else 0.0)
+
+    @property
+    def median(self) -> float:
+        """Median duration."""
+        return math.exp(self.mu)
+
+    @property
+    def mean(self) -> float:
+        """Mean duration."""
+        return math.exp(self.mu + self.sigma**2 / 2)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one duration."""
+        return rng.lognormvariate(self.mu, self.sigma)
+
+
+@dataclass(frozen=True)
+class StageModel:
+    """Duration and failure model for one issue type."""
+
+    dev: LogNormal
+    qa: LogNormal
+    fail_rate: float = 0.0
+
+    def sample(self, max_attempts: int, rng: random.Random) -> Tuple[float, int, bool]:
+        """
+        Sample one scrum-master run.
+
+        Returns:
+            (total seconds, attempts used, succeeded)
+        """
+        total = 0.0
+        for attempt in range(1, max_attempts + 1):
+            total += self.dev.sample(rng) + self.qa.sample(rng)
+            if rng.random() >= self.fail_rate:
+                return total, attempt, True
+        return total, max_attempts, False
+
+
+DEFAULT_STAGE_MODEL = StageModel(
+    dev=LogNormal.from_median(15 * 60), qa=LogNormal.from_median(5 * 60), fail_rate=0.3
+)
+
+
+@dataclass
+class DurationModel:
+    """Per-issue-type stage models with a fallback for unseen types."""
+
+    by_type: Dict[str, StageModel] = field(default_factory=dict)
+    default: StageModel = DEFAULT_STAGE_MODEL
+
+    def for_type(self, issue_type: str) -> StageModel:
+        """Return the model for an issue type."""
+        return self.by_type.get(issue_type, self.default)
+
+    @classmethod
+    def fit(
+        cls, beads: Iterable[Bead], default: StageModel = DEFAULT_STAGE_MODEL
+    ) -> "DurationModel":
+        """
+        Fit stage models from recorded execution histories.
+
+        Dev samples are per `DevExecution`; QA samples are the summed QA
+        time of each attempt. An attempt counts as failed if any of its QA
+        executions did not pass. Issue types without history use `default`.
+        """
+        dev: Dict[str, List[float]] = defaultdict(list)
+        qa: Dict[str, List[float]] = defaultdict(list)
+        failed: Dict[str, List[bool]] = defaultdict(list)
+        for bead in beads:
+            metadata = bead.metadata
+            kind = bead.issue_type
+            for execution in metadata.dev_agent_executions:
+                dev[kind].append((execution.completed_at - execution.started_at).total_seconds())
+            attempts: Dict[int, List[float]] = defaultdict(list)
+            attempt_failed: Dict[int, bool] = defaultdict(bool)
+            for execution in metadata.qa_agent_executions:
+                seconds = (execution.completed_at - execution.started_at).total_seconds()
+                attempts[execution.attempt].append(seconds)
+                attempt_failed[execution.attempt] |= execution.status != "pass"
+            qa[kind].extend(sum(durations) for durations in attempts.values())
+            failed[kind].extend(attempt_failed.values())
+
+        by_type = {}
+        for kind in dev.keys() & qa.keys():
+            try:
+                by_type[kind] = StageModel(
+                    dev=LogNormal.fit(dev[kind]),
+                    qa=LogNormal.fit(qa[kind]),
+                    fail_rate=sum(failed[kind]) / len(failed[kind]),
+                )
+            except ValueError:
+                continue
+        return cls(by_type=by_type, default=default)
+
+
+def load_beads(path: Optional[str]) -> List[Bead]:
+    """Load and validate a JSON array of beads (e.g. `bd list --json`)."""
+    raw = Path(path).read_text() if path else sys.stdin.read()
+    return [Bead.model_validate_json(json.dumps(item)) for item in json.loads(raw)]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""In-memory bead query engine with secondary indexes.
+
+Load beads once (e.g. from `BdClient.list`) and answer filtered queries
+without re-reading or scanning everything:
+
+    index = BeadIndex(client.list())
+    failing = index.query(
+        status="open", issue_type="beads-ralph-merge", phase="3a", last_qa_status="fail"
+    )
+    index.upsert(client.show("bd-a1b2c3"))    # keep the indexes current
+
+Every field in `INDEXED_FIELDS` has a value -> bead ID set index. A query
+intersects the sets of its filters, smallest first, so its cost follows
+the most selective filter rather than the number of beads; results sorted
+by priority are read off the priority index in order. A filter value
+may be a single value or a collection (any of). `labels` matches beads
+carrying the label; `last_qa_status` is the status of the most recent QA
+execution, inline or from `metadata.execution_history`.
+"""
+
+import heapq
+import threading
+from datetime import datetime, timezone
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from bead_schema import Bead
+
+INDEXED_FIELDS = (
+    "status",
+    "issue_type",
+    "phase",
+    "sprint",
+    "labels",
+    "priority",
+    "last_qa_status",
+)
+
+SORT_FIELDS = ("id", "priority", "created_at", "updated_at", "closed_at")
+
+
+def last_qa_status(bead: Bead) -> Optional[str]:
+    """Status of the bead's most recent QA execution, if any."""
+    executions = bead.metadata.qa_agent_executions
+    if executions:
+        return executions[-1].status
+    history = bead.metadata.execution_history
+    return history.last_qa_status if history is not None else None
+
+
+def index_keys(bead: Bead) -> Dict[str, Tuple[Any, ...]]:
+    """Index values of a bead, per indexed field."""
+    return {
+        "status": (bead.status,),
+        "issue_type": (bead.issue_type,),
+        "phase": (bead.metadata.phase,),
+        "sprint": (bead.metadata.sprint,),
+        "labels": tuple(set(bead.labels)),
+        "priority": (bead.priority,),
+        "last_qa_status": (last_qa_status(bead),),
+    }
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    """POSIX timestamp of a datetime, reading naive datetimes as UTC (0.0 for None)."""
+    if value is None:
+        return 0.0
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _sort_key(field: str) -> Callable[[Bead], Any]:
+    if field == "id":
+        return lambda bead: bead.id
+    # Datetime fields; naive and aware values compare as timestamps. None
+    # (e.g. closed_at of open beads) sorts after values; ties break on ID
+    return lambda bead: (
+        getattr(bead, field) is None,
+        _timestamp(getattr(bead, field)),
+        bead.id,
+    )
+
+
+class BeadIndex:
+    """Beads by ID plus secondary indexes, kept current by upsert/remove."""
+
+    def __init__(self, beads: Iterable[Bead] = ()):
+        """
+        Build the indexes.
+
+        Args:
+            beads: Initial beads; later duplicates of an ID replace earlier ones
+        """
+        self._beads: Dict[str, Bead] = {}
+        self._keys: Dict[str, Dict[str, Tuple[Any, ...]]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in INDEXED_FIELDS}
+        self._lock = threading.RLock()
+        self.upsert_many(beads)
+
+    def __len__(self) -> int:
+        return len(self._beads)
+
+    def __contains__(self, bead_id: str) -> bool:
+        return bead_id in self._beads
+
+    def get(self, bead_id: str) -> Optional[Bead]:
+        """Return a bead by ID, or None."""
+        return self._beads.get(bead_id)
+
+    def _unindex(self, bead_id: str) -> None:
+        for name, values in self._keys.pop(bead_id).items():
+            index = self._indexes[name]
+            for value in values:
+                ids = index[value]
+                ids.discard(bead_id)
+                if not ids:
+                    del index[value]
+
+    def upsert(self, bead: Bead) -> None:
+        """Add a bead or replace it, updating only the index entries that changed."""
+        with self._lock:
+            keys = index_keys(bead)
+            old = self._keys.get(bead.id)
+            self._beads[bead.id] = bead
+            if old == keys:
+                return
+            if old is not None:
+                self._unindex(bead.id)
+            self._keys[bead.id] = keys
+            for name, values in keys.items():
+                index = self._indexes[name]
+                for value in values:
+                    index.setdefault(value, set()).add(bead.id)
+
+    def upsert_many(self, beads: Iterable[Bead]) -> None:
+        """Upsert several beads."""
+        with self._lock:
+            for bead in beads:
+                self.upsert(bead)
+
+    def remove(self, bead_id: str) -> Optional[Bead]:
+        """Drop a bead; return it, or None if it was not indexed."""
+        with self._lock:
+            bead = self._beads.pop(bead_id, None)
+            if bead is not None:
+                self._unindex(bead_id)
+            return bead
+
+    def values(self, field: str) -> Dict[Any, int]:
+        """Count of beads per value of an indexed field."""
+        with self._lock:
+            return {value: len(ids) for value, ids in self._indexes[field].items()}
+
+    def _match(self, filters: Dict[str, Any]) -> AbstractSet[str]:
+        """IDs matching every filter; may be an index's own set, so never mutate it."""
+        candidates: List[Set[str]] = []
+        for name, wanted in filters.items():
+            if name not in self._indexes:
+                raise ValueError(f"cannot filter on {name}; indexed fields: {INDEXED_FIELDS}")
+            index = self._indexes[name]
+            if isinstance(wanted, (list, tuple, set, frozenset)):
+                union: Set[str] = set()
+                for value in wanted:
+                    union |= index.get(value, set())
+                candidates.append(union)
+            else:
+                candidates.append(index.get(wanted, set()))
+        if not candidates:
+            return self._beads.keys()
+        # Set intersection runs in C and iterates the smaller operand
+        candidates.sort(key=len)
+        matched = candidates[0]
+        for ids in candidates[1:]:
+            if not matched:
+                break
+            matched = matched & ids
+        return matched
+
+    def _by_priority(
+        self,
+        matched: AbstractSet[str],
+        where: Optional[Callable[[Bead], bool]],
+        descending: bool,
+        limit: Optional[int],
+    ) -> List[Bead]:
+        """Walk the priority index in order instead of sorting every match."""
+        beads: List[Bead] = []
+        index = self._indexes["priority"]
+        for priority in sorted(index, reverse=descending):
+            bucket = index[priority]
+            ids = bucket & matched if len(bucket) > len(matched) else matched & bucket
+            if where is None and limit is not None:
+                pick = heapq.nlargest if descending else heapq.nsmallest
+                ordered = pick(limit - len(beads), ids)
+            else:
+                ordered = sorted(ids, reverse=descending)
+            for bead_id in ordered:
+                bead = self._beads[bead_id]
+                if where is None or where(bead):
+                    beads.append(bead)
+                    if limit is not None and len(beads) >= limit:
+                        return beads
+        return beads
+
+    def query(
+        self,
+        where: Optional[Callable[[Bead], bool]] = None,
+        sort: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> List[Bead]:
+        """
+        Return beads matching every filter.
+
+        Args:
+            where: Extra predicate, applied only to beads the indexes match
+            sort: One of `SORT_FIELDS` (default: bead ID)
+            descending: Reverse the sort order
+            limit: Return at most this many beads
+            **filters: Indexed field -> value, or collection of values
+
+        Raises:
+            ValueError: If a filter or sort field is not supported
+        """
+        sort = sort or "id"
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"cannot sort on {sort}; sort fields: {SORT_FIELDS}")
+        with self._lock:
+            matched = self._match(filters)
+            if sort == "priority":
+                return self._by_priority(matched, where, descending, limit)
+            if sort == "id" and where is None:
+                if limit is not None and limit < len(matched):
+                    pick = heapq.nlargest if descending else heapq.nsmallest
+                    ordered = pick(limit, matched)
+                else:
+                    ordered = sorted(matched, reverse=descending)
+                return [self._beads[bead_id] for bead_id in ordered]
+            beads = [self._beads[bead_id] for bead_id in matched]
+        if where is not None:
+            beads = [bead for bead in beads if where(bead)]
+        key = _sort_key(sort)
+        if limit is not None and limit < len(beads):
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            return pick(limit, beads, key=key)
+        beads.sort(key=key, reverse=descending)
+        return beads
+
+    def count(self, **filters: Any) -> int:
+        """Number of beads matching every filter."""
+        with self._lock:
+            return len(self._match(filters))
@@ -209,6 +209,97 @@ class ScrumResult(BaseModel):
         return v
 
 
+class ExecutionHistoryRef(BaseModel):
+    """Summary of, and pointer to, execution history stored out of line."""
+
+    model_config = ConfigDict(strict=True)
+
+    store: str = Field(..., description="Location of the history store")
+    dev_execution_count: int = Field(
+        default=0, description="Dev executions recorded in the store"
+    )
+    qa_execution_count: int = Field(
+        default=0, description="QA executions recorded in the store"
+    )
+    comment_count: int = Field(default=0, description="Comments recorded in the store")
+    last_attempt: int = Field(default=0, description="Highest dev attempt recorded")
+    last_dev_status: Optional[str] = Field(
+        None, description="Status of the most recent dev execution"
+    )
+    last_qa_status: Optional[str] = Field(
+        None, description="Status of the most recent QA execution"
+    )
+
+    @field_validator(
+        "dev_execution_count", "qa_execution_count", "comment_count", "last_attempt"
+    )
+    @classmethod
+    def validate_counts(cls, v: int) -> int:
+        """Validate counts are non-negative."""
+        if v < 0:
+            raise ValueError("history counts must be >= 0")
+        return v
+
+    @field_validator("last_dev_status")
+    @classmethod
+    def validate_last_dev_status(cls, v: Optional[str]) -> Optional[str]:
+        """Validate last_dev_status is one of the allowed values."""
+        if v is not None and v not in VALID_DEV_EXECUTION_STATUS:
+            raise ValueError(
+                f"last_dev_status must be one of {VALID_DEV_EXECUTION_STATUS}, got: {v}"
+            )
+        return v
+
+    @field_validator("last_qa_status")
+    @classmethod
+    def validate_last_qa_status(cls, v: Optional[str]) -> Optional[str]:
+        """Validate last_qa_status is one of the allowed values."""
+        if v is not None and v not in VALID_QA_STATUS:
+            raise ValueError(
+                f"last_qa_status must be one of {VALID_QA_STATUS}, got: {v}"
+            )
+        return v
+
+
+class MergeRisk(BaseModel):
+    """Predicted merge-conflict risk for a merge bead (see merge_risk.py)."""
+
+    model_config = ConfigDict(strict=True)
+
+    score: float = Field(..., description="Fraction of merges expected to conflict (0-1)")
+    conflicting_pairs: int = Field(
+        default=0, description="Pairs of branches changing at least one common file"
+    )
+    overlapping_file_count: int = Field(
+        default=0, description="Files changed by more than one branch"
+    )
+    overlapping_files: List[str] = Field(
+        default_factory=list, description="The most contended overlapping files"
+    )
+    merge_order: List[str] = Field(
+        default_factory=list, description="Recommended order for branches_to_merge"
+    )
+    target_commit: Optional[str] = Field(
+        None, description="source_branch commit the prediction was made against"
+    )
+
+    @field_validator("score")
+    @classmethod
+    def validate_score(cls, v: float) -> float:
+        """Validate score is between 0 and 1."""
+        if not 0 <= v <= 1:
+            raise ValueError(f"score must be between 0 and 1, got: {v}")
+        return v
+
+    @field_validator("conflicting_pairs", "overlapping_file_count")
+    @classmethod
+    def validate_counts(cls, v: int) -> int:
+        """Validate counts are non-negative."""
+        if v < 0:
+            raise ValueError("merge risk counts must be >= 0")
+        return v
+
+
 class BeadMetadata(BaseModel):
     """Extended metadata for beads-ralph."""
 
@@ -258,6 +349,13 @@ class BeadMetadata(BaseModel):
     qa_agent_executions: List[QAExecution] = Field(
         default_factory=list, description="History of all QA agent executions"
     )
+    execution_history: Optional[ExecutionHistoryRef] = Field(
+        None, description="Out-of-line history summary (see history_store.py)"
+    )
+
+    merge_risk: Optional[MergeRisk] = Field(
+        None, description="Predicted merge-conflict risk (merge beads only)"
+    )
 
     # Output tracking
     pr_url: Optional[str] = Field(None, description="GitHub PR URL")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""msgspec mirrors of the beads-ralph pydantic models.
+
+These Structs express the same rules as `bead_schema.py` using msgspec's
+native constraints (Literal enums, numeric bounds, length and pattern
+limits), so most of validation happens in C while decoding. Rules that
+cannot be expressed as constraints call the pydantic validators directly
+from `__post_init__`, keeping a single source of truth for their logic.
+
+Use `validation_engine.py` to select between engines; it treats pydantic
+as authoritative for rejected input.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Literal, Optional
+
+import msgspec
+from msgspec import Meta
+
+import bead_schema
+from bead_schema import (
+    PHASE_PATTERN,
+    SPRINT_PATTERN,
+    VALID_DEV_EXECUTION_STATUS,
+    VALID_ISSUE_TYPES,
+    VALID_MODELS,
+    VALID_QA_STATUS,
+    VALID_STATUS,
+)
+
+
+Model = Literal[tuple(VALID_MODELS)]
+Status = Literal[tuple(VALID_STATUS)]
+QAStatus = Literal[tuple(VALID_QA_STATUS)]
+DevExecutionStatus = Literal[tuple(VALID_DEV_EXECUTION_STATUS)]
+IssueType = Literal[tuple(VALID_ISSUE_TYPES)]
+
+Attempt = Annotated[int, Meta(ge=1)]
+NonNegativeInt = Annotated[int, Meta(ge=0)]
+Priority = Annotated[int, Meta(ge=0, le=4)]
+Phase = Annotated[str, Meta(pattern=PHASE_PATTERN.pattern)]
+Sprint = Annotated[str, Meta(pattern=SPRINT_PATTERN.pattern)]
+
+
+class QAAgent(msgspec.Struct, kw_only=True):
+    """QA agent configuration."""
+
+    agent_path: str
+    model: Model
+    prompt: str
+    input_schema: Optional[Dict[str, Any]] = None
+    output_schema: Dict[str, Any]
+
+    def __post_init__(self):
+        bead_schema.QAAgent.validate_output_schema(self.output_schema)
+
+
+class DevExecution(msgspec.Struct, kw_only=True):
+    """Dev execution tracking."""
+
+    attempt: Attempt
+    session_id: str
+    agent_path: str
+    model: Model
+    started_at: datetime
+    completed_at: datetime
+    status: DevExecutionStatus
+    feedback_from_qa: Optional[str] = None
+
+
+class QAExecution(msgspec.Struct, kw_only=True):
+    """QA execution tracking."""
+
+    attempt: Attempt
+    session_id: str
+    agent_path: str
+    model: Model
+    started_at: datetime
+    completed_at: datetime
+    status: QAStatus
+    message: str
+    details: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class QAResult(msgspec.Struct, kw_only=True):
+    """QA result summary in scrum result."""
+
+    agent_path: str
+    status: QAStatus
+    message: str
+    details: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class ScrumResult(msgspec.Struct, kw_only=True):
+    """Scrum-master result."""
+
+    bead_id: str
+    success: bool
+    pr_url: Optional[str] = None
+    pr_number: Optional[int] = None
+    bead_updated: bool
+    attempt_count: NonNegativeInt
+    qa_results: List[QAResult] = msgspec.field(default_factory=list)
+    error: Optional[str] = None
+    fatal: bool
+
+
+class ExecutionHistoryRef(msgspec.Struct, kw_only=True):
+    """Summary of, and pointer to, execution history stored out of line."""
+
+    store: str
+    dev_execution_count: NonNegativeInt = 0
+    qa_execution_count: NonNegativeInt = 0
+    comment_count: NonNegativeInt = 0
+    last_attempt: NonNegativeInt = 0
+    last_dev_status: Optional[DevExecutionStatus] = None
+    last_qa_status: Optional[QAStatus] = None
+
+
+class MergeRisk(msgspec.Struct, kw_only=True):
+    """Predicted merge-conflict risk for a merge bead."""
+
+    score: Annotated[float, Meta(ge=0, le=1)]
+    conflicting_pairs: NonNegativeInt = 0
+    overlapping_file_count: NonNegativeInt = 0
+    overlapping_files: List[str] = msgspec.field(default_factory=list)
+    merge_order: List[str] = msgspec.field(default_factory=list)
+    target_commit: Optional[str] = None
+
+
+class BeadMetadata(msgspec.Struct, kw_only=True):
+    """Extended metadata for beads-ralph."""
+
+    worktree_path: str
+    branch: str
+    source_branch: str
+    phase: Phase
+    sprint: Sprint
+    plan_file: str
+    plan_section: str
+    plan_sprint_id: str
+    branches_to_merge: Optional[List[str]] = None
+    dev_agent_path: str
+    dev_model: Model
+    dev_prompts: Annotated[List[str], Meta(min_length=1)]
+    qa_agents: Annotated[List[QAAgent], Meta(min_length=1)]
+    max_retry_attempts: Attempt = 3
+    attempt_count: NonNegativeInt = 0
+    scrum_master_session_id: Optional[str] = None
+    dev_agent_session_id: Optional[str] = None
+    dev_agent_executions: List[DevExecution] = msgspec.field(default_factory=list)
+    qa_agent_executions: List[QAExecution] = msgspec.field(default_factory=list)
+    execution_history: Optional[ExecutionHistoryRef] = None
+    merge_risk: Optional[MergeRisk] = None
+    pr_url: Optional[str] = None
+    pr_number: Optional[int] = None
+    scrum_result: Optional[ScrumResult] = None
+
+
+class Bead(msgspec.Struct, kw_only=True):
+    """Complete bead model."""
+
+    id: str
+    title: str
+    description: str
+    status: Status
+    priority: Priority
+    issue_type: IssueType
+    assignee: Literal["beads-ralph-scrum-master"]
+    owner: Optional[str] = None
+    dependencies: List[str] = msgspec.field(default_factory=list)
+    labels: List[str] = msgspec.field(default_factory=list)
+    comments: List[Dict[str, Any]] = msgspec.field(default_factory=list)
+    metadata: BeadMetadata
+    external_ref: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    closed_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        bead_schema.Bead.validate_title(self.title)
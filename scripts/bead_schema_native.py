@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""pydantic models expressing the beads-ralph rules as pydantic-core constraints.
+
+`bead_schema.py` checks enums, ranges, patterns and non-empty lists in
+Python `@field_validator`s, so every field rule costs a Python call per
+bead (and per nested execution). These mirrors express the same rules as
+`Literal` types and `Annotated` constraints (`ge`/`le`, `min_length`,
+`pattern`) that pydantic-core checks while parsing, without calling back
+into Python validators. The one rule that is not a constraint (the QA
+output schema shape) reuses the `bead_schema` validator.
+
+Patterns use the `python-re` engine so they match exactly what
+`PHASE_PATTERN`/`SPRINT_PATTERN` match, and a title needs one
+non-whitespace character (NON_BLANK), which is what `str.strip()` keeps.
+Use `validation_engine.py` to select this mode; it re-validates rejected
+input with `bead_schema`, so error messages are the canonical ones.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Literal, Optional
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+import bead_schema
+from bead_schema import (
+    PHASE_PATTERN,
+    SPRINT_PATTERN,
+    VALID_DEV_EXECUTION_STATUS,
+    VALID_ISSUE_TYPES,
+    VALID_MODELS,
+    VALID_QA_STATUS,
+    VALID_STATUS,
+)
+
+Model = Literal[tuple(VALID_MODELS)]
+Status = Literal[tuple(VALID_STATUS)]
+QAStatus = Literal[tuple(VALID_QA_STATUS)]
+DevExecutionStatus = Literal[tuple(VALID_DEV_EXECUTION_STATUS)]
+IssueType = Literal[tuple(VALID_ISSUE_TYPES)]
+
+Attempt = Annotated[int, Field(ge=1)]
+NonNegativeInt = Annotated[int, Field(ge=0)]
+Priority = Annotated[int, Field(ge=0, le=4)]
+Score = Annotated[float, Field(ge=0, le=1)]
+Phase = Annotated[str, Field(pattern=PHASE_PATTERN.pattern)]
+Sprint = Annotated[str, Field(pattern=SPRINT_PATTERN.pattern)]
+# A non-whitespace character: str.isspace() is re's `\s` for str patterns
+NON_BLANK = r"\S"
+
+Title = Annotated[str, Field(pattern=NON_BLANK)]
+OutputSchema = Annotated[
+    Dict[str, Any], AfterValidator(bead_schema.QAAgent.validate_output_schema)
+]
+
+_CONFIG = ConfigDict(strict=True, regex_engine="python-re")
+
+
+class QAAgent(BaseModel):
+    """QA agent configuration."""
+
+    model_config = _CONFIG
+
+    agent_path: str
+    model: Model
+    prompt: str
+    input_schema: Optional[Dict[str, Any]] = None
+    output_schema: OutputSchema
+
+
+class DevExecution(BaseModel):
+    """Dev execution tracking."""
+
+    model_config = _CONFIG
+
+    attempt: Attempt
+    session_id: str
+    agent_path: str
+    model: Model
+    started_at: datetime
+    completed_at: datetime
+    status: DevExecutionStatus
+    feedback_from_qa: Optional[str] = None
+
+
+class QAExecution(BaseModel):
+    """QA execution tracking."""
+
+    model_config = _CONFIG
+
+    attempt: Attempt
+    session_id: str
+    agent_path: str
+    model: Model
+    started_at: datetime
+    completed_at: datetime
+    status: QAStatus
+    message: str
+    details: Dict[str, Any] = Field(default_factory=dict)
+
+
+class QAResult(BaseModel):
+    """QA result summary in scrum result."""
+
+    model_config = _CONFIG
+
+    agent_path: str
+    status: QAStatus
+    message: str
+    details: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ScrumResult(BaseModel):
+    """Scrum-master result."""
+
+    model_config = _CONFIG
+
+    bead_id: str
+    success: bool
+    pr_url: Optional[str] = None
+    pr_number: Optional[int] = None
+    bead_updated: bool
+    attempt_count: NonNegativeInt
+    qa_results: List[QAResult] = Field(default_factory=list)
+    error: Optional[str] = None
+    fatal: bool
+
+
+class ExecutionHistoryRef(BaseModel):
+    """Summary of, and pointer to, execution history stored out of line."""
+
+    model_config = _CONFIG
+
+    store: str
+    dev_execution_count: NonNegativeInt = 0
+    qa_execution_count: NonNegativeInt = 0
+    comment_count: NonNegativeInt = 0
+    last_attempt: NonNegativeInt = 0
+    last_dev_status: Optional[DevExecutionStatus] = None
+    last_qa_status: Optional[QAStatus] = None
+
+
+class MergeRisk(BaseModel):
+    """Predicted merge-conflict risk for a merge bead."""
+
+    model_config = _CONFIG
+
+    score: Score
+    conflicting_pairs: NonNegativeInt = 0
+    overlapping_file_count: NonNegativeInt = 0
+    overlapping_files: List[str] = Field(default_factory=list)
+    merge_order: List[str] = Field(default_factory=list)
+    target_commit: Optional[str] = None
+
+
+class BeadMetadata(BaseModel):
+    """Extended metadata for beads-ralph."""
+
+    model_config = _CONFIG
+
+    worktree_path: str
+    branch: str
+    source_branch: str
+    phase: Phase
+    sprint: Sprint
+    plan_file: str
+    plan_section: str
+    plan_sprint_id: str
+    branches_to_merge: Optional[List[str]] = None
+    dev_agent_path: str
+    dev_model: Model
+    dev_prompts: Annotated[List[str], Field(min_length=1)]
+    qa_agents: Annotated[List[QAAgent], Field(min_length=1)]
+    max_retry_attempts: Attempt = 3
+    attempt_count: NonNegativeInt = 0
+    scrum_master_session_id: Optional[str] = None
+    dev_agent_session_id: Optional[str] = None
+    dev_agent_executions: List[DevExecution] = Field(default_factory=list)
+    qa_agent_executions: List[QAExecution] = Field(default_factory=list)
+    execution_history: Optional[ExecutionHistoryRef] = None
+    merge_risk: Optional[MergeRisk] = None
+    pr_url: Optional[str] = None
+    pr_number: Optional[int] = None
+    scrum_result: Optional[ScrumResult] = None
+
+
+class Bead(BaseModel):
+    """Complete bead model."""
+
+    model_config = _CONFIG
+
+    id: str
+    title: Title
+    description: str
+    status: Status
+    priority: Priority
+    issue_type: IssueType
+    assignee: Literal["beads-ralph-scrum-master"]
+    owner: Optional[str] = None
+    dependencies: List[str] = Field(default_factory=list)
+    labels: List[str] = Field(default_factory=list)
+    comments: List[Dict[str, Any]] = Field(default_factory=list)
+    metadata: BeadMetadata
+    external_ref: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    closed_at: Optional[datetime] = None
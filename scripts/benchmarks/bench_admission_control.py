@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark: launch goodput against a rate-limited stand-in, fixed vs admitted."""
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from admission_control import AdmissionController, ModelLimit, TokenBucket
+
+
+class RateLimitedService:
+    """
+    Stand-in API: a server-side token bucket; over-limit calls get a 429.
+
+    Like request-per-minute limits, rejected attempts still count: each
+    429 pushes the bucket further into debt (down to -`burst`), so
+    hammering the service lowers its goodput.
+    """
+
+    def __init__(self, rate, burst, latency):
+        self.bucket = TokenBucket(rate, burst, now=time.monotonic())
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.ok = 0
+        self.rejected = 0
+
+    def launch(self):
+        """Return True if the launch was accepted, False on a 429."""
+        with self.lock:
+            accepted = self.bucket.take(time.monotonic()) == 0.0
+            if accepted:
+                self.ok += 1
+            else:
+                self.rejected += 1
+                self.bucket.tokens = max(-self.bucket.burst, self.bucket.tokens - 1)
+        time.sleep(self.latency)
+        return accepted
+
+
+def fixed_worker(service, base_backoff, deadline):
+    """Launch back to back; on a 429 sleep with jittered exponential backoff."""
+    failures = 0
+    while time.monotonic() < deadline:
+        if service.launch():
+            failures = 0
+        else:
+            time.sleep(base_backoff * 2**failures * random.uniform(0.5, 1.5))
+            failures = min(failures + 1, 6)
+
+
+def admitted_worker(path, limits, service, deadline):
+    """Ask the shared controller before every launch and report the outcome."""
+    with AdmissionController(path, limits, base_backoff=0.05, max_backoff=1.0) as controller:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not controller.acquire("sonnet", timeout=remaining):
+                return
+            if service.launch():
+                controller.report_success("sonnet")
+            else:
+                controller.report_rate_limited("sonnet")
+
+
+def run(target, args_for, workers, seconds):
+    """Run `workers` threads of `target` until the deadline."""
+    deadline = time.monotonic() + seconds
+    threads = [
+        threading.Thread(target=target, args=args_for(n) + (deadline,)) for n in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=float, default=20.0, help="Server launches/s allowed")
+    parser.add_argument("--burst", type=float, default=5.0, help="Server burst")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per call")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="Fixed-concurrency levels")
+    parser.add_argument("--backoff", type=float, default=0.5, help="Fixed clients' first backoff")
+    parser.add_argument("--workers", type=int, default=64, help="Admitted launcher threads")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Run time per scenario")
+    args = parser.parse_args()
+
+    print(f"server limit {args.rate:.0f}/s, burst {args.burst:.0f}, latency {args.latency}s")
+    for workers in [int(x) for x in args.concurrency.split(",")]:
+        service = RateLimitedService(args.rate, args.burst, args.latency)
+        run(fixed_worker, lambda n: (service, args.backoff), workers, args.seconds)
+        print(
+            f"fixed    x{workers:3d}: {service.ok / args.seconds:6.1f} launches/s, "
+            f"{service.rejected:5d} rate-limited"
+        )
+
+    # Configured 25% above the true limit, so AIMD has to find it
+    limits = {"sonnet": ModelLimit(rate=args.rate * 1.25, burst=args.burst)}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "admission.db")
+        AdmissionController(path, limits).close()
+        service = RateLimitedService(args.rate, args.burst, args.latency)
+        run(admitted_worker, lambda n: (path, limits, service), args.workers, args.seconds)
+    print(
+        f"admitted x{args.workers:3d}: {service.ok / args.seconds:6.1f} launches/s, "
+        f"{service.rejected:5d} rate-limited"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark: async bd fetch + validation speedup across concurrency levels."""
+
+import argparse
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from async_validation import validate_beads_sync
+from corpus import make_corpus
+
+FAKE_BD = Path(__file__).resolve().parent.parent / "tests" / "fake_bd.py"
+
+# Shell stub for `bd show <id> --json`: near-zero CPU, so the benchmark
+# measures latency overlap rather than Python interpreter start-up.
+SHELL_STUB = """#!/bin/sh
+sleep "$FAKE_BD_DELAY"
+printf '['
+cat "$FAKE_BD_DIR/$2.json"
+printf ']'
+"""
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=64, help="Beads to fetch")
+    parser.add_argument("--delay", type=float, default=0.1, help="Simulated bd latency (s)")
+    parser.add_argument(
+        "--stub",
+        choices=["sh", "python"],
+        default="sh",
+        help="Shell stub (latency only) or fake_bd.py (includes interpreter start-up)",
+    )
+    parser.add_argument(
+        "--levels", default="1,2,4,8,16,32", help="Comma-separated concurrency levels"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as store:
+        ids = []
+        for bead in make_corpus(args.count, history=3):
+            (Path(store) / f"{bead['id']}.json").write_text(json.dumps(bead))
+            ids.append(bead["id"])
+        os.environ["FAKE_BD_DIR"] = store
+        os.environ["FAKE_BD_DELAY"] = str(args.delay)
+        if args.stub == "sh":
+            stub = Path(store) / "bd-stub.sh"
+            stub.write_text(SHELL_STUB)
+            stub.chmod(stub.stat().st_mode | stat.S_IEXEC)
+            bd_command = [str(stub)]
+        else:
+            bd_command = [sys.executable, str(FAKE_BD)]
+
+        baseline = None
+        print(f"beads: {args.count}  simulated bd latency: {args.delay}s")
+        for level in [int(x) for x in args.levels.split(",")]:
+            start = time.perf_counter()
+            results = validate_beads_sync(ids, concurrency=level, bd_command=bd_command)
+            elapsed = time.perf_counter() - start
+            assert all(r.valid for r in results)
+            baseline = baseline or elapsed
+            print(
+                f"concurrency {level:3d}: {elapsed:7.2f}s  "
+                f"{args.count / elapsed:7.1f} beads/s  speedup {baseline / elapsed:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark: naive per-bead bd calls vs the pooled, batched BdClient."""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bd_client import BdClient, parse_beads
+from corpus import make_corpus
+
+FAKE_BD = [sys.executable, str(Path(__file__).resolve().parent.parent / "tests" / "fake_bd.py")]
+
+
+def naive(ids, updates):
+    """One `bd show` per bead and one `bd update` per field change."""
+    calls = 0
+    for bead_id in ids:
+        out = subprocess.run([*FAKE_BD, "show", bead_id, "--json"], capture_output=True, check=True)
+        parse_beads(out.stdout)
+        calls += 1
+    for bead_id in ids[:updates]:
+        out = subprocess.run([*FAKE_BD, "show", bead_id, "--json"], capture_output=True, check=True)
+        metadata = json.loads(out.stdout)[0]["metadata"]
+        for change in ({"attempt_count": 1}, {"scrum_master_session_id": "bench"}):
+            metadata.update(change)
+            subprocess.run(
+                [*FAKE_BD, "update", bead_id, "--metadata", json.dumps(metadata)], check=True
+            )
+        subprocess.run([*FAKE_BD, "update", bead_id, "--status", "in_progress"], check=True)
+        calls += 4
+    return calls
+
+
+def batched(ids, updates, pool_size, batch_size):
+    """Batched reads and coalesced writes through BdClient."""
+    with BdClient(FAKE_BD, pool_size=pool_size, batch_size=batch_size) as client:
+        client.show_many(ids)
+        for bead_id in ids[:updates]:
+            client.update(bead_id, metadata={"attempt_count": 1})
+            client.update(bead_id, metadata={"scrum_master_session_id": "bench"})
+            client.update(bead_id, status="in_progress")
+    return client.calls
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100, help="Beads to read")
+    parser.add_argument("--updates", type=int, default=10, help="Beads to update")
+    parser.add_argument("--delay", type=float, default=0.0, help="Extra simulated bd latency (s)")
+    parser.add_argument("--pool-size", type=int, default=4, help="BdClient worker pool size")
+    parser.add_argument("--batch-size", type=int, default=50, help="IDs per bd show call")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as store:
+        for bead in make_corpus(args.count, history=3):
+            (Path(store) / f"{bead['id']}.json").write_text(json.dumps(bead))
+        ids = sorted(p.stem for p in Path(store).glob("*.json"))
+        os.environ["FAKE_BD_DIR"] = store
+        os.environ["FAKE_BD_DELAY"] = str(args.delay)
+
+        print(f"beads read: {args.count}  beads updated: {args.updates}")
+        results = {}
+        for name, run in (
+            ("naive", lambda: naive(ids, args.updates)),
+            ("batched", lambda: batched(ids, args.updates, args.pool_size, args.batch_size)),
+        ):
+            start = time.perf_counter()
+            calls = run()
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(
+                f"{name:8s}: {elapsed:7.2f}s  bd calls {calls:5d}  "
+                f"{args.count / elapsed:8.1f} bead reads/s"
+            )
+        print(f"speedup: {results['naive'] / results['batched']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark: closed-bead archive size, point reads and live-set scans."""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bead_archive import ArchiveWriter, BeadArchive, archive_closed
+from bead_delta import canonical_json
+from bead_schema import Bead
+from corpus import make_corpus
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--beads", type=int, default=50_000, help="Beads in the store")
+    parser.add_argument("--history", type=int, default=3, help="Dev/QA attempts per bead")
+    parser.add_argument("--reads", type=int, default=2000, help="Random point reads")
+    args = parser.parse_args()
+
+    beads = [
+        Bead.model_validate_json(json.dumps(data)) for data in make_corpus(args.beads, args.history)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        everything = Path(tmp) / "beads.jsonl"
+        with open(everything, "w") as out:
+            for bead in beads:
+                out.write(canonical_json(bead) + "\n")
+
+        archive_path = str(Path(tmp) / "closed.arc")
+        live_path = Path(tmp) / "live.jsonl"
+        start = time.perf_counter()
+        with ArchiveWriter(archive_path) as writer, open(live_path, "w") as live:
+            for bead in archive_closed(beads, writer):
+                live.write(canonical_json(bead) + "\n")
+        seconds = time.perf_counter() - start
+        closed_raw = everything.stat().st_size - live_path.stat().st_size
+        archived = os.path.getsize(archive_path)
+        print(
+            f"archive:  {writer.count} closed beads in {seconds:5.2f}s, "
+            f"{closed_raw / 1e6:7.1f} MB -> {archived / 1e6:6.1f} MB "
+            f"({closed_raw / archived:4.1f}x)"
+        )
+
+        for label, path in [("scan all", everything), ("scan live", live_path)]:
+            start = time.perf_counter()
+            with open(path, "rb") as f:
+                count = sum(1 for line in f if b'"status":"in_progress"' in line)
+            print(f"{label}: {time.perf_counter() - start:6.3f}s ({count} in progress)")
+
+        closed_ids = [bead.id for bead in beads if bead.status == "closed"]
+        sample = random.Random(3).sample(closed_ids, min(args.reads, len(closed_ids)))
+        with BeadArchive(archive_path) as archive:
+            start = time.perf_counter()
+            for bead_id in sample:
+                archive.get(bead_id)
+            seconds = time.perf_counter() - start
+        print(f"archive get: {seconds / len(sample) * 1e6:7.1f} us/bead ({len(sample)} reads)")
+        start = time.perf_counter()
+        needle = f'"id":"{sample[0]}"'.encode()
+        with open(everything, "rb") as f:
+            Bead.model_validate_json(next(line for line in f if needle in line))
+        print(f"JSONL scan for one bead: {(time.perf_counter() - start) * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark: delta export vs full re-export of a bead store."""
+
+import argparse
+import io
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bead_delta import HashSnapshot, canonical_json, export_delta
+from bead_schema import Bead
+from corpus import make_corpus
+
+
+def make_beads(count, history):
+    """Validated beads from the shared benchmark corpus."""
+    return [Bead.model_validate_json(json.dumps(data)) for data in make_corpus(count, history)]
+
+
+def touch(bead, n):
+    """A typical loop update: bump the attempt and record the session."""
+    metadata = bead.metadata.model_copy(
+        update={"attempt_count": 1, "scrum_master_session_id": f"sm-{n}"}
+    )
+    return bead.model_copy(update={"metadata": metadata})
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--beads", type=int, default=100_000, help="Beads in the store")
+    parser.add_argument("--history", type=int, default=2, help="Dev/QA attempts per bead")
+    parser.add_argument("--changed", type=float, default=0.01, help="Fraction changed")
+    args = parser.parse_args()
+
+    beads = make_beads(args.beads, args.history)
+    rng = random.Random(7)
+    for n, i in enumerate(rng.sample(range(len(beads)), int(len(beads) * args.changed))):
+        beads[i] = touch(beads[i], n)
+
+    start = time.perf_counter()
+    full = sum(len(canonical_json(bead).encode()) + 1 for bead in beads)
+    full_seconds = time.perf_counter() - start
+    print(f"full export:   {full / 1e6:8.2f} MB in {full_seconds:5.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with HashSnapshot(str(Path(tmp) / "snapshot.db")) as snapshot:
+            export_delta(make_beads(args.beads, args.history), snapshot, io.StringIO())
+            start = time.perf_counter()
+            stats = export_delta(beads, snapshot, io.StringIO())
+            seconds = time.perf_counter() - start
+    print(
+        f"delta export:  {stats.delta_bytes / 1e6:8.2f} MB in {seconds:5.2f}s "
+        f"({stats.patched} patched, {stats.unchanged} unchanged), "
+        f"{100 * stats.delta_bytes / stats.full_bytes:.2f}% of the full bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
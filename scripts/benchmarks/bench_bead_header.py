@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark: header-only projection vs full bead validation."""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from bead_header import header_parser
+from bead_schema import Bead
+from corpus import make_bead
+from validation_engine import get_validator
+
+
+def make_lines(count, history, description_size):
+    """JSON lines of large beads, as in `bd export`."""
+    return [
+        json.dumps(make_bead(i, history=history, description_size=description_size)).encode()
+        for i in range(count)
+    ]
+
+
+def measure(parse, lines, retained):
+    """Seconds to parse every line, and bytes held by the first `retained` results."""
+    start = time.perf_counter()
+    for line in lines:
+        parse(line)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    kept = [parse(line) for line in lines[:retained]]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return seconds, size / retained
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--beads", type=int, default=100_000, help="Beads to parse")
+    parser.add_argument("--history", type=int, default=3, help="Dev/QA attempts per bead")
+    parser.add_argument("--description-size", type=int, default=1000, help="Description chars")
+    parser.add_argument("--retained", type=int, default=5000, help="Results kept for memory")
+    args = parser.parse_args()
+
+    lines = make_lines(args.beads, args.history, args.description_size)
+    megabytes = sum(len(line) for line in lines) / 1e6
+    print(f"{args.beads} beads, {megabytes:.0f} MB of JSON")
+    results = {}
+    for label, parse in [
+        ("pydantic Bead", Bead.model_validate_json),
+        ("msgspec Bead", get_validator("Bead", "msgspec")),
+        ("header", header_parser()),
+    ]:
+        seconds, per_bead = measure(parse, lines, min(args.retained, len(lines)))
+        results[label] = seconds
+        print(
+            f"{label:14s} {seconds:7.2f}s ({args.beads / seconds:9.0f} beads/s), "
+            f"{per_bead:7.0f} bytes retained per bead"
+        )
+    print(f"header speed-up vs pydantic: {results['pydantic Bead'] / results['header']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark: patch-level validation versus full re-validation of a bead."""
+
+import argparse
+import json
+import time
+from datetime import timedelta
+
+from bead_patch import apply_merge_patch, merge_patch
+from bead_schema import Bead
+from corpus import BASE_TIME, make_bead, make_dev_execution
+
+
+def timed(func, repeat):
+    """Return mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", type=int, default=1000, help="Executions per bead")
+    parser.add_argument("--repeat", type=int, default=50, help="Iterations per case")
+    args = parser.parse_args()
+
+    bead_json = make_bead(0, history=args.history)
+    bead = Bead.model_validate_json(json.dumps(bead_json))
+    new_execution = make_dev_execution(
+        args.history + 1, BASE_TIME + timedelta(days=1)
+    )
+    status_patch = {"status": "in_progress", "metadata": {"attempt_count": args.history + 1}}
+    full_history = bead_json["metadata"]["dev_agent_executions"] + [new_execution]
+    replace_patch = {"metadata": {"dev_agent_executions": full_history}}
+
+    full = timed(
+        lambda: Bead.model_validate_json(json.dumps(merge_patch(bead_json, status_patch))),
+        args.repeat,
+    )
+    status = timed(lambda: apply_merge_patch(bead, status_patch), args.repeat)
+    append = timed(
+        lambda: apply_merge_patch(
+            bead, status_patch, append={"metadata.dev_agent_executions": [new_execution]}
+        ),
+        args.repeat,
+    )
+    replace = timed(lambda: apply_merge_patch(bead, replace_patch), args.repeat)
+
+    print(f"history entries:            {args.history}")
+    print(f"full validation:            {full * 1e3:8.3f} ms")
+    print(f"patch status:               {status * 1e3:8.3f} ms  ({full / status:,.0f}x)")
+    print(f"patch status + append:      {append * 1e3:8.3f} ms  ({full / append:,.0f}x)")
+    print(f"patch replacing history:    {replace * 1e3:8.3f} ms  ({full / replace:,.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark: indexed bead queries vs a linear scan over every bead."""
+
+import argparse
+import json
+import random
+import time
+
+from bead_query import BeadIndex, last_qa_status
+from bead_schema import VALID_QA_STATUS, VALID_STATUS, Bead
+from corpus import make_bead
+
+PHASES = ["1", "2", "3a", "3b", "4", "5"]
+
+
+def make_beads(count, seed=0):
+    """Beads spread over phases, statuses, types and QA outcomes."""
+    rng = random.Random(seed)
+    beads = []
+    for i in range(count):
+        phase = rng.choice(PHASES)
+        data = make_bead(
+            i, history=1, status=rng.choice(VALID_STATUS), phase=phase, sprint=f"{phase}.{i % 4}"
+        )
+        if rng.random() < 0.1:
+            data["issue_type"] = "beads-ralph-merge"
+        data["metadata"]["qa_agent_executions"][-1]["status"] = rng.choice(VALID_QA_STATUS)
+        beads.append(Bead.model_validate_json(json.dumps(data)))
+    return beads
+
+
+def timed(fn, repeat):
+    """Best-of-`repeat` seconds and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--beads", type=int, default=100_000, help="Beads in the store")
+    parser.add_argument("--repeat", type=int, default=20, help="Best of N runs")
+    args = parser.parse_args()
+
+    beads = make_beads(args.beads)
+    seconds, index = timed(lambda: BeadIndex(beads), 1)
+    print(f"build index: {seconds:6.3f}s for {len(index)} beads")
+
+    filters = {
+        "status": "open",
+        "issue_type": "beads-ralph-merge",
+        "phase": "3a",
+        "last_qa_status": "fail",
+    }
+
+    def scan():
+        return [
+            bead
+            for bead in beads
+            if bead.status == "open"
+            and bead.issue_type == "beads-ralph-merge"
+            and bead.metadata.phase == "3a"
+            and last_qa_status(bead) == "fail"
+        ]
+
+    scan_seconds, expected = timed(scan, 3)
+    seconds, found = timed(lambda: index.query(**filters), args.repeat)
+    assert sorted(b.id for b in found) == sorted(b.id for b in expected)
+    print(f"linear scan:   {scan_seconds * 1e3:8.3f} ms ({len(expected)} beads)")
+    print(f"indexed query: {seconds * 1e3:8.3f} ms ({len(found)} beads)")
+    seconds, _ = timed(
+        lambda: index.query(status="open", sort="priority", limit=20), args.repeat
+    )
+    print(f"top 20 open by priority: {seconds * 1e3:8.3f} ms")
+
+    status = "open" if beads[0].status == "closed" else "closed"
+    updated = beads[0].model_copy(update={"status": status})
+    seconds, _ = timed(lambda: (index.upsert(updated), index.upsert(beads[0])), args.repeat)
+    print(f"incremental upsert (status change): {seconds / 2 * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark: one `git for-each-ref` for a whole plan vs one `git rev-parse` per branch."""
+
+import argparse
+import json
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from bead_schema import Bead
+from branch_check import check_branches, check_repo
+from corpus import make_bead
+from git_utils import GitCommandError, run_git
+
+
+def make_plan(merge_beads, fan_in):
+    """Work beads, each group of `fan_in` integrated by one merge bead."""
+    beads = []
+    for m in range(merge_beads):
+        work = [make_bead(m * (fan_in + 1) + k, sprint=f"1.{m + 1}") for k in range(fan_in)]
+        for bead in work:
+            # `main/...` branch names cannot coexist with a local `main` branch
+            bead["metadata"]["branch"] = bead["metadata"]["branch"].replace("main/", "plan/")
+        merge = make_bead(m * (fan_in + 1) + fan_in, dependencies=[b["id"] for b in work])
+        merge["issue_type"] = "beads-ralph-merge"
+        merge["metadata"]["branch"] = f"plan/merge-{m}"
+        merge["metadata"]["branches_to_merge"] = [b["metadata"]["branch"] for b in work]
+        beads.extend(work + [merge])
+    return [Bead.model_validate_json(json.dumps(bead)) for bead in beads]
+
+
+def make_repo(path, branches):
+    """A repository with one commit and every branch in `branches` pointing at it."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    git = ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "init"], check=True)
+    head = run_git(str(path), ["rev-parse", "HEAD"])
+    commands = "".join(f"create refs/heads/{branch} {head}\n" for branch in branches)
+    run_git(str(path), ["update-ref", "--stdin"], stdin=commands)
+
+
+def per_branch(repo, beads):
+    """Resolve each distinct referenced branch with its own git call."""
+    names = {bead.metadata.source_branch for bead in beads}
+    for bead in beads:
+        names.update(bead.metadata.branches_to_merge or ())
+    existing = set()
+    for name in names:
+        try:
+            run_git(repo, ["rev-parse", "--verify", "--quiet", f"refs/heads/{name}"])
+            existing.add(name)
+        except GitCommandError:
+            pass
+    return check_branches(beads, existing), len(names)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merge-beads", type=int, default=1000, help="Merge beads in the plan")
+    parser.add_argument("--fan-in", type=int, default=3, help="Branches merged per merge bead")
+    args = parser.parse_args()
+
+    beads = make_plan(args.merge_beads, args.fan_in)
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        # Every second work branch already exists; the rest are still to be created
+        work = [b.metadata.branch for b in beads if b.issue_type == "beads-ralph-work"]
+        make_repo(repo, work[::2])
+
+        start = time.perf_counter()
+        baseline, calls = per_branch(str(repo), beads)
+        slow = time.perf_counter() - start
+        print(f"rev-parse per branch:  {slow:7.3f}s ({calls} git calls)")
+
+        start = time.perf_counter()
+        report = check_repo(beads, str(repo))
+        fast = time.perf_counter() - start
+        print(
+            f"one for-each-ref:      {fast:7.3f}s (1 git call, {len(report.refs)} references, "
+            f"{len(report.pending)} pending, {len(report.missing)} missing), "
+            f"{slow / fast:.0f}x faster"
+        )
+        assert [r.status for r in report.refs] == [r.status for r in baseline.refs]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark: claim/renew/release throughput from many processes."""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from claim_manager import ClaimManager
+
+
+def worker(path, owner, beads, seconds, start_at, results):
+    """Cycle claim -> renew -> release until the deadline; report op counts."""
+    manager = ClaimManager(path, ttl=30)
+    ops = claims = 0
+    i = 0
+    while time.time() < start_at:
+        time.sleep(0.001)
+    deadline = start_at + seconds
+    while time.time() < deadline:
+        lease = manager.claim(beads[i % len(beads)], owner)
+        ops += 1
+        i += 1
+        if lease is not None:
+            claims += 1
+            manager.renew(lease)
+            manager.release(lease)
+            ops += 2
+    manager.close()
+    results.put((ops, claims))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", default="1,2,4,8,16", help="Process counts")
+    parser.add_argument("--beads", type=int, default=64, help="Distinct beads contended")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Run time per level")
+    args = parser.parse_args()
+
+    beads = [f"bd-{i:04d}" for i in range(args.beads)]
+    for count in [int(x) for x in args.processes.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "claims.db")
+            ClaimManager(path).close()
+            results = multiprocessing.Queue()
+            start_at = time.time() + 0.5
+            procs = [
+                multiprocessing.Process(
+                    target=worker,
+                    args=(path, f"sm-{n}", beads[n:] + beads[:n], args.seconds, start_at, results),
+                )
+                for n in range(count)
+            ]
+            for proc in procs:
+                proc.start()
+            outcomes = [results.get() for _ in procs]
+            for proc in procs:
+                proc.join()
+        ops = sum(o for o, _ in outcomes)
+        claims = sum(c for _, c in outcomes)
+        print(
+            f"processes {count:3d}: {ops / args.seconds:8.0f} ops/s "
+            f"({claims / args.seconds:7.0f} successful claims/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Benchmark: critical-path analysis time should grow linearly with plan size."""
+
+import argparse
+import json
+import time
+
+from bead_schema import Bead
+from corpus import make_plan
+from critical_path import analyze, split_candidates
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="2500,5000,10000,20000", help="Plan sizes")
+    parser.add_argument("--beads-per-sprint", type=int, default=20)
+    parser.add_argument(
+        "--intra-sprint", type=float, default=0.3, help="Chance of a same-sprint dependency"
+    )
+    args = parser.parse_args()
+
+    for size in [int(x) for x in args.sizes.split(",")]:
+        beads = [
+            Bead.model_validate_json(json.dumps(bead))
+            for bead in make_plan(
+                size,
+                beads_per_sprint=args.beads_per_sprint,
+                intra_sprint=args.intra_sprint,
+            )
+        ]
+        start = time.perf_counter()
+        analysis = analyze(beads)
+        analyzed = time.perf_counter() - start
+        start = time.perf_counter()
+        candidates = split_candidates(beads, analysis)
+        ranked = time.perf_counter() - start
+        print(
+            f"{size:6d} beads: analyze {analyzed * 1000:7.1f} ms "
+            f"({analyzed / size * 1e6:5.1f} us/bead), "
+            f"top {len(candidates)} splits {ranked * 1000:7.1f} ms, "
+            f"critical path {len(analysis.path)} beads"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark: one-pass gastown field scanner vs a regex search per key."""
+
+import argparse
+import random
+import re
+import time
+
+from gastown_fields import FIELD_TYPES, parse_description, parse_descriptions
+
+PROSE = (
+    "Implement the endpoint and keep the existing patterns in services/auth/. "
+    "Note: tests must cover the error paths. See the design doc for details.\n"
+)
+
+
+def make_descriptions(count, encoded, seed=0):
+    """Human descriptions; a fraction also carry gastown fields."""
+    rng = random.Random(seed)
+    descriptions = []
+    for i in range(count):
+        text = PROSE * rng.randint(2, 6)
+        if rng.random() < encoded:
+            text += (
+                f"\nrole_type: polecat\nrig: rig-{i % 7}\nagent_state: working\n"
+                f"hook_bead: bd-{i:06x}\ncleanup_status: clean\nretry_count: {i % 4}\n"
+            )
+        descriptions.append(text)
+    return descriptions
+
+
+def per_key_baseline(description, patterns):
+    """Line-by-line style: one regex search per known key."""
+    found = {}
+    for name, pattern in patterns:
+        match = pattern.search(description)
+        if match:
+            found[name] = match.group(1).strip()
+    return found
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=100_000, help="Descriptions")
+    parser.add_argument("--encoded", type=float, default=0.3, help="Fraction with fields")
+    args = parser.parse_args()
+
+    descriptions = make_descriptions(args.descriptions, args.encoded)
+    patterns = [(name, re.compile(rf"^{name}:(.*)$", re.MULTILINE)) for name in FIELD_TYPES]
+
+    start = time.perf_counter()
+    for description in descriptions:
+        per_key_baseline(description, patterns)
+    baseline = time.perf_counter() - start
+    print(f"regex per key ({len(patterns)} keys): {baseline:6.2f}s (untyped dicts)")
+
+    start = time.perf_counter()
+    results = parse_descriptions(descriptions)
+    seconds = time.perf_counter() - start
+    with_fields = sum(1 for fields in results if fields.role_type is not None)
+    print(
+        f"one-pass scanner:             {seconds:6.2f}s ({with_fields} with fields, "
+        f"typed GastownFields), {baseline / seconds:.0f}x faster"
+    )
+    assert parse_description(descriptions[0]) == results[0]
+
+
+if __name__ == "__main__":
+    main()
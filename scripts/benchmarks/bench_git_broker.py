@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark: concurrent git sessions, retry-on-lock vs the git broker."""
+
+import argparse
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from git_broker import GitBroker
+from git_utils import GitCommandError, run_git
+
+
+def make_repo(tmp, files):
+    """Create a local origin with `files` files and a clone of it."""
+    origin = Path(tmp) / "origin"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(origin)], check=True)
+    for i in range(files):
+        (origin / f"f{i:04d}.txt").write_text(f"{i}\n")
+    git = ["git", "-C", str(origin), "-c", "user.name=b", "-c", "user.email=b@b"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+    clone = Path(tmp) / "repo"
+    subprocess.run(["git", "clone", "-q", str(origin), str(clone)], check=True)
+    return str(clone)
+
+
+class RetryingGit:
+    """Direct git calls retried with jittered exponential backoff on lock errors."""
+
+    def __init__(self, repo, base_delay):
+        self.repo = repo
+        self.base_delay = base_delay
+        self.lock_failures = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, args, cwd=None, attempts=8):
+        for attempt in range(attempts):
+            try:
+                return run_git(cwd or self.repo, args)
+            except GitCommandError as exc:
+                if "lock" not in str(exc) or attempt == attempts - 1:
+                    raise
+                with self.lock:
+                    self.lock_failures += 1
+                time.sleep(self.base_delay * 2**attempt * random.uniform(0.5, 1.5))
+
+
+def retry_session(git, tmp, name):
+    """One session's git work, issued directly."""
+    git(["fetch", "--quiet", "origin", "main:refs/remotes/origin/main"])
+    git(["branch", "--no-track", name, "origin/main"])
+    path = f"{tmp}/wt-{name}"
+    git(["worktree", "add", "--quiet", path, name])
+    git(["for-each-ref", "--format=%(objectname)", f"refs/heads/{name}"])
+    git(["tag", f"done-{name}"])
+    git(["worktree", "remove", "--force", path])
+
+
+def broker_session(broker, tmp, name):
+    """The same work through the broker."""
+    broker.fetch("origin", "main:refs/remotes/origin/main").result()
+    broker.create_branch(name, "origin/main").result()
+    path = f"{tmp}/wt-{name}"
+    broker.worktree_add(path, name).result()
+    broker.resolve(f"refs/heads/{name}").result()
+    broker.run(["tag", f"done-{name}"]).result()
+    broker.worktree_remove(path).result()
+
+
+def run_sessions(target, args_for, sessions):
+    """Run sessions on threads; return (seconds, failures).
+
+    Failures include non-lock races, e.g. a fetch reading a worktree that
+    another session is still creating.
+    """
+    failures = []
+
+    def wrapped(n):
+        try:
+            target(*args_for(n))
+        except GitCommandError as exc:
+            failures.append(exc)
+
+    threads = [threading.Thread(target=wrapped, args=(n,)) for n in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, failures
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=48, help="Concurrent sessions")
+    parser.add_argument("--files", type=int, default=200, help="Files in the repository")
+    parser.add_argument("--base-delay", type=float, default=0.05, help="Retry backoff base (s)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp, args.files)
+        git = RetryingGit(repo, args.base_delay)
+        seconds, failures = run_sessions(
+            retry_session, lambda n: (git, tmp, f"r{n}"), args.sessions
+        )
+        done = args.sessions - len(failures)
+        print(
+            f"retry-on-lock: {seconds:6.2f}s, {done / seconds:5.1f} completed sessions/s, "
+            f"{git.lock_failures} lock errors retried, {len(failures)} sessions failed"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp, args.files)
+        with GitBroker(repo) as broker:
+            seconds, failures = run_sessions(
+                broker_session, lambda n: (broker, tmp, f"b{n}"), args.sessions
+            )
+        done = args.sessions - len(failures)
+        print(
+            f"broker:        {seconds:6.2f}s, {done / seconds:5.1f} completed sessions/s, "
+            f"{len(failures)} sessions failed, "
+            f"{broker.commands} git commands ({broker.batched} operations batched)"
+        )
+
+
+if __name__ == "__main__":
+    main()
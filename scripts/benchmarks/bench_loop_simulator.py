@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Benchmark: simulate a large bead plan across a concurrency sweep."""
+
+import argparse
+import json
+import time
+
+from bead_plan import DEFAULT_STAGE_MODEL, DurationModel, StageModel
+from bead_schema import Bead
+from corpus import make_plan
+from loop_simulator import SimBead, format_result, sample_work, sweep
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000, help="Beads in the plan")
+    parser.add_argument("--beads-per-sprint", type=int, default=20)
+    parser.add_argument(
+        "--fail-rate", type=float, default=0.0, help="Per-attempt QA failure probability"
+    )
+    parser.add_argument("--levels", default="1,2,4,8,16,32,64", help="Concurrency levels")
+    args = parser.parse_args()
+
+    beads = [
+        Bead.model_validate_json(json.dumps(bead))
+        for bead in make_plan(args.count, beads_per_sprint=args.beads_per_sprint)
+    ]
+    start = time.perf_counter()
+    plan = [SimBead.from_bead(bead) for bead in beads]
+    stage = StageModel(DEFAULT_STAGE_MODEL.dev, DEFAULT_STAGE_MODEL.qa, args.fail_rate)
+    work = sample_work(plan, DurationModel(default=stage))
+    prepared = time.perf_counter() - start
+
+    levels = [int(level) for level in args.levels.split(",")]
+    start = time.perf_counter()
+    results = sweep(plan, work, levels)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        print(format_result(result))
+    print(
+        f"{args.count} beads: prepare {prepared:.2f}s, {len(levels)} runs in {elapsed:.2f}s "
+        f"({elapsed / len(levels) * 1000:.0f} ms/run)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark: batched merge-risk analysis vs per-branch merge-base and diff calls."""
+
+import argparse
+import json
+import random
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from bead_schema import Bead
+from corpus import make_bead
+from git_utils import run_git
+from merge_risk import analyze, merge_order, overlap_matrix
+
+
+def make_repo(path, files, merge_beads, tracks, changes, seed=0):
+    """
+    A repository built with one `git fast-import`.
+
+    `main` holds `files` files; every merge bead has `tracks` branches,
+    each changing `changes` random files, and `main` then moves on.
+    Returns the branches per merge bead.
+    """
+    rng = random.Random(seed)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    lines = []
+    mark = 0
+
+    def commit(ref, paths, parent=None):
+        nonlocal mark
+        mark += 1
+        lines.extend([f"commit {ref}", f"mark :{mark}", "committer t <t@t> 0 +0000", "data 1", "x"])
+        if parent:
+            lines.append(f"from :{parent}")
+        for p in paths:
+            lines.extend([f"M 644 inline src/f{p}.py", f"data {len(str(mark)) + 1}", f"{mark}\n"])
+        return mark
+
+    root = commit("refs/heads/main", range(files))
+    plan = []
+    for m in range(merge_beads):
+        branches = [f"track/{m}{chr(97 + t)}" for t in range(tracks)]
+        for branch in branches:
+            commit(f"refs/heads/{branch}", rng.sample(range(files), changes), root)
+        plan.append(branches)
+    commit("refs/heads/main", rng.sample(range(files), changes), root)
+    stream = "\n".join(lines) + "\n"
+    subprocess.run(
+        ["git", "-C", str(path), "fast-import", "--quiet"], input=stream.encode(), check=True
+    )
+    return plan
+
+
+def per_branch(repo, plan):
+    """Two git calls per branch: `merge-base`, then `diff --name-only`."""
+    orders = []
+    for branches in plan:
+        files = []
+        for branch in branches:
+            base = run_git(repo, ["merge-base", "main", branch])
+            files.append(set(run_git(repo, ["diff", "--name-only", base, branch]).splitlines()))
+        orders.append([branches[i] for i in merge_order(overlap_matrix(files))])
+    return orders
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merge-beads", type=int, default=12, help="Merge beads")
+    parser.add_argument("--tracks", type=int, default=4, help="Branches per merge bead")
+    parser.add_argument("--files", type=int, default=5000, help="Files in the repository")
+    parser.add_argument("--changes", type=int, default=20, help="Files changed per branch")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = str(Path(tmp) / "repo")
+        plan = make_repo(repo, args.files, args.merge_beads, args.tracks, args.changes)
+        beads = []
+        for m, branches in enumerate(plan):
+            bead = make_bead(m)
+            bead["issue_type"] = "beads-ralph-merge"
+            bead["metadata"]["branches_to_merge"] = branches
+            beads.append(Bead.model_validate_json(json.dumps(bead)))
+        branch_count = sum(len(branches) for branches in plan)
+
+        start = time.perf_counter()
+        expected = per_branch(repo, plan)
+        slow = time.perf_counter() - start
+        print(f"per branch:  {slow:6.3f}s ({2 * branch_count} git calls)")
+
+        start = time.perf_counter()
+        analyses = analyze(beads, repo)
+        fast = time.perf_counter() - start
+        mean = sum(a.risk().score for a in analyses) / len(analyses)
+        print(
+            f"batched:     {fast:6.3f}s (3 git calls, {branch_count} branches, "
+            f"mean risk {mean:.2f}), {slow / fast:.1f}x faster"
+        )
+        assert [a.order for a in analyses] == expected
+
+
+if __name__ == "__main__":
+    main()
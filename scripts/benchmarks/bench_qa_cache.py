@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark: QA wall time across dev/QA retries with and without the QA cache."""
+
+import argparse
+import json
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bead_schema import QAAgent, QAExecution
+from qa_cache import QACache, tree_hash
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"status": {"enum": ["pass", "fail", "stop"]}, "message": {"type": "string"}},
+}
+
+
+def make_worktree(root, files):
+    """Create a committed repo with `files` small source files."""
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    for i in range(files):
+        (root / f"mod_{i:05d}.py").write_text(f"VALUE = {i}\n")
+    git = ["git", "-C", str(root), "-c", "user.name=b", "-c", "user.email=b@b"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+
+
+def make_execute(delay, attempt):
+    """Return a stand-in QA agent run that takes `delay` seconds."""
+
+    def execute(agent):
+        started = datetime.now(timezone.utc)
+        time.sleep(delay)
+        return QAExecution(
+            attempt=attempt,
+            session_id=f"qa-{attempt}",
+            agent_path=agent.agent_path,
+            model=agent.model,
+            started_at=started,
+            completed_at=datetime.now(timezone.utc),
+            status="pass",
+            message="ok",
+        )
+
+    return execute
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000, help="Files in the worktree")
+    parser.add_argument("--agents", type=int, default=3, help="QA agents per bead")
+    parser.add_argument("--attempts", type=int, default=20, help="Dev/QA attempts")
+    parser.add_argument("--delay", type=float, default=0.2, help="Seconds per QA agent run")
+    parser.add_argument(
+        "--unchanged", type=float, default=0.5, help="Fraction of retries leaving the tree as-is"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    agents = [
+        QAAgent(agent_path=f"qa-{i}", model="haiku", prompt=f"Check {i}.", output_schema=SCHEMA)
+        for i in range(args.agents)
+    ]
+    edits = [rng.random() >= args.unchanged for _ in range(args.attempts)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "wt"
+        make_worktree(root, args.files)
+        results = {}
+        for use_cache in (False, True):
+            cache = QACache(str(Path(tmp) / f"qa-{use_cache}.db"), metrics=None)
+            runs = 0
+            hash_time = 0.0
+            start = time.perf_counter()
+            for attempt, edit in enumerate(edits, start=1):
+                if edit:
+                    target = root / f"mod_{rng.randrange(args.files):05d}.py"
+                    target.write_text(f"VALUE = {attempt}\n")
+                execute = make_execute(args.delay, attempt)
+                if not use_cache:
+                    for agent in agents:
+                        execute(agent)
+                        runs += 1
+                    continue
+                t0 = time.perf_counter()
+                tree = tree_hash(str(root))
+                hash_time += time.perf_counter() - t0
+                for agent in agents:
+                    _, hit = cache.run(tree, agent, attempt, execute)
+                    runs += not hit
+            results[use_cache] = time.perf_counter() - start
+            cache.close()
+            label = "cached  " if use_cache else "uncached"
+            print(
+                f"{label}: {results[use_cache]:6.2f}s QA wall time, {runs:3d} agent runs"
+                + (f", {hash_time * 1000 / args.attempts:5.1f}ms/tree hash" if use_cache else "")
+            )
+    print(
+        json.dumps(
+            {
+                "attempts": args.attempts,
+                "edited_attempts": sum(edits),
+                "speedup": round(results[False] / results[True], 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
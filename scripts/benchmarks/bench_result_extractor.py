@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark: extracting a ScrumResult from a large agent transcript."""
+
+import argparse
+import json
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from bead_schema import ScrumResult
+from result_extractor import parse_scrum_output
+
+RESULT = {
+    "bead_id": "bd-a1b2c3",
+    "success": True,
+    "pr_url": "https://github.com/org/repo/pull/42",
+    "pr_number": 42,
+    "bead_updated": True,
+    "attempt_count": 2,
+    "qa_results": [{"agent_path": f"qa-{i}", "status": "pass", "message": "ok"} for i in range(3)],
+    "error": None,
+    "fatal": False,
+}
+
+FENCE_RE = re.compile(rb"```json\n(.*?)\n```", re.DOTALL)
+
+
+def write_transcript(path, megabytes):
+    """Write tool-call chatter with code fences, ending in the fenced result."""
+    line = b"Tool call: Edit(src/app/module.py) -> replaced 14 lines; running pytest -q ...\n"
+    code = b"```python\ndef handler(event):\n    return {'ok': True}\n```\n"
+    block = line * 400 + code
+    with open(path, "wb") as out:
+        for _ in range(megabytes * (1 << 20) // len(block)):
+            out.write(block)
+        out.write(b"Done. Result:\n```json\n" + json.dumps(RESULT, indent=2).encode() + b"\n```\n")
+
+
+def streaming(path):
+    """Stream the file through the extractor."""
+    with open(path, "rb") as f:
+        return parse_scrum_output(f)
+
+
+def regex_baseline(path):
+    """Read everything, regex out the last fence (the Go approach in corner case 3.2)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    matches = FENCE_RE.findall(data)
+    return ScrumResult.model_validate_json(matches[-1])
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=200, help="Transcript size")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcript.txt"
+        write_transcript(path, args.megabytes)
+        size = path.stat().st_size / (1 << 20)
+        for label, run in [
+            ("streaming extractor", lambda: streaming(path)),
+            ("read + regex", lambda: regex_baseline(path)),
+        ]:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = run()
+                best = min(best, time.perf_counter() - start)
+            assert result.pr_number == 42
+            print(f"{label:20s} {size:6.0f} MB in {best:6.3f}s = {size / best:7.0f} MB/s")
+    print("streaming memory: one 1 MiB chunk plus the fenced blocks; regex: whole transcript")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark: run-ledger recovery time (snapshot + tail) vs replaying every event."""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from run_ledger import LedgerEvent, RunLedger, RunState
+
+
+def record_run(ledger, events, in_flight):
+    """
+    Append about `events` events: beads cycle through claim, two dev
+    attempts, QA, scrum result and close, `in_flight` at a time.
+    """
+    bead = 0
+    active = []
+    while ledger.state.seq < events:
+        if len(active) < in_flight:
+            bead_id = f"bd-{bead:06d}"
+            bead += 1
+            ledger.record_status(bead_id, "in_progress")
+            active.append([bead_id, 0])
+            continue
+        entry = active.pop(0)
+        bead_id, step = entry
+        if step < 2:
+            ledger.record_dev_start(bead_id, step + 1, f"dev-{bead_id}-{step}")
+            entry[1] += 1
+            active.append(entry)
+        else:
+            ledger.record_status(bead_id, "closed")
+
+
+def full_replay(path):
+    """Rebuild the state from every event, as without snapshots."""
+    conn = sqlite3.connect(path)
+    state = RunState()
+    for seq, recorded_at, kind, bead_id, data in conn.execute(
+        "SELECT seq, recorded_at, kind, bead_id, data FROM events ORDER BY seq"
+    ):
+        state.apply(LedgerEvent(seq, recorded_at, kind, bead_id, json.loads(data)))
+    conn.close()
+    return state
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", default="10000,50000,200000", help="Run lengths")
+    parser.add_argument("--in-flight", type=int, default=32, help="Concurrent beads")
+    parser.add_argument("--snapshot-every", type=int, default=1000, help="Snapshot interval")
+    args = parser.parse_args()
+
+    for count in [int(x) for x in args.events.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "ledger.db")
+            start = time.perf_counter()
+            with RunLedger(path, snapshot_every=args.snapshot_every) as ledger:
+                # Stop just before a snapshot: the longest tail recovery can see
+                record_run(ledger, count + args.snapshot_every - 1, args.in_flight)
+                expected = ledger.state
+            write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            replayed = full_replay(path)
+            slow = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with RunLedger(path, snapshot_every=args.snapshot_every) as ledger:
+                recovered = ledger.state
+                tail = ledger.recovered_events
+            fast = time.perf_counter() - start
+            assert recovered == replayed == expected
+            print(
+                f"{expected.seq:>8} events ({expected.seq / write:,.0f}/s appended): "
+                f"full replay {slow * 1000:8.1f}ms, "
+                f"snapshot + {tail} events {fast * 1000:6.1f}ms, {slow / fast:.1f}x faster"
+            )
+
+
+if __name__ == "__main__":
+    main()
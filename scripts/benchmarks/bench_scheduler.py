@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark: utilization of barrier-free scheduling vs the wave-based loop."""
+
+import argparse
+import time
+
+from bead_plan import DEFAULT_STAGE_MODEL, DurationModel, StageModel
+from corpus import make_plan
+from loop_simulator import SimBead, sample_work, simulate_eager, simulate_waves
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000, help="Beads in the plan")
+    parser.add_argument("--beads-per-sprint", type=int, default=12)
+    parser.add_argument("--intra-sprint", type=float, default=0.3)
+    parser.add_argument("--levels", default="2,4,8,16,32", help="Concurrency levels")
+    parser.add_argument("--opus-cap", type=int, default=0, help="Per-model cap for opus beads")
+    args = parser.parse_args()
+
+    plan = [
+        SimBead(
+            id=bead["id"],
+            dependencies=tuple(bead["dependencies"]),
+            sprint=bead["metadata"]["sprint"],
+            phase=bead["metadata"]["phase"],
+            priority=bead["priority"],
+            dev_model="opus" if i % 4 == 0 else "sonnet",
+        )
+        for i, bead in enumerate(
+            make_plan(
+                args.count, beads_per_sprint=args.beads_per_sprint, intra_sprint=args.intra_sprint
+            )
+        )
+    ]
+    # Default durations without QA failures, so every bead runs
+    stage = StageModel(DEFAULT_STAGE_MODEL.dev, DEFAULT_STAGE_MODEL.qa, 0.0)
+    work = sample_work(plan, DurationModel(default=stage))
+    model_caps = {"opus": args.opus_cap} if args.opus_cap else None
+
+    print(f"beads: {args.count}")
+    for level in [int(x) for x in args.levels.split(",")]:
+        wave = simulate_waves(plan, work, level)
+        start = time.perf_counter()
+        eager = simulate_eager(plan, work, level, model_caps=model_caps)
+        elapsed = time.perf_counter() - start
+        print(
+            f"sessions {level:3d}: wave {wave.makespan / 3600:7.1f}h "
+            f"util {wave.utilization:4.0%} | eager {eager.makespan / 3600:7.1f}h "
+            f"util {eager.utilization:4.0%} | speedup {wave.makespan / eager.makespan:4.2f}x "
+            f"| sim {elapsed * 1000:5.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
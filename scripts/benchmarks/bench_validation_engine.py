@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Benchmark: throughput of the pydantic, native-constraint and msgspec validation engines."""
+
+import argparse
+import json
+import time
+
+from corpus import make_corpus
+from validation_engine import ENGINES, get_validator
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000, help="Beads to validate")
+    parser.add_argument("--history", type=int, default=3, help="Executions per bead")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds (best run is kept)")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(bead).encode() for bead in make_corpus(args.count, args.history)]
+    total_bytes = sum(len(p) for p in payloads)
+    print(f"beads: {args.count}  history: {args.history}  bytes: {total_bytes:,}")
+
+    best = dict.fromkeys(ENGINES, float("inf"))
+    # Engines take turns within each round so machine noise hits them alike
+    for _ in range(args.repeat):
+        for engine in ENGINES:
+            validate = get_validator("Bead", engine)
+            start = time.perf_counter()
+            for payload in payloads:
+                validate(payload)
+            best[engine] = min(best[engine], time.perf_counter() - start)
+    rates = {}
+    for engine, elapsed in best.items():
+        rates[engine] = args.count / elapsed
+        print(
+            f"{engine:9s} {rates[engine]:>10,.0f} beads/s  "
+            f"{total_bytes / elapsed / 1e6:7.1f} MB/s"
+        )
+    for engine in ENGINES[1:]:
+        print(f"speedup   {engine}: {rates[engine] / rates['pydantic']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
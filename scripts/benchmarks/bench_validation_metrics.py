@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Benchmark: overhead of validation metrics on Bead validation throughput."""
+
+import argparse
+import json
+import time
+
+from bead_schema import Bead
+from corpus import make_corpus
+from validation_metrics import ValidationMetrics
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000, help="Beads to validate")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(bead) for bead in make_corpus(args.count)]
+    metrics = ValidationMetrics()
+
+    start = time.perf_counter()
+    for payload in payloads:
+        Bead.model_validate_json(payload)
+    raw = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in payloads:
+        metrics.validate_json(Bead, payload)
+    instrumented = time.perf_counter() - start
+
+    print(f"beads:         {args.count}")
+    print(f"raw:           {args.count / raw:,.0f} validations/s")
+    print(f"instrumented:  {args.count / instrumented:,.0f} validations/s")
+    print(f"overhead:      {(instrumented - raw) / args.count * 1e6:.2f} us/validation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark: worktree hand-out latency, pool vs cold `git worktree add`."""
+
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from git_utils import run_git
+from worktree_pool import WorktreePool
+
+
+def make_repo(root, files, nbytes):
+    """Create a repo on `main` with `files` files of `nbytes` each."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(root)], check=True)
+    for i in range(files):
+        directory = root / f"pkg{i % 50:02d}"
+        directory.mkdir(exist_ok=True)
+        (directory / f"mod_{i:05d}.py").write_text(f"# {i}\n" + "x" * nbytes)
+    git = ["git", "-C", str(root), "-c", "user.name=b", "-c", "user.email=b@b"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+
+
+def summarize(label, samples):
+    """Print median and p90 latency in milliseconds."""
+    ordered = sorted(samples)
+    p90 = ordered[int(0.9 * (len(ordered) - 1))]
+    print(f"{label:24s} median {statistics.median(ordered) * 1000:7.1f}ms  p90 {p90 * 1000:7.1f}ms")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000, help="Files in the repository")
+    parser.add_argument("--bytes", type=int, default=2000, help="Bytes per file")
+    parser.add_argument("--beads", type=int, default=10, help="Worktrees handed out")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        make_repo(repo, args.files, args.bytes)
+
+        cold = []
+        for i in range(args.beads):
+            start = time.perf_counter()
+            run_git(str(repo), ["worktree", "add", "-q", "-b", f"cold/{i}", f"{tmp}/cold-{i}"])
+            cold.append(time.perf_counter() - start)
+
+        pool = WorktreePool(str(repo), f"{tmp}/pool", "main", size=args.beads)
+        start = time.perf_counter()
+        pool.warm()
+        warm_time = time.perf_counter() - start
+        # Warm-up runs ahead of time; let the fresh indexes age past git's
+        # racy-timestamp window like they would in a real pool
+        time.sleep(1.5)
+        pooled = []
+        for i in range(args.beads):
+            start = time.perf_counter()
+            pool.acquire(f"pooled/{i}")
+            pooled.append(time.perf_counter() - start)
+
+        # Retries and later sprints recycle finished worktrees
+        for wt in pool.worktrees:
+            pool.release(wt)
+        recycled = []
+        for i in range(args.beads):
+            start = time.perf_counter()
+            pool.acquire(f"recycled/{i}")
+            recycled.append(time.perf_counter() - start)
+
+    print(f"{args.files} files x {args.bytes} bytes, {args.beads} beads")
+    summarize("cold worktree add", cold)
+    summarize("pool acquire (idle)", pooled)
+    summarize("pool acquire (recycled)", recycled)
+    print(f"{'pool warm-up (off path)':24s} {warm_time:.2f}s total")
+    print(f"speedup (median, idle): {statistics.median(cold) / statistics.median(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
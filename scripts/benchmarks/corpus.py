@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Synthetic bead corpora for benchmarks."""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+BASE_TIME = datetime(2026, 2, 7, 10, 0, 0)
+
+OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "status": {"enum": ["pass", "fail", "stop"]},
+        "message": {"type": "string"},
+    },
+    "required": ["status", "message"],
+}
+
+
+def make_dev_execution(attempt: int, start: datetime) -> Dict[str, Any]:
+    """Return a DevExecution dict for the given attempt."""
+    return {
+        "attempt": attempt,
+        "session_id": f"claude-dev-{attempt:06d}",
+        "agent_path": ".claude/agents/backend-dev",
+        "model": "sonnet",
+        "started_at": start.isoformat(),
+        "completed_at": (start + timedelta(minutes=10)).isoformat(),
+        "status": "completed",
+        "feedback_from_qa": None if attempt == 1 else "Tests failed, please fix",
+    }
+
+
+def make_qa_execution(attempt: int, start: datetime, status: str = "pass") -> Dict[str, Any]:
+    """Return a QAExecution dict for the given attempt."""
+    return {
+        "attempt": attempt,
+        "session_id": f"claude-qa-{attempt:06d}",
+        "agent_path": ".claude/agents/qa-unit-tests",
+        "model": "haiku",
+        "started_at": (start + timedelta(minutes=10)).isoformat(),
+        "completed_at": (start + timedelta(minutes=13)).isoformat(),
+        "status": status,
+        "message": "All tests passed" if status == "pass" else "2 tests failed",
+        "details": {"tests_run": 42, "coverage_percent": 91.5},
+    }
+
+
+def make_bead(
+    index: int,
+    history: int = 0,
+    status: str = "open",
+    dependencies: List[str] = (),
+    phase: str = "1",
+    sprint: str = "1.1",
+    description_size: int = 64,
+) -> Dict[str, Any]:
+    """
+    Return a valid bead dict.
+
+    Args:
+        index: Used to derive a unique bead ID
+        history: Number of dev/QA execution pairs to attach
+        status: Bead status
+        dependencies: Bead IDs this bead depends on
+        phase: Metadata phase
+        sprint: Metadata sprint
+        description_size: Approximate description length in characters
+    """
+    created = BASE_TIME + timedelta(minutes=index)
+    dev_executions = []
+    qa_executions = []
+    for attempt in range(1, history + 1):
+        start = created + timedelta(minutes=15 * attempt)
+        dev_executions.append(make_dev_execution(attempt, start))
+        qa_status = "pass" if attempt == history else "fail"
+        qa_executions.append(make_qa_execution(attempt, start, qa_status))
+    sprint_slug = sprint.replace(".", "-")
+    return {
+        "id": f"bd-{index:06x}",
+        "title": f"Implement work item {index}",
+        "description": ("Lorem ipsum dolor sit amet. " * (description_size // 28 + 1))[
+            :description_size
+        ],
+        "status": status,
+        "priority": index % 5,
+        "issue_type": "beads-ralph-work",
+        "assignee": "beads-ralph-scrum-master",
+        "owner": None,
+        "dependencies": list(dependencies),
+        "labels": [f"phase-{phase}", f"sprint-{sprint_slug}"],
+        "comments": [],
+        "metadata": {
+            "worktree_path": f"/worktrees/main/{sprint_slug}-item-{index}",
+            "branch": f"main/{sprint_slug}-item-{index}",
+            "source_branch": "main",
+            "phase": phase,
+            "sprint": sprint,
+            "plan_file": "plans/feature.md",
+            "plan_section": f"## Phase {phase} > ### Sprint {sprint}",
+            "plan_sprint_id": sprint,
+            "branches_to_merge": None,
+            "dev_agent_path": ".claude/agents/backend-dev",
+            "dev_model": "sonnet",
+            "dev_prompts": ["Implement the feature.", "Follow existing patterns."],
+            "qa_agents": [
+                {
+                    "agent_path": ".claude/agents/qa-unit-tests",
+                    "model": "haiku",
+                    "prompt": "Run pytest with coverage.",
+                    "input_schema": None,
+                    "output_schema": OUTPUT_SCHEMA,
+                }
+            ],
+            "max_retry_attempts": max(3, history),
+            "attempt_count": history,
+            "scrum_master_session_id": None,
+            "dev_agent_session_id": None,
+            "dev_agent_executions": dev_executions,
+            "qa_agent_executions": qa_executions,
+            "pr_url": None,
+            "pr_number": None,
+            "scrum_result": None,
+        },
+        "external_ref": None,
+        "created_at": created.isoformat(),
+        "updated_at": created.isoformat(),
+        "closed_at": None,
+    }
+
+
+def make_corpus(count: int, history: int = 0, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return `count` valid beads with randomized statuses and priorities."""
+    rng = random.Random(seed)
+    beads = []
+    for i in range(count):
+        status = rng.choice(["open", "in_progress", "closed", "blocked"])
+        beads.append(make_bead(i, history=history, status=status))
+    return beads
+
+
+def make_plan(
+    count: int,
+    beads_per_sprint: int = 10,
+    sprints_per_phase: int = 4,
+    seed: int = 0,
+    intra_sprint: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """
+    Return `count` open beads forming a layered dependency DAG.
+
+    Beads are grouped into sprints of `beads_per_sprint`; each bead depends
+    on one or two random beads of the previous sprint and, with probability
+    `intra_sprint`, on the bead before it in the same sprint.
+    """
+    rng = random.Random(seed)
+    beads: List[Dict[str, Any]] = []
+    previous: List[str] = []
+    for start in range(0, count, beads_per_sprint):
+        layer = start // beads_per_sprint
+        phase = str(layer // sprints_per_phase + 1)
+        sprint = f"{phase}.{layer % sprints_per_phase + 1}"
+        current = []
+        for i in range(start, min(start + beads_per_sprint, count)):
+            deps = rng.sample(previous, min(len(previous), rng.randint(1, 2)))
+            if current and rng.random() < intra_sprint:
+                deps.append(current[-1])
+            bead = make_bead(i, dependencies=sorted(deps), phase=phase, sprint=sprint)
+            beads.append(bead)
+            current.append(bead["id"])
+        previous = current
+    return beads
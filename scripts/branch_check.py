@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Bulk check of the branches merge beads and sprints start from.
+
+`metadata.branches_to_merge` and `metadata.source_branch` are free text,
+so a typo only surfaces when the scrum-master tries the merge. This
+module gathers every referenced branch, reads the repository's branches
+with one `git for-each-ref` (however many beads or branches there are)
+and classifies each reference:
+
+- present: the branch exists locally or on a checked remote
+- pending: not created yet, but it is the `metadata.branch` of an open
+  bead the referencing bead depends on (directly or transitively), so it
+  will exist by the time the referencing bead runs
+- missing: anything else - no bead creates it (likely a typo), the bead
+  that creates it is not upstream in the dependency DAG, or that bead is
+  closed but the branch is gone
+
+Closed beads are skipped by default: merged branches are often deleted.
+"""
+
+import argparse
+import difflib
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from bead_plan import load_beads
+from bead_schema import Bead
+from git_utils import GitCommandError, run_git
+
+PRESENT = "present"
+PENDING = "pending"
+MISSING = "missing"
+
+
+@dataclass
+class BranchRef:
+    """One branch named by one bead."""
+
+    bead_id: str
+    field: str  # "source_branch" or "branches_to_merge"
+    branch: str
+    status: str
+    producer: Optional[str] = None  # Bead whose metadata.branch this is
+    reason: str = ""
+
+
+@dataclass
+class BranchReport:
+    """Classification of every branch reference in a plan."""
+
+    refs: List[BranchRef] = field(default_factory=list)
+
+    def with_status(self, status: str) -> List[BranchRef]:
+        """References with the given status, in plan order."""
+        return [ref for ref in self.refs if ref.status == status]
+
+    @property
+    def missing(self) -> List[BranchRef]:
+        return self.with_status(MISSING)
+
+    @property
+    def pending(self) -> List[BranchRef]:
+        return self.with_status(PENDING)
+
+
+def resolve_branches(repo: str, remotes: Sequence[str] = ("origin",)) -> Dict[str, str]:
+    """
+    Commit of every local branch and branch of `remotes`, from one git call.
+
+    Remote branches are keyed without the remote prefix, so
+    `refs/remotes/origin/main/1-2-api` counts as `main/1-2-api`. A local
+    branch wins over a remote one of the same name, then earlier remotes.
+
+    Raises:
+        GitCommandError: If git fails (e.g. `repo` is not a repository)
+    """
+    prefixes = ["refs/heads/", *(f"refs/remotes/{remote}/" for remote in remotes)]
+    found: List[Dict[str, str]] = [{} for _ in prefixes]
+    output = run_git(
+        repo, ["for-each-ref", "--format=%(objectname) %(refname)", *(p[:-1] for p in prefixes)]
+    )
+    for line in output.splitlines():
+        sha, refname = line.split(" ", 1)
+        for i, prefix in enumerate(prefixes):
+            if refname.startswith(prefix):
+                found[i][refname[len(prefix) :]] = sha
+                break
+    commits: Dict[str, str] = {}
+    for names in reversed(found):
+        commits.update(names)
+    commits.pop("HEAD", None)  # refs/remotes/<remote>/HEAD is a symref, not a branch
+    return commits
+
+
+def list_branches(repo: str, remotes: Sequence[str] = ("origin",)) -> Set[str]:
+    """Names of all local branches and branches of `remotes` (see `resolve_branches`)."""
+    return set(resolve_branches(repo, remotes))
+
+
+def _references(bead: Bead) -> Iterable[Tuple[str, str]]:
+    """(field, branch) pairs a bead needs to exist before it runs."""
+    metadata = bead.metadata
+    if metadata.source_branch:
+        yield "source_branch", metadata.source_branch
+    if bead.issue_type == "beads-ralph-merge":
+        for branch in metadata.branches_to_merge or ():
+            yield "branches_to_merge", branch
+
+
+def check_branches(
+    beads: Sequence[Bead], existing: Set[str], include_closed: bool = False
+) -> BranchReport:
+    """
+    Classify every branch reference in `beads` against `existing` branch names.
+
+    Args:
+        beads: The plan; dependencies outside it are ignored
+        existing: Branch names in the repository (see `list_branches`)
+        include_closed: Also check references made by closed beads
+    """
+    by_id = {bead.id: bead for bead in beads}
+    producers: Dict[str, List[str]] = {}
+    for bead in beads:
+        producers.setdefault(bead.metadata.branch, []).append(bead.id)
+    ancestors: Dict[str, Set[str]] = {}
+
+    def upstream(bead: Bead) -> Set[str]:
+        # Computed on demand, and only for beads whose producer is not a direct dependency
+        if bead.id not in ancestors:
+            seen: Set[str] = set()
+            stack = [dep for dep in bead.dependencies if dep in by_id]
+            while stack:
+                dep = stack.pop()
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.extend(d for d in by_id[dep].dependencies if d in by_id)
+            ancestors[bead.id] = seen
+        return ancestors[bead.id]
+
+    report = BranchReport()
+    for bead in beads:
+        if bead.status == "closed" and not include_closed:
+            continue
+        for name, branch in _references(bead):
+            if branch in existing:
+                report.refs.append(BranchRef(bead.id, name, branch, PRESENT))
+                continue
+            candidates = [p for p in producers.get(branch, ()) if p != bead.id]
+            direct = set(bead.dependencies)
+            upstream_ids = [p for p in candidates if p in direct] or [
+                p for p in candidates if p in upstream(bead)
+            ]
+            open_ids = [p for p in upstream_ids if by_id[p].status != "closed"]
+            if open_ids:
+                ref = BranchRef(bead.id, name, branch, PENDING, open_ids[0])
+            elif upstream_ids:
+                reason = f"{upstream_ids[0]} is closed but the branch is not in the repository"
+                ref = BranchRef(bead.id, name, branch, MISSING, upstream_ids[0], reason)
+            elif candidates:
+                reason = f"created by {candidates[0]}, which {bead.id} does not depend on"
+                ref = BranchRef(bead.id, name, branch, MISSING, candidates[0], reason)
+            else:
+                reason = _no_producer(branch, existing, producers)
+                ref = BranchRef(bead.id, name, branch, MISSING, reason=reason)
+            report.refs.append(ref)
+    return report
+
+
+def _no_producer(branch: str, existing: Set[str], producers: Dict[str, List[str]]) -> str:
+    """Reason for a branch nothing creates, with the closest known name if any."""
+    close = difflib.get_close_matches(branch, [*existing, *producers], n=1, cutoff=0.8)
+    hint = f" (did you mean {close[0]}?)" if close else ""
+    return f"not in the repository and no bead creates it{hint}"
+
+
+def check_repo(
+    beads: Sequence[Bead],
+    repo: str,
+    remotes: Sequence[str] = ("origin",),
+    include_closed: bool = False,
+) -> BranchReport:
+    """`check_branches` against the branches of a local repository."""
+    return check_branches(beads, list_branches(repo, remotes), include_closed)
+
+
+def format_report(report: BranchReport, show_pending: bool = False) -> str:
+    """Render the report as human-readable lines."""
+    counts = {status: len(report.with_status(status)) for status in (PRESENT, PENDING, MISSING)}
+    lines = [
+        f"{len(report.refs)} branch references: {counts[PRESENT]} present, "
+        f"{counts[PENDING]} pending, {counts[MISSING]} missing"
+    ]
+    for ref in report.missing:
+        lines.append(f"  missing {ref.bead_id} {ref.field}: {ref.branch} - {ref.reason}")
+    if show_pending:
+        for ref in report.pending:
+            lines.append(f"  pending {ref.bead_id} {ref.field}: {ref.branch} (from {ref.producer})")
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check bead branch references against a repo.")
+    parser.add_argument("file", nargs="?", help="JSON array of beads (default: stdin)")
+    parser.add_argument("--repo", default=".", help="Local git repository (default: .)")
+    parser.add_argument(
+        "--remote", action="append", help="Remote whose branches count (default: origin)"
+    )
+    parser.add_argument("--include-closed", action="store_true", help="Also check closed beads")
+    parser.add_argument("--show-pending", action="store_true", help="List pending branches too")
+    args = parser.parse_args()
+
+    beads = load_beads(args.file)
+    try:
+        report = check_repo(beads, args.repo, args.remote or ["origin"], args.include_closed)
+    except GitCommandError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    print(format_report(report, args.show_pending))
+    sys.exit(1 if report.missing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Lease-based bead claims shared by concurrent scrum-masters.
+
+Claims live in a local SQLite database (WAL mode) instead of round-tripping
+through `bd claim` (corner case 4.2). A claim is an atomic compare-and-set
+on one row: it succeeds only if the bead is unclaimed or its lease has
+expired. Leases carry a TTL, so a crashed scrum-master (corner case 1.4)
+loses its claim automatically; live sessions keep theirs with heartbeats.
+
+Every successful claim increments the bead's fencing `token`. Renew and
+release check owner and token, so a session whose lease was taken over
+cannot extend or drop the new holder's claim.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+FORMAT_VERSION = "1"
+
+DEFAULT_TTL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS claim_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS claims (
+    bead_id TEXT PRIMARY KEY,
+    owner TEXT,
+    token INTEGER NOT NULL,
+    acquired_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class LeaseLostError(Exception):
+    """The lease expired or was taken over by another owner."""
+
+
+@dataclass(frozen=True)
+class Lease:
+    """A held claim on one bead."""
+
+    bead_id: str
+    owner: str
+    token: int
+    acquired_at: float
+    expires_at: float
+
+
+class ClaimManager:
+    """SQLite-backed claim table with TTL leases."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+        busy_timeout: float = 30.0,
+    ):
+        """
+        Open (or create) a claim database.
+
+        Args:
+            path: SQLite database file path, shared by all sessions
+            ttl: Default lease duration in seconds
+            clock: Wall-clock source (shared across processes)
+            busy_timeout: Seconds to wait for another writer
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.path = os.path.abspath(path)
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, timeout=busy_timeout, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM claim_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO claim_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(f"unsupported claim store format {row[0]}, expected {FORMAT_VERSION}")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ClaimManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _expiry(self, now: float, ttl: Optional[float]) -> float:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        return now + ttl
+
+    def claim(self, bead_id: str, owner: str, ttl: Optional[float] = None) -> Optional[Lease]:
+        """
+        Atomically claim a bead if it is free or its lease has expired.
+
+        Args:
+            bead_id: Bead to claim
+            owner: Claiming session (e.g. scrum-master session ID)
+            ttl: Lease duration (default: the manager's ttl)
+
+        Returns:
+            The new lease, or None if another owner holds a live lease
+
+        Raises:
+            ValueError: If `ttl` is not positive
+        """
+        now = self.clock()
+        expires_at = self._expiry(now, ttl)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO claims (bead_id, owner, token, acquired_at, expires_at)"
+                    " VALUES (?, ?, 1, ?, ?)"
+                    " ON CONFLICT (bead_id) DO UPDATE SET"
+                    " owner = excluded.owner, token = claims.token + 1,"
+                    " acquired_at = excluded.acquired_at, expires_at = excluded.expires_at"
+                    " WHERE claims.owner IS NULL OR claims.expires_at <= excluded.acquired_at",
+                    (bead_id, owner, now, expires_at),
+                )
+                token = None
+                if cursor.rowcount == 1:
+                    (token,) = self._conn.execute(
+                        "SELECT token FROM claims WHERE bead_id = ?", (bead_id,)
+                    ).fetchone()
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        if token is None:
+            return None
+        return Lease(bead_id, owner, token, now, expires_at)
+
+    def renew(self, lease: Lease, ttl: Optional[float] = None) -> Lease:
+        """
+        Extend a live lease (a heartbeat).
+
+        Raises:
+            LeaseLostError: If the lease expired or another owner took the bead
+            ValueError: If `ttl` is not positive
+        """
+        now = self.clock()
+        expires_at = self._expiry(now, ttl)
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE claims SET expires_at = ?"
+                " WHERE bead_id = ? AND owner = ? AND token = ? AND expires_at > ?",
+                (expires_at, lease.bead_id, lease.owner, lease.token, now),
+            )
+        if cursor.rowcount != 1:
+            raise LeaseLostError(f"lease on {lease.bead_id} (token {lease.token}) was lost")
+        return Lease(lease.bead_id, lease.owner, lease.token, lease.acquired_at, expires_at)
+
+    def release(self, lease: Lease) -> bool:
+        """
+        Give up a lease.
+
+        Returns:
+            True if the lease was still held and is now released
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE claims SET owner = NULL, expires_at = 0"
+                " WHERE bead_id = ? AND owner = ? AND token = ?",
+                (lease.bead_id, lease.owner, lease.token),
+            )
+        return cursor.rowcount == 1
+
+    def holder(self, bead_id: str) -> Optional[Lease]:
+        """Return the live lease on a bead, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT bead_id, owner, token, acquired_at, expires_at FROM claims"
+                " WHERE bead_id = ? AND owner IS NOT NULL AND expires_at > ?",
+                (bead_id, self.clock()),
+            ).fetchone()
+        return Lease(*row) if row else None
+
+    def reclaim_expired(self) -> List[Lease]:
+        """
+        Release every expired lease (sessions that stopped heartbeating).
+
+        Expired leases can already be claimed without this; call it to find
+        crashed sessions, e.g. to mark their attempts as failed.
+
+        Returns:
+            The expired leases that were released
+        """
+        now = self.clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT bead_id, owner, token, acquired_at, expires_at FROM claims"
+                    " WHERE owner IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                ).fetchall()
+                self._conn.execute(
+                    "UPDATE claims SET owner = NULL, expires_at = 0"
+                    " WHERE owner IS NOT NULL AND expires_at <= ?",
+                    (now,),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return [Lease(*row) for row in rows]
+
+
+class Heartbeat:
+    """
+    Background thread renewing one lease until stopped or lost.
+
+    A renewal that fails with a database error (e.g. a locked or
+    unavailable store) is retried every interval; `lost` is set once the
+    lease has been taken over, or has expired without a successful renewal.
+    The last database error is kept in `error`.
+    """
+
+    def __init__(self, manager: ClaimManager, lease: Lease, interval: Optional[float] = None):
+        """
+        Args:
+            manager: Manager that issued the lease
+            lease: Lease to keep alive
+            interval: Seconds between renewals (default: a third of the TTL)
+        """
+        self.manager = manager
+        self.lease = lease
+        self.interval = interval or (lease.expires_at - lease.acquired_at) / 3
+        self.lost = threading.Event()
+        self.error: Optional[sqlite3.Error] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{lease.bead_id}")
+        self._thread.daemon = True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.lease = self.manager.renew(self.lease)
+            except LeaseLostError:
+                break
+            except sqlite3.Error as e:
+                self.error = e
+                if self.manager.clock() >= self.lease.expires_at:
+                    break
+            else:
+                self.error = None
+        else:
+            return
+        self.lost.set()
+
+    def start(self) -> "Heartbeat":
+        """Start renewing."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop renewing (the lease is kept until it expires or is released)."""
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self) -> "Heartbeat":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Critical-path analysis over the bead dependency DAG.
+
+Each bead is weighted by its observed duration (the summed wall time of
+its recorded dev and QA executions) or, without history, by the expected
+duration under a `bead_plan.StageModel` fitted per `issue_type`. With
+unlimited parallel sessions the plan can finish no sooner than the longest
+weighted path, so shortening that path is the main lever on total time.
+
+`analyze` runs a topological sort plus one forward and one backward pass:
+O(beads + dependencies). `split_candidates` ranks phases or sprints whose
+internal dependency chains lie on the critical path, i.e. the ones where
+splitting into parallel tracks (`3a`/`3b`, `1.2a`/`1.2b`) would shorten the
+plan the most.
+"""
+
+import argparse
+import itertools
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from bead_plan import DurationModel, StageModel, load_beads
+from bead_schema import Bead
+
+
+GROUP_KEYS: Dict[str, Callable[[Bead], str]] = {
+    "sprint": lambda bead: bead.metadata.sprint,
+    "phase": lambda bead: bead.metadata.phase,
+}
+
+
+def observed_duration(bead: Bead) -> Optional[float]:
+    """Summed dev and QA execution wall time in seconds, or None without history."""
+    metadata = bead.metadata
+    executions = [*metadata.dev_agent_executions, *metadata.qa_agent_executions]
+    if not executions:
+        return None
+    return sum((e.completed_at - e.started_at).total_seconds() for e in executions)
+
+
+def expected_duration(stage: StageModel, max_attempts: int) -> float:
+    """Mean scrum-master duration: per-attempt mean times expected attempts."""
+    attempts = sum(stage.fail_rate**k for k in range(max_attempts))
+    return (stage.dev.mean + stage.qa.mean) * attempts
+
+
+def estimate_durations(
+    beads: Sequence[Bead], model: Optional[DurationModel] = None
+) -> Tuple[Dict[str, float], Set[str]]:
+    """
+    Weight every bead by observed duration, estimating the rest.
+
+    Args:
+        beads: Beads to weight
+        model: Model for beads without history (default: fitted from `beads`)
+
+    Returns:
+        (duration per bead ID, IDs whose duration was estimated)
+    """
+    durations: Dict[str, float] = {}
+    estimated: Set[str] = set()
+    for bead in beads:
+        observed = observed_duration(bead)
+        if observed is None:
+            if model is None:
+                model = DurationModel.fit(beads)
+            stage = model.for_type(bead.issue_type)
+            observed = expected_duration(stage, bead.metadata.max_retry_attempts)
+            estimated.add(bead.id)
+        durations[bead.id] = observed
+    return durations, estimated
+
+
+class _Dag:
+    """Index-based adjacency for the beads in one plan."""
+
+    def __init__(self, beads: Sequence[Bead]):
+        self.ids = [bead.id for bead in beads]
+        index = {bead_id: i for i, bead_id in enumerate(self.ids)}
+        if len(index) != len(self.ids):
+            raise ValueError("duplicate bead IDs in plan")
+        # Dependencies outside the plan are treated as already closed
+        self.preds: List[List[int]] = [
+            sorted({index[dep] for dep in bead.dependencies if dep in index}) for bead in beads
+        ]
+        self.succs: List[List[int]] = [[] for _ in beads]
+        for i, preds in enumerate(self.preds):
+            for p in preds:
+                self.succs[p].append(i)
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[int]:
+        indegree = [len(p) for p in self.preds]
+        order = [i for i, d in enumerate(indegree) if d == 0]
+        for i in order:  # order grows while iterating (Kahn's algorithm)
+            for s in self.succs[i]:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    order.append(s)
+        if len(order) != len(self.ids):
+            cyclic = sorted(self.ids[i] for i, d in enumerate(indegree) if d > 0)
+            raise ValueError(f"dependency cycle among beads: {', '.join(cyclic[:10])}")
+        return order
+
+    def longest_paths(
+        self, weight: List[float], split: Optional[Callable[[int, int], bool]] = None
+    ) -> Tuple[List[float], List[int]]:
+        """
+        Earliest finish per bead and the predecessor that bounds it (-1 if none).
+
+        For edges where `split(pred, bead)` is true the bead no longer waits
+        for `pred` to finish, only for `pred`'s own dependencies (as if both
+        were moved into parallel tracks of the same sprint).
+        """
+        finish = [0.0] * len(weight)
+        via = [-1] * len(weight)
+        for i in self.order:
+            start = 0.0
+            for p in self.preds[i]:
+                ready = finish[p] - weight[p] if split is not None and split(p, i) else finish[p]
+                if ready > start:
+                    start, via[i] = ready, p
+            finish[i] = start + weight[i]
+        return finish, via
+
+
+@dataclass
+class CriticalPathAnalysis:
+    """Critical path, schedule bounds and slack for one plan."""
+
+    makespan: float
+    path: List[str]
+    durations: Dict[str, float]
+    earliest_start: Dict[str, float]
+    latest_start: Dict[str, float]
+    estimated: Set[str] = field(default_factory=set)
+
+    @property
+    def slack(self) -> Dict[str, float]:
+        """How long each bead can slip without delaying the plan."""
+        return {
+            bead_id: self.latest_start[bead_id] - start
+            for bead_id, start in self.earliest_start.items()
+        }
+
+    @property
+    def remaining(self) -> Dict[str, float]:
+        """Longest path from the start of each bead to the end of the plan."""
+        return {
+            bead_id: self.makespan - start for bead_id, start in self.latest_start.items()
+        }
+
+    def critical(self, tolerance: float = 1e-6) -> List[str]:
+        """All beads with zero slack (the critical path plus any ties)."""
+        return [bead_id for bead_id, slack in self.slack.items() if slack <= tolerance]
+
+
+def analyze(
+    beads: Sequence[Bead], durations: Optional[Dict[str, float]] = None
+) -> CriticalPathAnalysis:
+    """
+    Find the critical path and per-bead slack in O(beads + dependencies).
+
+    Args:
+        beads: The plan; dependencies on beads outside it are ignored. With
+            `durations` given, anything with `id` and `dependencies` works
+            (e.g. loop_simulator.SimBead)
+        durations: Seconds per bead ID (default: estimate_durations)
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    estimated: Set[str] = set()
+    if durations is None:
+        durations, estimated = estimate_durations(beads)
+    dag = _Dag(beads)
+    weight = [durations[bead_id] for bead_id in dag.ids]
+    finish, via = dag.longest_paths(weight)
+
+    makespan = max(finish, default=0.0)
+    latest_finish = [makespan] * len(weight)
+    for i in reversed(dag.order):
+        for s in dag.succs[i]:
+            latest_finish[i] = min(latest_finish[i], latest_finish[s] - weight[s])
+
+    path: List[str] = []
+    i = max(range(len(finish)), key=finish.__getitem__, default=-1)
+    while i != -1:
+        path.append(dag.ids[i])
+        i = via[i]
+    path.reverse()
+
+    return CriticalPathAnalysis(
+        makespan=makespan,
+        path=path,
+        durations=dict(zip(dag.ids, weight)),
+        earliest_start={dag.ids[i]: finish[i] - weight[i] for i in range(len(weight))},
+        latest_start={dag.ids[i]: latest_finish[i] - weight[i] for i in range(len(weight))},
+        estimated=estimated,
+    )
+
+
+@dataclass
+class SplitCandidate:
+    """A phase or sprint whose internal chain lengthens the critical path."""
+
+    group: str
+    critical_beads: List[str]
+    critical_time: float
+    gain_bound: float
+    gain: Optional[float] = None
+
+
+def split_candidates(
+    beads: Sequence[Bead],
+    analysis: CriticalPathAnalysis,
+    by: str = "sprint",
+    top: int = 5,
+) -> List[SplitCandidate]:
+    """
+    Rank groups by how much splitting them into parallel tracks could save.
+
+    A group can only help if the critical path runs through two or more of
+    its beads in a row. Without its internal dependencies such a run would
+    cost only its last bead, which bounds the gain and is found in one pass
+    over the path. For the `top` groups by bound, the exact gain is then
+    measured by recomputing the makespan with the group's internal
+    dependencies split (each bead still waits for the group's external
+    dependencies), so the total cost is O(top * (beads + dependencies)).
+
+    Args:
+        beads: The analysed plan
+        analysis: Result of analyze(beads)
+        by: "sprint" or "phase"
+        top: Number of candidates to return with an exact gain
+
+    Returns:
+        Candidates sorted by exact gain, largest first
+    """
+    key = GROUP_KEYS[by]
+    groups = {bead.id: key(bead) for bead in beads}
+    candidates: Dict[str, SplitCandidate] = {}
+    for group, run in itertools.groupby(analysis.path, key=groups.__getitem__):
+        run = list(run)
+        if len(run) < 2:
+            continue
+        times = [analysis.durations[bead_id] for bead_id in run]
+        candidate = candidates.setdefault(group, SplitCandidate(group, [], 0.0, 0.0))
+        candidate.critical_beads.extend(run)
+        candidate.critical_time += sum(times)
+        candidate.gain_bound += sum(times) - times[-1]
+    ranked = sorted(candidates.values(), key=lambda c: c.gain_bound, reverse=True)[:top]
+
+    if ranked:
+        dag = _Dag(beads)
+        weight = [analysis.durations[bead_id] for bead_id in dag.ids]
+        group_of = [groups[bead_id] for bead_id in dag.ids]
+        for candidate in ranked:
+            name = candidate.group
+
+            def split(p: int, i: int, name: str = name) -> bool:
+                return group_of[p] == name and group_of[i] == name
+
+            finish, _ = dag.longest_paths(weight, split)
+            candidate.gain = analysis.makespan - max(finish)
+        ranked.sort(key=lambda c: c.gain, reverse=True)
+    return ranked
+
+
+def format_report(
+    analysis: CriticalPathAnalysis, candidates: Sequence[SplitCandidate], by: str = "sprint"
+) -> str:
+    """Render the analysis as human-readable lines."""
+    lines = [
+        f"makespan lower bound: {analysis.makespan / 3600:.2f}h "
+        f"({len(analysis.estimated)} of {len(analysis.durations)} durations estimated)",
+        f"critical path ({len(analysis.path)} beads):",
+    ]
+    for bead_id in analysis.path:
+        marker = " (estimated)" if bead_id in analysis.estimated else ""
+        lines.append(f"  {bead_id}: {analysis.durations[bead_id] / 60:.1f}m{marker}")
+    if candidates:
+        lines.append(f"{by}s to split into parallel tracks:")
+        for c in candidates:
+            lines.append(
+                f"  {c.group}: saves {c.gain / 3600:.2f}h "
+                f"({len(c.critical_beads)} critical beads, {c.critical_time / 3600:.2f}h in chain)"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Critical-path analysis for a bead plan.")
+    parser.add_argument("file", nargs="?", help="JSON array of beads (default: stdin)")
+    parser.add_argument("--by", choices=sorted(GROUP_KEYS), default="sprint")
+    parser.add_argument("--top", type=int, default=5, help="Split candidates to report")
+    args = parser.parse_args()
+
+    beads = load_beads(args.file)
+    try:
+        analysis = analyze(beads)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(format_report(analysis, split_candidates(beads, analysis, args.by, args.top), args.by))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Parser for gastown's description-field encoding.
+
+Gastown does not use the metadata column; it stores its fields as
+`key: value` lines inside `description` (schemas/extensions/gastown-v0.5.0.yaml).
+This module extracts those lines into a typed `GastownFields` model that
+sits alongside `Bead`.
+
+Each description is scanned once by one precompiled pattern that matches
+only known keys at the start of a line, so human text around the fields
+(including other `word: text` lines) is ignored. Values are trimmed; an
+empty value or `null` means unset; when a key repeats, the last line
+wins. Values that do not convert (a non-numeric count, an unknown enum
+value) are kept as text in `invalid` instead of failing the bead.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, get_args
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from bead_schema import Bead
+
+ROLE_TYPES = ["polecat", "witness", "refinery", "deacon", "mayor", "crew"]
+AGENT_STATES = ["spawning", "working", "done", "stuck"]
+CLEANUP_STATUSES = ["clean", "has_uncommitted", "has_stash", "has_unpushed"]
+NOTIFICATION_LEVELS = ["verbose", "normal", "muted"]
+CLOSE_REASONS = ["merged", "rejected", "conflict", "superseded"]
+SEVERITIES = ["critical", "high", "medium", "low"]
+PROCESSING_STRATEGIES = ["fifo", "lifo", "priority"]
+RIG_STATUSES = ["active", "paused", "stopped"]
+
+ENUM_VALUES: Dict[str, List[str]] = {
+    "role_type": ROLE_TYPES,
+    "agent_state": AGENT_STATES,
+    "cleanup_status": CLEANUP_STATUSES,
+    "notification_level": NOTIFICATION_LEVELS,
+    "close_reason": CLOSE_REASONS,
+    "severity": SEVERITIES,
+    "processing_strategy": PROCESSING_STRATEGIES,
+    "rig_status": RIG_STATUSES,
+}
+
+_TRUE = frozenset({"true", "yes", "1"})
+_FALSE = frozenset({"false", "no", "0"})
+_UNSET = frozenset({"", "null"})
+
+
+class GastownFields(BaseModel):
+    """Gastown fields decoded from a bead description (unset fields are None)."""
+
+    model_config = ConfigDict(strict=True, frozen=True)
+
+    # Agent beads
+    role_type: Optional[str] = Field(None, description="Agent role type")
+    rig: Optional[str] = Field(None, description="Rig name (agent and merge request beads)")
+    agent_state: Optional[str] = Field(None, description="Current agent state")
+    hook_bead: Optional[str] = Field(None, description="Currently pinned work bead ID")
+    cleanup_status: Optional[str] = Field(None, description="Git working tree status")
+    active_mr: Optional[str] = Field(None, description="Current merge request bead ID")
+    notification_level: Optional[str] = Field(None, description="Notification preference")
+
+    # Merge request beads
+    branch: Optional[str] = Field(None, description="Source branch name")
+    target: Optional[str] = Field(None, description="Target branch")
+    source_issue: Optional[str] = Field(None, description="Work item being merged")
+    worker: Optional[str] = Field(None, description="Who did the work")
+    merge_commit: Optional[str] = Field(None, description="SHA of merge commit")
+    close_reason: Optional[str] = Field(None, description="Reason for closure")
+    agent_bead: Optional[str] = Field(None, description="Agent bead that created the MR")
+    retry_count: Optional[int] = Field(None, description="Conflict-resolution cycles")
+    last_conflict_sha: Optional[str] = Field(None, description="SHA of main at conflict")
+    conflict_task_id: Optional[str] = Field(None, description="Conflict-resolution task")
+    convoy_id: Optional[str] = Field(None, description="Parent convoy ID")
+    convoy_created_at: Optional[str] = Field(None, description="Convoy creation time")
+
+    # Attachments
+    attached_molecule: Optional[str] = Field(None, description="Attached molecule root ID")
+    attached_at: Optional[str] = Field(None, description="Attachment timestamp")
+    attached_args: Optional[str] = Field(None, description="Natural language args")
+    dispatched_by: Optional[str] = Field(None, description="Agent that dispatched work")
+    no_merge: Optional[bool] = Field(None, description="Skip merge queue")
+
+    # Escalations
+    severity: Optional[str] = Field(None, description="Escalation severity")
+    reason: Optional[str] = Field(None, description="Why escalated")
+    source: Optional[str] = Field(None, description="Source identifier")
+    escalated_by: Optional[str] = Field(None, description="Agent address")
+    escalated_at: Optional[str] = Field(None, description="Escalation timestamp")
+    acked_by: Optional[str] = Field(None, description="Agent that acknowledged")
+    acked_at: Optional[str] = Field(None, description="When acknowledged")
+    closed_by: Optional[str] = Field(None, description="Agent that closed")
+    closed_reason: Optional[str] = Field(None, description="Resolution reason")
+    related_bead: Optional[str] = Field(None, description="Related bead ID")
+    original_severity: Optional[str] = Field(None, description="Severity before re-escalation")
+    reescalation_count: Optional[int] = Field(None, description="Re-escalation count")
+    last_reescalated_at: Optional[str] = Field(None, description="When last re-escalated")
+    last_reescalated_by: Optional[str] = Field(None, description="Who last re-escalated")
+
+    # Queues
+    queue_name: Optional[str] = Field(None, description="Queue name")
+    max_size: Optional[int] = Field(None, description="Maximum queue size")
+    current_size: Optional[int] = Field(None, description="Current items in queue")
+    processing_strategy: Optional[str] = Field(None, description="Queue processing order")
+    created_by: Optional[str] = Field(None, description="Agent that created the queue")
+    paused: Optional[bool] = Field(None, description="Whether the queue is paused")
+
+    # Rigs
+    rig_name: Optional[str] = Field(None, description="Rig name")
+    rig_status: Optional[str] = Field(None, description="Rig status")
+    agents_count: Optional[int] = Field(None, description="Number of agents in rig")
+
+    # Synthesis
+    synthesis_status: Optional[str] = Field(None, description="Synthesis status")
+    synthesis_error: Optional[str] = Field(None, description="Synthesis error message")
+
+    # Role config
+    role_name: Optional[str] = Field(None, description="Role name")
+    role_description: Optional[str] = Field(None, description="Role description")
+    capabilities: Optional[List[str]] = Field(None, description="Comma-separated capabilities")
+
+    invalid: Dict[str, str] = Field(
+        default_factory=dict, description="Known keys whose values did not convert"
+    )
+
+
+def _value_type(name: str) -> Any:
+    """The non-None type of a GastownFields field."""
+    annotation = GastownFields.model_fields[name].annotation
+    return next(arg for arg in get_args(annotation) if arg is not type(None))
+
+
+FIELD_TYPES: Dict[str, Any] = {
+    name: _value_type(name) for name in GastownFields.model_fields if name != "invalid"
+}
+
+_EMPTY = GastownFields()
+
+# One pass per description: a known key at the start of a line, then the rest of the line
+_SCANNER = re.compile(
+    r"^[ \t]*("
+    + "|".join(sorted(FIELD_TYPES, key=len, reverse=True))
+    + r")[ \t]*:[ \t]*([^\r\n]*)",
+    re.MULTILINE,
+)
+
+
+def _convert(name: str, text: str) -> Any:
+    """Typed value for a field, or raise ValueError."""
+    kind = FIELD_TYPES[name]
+    if kind is int:
+        return int(text)
+    if kind is bool:
+        lowered = text.lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+        raise ValueError(text)
+    if kind is not str:  # List[str]
+        return [item.strip() for item in text.split(",") if item.strip()]
+    allowed = ENUM_VALUES.get(name)
+    if allowed is not None and text not in allowed:
+        raise ValueError(text)
+    return text
+
+
+def parse_description(description: str) -> GastownFields:
+    """
+    Extract gastown fields from one description.
+
+    Descriptions without any fields all return the same (frozen) empty model.
+    """
+    values: Dict[str, Any] = {}
+    invalid: Dict[str, str] = {}
+    if ":" in description:
+        for name, text in _SCANNER.findall(description):
+            text = text.rstrip()
+            values.pop(name, None)
+            invalid.pop(name, None)
+            if text in _UNSET:
+                continue
+            try:
+                values[name] = _convert(name, text)
+            except ValueError:
+                invalid[name] = text
+    if invalid:
+        values["invalid"] = invalid
+    elif not values:
+        return _EMPTY
+    return GastownFields.model_validate(values)
+
+
+def parse_descriptions(descriptions: Iterable[str]) -> List[GastownFields]:
+    """Extract gastown fields from many descriptions, in order."""
+    return [parse_description(description) for description in descriptions]
+
+
+def parse_beads(beads: Iterable[Bead]) -> Dict[str, GastownFields]:
+    """Gastown fields for every bead, keyed by bead ID."""
+    return {bead.id: parse_description(bead.description) for bead in beads}
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Per-repository git operation broker.
+
+Parallel sessions running git against one repository race for
+`index.lock`, ref locks and `FETCH_HEAD` (corner case 4.4); retrying with
+backoff wastes seconds per collision. The broker removes the races:
+
+- ref-mutating commands (worktree add/remove, branch creation, fetch and
+  anything not known to be read-only) go through one writer thread, and
+  across processes through an exclusive lock file in the common git dir
+- consecutive compatible writes are batched: fetches from one remote
+  become one `git fetch`, branch creations one `git update-ref --stdin`
+  transaction (falling back to one command each if the batch fails)
+- read-only commands run concurrently on a thread pool, and ref lookups
+  arriving together are answered by one `git for-each-ref`
+
+Every method returns a `concurrent.futures.Future`:
+
+    with GitBroker(repo) as git:
+        git.fetch("origin", "main").result()
+        git.create_branch("main/1-2-api", "origin/main").result()
+        git.worktree_add(path, "main/1-2-api").result()
+        sha = git.resolve("refs/heads/main/1-2-api").result()
+"""
+
+import fcntl
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from git_utils import GitCommandError, run_git
+
+READ_COMMANDS = frozenset(
+    {
+        "cat-file",
+        "describe",
+        "diff",
+        "for-each-ref",
+        "log",
+        "ls-files",
+        "ls-remote",
+        "ls-tree",
+        "merge-base",
+        "rev-list",
+        "rev-parse",
+        "show",
+        "show-ref",
+    }
+)
+
+_FETCH = "fetch"
+_BRANCH = "branch"
+_RUN = "run"
+
+
+@dataclass
+class _Op:
+    kind: str
+    key: Optional[str]
+    payload: Any
+    future: Future = field(default_factory=Future)
+
+
+def is_read_only(args: Sequence[str]) -> bool:
+    """True if a git command never takes a repository lock."""
+    return bool(args) and args[0] in READ_COMMANDS
+
+
+class GitBroker:
+    """Serializes writes and batches compatible git operations for one repo."""
+
+    def __init__(self, repo: str, readers: int = 4, timeout: Optional[float] = None):
+        """
+        Start the broker.
+
+        Args:
+            repo: Repository (or worktree) path
+            readers: Threads for concurrent read-only commands
+            timeout: Per-command timeout in seconds
+        """
+        if readers < 1:
+            raise ValueError("readers must be >= 1")
+        self.repo = os.path.abspath(repo)
+        self.timeout = timeout
+        common_dir = run_git(self.repo, ["rev-parse", "--path-format=absolute", "--git-common-dir"])
+        self.lock_path = os.path.join(common_dir, "beads-ralph-broker.lock")
+        self.commands = 0
+        self.batched = 0
+        self._stats_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[_Op]]" = queue.Queue()
+        self._readers = ThreadPoolExecutor(readers, thread_name_prefix="git-read")
+        self._lookup_lock = threading.Lock()
+        self._lookups: List[Tuple[str, Future]] = []
+        self._lookup_running = False
+        self._writer = threading.Thread(target=self._write_loop, name="git-write", daemon=True)
+        self._writer.start()
+
+    def close(self) -> None:
+        """Finish queued operations and stop the worker threads."""
+        self._queue.put(None)
+        self._writer.join()
+        self._readers.shutdown(wait=True)
+
+    def __enter__(self) -> "GitBroker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _git(
+        self, args: Sequence[str], cwd: Optional[str] = None, stdin: Optional[str] = None
+    ) -> str:
+        with self._stats_lock:
+            self.commands += 1
+        return run_git(cwd or self.repo, args, timeout=self.timeout, stdin=stdin)
+
+    # Writes
+
+    def _submit(self, kind: str, key: Optional[str], payload: Any) -> Future:
+        op = _Op(kind, key, payload)
+        self._queue.put(op)
+        return op.future
+
+    def run(self, args: Sequence[str], cwd: Optional[str] = None) -> Future:
+        """
+        Run any git command, read-only ones concurrently and the rest serialized.
+
+        Args:
+            args: Arguments after `git`
+            cwd: Worktree to run in (default: the repository)
+        """
+        if is_read_only(args):
+            return self._readers.submit(self._git, list(args), cwd)
+        return self._submit(_RUN, None, (list(args), cwd))
+
+    def fetch(self, remote: str, refspec: str) -> Future:
+        """Fetch one refspec; concurrent fetches from a remote share one command."""
+        return self._submit(_FETCH, remote, refspec)
+
+    def create_branch(self, name: str, start: str, force: bool = False) -> Future:
+        """Create (or with `force`, reset) a branch; batched into one ref transaction."""
+        if start.startswith("-"):
+            raise ValueError(f"invalid start point: {start}")
+        return self._submit(_BRANCH, "update-ref", (name, start, force))
+
+    def worktree_add(
+        self, path: str, branch: Optional[str] = None, start: Optional[str] = None
+    ) -> Future:
+        """Add a worktree on an existing `branch`, or detached at `start`."""
+        if branch is not None:
+            args = ["worktree", "add", "--quiet", path, branch]
+        else:
+            args = ["worktree", "add", "--quiet", "--detach", path, start or "HEAD"]
+        return self.run(args)
+
+    def worktree_remove(self, path: str, force: bool = True) -> Future:
+        """Remove a worktree."""
+        return self.run(["worktree", "remove", *(["--force"] if force else []), path])
+
+    def _write_loop(self) -> None:
+        pending: List[Optional[_Op]] = []
+        while True:
+            op = pending.pop() if pending else self._queue.get()
+            if op is None:
+                return
+            batch = [op]
+            # Batch only consecutive compatible operations to keep ordering
+            while op.key is not None and not pending:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is not None and (nxt.kind, nxt.key) == (op.kind, op.key):
+                    batch.append(nxt)
+                else:
+                    pending.append(nxt)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._execute(batch)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _execute(self, batch: List[_Op]) -> None:
+        op = batch[0]
+        try:
+            if op.kind == _RUN:
+                args, cwd = op.payload
+                op.future.set_result(self._git(args, cwd))
+                return
+            if len(batch) > 1:
+                with self._stats_lock:
+                    self.batched += len(batch) - 1
+                try:
+                    self._execute_batch(batch)
+                    return
+                except GitCommandError:
+                    pass  # attribute failures by running each on its own
+            for each in batch:
+                try:
+                    self._execute_batch([each])
+                except GitCommandError as exc:
+                    each.future.set_exception(exc)
+        except BaseException as exc:
+            for each in batch:
+                if not each.future.done():
+                    each.future.set_exception(exc)
+
+    def _execute_batch(self, batch: List[_Op]) -> None:
+        op = batch[0]
+        if op.kind == _FETCH:
+            refspecs = dict.fromkeys(each.payload for each in batch)
+            output = self._git(["fetch", "--quiet", op.key, *refspecs])
+        else:
+            starts = [f"{each.payload[1]}^{{commit}}" for each in batch]
+            shas = self._git(["rev-parse", *starts]).splitlines()
+            lines = []
+            for each, sha in zip(batch, shas):
+                name, _, force = each.payload
+                lines.append(f"{'update' if force else 'create'} refs/heads/{name} {sha}\n")
+            output = self._git(["update-ref", "--stdin"], stdin="".join(lines))
+        for each in batch:
+            each.future.set_result(output)
+
+    # Reads
+
+    def resolve(self, ref: str) -> Future:
+        """
+        Resolve a full ref name (e.g. `refs/heads/main`) to its object ID.
+
+        Lookups issued while another is running are answered together by
+        one `git for-each-ref`. The future's result is None for a missing ref.
+        """
+        future: Future = Future()
+        with self._lookup_lock:
+            self._lookups.append((ref, future))
+            if self._lookup_running:
+                return future
+            self._lookup_running = True
+        self._readers.submit(self._lookup_loop)
+        return future
+
+    def _lookup_loop(self) -> None:
+        while True:
+            with self._lookup_lock:
+                batch, self._lookups = self._lookups, []
+                if not batch:
+                    self._lookup_running = False
+                    return
+            names = sorted({ref for ref, _ in batch})
+            if len(batch) > 1:
+                with self._stats_lock:
+                    self.batched += len(batch) - 1
+            try:
+                output = self._git(["for-each-ref", "--format=%(objectname) %(refname)", *names])
+            except BaseException as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            found: Dict[str, str] = {}
+            for line in output.splitlines():
+                sha, _, refname = line.partition(" ")
+                found[refname] = sha
+            for ref, future in batch:
+                future.set_result(found.get(ref))
+
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Thin subprocess wrapper shared by the git-facing helpers."""
+
+import subprocess
+from typing import Dict, Optional, Sequence
+
+
+class GitCommandError(Exception):
+    """A git subprocess failed."""
+
+
+def run_git(
+    cwd: str,
+    args: Sequence[str],
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    stdin: Optional[str] = None,
+) -> str:
+    """
+    Run `git -C cwd <args>` and return its stripped stdout.
+
+    Raises:
+        GitCommandError: If git exits non-zero or times out
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "-C", cwd, *args],
+            input=None if stdin is None else stdin.encode(),
+            capture_output=True,
+            env=env,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise GitCommandError(f"git {args[0]} timed out after {timeout}s")
+    if proc.returncode != 0:
+        message = proc.stderr.decode("utf-8", "replace").strip()
+        raise GitCommandError(f"git {args[0]} exited with {proc.returncode}: {message}")
+    return proc.stdout.decode("utf-8", "replace").strip()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Append-only, out-of-line storage for bead execution histories.
+
+`dev_agent_executions`, `qa_agent_executions` and `comments` grow with every
+retry. This store keeps them in a SQLite table keyed by bead ID so the bead
+itself only carries an `ExecutionHistoryRef` summary and stays a constant
+size. Records use a compact positional JSON encoding and are read back
+lazily, one row at a time.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from bead_schema import Bead, DevExecution, ExecutionHistoryRef, QAExecution
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+FORMAT_VERSION = "1"
+
+KIND_DEV = "dev"
+KIND_QA = "qa"
+KIND_COMMENT = "comment"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS execution_history (
+    bead_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (bead_id, kind, seq)
+) WITHOUT ROWID;
+"""
+
+
+class RecordCodec:
+    """Positional JSON encoding for one execution model.
+
+    A record is a JSON array of field values in model field order, with
+    datetimes as ISO strings and trailing default values dropped.
+    """
+
+    def __init__(self, model: Type[ModelT]):
+        self.model = model
+        self.fields = tuple(model.model_fields)
+        self.datetime_fields = frozenset(
+            name for name, field in model.model_fields.items() if field.annotation is datetime
+        )
+        self.defaults = tuple(
+            None if field.is_required() else field.get_default(call_default_factory=True)
+            for field in model.model_fields.values()
+        )
+
+    def encode(self, item: BaseModel) -> str:
+        """Encode a model instance as a compact JSON array."""
+        values: List[Any] = []
+        for name in self.fields:
+            value = getattr(item, name)
+            if name in self.datetime_fields:
+                value = value.isoformat()
+            values.append(value)
+        while values and values[-1] == self.defaults[len(values) - 1]:
+            values.pop()
+        return json.dumps(values, separators=(",", ":"))
+
+    def decode(self, record: str) -> ModelT:
+        """Decode a compact JSON array back into a validated model."""
+        data: Dict[str, Any] = {}
+        for name, value in zip(self.fields, json.loads(record)):
+            if name in self.datetime_fields:
+                value = datetime.fromisoformat(value)
+            data[name] = value
+        return self.model.model_validate(data)
+
+
+DEV_CODEC = RecordCodec(DevExecution)
+QA_CODEC = RecordCodec(QAExecution)
+
+# JSON path of the attempt number inside an encoded record, per kind
+_ATTEMPT_PATHS = {
+    KIND_DEV: f"$[{DEV_CODEC.fields.index('attempt')}]",
+    KIND_QA: f"$[{QA_CODEC.fields.index('attempt')}]",
+}
+
+
+class HistoryStore:
+    """SQLite-backed append-only history store keyed by bead ID."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a history store.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = os.path.abspath(path)
+        self._conn = sqlite3.connect(self.path, isolation_level=None, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM history_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO history_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported history store format {row[0]}, expected {FORMAT_VERSION}"
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Writing
+
+    def _append_locked(self, bead_id: str, kind: str, records: List[str]) -> int:
+        # Caller holds the write transaction
+        (last,) = self._conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM execution_history WHERE bead_id = ? AND kind = ?",
+            (bead_id, kind),
+        ).fetchone()
+        self._conn.executemany(
+            "INSERT INTO execution_history (bead_id, kind, seq, record) VALUES (?, ?, ?, ?)",
+            [(bead_id, kind, last + i, record) for i, record in enumerate(records, 1)],
+        )
+        return last + len(records)
+
+    def _append(self, bead_id: str, batches: List[Tuple[str, List[str]]]) -> None:
+        """Append encoded records for several kinds in one transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for kind, records in batches:
+                if records:
+                    self._append_locked(bead_id, kind, records)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def append_dev_executions(self, bead_id: str, executions: Iterable[DevExecution]) -> None:
+        """Append dev executions to a bead's history."""
+        self._append(bead_id, [(KIND_DEV, [DEV_CODEC.encode(e) for e in executions])])
+
+    def append_qa_executions(self, bead_id: str, executions: Iterable[QAExecution]) -> None:
+        """Append QA executions to a bead's history."""
+        self._append(bead_id, [(KIND_QA, [QA_CODEC.encode(e) for e in executions])])
+
+    def append_comments(self, bead_id: str, comments: Iterable[Dict[str, Any]]) -> None:
+        """Append comments to a bead's history."""
+        records = [json.dumps(c, separators=(",", ":")) for c in comments]
+        self._append(bead_id, [(KIND_COMMENT, records)])
+
+    # Reading
+
+    def _iter_records(self, bead_id: str, kind: str, after: int) -> Iterator[str]:
+        cursor = self._conn.execute(
+            "SELECT record FROM execution_history"
+            " WHERE bead_id = ? AND kind = ? AND seq > ? ORDER BY seq",
+            (bead_id, kind, after),
+        )
+        try:
+            for (record,) in cursor:
+                yield record
+        finally:
+            cursor.close()
+
+    def iter_dev_executions(self, bead_id: str, after: int = 0) -> Iterator[DevExecution]:
+        """
+        Lazily stream a bead's dev executions in append order.
+
+        Args:
+            bead_id: Bead ID
+            after: Skip the first `after` records (e.g. ones already seen)
+        """
+        for record in self._iter_records(bead_id, KIND_DEV, after):
+            yield DEV_CODEC.decode(record)
+
+    def iter_qa_executions(self, bead_id: str, after: int = 0) -> Iterator[QAExecution]:
+        """Lazily stream a bead's QA executions in append order."""
+        for record in self._iter_records(bead_id, KIND_QA, after):
+            yield QA_CODEC.decode(record)
+
+    def iter_comments(self, bead_id: str, after: int = 0) -> Iterator[Dict[str, Any]]:
+        """Lazily stream a bead's comments in append order."""
+        for record in self._iter_records(bead_id, KIND_COMMENT, after):
+            yield json.loads(record)
+
+    def _count(self, bead_id: str, kind: str) -> int:
+        (count,) = self._conn.execute(
+            "SELECT MAX(seq) FROM execution_history WHERE bead_id = ? AND kind = ?",
+            (bead_id, kind),
+        ).fetchone()
+        return count or 0
+
+    def _latest_attempt(self, bead_id: str, kind: str) -> Optional[str]:
+        # Retries can be appended out of order, so the last record is not
+        # necessarily the highest attempt; among equals the latest one wins
+        row = self._conn.execute(
+            "SELECT record FROM execution_history WHERE bead_id = ? AND kind = ?"
+            " ORDER BY json_extract(record, ?) DESC, seq DESC LIMIT 1",
+            (bead_id, kind, _ATTEMPT_PATHS[kind]),
+        ).fetchone()
+        return row[0] if row else None
+
+    def summary(self, bead_id: str) -> ExecutionHistoryRef:
+        """Return the summary/pointer for a bead's stored history."""
+        dev_record = self._latest_attempt(bead_id, KIND_DEV)
+        qa_record = self._latest_attempt(bead_id, KIND_QA)
+        last_dev = DEV_CODEC.decode(dev_record) if dev_record else None
+        last_qa = QA_CODEC.decode(qa_record) if qa_record else None
+        return ExecutionHistoryRef(
+            store=self.path,
+            dev_execution_count=self._count(bead_id, KIND_DEV),
+            qa_execution_count=self._count(bead_id, KIND_QA),
+            comment_count=self._count(bead_id, KIND_COMMENT),
+            last_attempt=last_dev.attempt if last_dev else 0,
+            last_dev_status=last_dev.status if last_dev else None,
+            last_qa_status=last_qa.status if last_qa else None,
+        )
+
+    # Bead conversion
+
+    def offload(self, bead: Bead) -> Bead:
+        """
+        Move a bead's inline histories into the store.
+
+        Inline entries are treated as not yet stored, so a bead can keep
+        appending executions inline between offloads.
+
+        Args:
+            bead: Bead with inline dev/QA executions and comments
+
+        Returns:
+            Copy of the bead with empty inline histories and an updated
+            `metadata.execution_history` summary
+        """
+        metadata = bead.metadata
+        self._append(
+            bead.id,
+            [
+                (KIND_DEV, [DEV_CODEC.encode(e) for e in metadata.dev_agent_executions]),
+                (KIND_QA, [QA_CODEC.encode(e) for e in metadata.qa_agent_executions]),
+                (KIND_COMMENT, [json.dumps(c, separators=(",", ":")) for c in bead.comments]),
+            ],
+        )
+        new_metadata = metadata.model_copy(
+            update={
+                "dev_agent_executions": [],
+                "qa_agent_executions": [],
+                "execution_history": self.summary(bead.id),
+            }
+        )
+        return bead.model_copy(update={"comments": [], "metadata": new_metadata})
+
+    def hydrate(self, bead: Bead) -> Bead:
+        """
+        Return a copy of the bead with its full history inline.
+
+        Stored entries come first, followed by any inline entries not yet
+        offloaded. The summary pointer is cleared.
+        """
+        metadata = bead.metadata
+        new_metadata = metadata.model_copy(
+            update={
+                "dev_agent_executions": list(self.iter_dev_executions(bead.id))
+                + metadata.dev_agent_executions,
+                "qa_agent_executions": list(self.iter_qa_executions(bead.id))
+                + metadata.qa_agent_executions,
+                "execution_history": None,
+            }
+        )
+        return bead.model_copy(
+            update={
+                "comments": list(self.iter_comments(bead.id)) + bead.comments,
+                "metadata": new_metadata,
+            }
+        )
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Discrete-event simulator for ralph-loop makespan and parallelism.
+
+Replays the loop in docs/architecture.md over a bead corpus without
+launching any agents:
+
+1. `bd ready` returns every open bead whose dependencies are closed
+2. one scrum-master per ready bead is launched, at most `concurrency` at a
+   time (the `MaxParallelSessions` semaphore)
+3. the loop waits for the whole wave (`wg.Wait()`) before looking again
+
+The `eager` policy instead replays `scheduler.Scheduler`, which launches
+each bead as soon as its dependencies close.
+
+Each scrum-master runs the dev/QA retry loop: dev then QA, retried with
+probability `fail_rate` up to `max_retry_attempts`; a bead that exhausts
+its attempts fails and its dependents stay blocked. Stage durations come
+from lognormal distributions fitted to recorded `DevExecution` and
+`QAExecution` timestamps, per `issue_type` (`bead_plan.DurationModel`).
+
+Durations are sampled once per bead (`sample_work`) and shared across
+runs, so a concurrency sweep compares policies on identical work.
+"""
+
+import argparse
+import heapq
+import math
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bead_plan import DurationModel, load_beads
+from bead_schema import Bead
+from critical_path import analyze
+from scheduler import Scheduler
+
+
+@dataclass(frozen=True)
+class SimBead:
+    """The parts of a bead the simulator needs."""
+
+    id: str
+    dependencies: Tuple[str, ...] = ()
+    issue_type: str = "beads-ralph-work"
+    max_retry_attempts: int = 3
+    phase: str = "1"
+    sprint: str = "1.1"
+    priority: int = 2
+    dev_model: str = "sonnet"
+
+    @classmethod
+    def from_bead(cls, bead: Bead) -> "SimBead":
+        """Extract simulation inputs from a validated bead."""
+        metadata = bead.metadata
+        return cls(
+            id=bead.id,
+            dependencies=tuple(bead.dependencies),
+            issue_type=bead.issue_type,
+            max_retry_attempts=metadata.max_retry_attempts,
+            phase=metadata.phase,
+            sprint=metadata.sprint,
+            priority=bead.priority,
+            dev_model=metadata.dev_model,
+        )
+
+
+@dataclass(frozen=True)
+class Work:
+    """Pre-sampled outcome of running one bead."""
+
+    duration: float
+    attempts: int
+    success: bool
+
+
+def sample_work(beads: Sequence[SimBead], model: DurationModel, seed: int = 0) -> Dict[str, Work]:
+    """Sample every bead's scrum-master run once, reproducibly."""
+    rng = random.Random(seed)
+    work = {}
+    for bead in beads:
+        duration, attempts, success = model.for_type(bead.issue_type).sample(
+            bead.max_retry_attempts, rng
+        )
+        work[bead.id] = Work(duration, attempts, success)
+    return work
+
+
+@dataclass
+class SprintStats:
+    """Timing of one sprint within a simulated run."""
+
+    sprint: str
+    beads: int = 0
+    start: float = math.inf
+    end: float = 0.0
+    busy: float = 0.0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def span(self) -> float:
+        """Wall time from the sprint's first launch to its last completion."""
+        return max(0.0, self.end - self.start)
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean time beads spent ready but not launched."""
+        return self.total_wait / self.beads if self.beads else 0.0
+
+
+@dataclass
+class SimulationResult:
+    """Summary of one simulated run."""
+
+    policy: str
+    concurrency: int
+    makespan: float = 0.0
+    busy: float = 0.0
+    launched: int = 0
+    completed: int = 0
+    failed: int = 0
+    blocked: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    sprints: Dict[str, SprintStats] = field(default_factory=dict)
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of session-slot time spent running scrum-masters."""
+        capacity = self.concurrency * self.makespan
+        return self.busy / capacity if capacity else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean time beads spent ready but not launched."""
+        return self.total_wait / self.launched if self.launched else 0.0
+
+    def record(self, bead: SimBead, ready_at: float, start: float, end: float) -> None:
+        """Record one scrum-master run."""
+        wait = start - ready_at
+        self.launched += 1
+        self.busy += end - start
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.makespan = max(self.makespan, end)
+        stats = self.sprints.get(bead.sprint)
+        if stats is None:
+            stats = self.sprints[bead.sprint] = SprintStats(bead.sprint)
+        stats.beads += 1
+        stats.start = min(stats.start, start)
+        stats.end = max(stats.end, end)
+        stats.busy += end - start
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+
+
+class _Graph:
+    """Dependency bookkeeping shared by policies."""
+
+    def __init__(self, beads: Sequence[SimBead]):
+        ids = {bead.id for bead in beads}
+        self.beads = {bead.id: bead for bead in beads}
+        self.waiting = {}
+        self.dependents: Dict[str, List[str]] = defaultdict(list)
+        for bead in beads:
+            # Dependencies outside the corpus are treated as already closed
+            deps = {dep for dep in bead.dependencies if dep in ids}
+            self.waiting[bead.id] = len(deps)
+            for dep in deps:
+                self.dependents[dep].append(bead.id)
+
+    def initial(self) -> List[str]:
+        """IDs ready at time zero, in corpus order."""
+        return [bead_id for bead_id, count in self.waiting.items() if count == 0]
+
+    def close(self, bead_id: str) -> List[str]:
+        """Mark a bead closed and return the dependents it unblocks."""
+        unblocked = []
+        for dependent in self.dependents[bead_id]:
+            self.waiting[dependent] -= 1
+            if self.waiting[dependent] == 0:
+                unblocked.append(dependent)
+        return unblocked
+
+
+def simulate_waves(
+    beads: Sequence[SimBead],
+    work: Dict[str, Work],
+    concurrency: int,
+    launch_overhead: float = 0.0,
+) -> SimulationResult:
+    """
+    Simulate the documented wave policy: launch every ready bead under the
+    semaphore, then wait for the whole wave before polling `bd ready` again.
+
+    Args:
+        beads: Corpus to run
+        work: Pre-sampled outcomes from sample_work
+        concurrency: MaxParallelSessions
+        launch_overhead: Seconds per bead for claim and session start-up
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    graph = _Graph(beads)
+    result = SimulationResult("wave", concurrency)
+    ready_at = dict.fromkeys(graph.initial(), 0.0)
+    wave = sorted(ready_at, key=lambda bead_id: graph.beads[bead_id].priority)
+    now = 0.0
+    while wave:
+        slots = [now] * min(concurrency, len(wave))
+        finished: List[Tuple[float, str]] = []
+        for bead_id in wave:
+            start = heapq.heappop(slots)
+            end = start + launch_overhead + work[bead_id].duration
+            heapq.heappush(slots, end)
+            result.record(graph.beads[bead_id], ready_at[bead_id], start, end)
+            finished.append((end, bead_id))
+        now = max(slots)
+        unblocked = []
+        for end, bead_id in sorted(finished):
+            if not work[bead_id].success:
+                result.failed += 1
+                continue
+            result.completed += 1
+            for dependent in graph.close(bead_id):
+                ready_at[dependent] = end
+                unblocked.append(dependent)
+        wave = sorted(unblocked, key=lambda bead_id: graph.beads[bead_id].priority)
+    result.blocked = len(beads) - result.launched
+    return result
+
+
+def simulate_eager(
+    beads: Sequence[SimBead],
+    work: Dict[str, Work],
+    concurrency: int,
+    launch_overhead: float = 0.0,
+    model_caps: Optional[Dict[str, int]] = None,
+    ranks: Optional[Dict[str, float]] = None,
+) -> SimulationResult:
+    """
+    Simulate barrier-free dispatch through `scheduler.Scheduler`.
+
+    Args:
+        beads: Corpus to run
+        work: Pre-sampled outcomes from sample_work
+        concurrency: Global session cap
+        launch_overhead: Seconds per bead for claim and session start-up
+        model_caps: Per-`dev_model` session caps
+        ranks: Remaining critical-path length per bead (default: the number
+            of beads on the longest chain from each bead, which needs no
+            duration estimates)
+    """
+    scheduler = Scheduler(concurrency, model_caps)
+    if ranks is None:
+        ranks = analyze(beads, dict.fromkeys((bead.id for bead in beads), 1.0)).remaining
+    scheduler.submit_many(
+        [
+            (bead.id, bead.dependencies, bead.priority, bead.dev_model, ranks.get(bead.id, 0.0))
+            for bead in beads
+        ]
+    )
+    by_id = {bead.id: bead for bead in beads}
+    result = SimulationResult("eager", concurrency)
+    ready_at: Dict[str, float] = {}
+    running: List[Tuple[float, str]] = []
+    now = 0.0
+
+    def launch() -> None:
+        for bead_id in scheduler.dispatch():
+            end = now + launch_overhead + work[bead_id].duration
+            heapq.heappush(running, (end, bead_id))
+            result.record(by_id[bead_id], ready_at.get(bead_id, 0.0), now, end)
+
+    launch()
+    while running:
+        now, bead_id = heapq.heappop(running)
+        success = work[bead_id].success
+        if success:
+            result.completed += 1
+        else:
+            result.failed += 1
+        for dependent in scheduler.complete(bead_id, success):
+            ready_at[dependent] = now
+        launch()
+    result.blocked = len(beads) - result.launched
+    return result
+
+
+POLICIES: Dict[str, Callable[..., SimulationResult]] = {
+    "wave": simulate_waves,
+    "eager": simulate_eager,
+}
+
+
+def sweep(
+    beads: Sequence[SimBead],
+    work: Dict[str, Work],
+    levels: Iterable[int],
+    policy: str = "wave",
+    launch_overhead: float = 0.0,
+) -> List[SimulationResult]:
+    """Simulate one policy across several concurrency levels."""
+    simulate = POLICIES[policy]
+    return [simulate(beads, work, level, launch_overhead) for level in levels]
+
+
+def format_result(result: SimulationResult, per_sprint: bool = False) -> str:
+    """Render a result as human-readable lines."""
+    lines = [
+        f"{result.policy} concurrency={result.concurrency}: "
+        f"makespan {result.makespan / 3600:.2f}h, utilization {result.utilization:.0%}, "
+        f"mean wait {result.mean_wait / 60:.1f}m, max wait {result.max_wait / 60:.1f}m, "
+        f"completed {result.completed}, failed {result.failed}, blocked {result.blocked}"
+    ]
+    if per_sprint:
+        for stats in result.sprints.values():
+            lines.append(
+                f"  sprint {stats.sprint}: {stats.beads} beads, "
+                f"span {stats.span / 3600:.2f}h, mean wait {stats.mean_wait / 60:.1f}m, "
+                f"max wait {stats.max_wait / 60:.1f}m"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Simulate ralph-loop makespan for a bead plan.")
+    parser.add_argument("file", nargs="?", help="JSON array of beads (default: stdin)")
+    parser.add_argument("--history", help="JSON array of beads to fit durations from")
+    parser.add_argument("--levels", default="1,2,4,8,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="wave")
+    parser.add_argument("--launch-overhead", type=float, default=0.0, help="Seconds per launch")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sprints", action="store_true", help="Print per-sprint statistics")
+    args = parser.parse_args()
+
+    beads = load_beads(args.file)
+    model = DurationModel.fit(load_beads(args.history) if args.history else beads)
+    plan = [SimBead.from_bead(bead) for bead in beads]
+    work = sample_work(plan, model, args.seed)
+    levels = [int(level) for level in args.levels.split(",")]
+    for result in sweep(plan, work, levels, args.policy, args.launch_overhead):
+        print(format_result(result, args.sprints))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Merge-conflict risk prediction for merge beads.
+
+Merge sprints fail expensively when parallel branches (`3a.*`, `3b.*`)
+changed the same files (corner case 7.1). For every merge bead this module
+computes the files each of its `branches_to_merge` changed since its merge
+base with the bead's `source_branch`, builds the overlap matrix between
+branches and recommends a merge order.
+
+All merge beads are analyzed together with a fixed number of git calls:
+one `for-each-ref` for branch commits, `rev-parse A...B` for merge bases
+(batched, MERGE_BASE_BATCH pairs per call) and one `diff-tree --stdin`
+for every changed-file set.
+
+Whatever the order, each file changed by k branches conflicts in k - 1
+merges, so order cannot reduce contended files. It can reduce how many
+merges stop for conflict resolution: a branch only conflicts when it
+overlaps a branch merged before it. `merge_order` puts a maximal set of
+mutually non-overlapping branches first (greedy by fewest overlaps) and
+the most contended branches last. The risk score is the fraction of
+merges still expected to conflict in that order.
+"""
+
+import argparse
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from bd_client import BdClient
+from bead_plan import load_beads
+from bead_schema import Bead, MergeRisk
+from branch_check import resolve_branches
+from git_utils import GitCommandError, run_git
+
+MERGE_BASE_BATCH = 1000
+LISTED_FILES = 20
+
+
+@dataclass
+class MergeAnalysis:
+    """Overlap between the branches of one merge bead."""
+
+    bead_id: str
+    target: str
+    target_commit: str
+    branches: List[str]  # Resolved branches_to_merge, in bead order
+    files: List[Set[str]]  # Changed files per branch
+    overlap: List[List[int]]  # Shared file counts between branches
+    unresolved: Dict[str, str] = field(default_factory=dict)  # Branch -> reason
+    order: List[str] = field(default_factory=list)
+
+    @property
+    def conflicting_pairs(self) -> List[Tuple[str, str]]:
+        """Branch pairs that changed at least one common file."""
+        n = len(self.branches)
+        return [
+            (self.branches[i], self.branches[j])
+            for i in range(n)
+            for j in range(i + 1, n)
+            if self.overlap[i][j]
+        ]
+
+    @property
+    def contended_files(self) -> Counter:
+        """Files changed by more than one branch, with how many branches changed them."""
+        counts = Counter(path for files in self.files for path in files)
+        return Counter({path: count for path, count in counts.items() if count > 1})
+
+    @property
+    def conflicting_merges(self) -> int:
+        """Merges in `order` whose branch overlaps one merged before it."""
+        index = {branch: i for i, branch in enumerate(self.branches)}
+        merged: List[int] = []
+        conflicts = 0
+        for branch in self.order:
+            i = index[branch]
+            conflicts += any(self.overlap[i][j] for j in merged)
+            merged.append(i)
+        return conflicts
+
+    @property
+    def score(self) -> float:
+        """Fraction of merges expected to conflict (0 with fewer than two branches)."""
+        merges = len(self.branches) - 1
+        return self.conflicting_merges / merges if merges > 0 else 0.0
+
+    def risk(self) -> MergeRisk:
+        """The prediction as stored in `metadata.merge_risk`."""
+        contended = self.contended_files
+        listed = sorted(contended, key=lambda path: (-contended[path], path))[:LISTED_FILES]
+        return MergeRisk(
+            score=self.score,
+            conflicting_pairs=len(self.conflicting_pairs),
+            overlapping_file_count=len(contended),
+            overlapping_files=listed,
+            merge_order=list(self.order),
+            target_commit=self.target_commit,
+        )
+
+
+def overlap_matrix(files: Sequence[Set[str]]) -> List[List[int]]:
+    """Number of files shared by each pair of branches (diagonal: files changed)."""
+    n = len(files)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = len(files[i])
+        for j in range(i + 1, n):
+            matrix[i][j] = matrix[j][i] = len(files[i] & files[j])
+    return matrix
+
+
+def merge_order(overlap: Sequence[Sequence[int]]) -> List[int]:
+    """
+    Branch indexes in recommended merge order.
+
+    Greedily picks an independent set of the overlap graph (fewest
+    overlapping branches first), then appends the remaining branches by
+    ascending number of overlaps. Ties keep the bead's order.
+    """
+    n = len(overlap)
+    neighbours = [{j for j in range(n) if j != i and overlap[i][j]} for i in range(n)]
+    by_degree = sorted(range(n), key=lambda i: len(neighbours[i]))
+    first: List[int] = []
+    blocked: Set[int] = set()
+    for i in by_degree:
+        if i not in blocked:
+            first.append(i)
+            blocked |= neighbours[i]
+    chosen = set(first)
+    return first + [i for i in by_degree if i not in chosen]
+
+
+def _merge_bases(repo: str, pairs: Sequence[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """Merge base of each (target, branch) commit pair; pairs without one are omitted."""
+    bases: Dict[Tuple[str, str], str] = {}
+    for start in range(0, len(pairs), MERGE_BASE_BATCH):
+        batch = pairs[start : start + MERGE_BASE_BATCH]
+        # `rev-parse A...B` prints B, A, then ^<base> for each merge base
+        groups: List[List[str]] = []
+        positives = 2
+        for line in run_git(repo, ["rev-parse", *(f"{t}...{b}" for t, b in batch)]).splitlines():
+            if line.startswith("^"):
+                groups[-1].append(line[1:])
+            elif positives == 2:
+                groups.append([])
+                positives = 1
+            else:
+                positives += 1
+        for pair, found in zip(batch, groups):
+            if found:
+                bases[pair] = found[0]
+    return bases
+
+
+def _changed_files(repo: str, pairs: Sequence[Tuple[str, str]]) -> List[Set[str]]:
+    """Files changed between each (base, commit) pair, from one `git diff-tree`."""
+    if not pairs:
+        return []
+    stdin = "".join(f"{commit} {base}\n" for base, commit in pairs)
+    output = run_git(
+        repo,
+        ["diff-tree", "--stdin", "--always", "-r", "--name-only", "--no-renames", "-z"],
+        stdin=stdin,
+    )
+    # With --always every input line yields a header (the commit), then its paths
+    results: List[Set[str]] = []
+    headers = iter(commit for _, commit in pairs)
+    expected = next(headers)
+    for token in output.split("\0"):
+        if token == expected:
+            results.append(set())
+            expected = next(headers, None)
+        elif token and results:
+            results[-1].add(token)
+    return results
+
+
+def merge_beads(beads: Iterable[Bead], include_closed: bool = False) -> List[Bead]:
+    """Merge beads with branches to merge (open ones only by default)."""
+    return [
+        bead
+        for bead in beads
+        if bead.issue_type == "beads-ralph-merge"
+        and bead.metadata.branches_to_merge
+        and (include_closed or bead.status != "closed")
+    ]
+
+
+def analyze(
+    beads: Iterable[Bead], repo: str, remotes: Sequence[str] = ("origin",)
+) -> List[MergeAnalysis]:
+    """
+    Overlap analysis for every merge bead in `beads`.
+
+    Branches (or targets) that are not in the repository, or share no
+    history with the target, are left out of the analysis and listed in
+    `unresolved`.
+
+    Raises:
+        GitCommandError: If git fails
+    """
+    commits = resolve_branches(repo, remotes)
+    plans = []
+    pairs: Dict[Tuple[str, str], None] = {}
+    for bead in merge_beads(beads):
+        target = bead.metadata.source_branch
+        target_commit = commits.get(target, "")
+        resolved, unresolved = [], {}
+        for branch in dict.fromkeys(bead.metadata.branches_to_merge):
+            if branch not in commits:
+                unresolved[branch] = "not in the repository"
+            elif not target_commit:
+                unresolved[branch] = f"target {target} is not in the repository"
+            else:
+                resolved.append(branch)
+                pairs[(target_commit, commits[branch])] = None
+        plans.append((bead, target, target_commit, resolved, unresolved))
+
+    bases = _merge_bases(repo, list(pairs))
+    diffs = list(dict.fromkeys((base, pair[1]) for pair, base in bases.items()))
+    changed = dict(zip(diffs, _changed_files(repo, diffs)))
+
+    analyses = []
+    for bead, target, target_commit, resolved, unresolved in plans:
+        branches, files = [], []
+        for branch in resolved:
+            base = bases.get((target_commit, commits[branch]))
+            if base is None:
+                unresolved[branch] = f"no common history with {target}"
+            else:
+                branches.append(branch)
+                files.append(changed[(base, commits[branch])])
+        overlap = overlap_matrix(files)
+        analysis = MergeAnalysis(
+            bead.id, target, target_commit, branches, files, overlap, unresolved
+        )
+        analysis.order = [branches[i] for i in merge_order(overlap)]
+        analyses.append(analysis)
+    return analyses
+
+
+def format_analysis(analysis: MergeAnalysis) -> str:
+    """Render one merge bead's analysis as human-readable lines."""
+    risk = analysis.risk()
+    lines = [
+        f"{analysis.bead_id}: risk {risk.score:.2f}, "
+        f"{risk.conflicting_pairs} conflicting pairs, "
+        f"{risk.overlapping_file_count} overlapping files (into {analysis.target})"
+    ]
+    n = len(analysis.branches)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if analysis.overlap[i][j]:
+                lines.append(
+                    f"  {analysis.branches[i]} x {analysis.branches[j]}: "
+                    f"{analysis.overlap[i][j]} shared files"
+                )
+    if risk.overlapping_files:
+        lines.append(f"  most contended: {', '.join(risk.overlapping_files[:5])}")
+    lines.append(f"  merge order: {' -> '.join(analysis.order)}")
+    for branch, reason in analysis.unresolved.items():
+        lines.append(f"  skipped {branch}: {reason}")
+    return "\n".join(lines)
+
+
+def write_risks(client: BdClient, analyses: Iterable[MergeAnalysis]) -> None:
+    """Store each prediction in its bead's `metadata.merge_risk` (one flush)."""
+    for analysis in analyses:
+        client.update(
+            analysis.bead_id, metadata={"merge_risk": analysis.risk().model_dump(mode="json")}
+        )
+    client.flush()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Predict merge conflicts for merge beads.")
+    parser.add_argument("file", nargs="?", help="JSON array of beads (default: stdin)")
+    parser.add_argument("--repo", default=".", help="Local git repository (default: .)")
+    parser.add_argument(
+        "--remote", action="append", help="Remote whose branches count (default: origin)"
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Write metadata.merge_risk back through bd"
+    )
+    args = parser.parse_args()
+
+    beads = load_beads(args.file)
+    try:
+        analyses = analyze(beads, args.repo, args.remote or ["origin"])
+    except GitCommandError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for analysis in analyses:
+        print(format_analysis(analysis))
+    if args.update:
+        with BdClient() as client:
+            write_risks(client, analyses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Cache of QA agent outcomes keyed by worktree content.
+
+Every dev/QA retry re-runs every agent in `BeadMetadata.qa_agents`. A QA
+verdict only depends on what the agent looked at and how it was asked, so
+outcomes are stored under:
+
+- the git tree hash of the worktree, including uncommitted changes
+- the QA agent's `agent_path`
+- a hash of its prompt (with `model` and `input_schema`)
+- a hash of its `output_schema`
+
+A retry whose tree is unchanged reuses the stored `QAExecution`. Only
+`pass` and `fail` are cached; `stop` always re-runs. Agents whose checks
+are flaky (corner case 3.4) opt out by `agent_path` and are never cached.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from bead_schema import QAAgent, QAExecution
+from git_utils import run_git
+from history_store import QA_CODEC
+from validation_metrics import VALIDATION_METRICS, ValidationMetrics
+
+FORMAT_VERSION = "1"
+
+CACHEABLE_STATUS = frozenset({"pass", "fail"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS qa_cache_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS qa_results (
+    tree_hash TEXT NOT NULL,
+    agent_path TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    schema_hash TEXT NOT NULL,
+    record TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (tree_hash, agent_path, prompt_hash, schema_hash)
+) WITHOUT ROWID;
+"""
+
+
+def tree_hash(worktree: str) -> str:
+    """
+    Hash a worktree's content, including uncommitted and untracked files.
+
+    Stages everything into a copy of the worktree's index (so the real
+    index is untouched and unchanged files keep their cached stat data)
+    and writes it as a tree object. Ignored files are excluded.
+    """
+    index = run_git(worktree, ["rev-parse", "--path-format=absolute", "--git-path", "index"])
+    fd, scratch = tempfile.mkstemp(prefix="qa-cache-index-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            if os.path.exists(index):
+                with open(index, "rb") as src:
+                    out.write(src.read())
+        env = dict(os.environ, GIT_INDEX_FILE=scratch)
+        run_git(worktree, ["add", "--all", "--", "."], env)
+        return run_git(worktree, ["write-tree"], env)
+    finally:
+        os.unlink(scratch)
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 of a value's canonical JSON (sorted keys, no whitespace)."""
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cache_key(tree: str, agent: QAAgent) -> Tuple[str, str, str, str]:
+    """Return (tree hash, agent_path, prompt hash, output_schema hash)."""
+    prompt = {"model": agent.model, "prompt": agent.prompt, "input_schema": agent.input_schema}
+    return (tree, agent.agent_path, content_hash(prompt), content_hash(agent.output_schema))
+
+
+class QACache:
+    """SQLite-backed QA outcome cache shared by all retries of a plan."""
+
+    def __init__(
+        self,
+        path: str,
+        flaky_agents: Iterable[str] = (),
+        metrics: Optional[ValidationMetrics] = VALIDATION_METRICS,
+    ):
+        """
+        Open (or create) a QA cache.
+
+        Args:
+            path: SQLite database file path
+            flaky_agents: `agent_path`s never served from or stored in the cache
+            metrics: Records hits and misses as cache "qa" (None to disable)
+        """
+        self.path = os.path.abspath(path)
+        self.flaky_agents = frozenset(flaky_agents)
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM qa_cache_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO qa_cache_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(f"unsupported QA cache format {row[0]}, expected {FORMAT_VERSION}")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "QACache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def cacheable(self, agent: QAAgent) -> bool:
+        """False for agents opted out as flaky."""
+        return agent.agent_path not in self.flaky_agents
+
+    def get(self, tree: str, agent: QAAgent, attempt: int) -> Optional[QAExecution]:
+        """
+        Look up a stored outcome.
+
+        Args:
+            tree: Worktree hash from `tree_hash`
+            agent: QA agent about to run
+            attempt: Current dev attempt; the hit is re-labelled with it
+
+        Returns:
+            The stored execution (original session and timestamps), or None
+        """
+        if not self.cacheable(agent):
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM qa_results WHERE tree_hash = ? AND agent_path = ?"
+                " AND prompt_hash = ? AND schema_hash = ?",
+                cache_key(tree, agent),
+            ).fetchone()
+        if self.metrics is not None:
+            self.metrics.record_cache("qa", hit=row is not None)
+        if row is None:
+            return None
+        return QA_CODEC.decode(row[0]).model_copy(update={"attempt": attempt})
+
+    def put(self, tree: str, agent: QAAgent, execution: QAExecution) -> bool:
+        """
+        Store an outcome.
+
+        Returns:
+            True if stored; False for flaky agents and `stop` results
+        """
+        if not self.cacheable(agent) or execution.status not in CACHEABLE_STATUS:
+            return False
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO qa_results"
+                " (tree_hash, agent_path, prompt_hash, schema_hash, record, stored_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (*cache_key(tree, agent), QA_CODEC.encode(execution), time.time()),
+            )
+        return True
+
+    def run(
+        self,
+        tree: str,
+        agent: QAAgent,
+        attempt: int,
+        execute: Callable[[QAAgent], QAExecution],
+    ) -> Tuple[QAExecution, bool]:
+        """
+        Return a cached outcome or run the agent and cache its result.
+
+        Args:
+            tree: Worktree hash from `tree_hash`
+            agent: QA agent to run
+            attempt: Current dev attempt
+            execute: Runs the agent for real
+
+        Returns:
+            (execution, True if served from the cache)
+        """
+        cached = self.get(tree, agent, attempt)
+        if cached is not None:
+            return cached, True
+        execution = execute(agent)
+        self.put(tree, agent, execution)
+        return execution, False
+
+    def evict_older_than(self, seconds: float) -> int:
+        """Drop entries stored more than `seconds` ago; return how many."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM qa_results WHERE stored_at < ?", (time.time() - seconds,)
+            )
+        return cursor.rowcount
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Streaming extraction of fenced JSON results from agent output.
+
+Scrum-master and QA agents end their output with a fenced ```json block
+(docs/architecture.md), but the transcript around it can run to megabytes.
+`FencedJsonScanner` reads the output once, in chunks, and keeps only the
+bytes inside ```json fences (the last `keep` blocks), so memory is bounded
+by the size of the result rather than the transcript. Outside a fence it
+only searches for the next opening marker.
+
+A block that does not parse gets bounded repairs (corner case 3.2):
+trailing commas are dropped and, for output cut off mid-result, an open
+string and up to `MAX_CLOSERS` open brackets are closed. The last block
+that parses and validates wins.
+"""
+
+import io
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+from bead_schema import QAResult, ScrumResult
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Source = Union[bytes, str, io.IOBase, Iterable[bytes]]
+
+OPEN_FENCE = b"```json"
+CLOSE_FENCE = b"\n```"
+CHUNK_SIZE = 1 << 20
+MAX_BLOCK_BYTES = 16 << 20
+MAX_CLOSERS = 64
+
+
+class ResultExtractionError(ValueError):
+    """No fenced JSON block in the output parsed and validated."""
+
+
+@dataclass(frozen=True)
+class FencedBlock:
+    """Content of one ```json fence."""
+
+    text: bytes
+    complete: bool
+
+
+class FencedJsonScanner:
+    """Incremental scanner for ```json fenced blocks."""
+
+    def __init__(self, keep: Optional[int] = 8, max_block_bytes: int = MAX_BLOCK_BYTES):
+        """
+        Args:
+            keep: Blocks to retain, most recent last (None keeps all)
+            max_block_bytes: Blocks larger than this are skipped
+        """
+        self.blocks: Deque[FencedBlock] = deque(maxlen=keep)
+        self.max_block_bytes = max_block_bytes
+        self.bytes_scanned = 0
+        self.skipped = 0
+        self._tail = b""
+        self._block: Optional[bytearray] = None
+        self._oversized = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of output."""
+        self.bytes_scanned += len(chunk)
+        data = self._tail + chunk if self._tail else chunk
+        self._tail = b""
+        pos = 0
+        while True:
+            if self._block is None:
+                start = data.find(OPEN_FENCE, pos)
+                if start < 0:
+                    self._tail = data[max(pos, len(data) - len(OPEN_FENCE) + 1) :]
+                    return
+                newline = data.find(b"\n", start + len(OPEN_FENCE))
+                if newline < 0:
+                    # Info string continues in the next chunk
+                    self._tail = data[start:] if len(data) - start < 256 else b""
+                    return
+                if data[start + len(OPEN_FENCE) : newline].strip():
+                    pos = newline  # e.g. ```jsonc or ```json5: not ours
+                    continue
+                self._block = bytearray()
+                self._oversized = False
+                # Search from the newline so an empty block still closes
+                search, content = newline, newline + 1
+            else:
+                search = content = pos
+            end = data.find(CLOSE_FENCE, search)
+            if end < 0:
+                keep_from = max(search, len(data) - len(CLOSE_FENCE) + 1)
+                self._append(data[content:keep_from])
+                self._tail = data[keep_from:]
+                return
+            self._append(data[content:end])
+            self._finish(complete=True)
+            pos = end + len(CLOSE_FENCE)
+
+    def _append(self, piece: bytes) -> None:
+        if self._oversized:
+            return
+        if len(self._block) + len(piece) > self.max_block_bytes:
+            self._oversized = True
+            self._block = bytearray()
+            return
+        self._block += piece
+
+    def _finish(self, complete: bool) -> None:
+        if self._oversized:
+            self.skipped += 1
+        else:
+            self.blocks.append(FencedBlock(bytes(self._block), complete))
+        self._block = None
+        self._oversized = False
+
+    def close(self) -> List[FencedBlock]:
+        """End of output; an unterminated block is kept as incomplete."""
+        if self._block is not None:
+            self._append(self._tail)
+            self._finish(complete=False)
+        self._tail = b""
+        return list(self.blocks)
+
+
+def iter_chunks(source: Source, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield byte chunks from bytes, str, a binary/text file or an iterable of chunks."""
+    if isinstance(source, str):
+        source = source.encode()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+        return
+    read = getattr(source, "read", None)
+    if read is not None:
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+    for chunk in source:
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+def scan(source: Source, keep: Optional[int] = 8) -> List[FencedBlock]:
+    """Return the fenced JSON blocks of an output (the last `keep`, oldest first)."""
+    scanner = FencedJsonScanner(keep)
+    for chunk in iter_chunks(source):
+        scanner.feed(chunk)
+    return scanner.close()
+
+
+def repair_json(text: str, max_closers: int = MAX_CLOSERS) -> Optional[str]:
+    """
+    Apply bounded repairs to almost-JSON.
+
+    Drops trailing commas before `}`/`]` and at the end, closes an open
+    string and appends missing closers (at most `max_closers`).
+
+    Returns:
+        The repaired text, or None if nothing could be repaired
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = escaped = False
+    pending_comma = -1
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char in " \t\r\n":
+            out.append(char)
+            continue
+        if char in "}]":
+            if pending_comma >= 0:
+                out[pending_comma] = ""
+            if stack and stack[-1] == char:
+                stack.pop()
+        elif char == "{":
+            stack.append("}")
+        elif char == "[":
+            stack.append("]")
+        elif char == '"':
+            in_string = True
+        pending_comma = len(out) if char == "," else -1
+        out.append(char)
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    elif pending_comma >= 0:
+        out[pending_comma] = ""
+    if len(stack) > max_closers:
+        return None
+    out.extend(reversed(stack))
+    repaired = "".join(out)
+    return repaired if repaired != text else None
+
+
+def parse_block(block: FencedBlock) -> Any:
+    """Parse a block, repairing it if plain parsing fails."""
+    text = block.text.decode("utf-8", "replace")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        repaired = repair_json(text)
+        if repaired is None:
+            raise
+        try:
+            return json.loads(repaired)
+        except json.JSONDecodeError:
+            raise exc from None
+
+
+def extract_result(
+    source: Source,
+    model: Type[ModelT],
+    defaults: Optional[Dict[str, Any]] = None,
+    keep: int = 8,
+) -> ModelT:
+    """
+    Validate the last usable fenced JSON block of an output into `model`.
+
+    Args:
+        source: Agent output (bytes, str, file or chunk iterable)
+        model: Result model, e.g. ScrumResult or QAResult
+        defaults: Fields filled in when the block omits them
+        keep: Most recent blocks considered
+
+    Raises:
+        ResultExtractionError: If no block parses and validates
+    """
+    blocks = scan(source, keep)
+    if not blocks:
+        raise ResultExtractionError("output contains no ```json block")
+    errors = []
+    for block in reversed(blocks):
+        try:
+            data = parse_block(block)
+        except json.JSONDecodeError as exc:
+            errors.append(f"invalid JSON: {exc}")
+            continue
+        if defaults and isinstance(data, dict):
+            data = {**defaults, **data}
+        try:
+            return model.model_validate(data)
+        except ValidationError as exc:
+            errors.append(f"{exc.error_count()} validation error(s): {exc.errors()[0]['msg']}")
+    raise ResultExtractionError(
+        f"no usable {model.__name__} in {len(blocks)} block(s); last: {errors[0]}"
+    )
+
+
+def parse_scrum_output(source: Source) -> ScrumResult:
+    """Extract a ScrumResult from scrum-master output."""
+    return extract_result(source, ScrumResult)
+
+
+def parse_qa_output(source: Source, agent_path: str) -> QAResult:
+    """
+    Extract a QAResult from QA agent output.
+
+    Output without a usable result becomes a `fail` (corner case 3.2), so
+    the dev agent is retried rather than the loop crashing.
+    """
+    try:
+        return extract_result(source, QAResult, defaults={"agent_path": agent_path})
+    except ResultExtractionError as exc:
+        return QAResult(
+            agent_path=agent_path,
+            status="fail",
+            message="QA agent returned invalid output format",
+            details={"error": str(exc)},
+        )
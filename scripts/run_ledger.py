@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""Append-only ledger of ralph-loop events for crash recovery.
+
+The restart and emergency-stop procedures (docs/corner-cases.md) find
+interrupted work by listing `in_progress` beads and inspecting them by
+hand. The loop instead records every event it acts on (claims, dev
+attempt start/end, QA results, `ScrumResult`s and status changes) in a
+local SQLite ledger, and a restarted loop rebuilds its in-flight state
+from it.
+
+Events are never rewritten. Every `snapshot_every` events the ledger
+stores, in the same transaction, a compact snapshot of the state: one
+entry per bead that is not closed. Recovery loads the last snapshot and
+replays at most `snapshot_every` events after it, so its cost depends on
+the number of in-flight beads, not on how long the run has been going.
+
+Several processes may append to one ledger: each append first applies
+the events other writers added since its own last one.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from bd_client import BdClient
+from bead_schema import VALID_STATUS, DevExecution, QAResult, ScrumResult
+from claim_manager import Lease
+
+FORMAT_VERSION = "1"
+
+DEFAULT_SNAPSHOT_EVERY = 1000
+
+EVENT_CLAIM = "claim"
+EVENT_RELEASE = "release"
+EVENT_DEV_START = "dev_start"
+EVENT_DEV_END = "dev_end"
+EVENT_QA_RESULT = "qa_result"
+EVENT_SCRUM_RESULT = "scrum_result"
+EVENT_STATUS = "status"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    bead_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq INTEGER PRIMARY KEY,
+    taken_at REAL NOT NULL,
+    state TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class LedgerEvent:
+    """One recorded loop event."""
+
+    seq: int
+    recorded_at: float
+    kind: str
+    bead_id: str
+    data: Dict[str, Any]
+
+
+@dataclass
+class BeadState:
+    """What the loop knows about one bead that is not closed."""
+
+    bead_id: str
+    status: Optional[str] = None
+    owner: Optional[str] = None  # Claiming session, None when released
+    token: int = 0  # Fencing token of the last claim
+    attempt: int = 0  # Last dev attempt started
+    dev_session_id: Optional[str] = None  # Set while a dev attempt runs
+    last_dev_status: Optional[str] = None
+    qa_results: Dict[str, str] = field(default_factory=dict)  # Agent path -> status
+    scrum_result: Optional[Dict[str, Any]] = None
+
+    @property
+    def interrupted(self) -> bool:
+        """True if a restart must reopen the bead (in progress or mid-attempt)."""
+        return self.status == "in_progress" or self.dev_session_id is not None
+
+
+@dataclass
+class RunState:
+    """In-flight state rebuilt from the ledger."""
+
+    seq: int = 0  # Last event applied
+    beads: Dict[str, BeadState] = field(default_factory=dict)
+
+    def apply(self, event: LedgerEvent) -> None:
+        """Fold one event into the state."""
+        self.seq = event.seq
+        data = event.data
+        if event.kind == EVENT_STATUS and data["status"] == "closed":
+            self.beads.pop(event.bead_id, None)
+            return
+        bead = self.beads.get(event.bead_id)
+        if bead is None:
+            bead = self.beads[event.bead_id] = BeadState(event.bead_id)
+        if event.kind == EVENT_CLAIM:
+            bead.owner, bead.token = data["owner"], data["token"]
+        elif event.kind == EVENT_RELEASE:
+            if data["token"] == bead.token:
+                bead.owner = None
+        elif event.kind == EVENT_DEV_START:
+            bead.attempt = data["attempt"]
+            bead.dev_session_id = data["session_id"]
+            bead.qa_results = {}
+        elif event.kind == EVENT_DEV_END:
+            bead.attempt = max(bead.attempt, data["attempt"])
+            bead.dev_session_id = None
+            bead.last_dev_status = data["status"]
+        elif event.kind == EVENT_QA_RESULT:
+            bead.qa_results[data["agent_path"]] = data["status"]
+        elif event.kind == EVENT_SCRUM_RESULT:
+            bead.scrum_result = data
+        elif event.kind == EVENT_STATUS:
+            bead.status = data["status"]
+            if bead.status == "open":
+                # Reopened: nothing runs and nobody holds it
+                bead.dev_session_id = None
+                bead.owner = None
+
+    def interrupted(self) -> List[BeadState]:
+        """Beads a restarted loop must reopen, in ID order."""
+        return [bead for _, bead in sorted(self.beads.items()) if bead.interrupted]
+
+    def dumps(self) -> str:
+        """Compact JSON encoding used for snapshots."""
+        state = {"seq": self.seq, "beads": [asdict(bead) for bead in self.beads.values()]}
+        return json.dumps(state, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, text: str) -> "RunState":
+        """Decode a snapshot."""
+        state = json.loads(text)
+        beads = {bead["bead_id"]: BeadState(**bead) for bead in state["beads"]}
+        return cls(seq=state["seq"], beads=beads)
+
+
+class RunLedger:
+    """SQLite-backed append-only event log with periodic state snapshots."""
+
+    def __init__(
+        self,
+        path: str,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) a ledger and recover its state.
+
+        Args:
+            path: SQLite database file path
+            snapshot_every: Events between snapshots (bounds the replayed tail)
+            clock: Timestamp source for events and snapshots
+        """
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be >= 1")
+        self.path = os.path.abspath(path)
+        self.snapshot_every = snapshot_every
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM ledger_meta WHERE key = 'format_version'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO ledger_meta (key, value) VALUES ('format_version', ?)",
+                (FORMAT_VERSION,),
+            )
+        elif row[0] != FORMAT_VERSION:
+            raise ValueError(f"unsupported ledger format {row[0]}, expected {FORMAT_VERSION}")
+        with self._lock:
+            self._recover()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "RunLedger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Recovery
+
+    def _recover(self) -> None:
+        # Caller holds the lock
+        row = self._conn.execute(
+            "SELECT seq, state FROM snapshots ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        self._state = RunState.loads(row[1]) if row else RunState()
+        self._snapshot_seq = self._state.seq
+        # Events replayed after the snapshot, at most snapshot_every
+        self.recovered_events = self._catch_up()
+
+    def _catch_up(self) -> int:
+        """Apply events appended after the current state; return how many."""
+        count = 0
+        for event in self._events_after(self._state.seq):
+            self._state.apply(event)
+            count += 1
+        return count
+
+    def _events_after(self, seq: int) -> Iterator[LedgerEvent]:
+        cursor = self._conn.execute(
+            "SELECT seq, recorded_at, kind, bead_id, data FROM events WHERE seq > ? ORDER BY seq",
+            (seq,),
+        )
+        try:
+            for seq, recorded_at, kind, bead_id, data in cursor:
+                yield LedgerEvent(seq, recorded_at, kind, bead_id, json.loads(data))
+        finally:
+            cursor.close()
+
+    @property
+    def state(self) -> RunState:
+        """The in-flight state as of the last event this ledger read or wrote."""
+        return self._state
+
+    def refresh(self) -> RunState:
+        """Apply events appended by other writers and return the state."""
+        with self._lock:
+            self._catch_up()
+        return self._state
+
+    def iter_events(self, after: int = 0) -> Iterator[LedgerEvent]:
+        """Recorded events in order, starting after sequence number `after`."""
+        with self._lock:
+            events = list(self._events_after(after))
+        yield from events
+
+    # Writing
+
+    def _write_snapshot(self) -> None:
+        # Caller holds the write transaction
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots (seq, taken_at, state) VALUES (?, ?, ?)",
+            (self._state.seq, self.clock(), self._state.dumps()),
+        )
+        self._conn.execute("DELETE FROM snapshots WHERE seq < ?", (self._state.seq,))
+        self._snapshot_seq = self._state.seq
+
+    def _append(self, kind: str, bead_id: str, data: Dict[str, Any]) -> LedgerEvent:
+        """Record one event, snapshotting when `snapshot_every` events have passed."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._catch_up()
+                recorded_at = self.clock()
+                cursor = self._conn.execute(
+                    "INSERT INTO events (recorded_at, kind, bead_id, data) VALUES (?, ?, ?, ?)",
+                    (recorded_at, kind, bead_id, json.dumps(data, separators=(",", ":"))),
+                )
+                event = LedgerEvent(cursor.lastrowid, recorded_at, kind, bead_id, data)
+                self._state.apply(event)
+                if event.seq - self._snapshot_seq >= self.snapshot_every:
+                    self._write_snapshot()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                # The in-memory state may hold the rolled-back event
+                self._recover()
+                raise
+        return event
+
+    def snapshot(self) -> None:
+        """Store a snapshot now (e.g. on clean shutdown) so the next start replays nothing."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._catch_up()
+                if self._state.seq > self._snapshot_seq:
+                    self._write_snapshot()
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def record_claim(self, lease: Lease) -> LedgerEvent:
+        """Record a claim acquired through `ClaimManager`."""
+        return self._append(
+            EVENT_CLAIM, lease.bead_id, {"owner": lease.owner, "token": lease.token}
+        )
+
+    def record_release(self, lease: Lease) -> LedgerEvent:
+        """Record a released claim (ignored if the bead was claimed again since)."""
+        return self._append(
+            EVENT_RELEASE, lease.bead_id, {"owner": lease.owner, "token": lease.token}
+        )
+
+    def record_dev_start(self, bead_id: str, attempt: int, session_id: str) -> LedgerEvent:
+        """Record the start of a dev attempt."""
+        return self._append(
+            EVENT_DEV_START, bead_id, {"attempt": attempt, "session_id": session_id}
+        )
+
+    def record_dev_end(self, bead_id: str, execution: DevExecution) -> LedgerEvent:
+        """Record a finished dev attempt."""
+        return self._append(EVENT_DEV_END, bead_id, execution.model_dump(mode="json"))
+
+    def record_qa_result(self, bead_id: str, result: QAResult) -> LedgerEvent:
+        """Record one QA agent's verdict on the current attempt."""
+        return self._append(EVENT_QA_RESULT, bead_id, result.model_dump(mode="json"))
+
+    def record_scrum_result(self, result: ScrumResult) -> LedgerEvent:
+        """Record a scrum-master's final result."""
+        return self._append(EVENT_SCRUM_RESULT, result.bead_id, result.model_dump(mode="json"))
+
+    def record_status(self, bead_id: str, status: str) -> LedgerEvent:
+        """
+        Record a bead status change.
+
+        Raises:
+            ValueError: If status is not a bead status
+        """
+        if status not in VALID_STATUS:
+            raise ValueError(f"status must be one of {VALID_STATUS}, got: {status}")
+        return self._append(EVENT_STATUS, bead_id, {"status": status})
+
+
+def reopen_interrupted(ledger: RunLedger, client: BdClient) -> List[str]:
+    """
+    Reopen interrupted beads through bd and record it in the ledger.
+
+    This is the ledger-driven form of the emergency-stop step that moves
+    `in_progress` beads back to `open`.
+
+    Returns:
+        IDs of the reopened beads
+    """
+    bead_ids = [bead.bead_id for bead in ledger.refresh().interrupted()]
+    for bead_id in bead_ids:
+        client.update(bead_id, status="open")
+    client.flush()
+    for bead_id in bead_ids:
+        ledger.record_status(bead_id, "open")
+    return bead_ids
+
+
+def format_state(state: RunState) -> str:
+    """Render the in-flight beads as human-readable lines."""
+    interrupted = state.interrupted()
+    lines = [
+        f"{len(state.beads)} beads in flight after event {state.seq}, "
+        f"{len(interrupted)} interrupted"
+    ]
+    for bead_id in sorted(state.beads):
+        bead = state.beads[bead_id]
+        parts = [f"{bead_id}: {bead.status or 'unknown'}", f"attempt {bead.attempt}"]
+        if bead.dev_session_id:
+            parts.append(f"dev running ({bead.dev_session_id})")
+        elif bead.last_dev_status:
+            parts.append(f"dev {bead.last_dev_status}")
+        if bead.owner:
+            parts.append(f"claimed by {bead.owner}")
+        if bead.qa_results:
+            qa = ", ".join(f"{path}={status}" for path, status in sorted(bead.qa_results.items()))
+            parts.append(f"qa {qa}")
+        if bead.scrum_result is not None:
+            parts.append("succeeded" if bead.scrum_result["success"] else "failed")
+        lines.append(("* " if bead.interrupted else "  ") + ", ".join(parts))
+    return "\n".join(lines)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Show or recover a ralph-loop run ledger.")
+    parser.add_argument("ledger", help="Ledger database file")
+    parser.add_argument(
+        "--reopen", action="store_true", help="Reopen interrupted beads through bd"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.ledger):
+        print(f"Error: no ledger at {args.ledger}", file=sys.stderr)
+        sys.exit(1)
+    with RunLedger(args.ledger) as ledger:
+        print(format_state(ledger.state))
+        if args.reopen:
+            with BdClient() as client:
+                reopened = reopen_interrupted(ledger, client)
+            print(f"reopened {len(reopened)} beads")
+
+
+if __name__ == "__main__":
+    main()
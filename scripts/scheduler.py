@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Barrier-free priority scheduler for ready beads.
+
+The loop in docs/architecture.md launches a wave of ready beads and waits
+for all of them, so one slow bead idles every other session. This
+scheduler dispatches each bead as soon as its dependencies close:
+
+- ready beads are ordered by `priority` (0 first), then by remaining
+  critical-path length (longest first), then by submission order
+- at most `max_sessions` beads run at once, and at most
+  `model_caps[model]` beads per `dev_model`
+- a failed bead never closes, so its dependents stay blocked
+
+The orchestrator drives it with `submit`, `dispatch` and `complete`:
+
+    scheduler = Scheduler(max_sessions=8, model_caps={"opus": 2})
+    scheduler.submit_beads(beads)
+    while not scheduler.finished:
+        for bead_id in scheduler.dispatch():
+            launch(bead_id)                 # e.g. start a scrum-master
+        bead_id, ok = wait_for_any()
+        scheduler.complete(bead_id, success=ok)
+"""
+
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from bead_schema import VALID_MODELS, Bead
+
+
+PENDING = "pending"
+READY = "ready"
+RUNNING = "running"
+CLOSED = "closed"
+FAILED = "failed"
+
+
+@dataclass
+class _Task:
+    bead_id: str
+    priority: int
+    model: str
+    rank: float
+    waiting: int = 0
+    state: str = PENDING
+    dependents: List[str] = field(default_factory=list)
+
+
+class Scheduler:
+    """Dependency-driven dispatcher with global and per-model caps."""
+
+    def __init__(self, max_sessions: int, model_caps: Optional[Dict[str, int]] = None):
+        """
+        Create a scheduler.
+
+        Args:
+            max_sessions: Global concurrency cap (MaxParallelSessions)
+            model_caps: Optional per-`dev_model` caps, e.g. {"opus": 2}
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        model_caps = dict(model_caps or {})
+        for model, cap in model_caps.items():
+            if model not in VALID_MODELS:
+                raise ValueError(f"model must be one of {VALID_MODELS}, got: {model}")
+            if cap < 1:
+                raise ValueError(f"cap for {model} must be >= 1, got: {cap}")
+        self.max_sessions = max_sessions
+        self.model_caps = model_caps
+        self._tasks: Dict[str, _Task] = {}
+        # One ready heap per model so a capped model never blocks the others
+        self._ready: Dict[str, List[Tuple[int, float, int, str]]] = {}
+        self._running: Dict[str, int] = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    # Submission
+
+    def submit(
+        self,
+        bead_id: str,
+        dependencies: Iterable[str] = (),
+        priority: int = 2,
+        model: str = "sonnet",
+        rank: float = 0.0,
+    ) -> None:
+        """
+        Add one bead.
+
+        Dependencies that were never submitted are assumed closed already;
+        submit a plan with `submit_many` so order within it does not matter.
+
+        Args:
+            bead_id: Bead ID
+            dependencies: IDs of beads that must close first
+            priority: Bead priority (0 is most urgent)
+            model: The bead's `dev_model`
+            rank: Remaining critical-path length; longer runs first
+        """
+        self.submit_many([(bead_id, tuple(dependencies), priority, model, rank)])
+
+    def submit_many(self, items: Sequence[Tuple[str, Sequence[str], int, str, float]]) -> None:
+        """Add several beads given as (id, dependencies, priority, model, rank)."""
+        with self._lock:
+            for bead_id, _, priority, model, rank in items:
+                if bead_id in self._tasks:
+                    raise ValueError(f"bead already submitted: {bead_id}")
+                if model not in VALID_MODELS:
+                    raise ValueError(f"model must be one of {VALID_MODELS}, got: {model}")
+                self._tasks[bead_id] = _Task(bead_id, priority, model, rank)
+            for bead_id, dependencies, _, _, _ in items:
+                task = self._tasks[bead_id]
+                for dep in set(dependencies):
+                    parent = self._tasks.get(dep)
+                    if parent is None or parent.state == CLOSED:
+                        continue
+                    parent.dependents.append(bead_id)
+                    task.waiting += 1
+                if task.waiting == 0:
+                    self._make_ready(task)
+
+    def submit_beads(
+        self, beads: Sequence[Bead], ranks: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Add validated beads.
+
+        Args:
+            beads: Beads to schedule
+            ranks: Remaining critical-path length per bead ID, e.g.
+                `critical_path.analyze(beads).remaining` (default: 0)
+        """
+        ranks = ranks or {}
+        self.submit_many(
+            [
+                (
+                    bead.id,
+                    bead.dependencies,
+                    bead.priority,
+                    bead.metadata.dev_model,
+                    ranks.get(bead.id, 0.0),
+                )
+                for bead in beads
+            ]
+        )
+
+    def _make_ready(self, task: _Task) -> None:
+        task.state = READY
+        entry = (task.priority, -task.rank, next(self._order), task.bead_id)
+        heapq.heappush(self._ready.setdefault(task.model, []), entry)
+
+    # Dispatch
+
+    def _has_capacity(self, model: str) -> bool:
+        cap = self.model_caps.get(model)
+        return cap is None or self._running.get(model, 0) < cap
+
+    def dispatch(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Mark the best ready beads as running, within the caps.
+
+        Args:
+            limit: Dispatch at most this many (default: as many as fit)
+
+        Returns:
+            IDs to launch, best first
+        """
+        launched: List[str] = []
+        with self._lock:
+            while self.running < self.max_sessions and (limit is None or len(launched) < limit):
+                best = None
+                for model, heap in self._ready.items():
+                    if heap and self._has_capacity(model) and (best is None or heap[0] < best[0]):
+                        best = (heap[0], model)
+                if best is None:
+                    break
+                _, model = best
+                _, _, _, bead_id = heapq.heappop(self._ready[model])
+                self._tasks[bead_id].state = RUNNING
+                self._running[model] = self._running.get(model, 0) + 1
+                launched.append(bead_id)
+        return launched
+
+    def complete(self, bead_id: str, success: bool = True) -> List[str]:
+        """
+        Record that a running bead finished.
+
+        Args:
+            bead_id: Bead that finished
+            success: False if the scrum-master failed; dependents stay blocked
+
+        Returns:
+            IDs of beads that became ready as a result
+        """
+        with self._lock:
+            task = self._tasks.get(bead_id)
+            if task is None or task.state != RUNNING:
+                raise ValueError(f"bead is not running: {bead_id}")
+            self._running[task.model] -= 1
+            if not success:
+                task.state = FAILED
+                return []
+            task.state = CLOSED
+            unblocked = []
+            for dependent_id in task.dependents:
+                dependent = self._tasks[dependent_id]
+                dependent.waiting -= 1
+                if dependent.waiting == 0:
+                    self._make_ready(dependent)
+                    unblocked.append(dependent_id)
+            return unblocked
+
+    # Introspection
+
+    @property
+    def running(self) -> int:
+        """Number of beads currently running."""
+        return sum(self._running.values())
+
+    @property
+    def ready(self) -> int:
+        """Number of beads ready but not yet dispatched."""
+        return sum(len(heap) for heap in self._ready.values())
+
+    @property
+    def finished(self) -> bool:
+        """True when nothing is running or ready (the rest, if any, is blocked)."""
+        return self.running == 0 and self.ready == 0
+
+    def state(self, bead_id: str) -> str:
+        """Scheduling state of a bead (pending, ready, running, closed, failed)."""
+        return self._tasks[bead_id].state
+
+    def blocked(self) -> Set[str]:
+        """Beads waiting on dependencies; once `finished`, those blocked by a failure."""
+        return {bead_id for bead_id, task in self._tasks.items() if task.state == PENDING}
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""JSON Schema export of the beads-ralph models.
+
+Consumers that do not run Python (bd hooks, Go tooling, editors) can
+validate beads against JSON Schema (draft 2020-12) documents generated
+from the models. The schemas come from `bead_schema_native.py`, whose
+enums, ranges, list lengths and phase/sprint patterns are declarative,
+and are then completed with the rules pydantic cannot export portably:
+
+- `title` must contain a non-whitespace character (`str.strip()`), with
+  the whitespace spelled out since regex dialects disagree on its class
+- `output_schema` must have `status` and `message` properties, with any
+  `status` enum limited to the QA statuses (mirroring every input the
+  Python validator accepts, including its quirks)
+- datetimes must match DATETIME_PATTERN, a calendar-exact RFC 3339
+  date-time (`format` alone is only an annotation)
+
+JSON Schema patterns use ECMA-262 semantics, where `$` only matches at
+the end of the string; Python's `$` also matches before a final newline,
+so the phase and sprint patterns allow it explicitly.
+
+Known gaps, where the schema is stricter or looser than pydantic:
+
+- datetimes pydantic also parses (unix timestamps as strings, times
+  without seconds, more than six fractional digits) are rejected
+- JSON Schema counts `1.0` as an integer; pydantic's strict mode does not
+
+Schemas are cached under SCHEMA_DIR, one directory per schema version,
+with a manifest of content hashes. `export` only rewrites files whose
+content changed and `--check` fails when the cache is stale.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import bead_schema
+import bead_schema_native
+from bead_schema import VALID_QA_STATUS
+
+# Version of the ralph extension (schemas/extensions/ralph-v0.1.0.yaml)
+SCHEMA_VERSION = "0.1.0"
+DRAFT = "https://json-schema.org/draft/2020-12/schema"
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schemas" / "compiled" / "json-schema"
+MANIFEST = "manifest.json"
+
+EXPORTED_MODELS = {
+    "Bead": "bead.schema.json",
+    "BeadMetadata": "bead-metadata.schema.json",
+    "ScrumResult": "scrum-result.schema.json",
+    "QAResult": "qa-result.schema.json",
+}
+
+# Every character Python's str.strip() removes, as literals (no \s or \p
+# classes, which differ between regex dialects)
+WHITESPACE = "".join(chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace())
+TITLE_PATTERN = f"[^{WHITESPACE}]"
+
+_YEAR = "(?:[1-9][0-9]{3}|0[1-9][0-9]{2}|00[1-9][0-9]|000[1-9])"
+_LEAP_YEAR = "(?:[0-9]{2}(?:0[48]|[2468][048]|[13579][26])|(?:0[48]|[2468][048]|[13579][26])00)"
+_MONTH_DAY = (
+    "(?:(?:0[13578]|1[02])-(?:0[1-9]|[12][0-9]|3[01])"
+    "|(?:0[469]|11)-(?:0[1-9]|[12][0-9]|30)"
+    "|02-(?:0[1-9]|1[0-9]|2[0-8]))"
+)
+_TIME = "[Tt](?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\\.[0-9]{1,6})?"
+_OFFSET = "(?:[Zz]|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])?"
+DATETIME_PATTERN = f"^(?:{_YEAR}-{_MONTH_DAY}|{_LEAP_YEAR}-02-29){_TIME}{_OFFSET}$"
+
+# QAAgent.validate_output_schema: `"enum" in status` must hold only for an
+# object, whose enum values (or characters, or keys) are QA statuses
+OUTPUT_SCHEMA_RULE: Dict[str, Any] = {
+    "type": "object",
+    "required": ["properties"],
+    "properties": {
+        "properties": {
+            "type": "object",
+            "required": ["status", "message"],
+            "properties": {
+                "status": {
+                    "anyOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "enum": {
+                                    "anyOf": [
+                                        {"type": "array", "items": {"enum": VALID_QA_STATUS}},
+                                        {"const": ""},
+                                        {
+                                            "type": "object",
+                                            "propertyNames": {"enum": VALID_QA_STATUS},
+                                        },
+                                    ]
+                                }
+                            },
+                        },
+                        {"type": "string", "not": {"pattern": "enum"}},
+                        {"type": "array", "not": {"contains": {"const": "enum"}}},
+                    ]
+                }
+            },
+        }
+    },
+}
+
+
+def _ecma_pattern(pattern: str) -> str:
+    """A `^...$` Python pattern with Python's optional final newline made explicit."""
+    return pattern[:-1] + "\\n?$" if pattern.endswith("$") else pattern
+
+
+def _add_datetime_patterns(node: Any) -> None:
+    """Add DATETIME_PATTERN to every `date-time` string in a schema (recursively)."""
+    if isinstance(node, dict):
+        if node.get("format") == "date-time":
+            node["pattern"] = DATETIME_PATTERN
+        for child in node.values():
+            _add_datetime_patterns(child)
+    elif isinstance(node, list):
+        for child in node:
+            _add_datetime_patterns(child)
+
+
+def json_schema(model_name: str) -> Dict[str, Any]:
+    """
+    JSON Schema for one model, with nested models under `$defs`.
+
+    Descriptions are taken from `bead_schema`, the authoritative models.
+    """
+    schema = getattr(bead_schema_native, model_name).model_json_schema()
+    models = {model_name: schema, **schema.get("$defs", {})}
+    for name, node in models.items():
+        source = getattr(bead_schema, name)
+        node["description"] = source.__doc__
+        properties = node.get("properties", {})
+        for field_name, prop in properties.items():
+            description = source.model_fields[field_name].description
+            if description:
+                prop["description"] = description
+        if name == "Bead":
+            properties["title"]["pattern"] = TITLE_PATTERN
+        elif name == "QAAgent":
+            prop = properties["output_schema"]
+            properties["output_schema"] = {
+                "title": prop["title"],
+                "description": prop.get("description", ""),
+                **OUTPUT_SCHEMA_RULE,
+            }
+        elif name == "BeadMetadata":
+            for field_name in ("phase", "sprint"):
+                properties[field_name]["pattern"] = _ecma_pattern(
+                    properties[field_name]["pattern"]
+                )
+    _add_datetime_patterns(schema)
+    return {
+        "$schema": DRAFT,
+        "$id": f"urn:beads-ralph:schema:{SCHEMA_VERSION}:{model_name}",
+        **schema,
+    }
+
+
+def render(model_name: str) -> str:
+    """The exported file content for one model."""
+    return json.dumps(json_schema(model_name), indent=2) + "\n"
+
+
+def _sha256(text: str) -> str:
+    """Hex SHA-256 of a text's UTF-8 encoding."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def render_all() -> Dict[str, str]:
+    """File name -> content for every exported schema and the manifest."""
+    files = {EXPORTED_MODELS[name]: render(name) for name in EXPORTED_MODELS}
+    manifest = {
+        "version": SCHEMA_VERSION,
+        "draft": DRAFT,
+        "generator": "scripts/schema_export.py",
+        "schemas": {
+            name: {"file": file_name, "sha256": _sha256(files[file_name])}
+            for name, file_name in EXPORTED_MODELS.items()
+        },
+    }
+    files[MANIFEST] = json.dumps(manifest, indent=2) + "\n"
+    return files
+
+
+def version_dir(root: Path = SCHEMA_DIR, version: str = SCHEMA_VERSION) -> Path:
+    """Directory holding the schemas of one version."""
+    return root / f"v{version}"
+
+
+def stale_files(root: Path = SCHEMA_DIR, files: Optional[Dict[str, str]] = None) -> List[str]:
+    """Cached files that are missing or differ from `files` (default: a fresh export)."""
+    directory = version_dir(root)
+    stale = []
+    for file_name, text in (files or render_all()).items():
+        path = directory / file_name
+        if not path.exists() or path.read_text() != text:
+            stale.append(file_name)
+    return stale
+
+
+def export(root: Path = SCHEMA_DIR) -> List[str]:
+    """Write the current version's schemas, returning the files that changed."""
+    directory = version_dir(root)
+    directory.mkdir(parents=True, exist_ok=True)
+    files = render_all()
+    changed = stale_files(root, files)
+    for file_name in changed:
+        (directory / file_name).write_text(files[file_name])
+    return changed
+
+
+def load_schema(model_name: str, root: Path = SCHEMA_DIR) -> Dict[str, Any]:
+    """
+    Read a cached schema.
+
+    Raises:
+        KeyError: If the model is not exported
+        FileNotFoundError: If the schema has not been exported
+    """
+    return json.loads((version_dir(root) / EXPORTED_MODELS[model_name]).read_text())
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Export JSON Schema for the bead models.")
+    parser.add_argument(
+        "--out", type=Path, default=SCHEMA_DIR, help=f"Schema root (default: {SCHEMA_DIR})"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 if the cached schemas are out of date"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        stale = stale_files(args.out)
+        for file_name in stale:
+            print(f"stale: {version_dir(args.out) / file_name}")
+        sys.exit(1 if stale else 0)
+    changed = export(args.out)
+    directory = version_dir(args.out)
+    print(f"{len(changed)} of {len(EXPORTED_MODELS) + 1} files updated in {directory}")
+
+
+if __name__ == "__main__":
+    main()
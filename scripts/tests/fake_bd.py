@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Minimal local stand-in for the `bd` CLI, for tests and benchmarks.
+
+Beads are stored as one JSON file per bead in the directory named by
+FAKE_BD_DIR. FAKE_BD_DELAY adds a fixed latency (seconds) to every call to
+mimic real `bd` process and database cost. Every invocation is appended to
+`calls.log` in the store so tests can count subprocess launches.
+
+Supported subset:
+    fake_bd.py show <id> [<id>...] --json
+    fake_bd.py update <id> [--status S] [--metadata JSON] [--json]
+    fake_bd.py ready [--assignee A] [--limit N] --json
+    fake_bd.py list [--status S] [--label L] [--assignee A] --json
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+def bead_path(store: Path, bead_id: str) -> Path:
+    """Return the file path holding a bead."""
+    return store / f"{bead_id}.json"
+
+
+def parse_flags(args: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Split arguments into positionals and --flag values (--flag=v or --flag v)."""
+    positionals: List[str] = []
+    flags: Dict[str, str] = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("--"):
+            name, sep, value = arg[2:].partition("=")
+            if not sep:
+                if i + 1 < len(args) and not args[i + 1].startswith("--"):
+                    value = args[i + 1]
+                    i += 1
+                else:
+                    value = "true"
+            flags[name] = value
+        else:
+            positionals.append(arg)
+        i += 1
+    return positionals, flags
+
+
+def load_all(store: Path) -> List[dict]:
+    """Load every bead in the store, ordered by priority then ID."""
+    beads = [json.loads(p.read_text()) for p in store.glob("*.json")]
+    return sorted(beads, key=lambda b: (b.get("priority", 0), b.get("id", "")))
+
+
+def write_bead(store: Path, bead: dict) -> None:
+    """Atomically replace a bead file."""
+    fd, tmp = tempfile.mkstemp(dir=store, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(bead, f)
+    os.replace(tmp, bead_path(store, bead["id"]))
+
+
+def cmd_show(store: Path, args: List[str]) -> int:
+    """Print the requested beads as a JSON array."""
+    ids, _ = parse_flags(args)
+    if not ids:
+        print("Error: show requires at least one issue ID", file=sys.stderr)
+        return 1
+    beads = []
+    for bead_id in ids:
+        path = bead_path(store, bead_id)
+        if not path.exists():
+            print(f"Error: issue not found: {bead_id}", file=sys.stderr)
+            return 1
+        beads.append(json.loads(path.read_text()))
+    json.dump(beads, sys.stdout)
+    return 0
+
+
+def cmd_update(store: Path, args: List[str]) -> int:
+    """Update status and/or replace metadata of one bead."""
+    ids, flags = parse_flags(args)
+    if len(ids) != 1:
+        print("Error: update requires exactly one issue ID", file=sys.stderr)
+        return 1
+    path = bead_path(store, ids[0])
+    if not path.exists():
+        print(f"Error: issue not found: {ids[0]}", file=sys.stderr)
+        return 1
+    bead = json.loads(path.read_text())
+    if "status" in flags:
+        bead["status"] = flags["status"]
+    if "metadata" in flags:
+        try:
+            bead["metadata"] = json.loads(flags["metadata"])
+        except json.JSONDecodeError as e:
+            print(f"Error: invalid metadata JSON: {e}", file=sys.stderr)
+            return 1
+    write_bead(store, bead)
+    if "json" in flags:
+        json.dump(bead, sys.stdout)
+    return 0
+
+
+def cmd_ready(store: Path, args: List[str]) -> int:
+    """Print open beads whose dependencies are all closed."""
+    _, flags = parse_flags(args)
+    beads = load_all(store)
+    status = {b["id"]: b.get("status") for b in beads}
+    ready = [
+        b
+        for b in beads
+        if b.get("status") == "open"
+        and all(status.get(dep) == "closed" for dep in b.get("dependencies", []))
+        and ("assignee" not in flags or b.get("assignee") == flags["assignee"])
+    ]
+    json.dump(ready[: int(flags.get("limit", "100"))], sys.stdout)
+    return 0
+
+
+def cmd_list(store: Path, args: List[str]) -> int:
+    """Print beads filtered by status, label and assignee."""
+    _, flags = parse_flags(args)
+    beads = [
+        b
+        for b in load_all(store)
+        if ("status" not in flags or b.get("status") == flags["status"])
+        and ("label" not in flags or flags["label"] in b.get("labels", []))
+        and ("assignee" not in flags or b.get("assignee") == flags["assignee"])
+    ]
+    json.dump(beads, sys.stdout)
+    return 0
+
+
+COMMANDS = {"show": cmd_show, "update": cmd_update, "ready": cmd_ready, "list": cmd_list}
+
+
+def main():
+    """Main entry point."""
+    store = Path(os.environ.get("FAKE_BD_DIR", ".fake-bd"))
+    delay = float(os.environ.get("FAKE_BD_DELAY", "0"))
+    if delay:
+        time.sleep(delay)
+
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print(f"Error: unsupported command, expected one of {sorted(COMMANDS)}", file=sys.stderr)
+        sys.exit(2)
+    if store.is_dir():
+        with open(store / "calls.log", "a") as log:
+            log.write(" ".join(sys.argv[1:2]) + "\n")
+    sys.exit(COMMANDS[sys.argv[1]](store, sys.argv[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Unit tests for token-bucket admission control."""
+
+import pytest
+
+from admission_control import AdmissionController, ModelLimit, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+LIMITS = {"sonnet": ModelLimit(rate=2.0, burst=3), "opus": ModelLimit(rate=1.0, burst=1)}
+
+
+@pytest.fixture
+def controller(tmp_path, clock):
+    with AdmissionController(str(tmp_path / "admission.db"), LIMITS, clock=clock) as controller:
+        yield controller
+
+
+class TestTokenBucket:
+    """Tests for the bucket arithmetic."""
+
+    def test_burst_then_refill(self):
+        """Test a full bucket admits a burst, then refills at the rate."""
+        bucket = TokenBucket(rate=2.0, burst=3)
+        assert [bucket.take(0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.take(0.0) == pytest.approx(0.5)
+        assert bucket.take(0.5) == 0.0
+        bucket.refill(100.0)
+        assert bucket.tokens == 3
+
+
+class TestAdmission:
+    """Tests for AdmissionController."""
+
+    def test_try_acquire_waits_for_tokens(self, controller, clock):
+        """Test launches beyond the burst are told how long to wait."""
+        assert [controller.try_acquire("sonnet") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert controller.try_acquire("sonnet") == pytest.approx(0.5)
+        # Models have independent budgets
+        assert controller.try_acquire("opus") == 0.0
+        clock.now += 0.5
+        assert controller.try_acquire("sonnet") == 0.0
+
+    def test_rate_limit_backs_off_exponentially(self, controller, clock):
+        """Test repeated 429s pause the model for 1s, 2s, 4s."""
+        assert controller.report_rate_limited("sonnet") == 1.0
+        assert controller.try_acquire("sonnet") == pytest.approx(1.0)
+        clock.now += 1.0
+        assert controller.report_rate_limited("sonnet") == 2.0
+        clock.now += 2.0
+        assert controller.report_rate_limited("sonnet") == 4.0
+        controller.report_success("sonnet")
+        clock.now += 4.0
+        assert controller.report_rate_limited("sonnet") == 1.0
+
+    def test_retry_after_is_honoured(self, controller, clock):
+        """Test a server retry-after overrides the computed backoff."""
+        assert controller.report_rate_limited("opus", retry_after=7.5) == 7.5
+        clock.now += 7.0
+        assert controller.try_acquire("opus") == pytest.approx(0.5)
+
+    def test_aimd_rate(self, controller, clock):
+        """Test the rate halves on 429s down to the floor and grows back additively."""
+        for _ in range(10):
+            controller.report_rate_limited("sonnet", retry_after=0)
+            clock.now += 1.0
+        assert controller.rate("sonnet") == pytest.approx(2.0 / 16)
+        controller.report_success("sonnet")
+        assert controller.rate("sonnet") == pytest.approx(2.0 / 16 + 0.1)
+        for _ in range(50):
+            controller.report_success("sonnet")
+        assert controller.rate("sonnet") == 2.0
+
+    def test_one_burst_is_one_decrease(self, controller, clock):
+        """Test 429s from one over-admitted burst halve the rate once."""
+        assert controller.report_rate_limited("sonnet") == 1.0
+        clock.now += 0.5
+        assert controller.report_rate_limited("sonnet") == pytest.approx(0.5)
+        assert controller.rate("sonnet") == 1.0
+        clock.now += 0.5
+        assert controller.report_rate_limited("sonnet") == 2.0
+        assert controller.rate("sonnet") == 0.5
+
+    def test_shared_between_connections(self, tmp_path, clock):
+        """Test two controllers on one file draw from one budget."""
+        path = str(tmp_path / "admission.db")
+        with AdmissionController(path, LIMITS, clock=clock) as a, AdmissionController(
+            path, LIMITS, clock=clock
+        ) as b:
+            assert a.try_acquire("opus") == 0.0
+            assert b.try_acquire("opus") == pytest.approx(1.0)
+            b.report_rate_limited("sonnet", retry_after=5)
+            assert a.try_acquire("sonnet") == pytest.approx(5.0)
+
+    def test_acquire_times_out(self, tmp_path):
+        """Test acquire gives up after its timeout."""
+        limits = {"haiku": ModelLimit(rate=0.01, burst=1)}
+        with AdmissionController(str(tmp_path / "admission.db"), limits) as controller:
+            assert controller.acquire("haiku", timeout=0.05)
+            assert not controller.acquire("haiku", timeout=0.05)
+
+    def test_cost_above_burst_is_rejected(self, controller):
+        """Test a cost no full bucket can cover raises instead of waiting forever."""
+        with pytest.raises(ValueError, match="exceeds burst"):
+            controller.try_acquire("opus", cost=2)
+        with pytest.raises(ValueError, match="exceeds burst"):
+            controller.acquire("sonnet", cost=3.5)
+        assert controller.acquire("sonnet", cost=3)
+
+    def test_invalid_models(self, tmp_path, controller):
+        """Test unknown models and models without a limit are rejected."""
+        with pytest.raises(ValueError, match="model must be one of"):
+            AdmissionController(str(tmp_path / "other.db"), {"gpt": ModelLimit(1, 1)})
+        with pytest.raises(ValueError, match="no admission limit"):
+            controller.try_acquire("haiku")
+        with pytest.raises(ValueError):
+            ModelLimit(rate=0, burst=1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Unit tests for the asyncio bd validation pipeline."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import async_validation
+from async_validation import fetch_bead_json, split_show_output, validate_beads_sync
+from bd_client import BdCommandError
+from tests.test_validator import get_valid_bead_json
+
+FAKE_BD = [sys.executable, str(Path(__file__).resolve().parent / "fake_bd.py")]
+
+
+@pytest.fixture
+def bd_store(tmp_path, monkeypatch):
+    """Populate a fake bd store with valid beads and one invalid bead."""
+    for i in range(6):
+        bead = get_valid_bead_json()
+        bead["id"] = f"bd-{i}"
+        (tmp_path / f"bd-{i}.json").write_text(json.dumps(bead))
+    bad = get_valid_bead_json()
+    bad["id"] = "bd-bad"
+    bad["metadata"]["phase"] = "1.2"
+    (tmp_path / "bd-bad.json").write_text(json.dumps(bad))
+    monkeypatch.setenv("FAKE_BD_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestSplitShowOutput:
+    """Tests for split_show_output."""
+
+    def test_array_and_object(self):
+        """Test arrays split per bead and objects pass through."""
+        assert [json.loads(d) for d in split_show_output(b' [{"id": "a"}, {"id": "b"}]')] == [
+            {"id": "a"},
+            {"id": "b"},
+        ]
+        assert split_show_output(b'{"id": "a"}') == [b'{"id": "a"}']
+
+
+class TestFetch:
+    """Tests for fetch_bead_json."""
+
+    def test_fetch_and_missing(self, bd_store):
+        """Test a bead is fetched and a missing one raises BdCommandError."""
+        payload = asyncio.run(fetch_bead_json("bd-1", FAKE_BD))
+        assert json.loads(payload)["id"] == "bd-1"
+        with pytest.raises(BdCommandError, match="issue not found"):
+            asyncio.run(fetch_bead_json("bd-missing", FAKE_BD))
+
+    def test_timeout(self, bd_store, monkeypatch):
+        """Test slow bd calls are killed after the timeout."""
+        monkeypatch.setenv("FAKE_BD_DELAY", "5")
+        with pytest.raises(BdCommandError, match="timed out"):
+            asyncio.run(fetch_bead_json("bd-1", FAKE_BD, timeout=0.2))
+
+
+class TestValidateBeads:
+    """Tests for the concurrent pipeline."""
+
+    def test_results_for_every_bead(self, bd_store):
+        """Test valid, invalid and missing beads are all reported."""
+        ids = [f"bd-{i}" for i in range(6)] + ["bd-bad", "bd-missing"]
+        results = {r.bead_id: r for r in validate_beads_sync(ids, bd_command=FAKE_BD)}
+        assert set(results) == set(ids)
+        assert all(results[f"bd-{i}"].valid for i in range(6))
+        assert results["bd-0"].bead.id == "bd-0"
+        assert results["bd-bad"].errors[0]["loc"] == ("metadata", "phase")
+        assert "issue not found" in results["bd-missing"].error
+
+    def test_msgspec_engine(self, bd_store):
+        """Test the pipeline honours the engine selection."""
+        pytest.importorskip("msgspec")
+        results = validate_beads_sync(["bd-0", "bd-bad"], bd_command=FAKE_BD, engine="msgspec")
+        assert sorted(r.valid for r in results) == [False, True]
+
+    def test_concurrency_speedup(self, bd_store, monkeypatch):
+        """Test fetches overlap up to the concurrency limit."""
+        monkeypatch.setenv("FAKE_BD_DELAY", "0.3")
+        ids = [f"bd-{i}" for i in range(6)]
+
+        start = time.perf_counter()
+        validate_beads_sync(ids, bd_command=FAKE_BD, concurrency=6)
+        parallel = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validate_beads_sync(ids[:2], bd_command=FAKE_BD, concurrency=1)
+        serial_two = time.perf_counter() - start
+
+        # Six beads at concurrency 6 take about as long as one bead serially
+        assert parallel < serial_two
+
+    def test_missing_bd_command(self, bd_store):
+        """Test a bd command that cannot be started is reported per bead, not hung on."""
+        ids = ["bd-0", "bd-1", "bd-2"]
+        results = validate_beads_sync(ids, bd_command=[str(bd_store / "no-such-bd")], timeout=5)
+        assert sorted(r.bead_id for r in results) == ids
+        assert all(r.error.startswith("FileNotFoundError") for r in results)
+
+    def test_worker_crash_is_raised(self, bd_store, monkeypatch):
+        """Test a worker dying outside per-bead handling raises instead of hanging."""
+
+        def broken_result(**kwargs):
+            raise RuntimeError("worker bug")
+
+        monkeypatch.setattr(async_validation, "BeadValidationResult", broken_result)
+        with pytest.raises(RuntimeError, match="worker bug"):
+            validate_beads_sync(["bd-0", "bd-1"], bd_command=FAKE_BD)
+
+    def test_invalid_concurrency(self):
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            validate_beads_sync(["bd-1"], concurrency=0)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Unit tests for the pooled, batched bd client."""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from bd_client import BdClient, BdCommandError, parse_beads
+from tests.test_validator import get_valid_bead_json
+
+FAKE_BD = [sys.executable, str(Path(__file__).resolve().parent / "fake_bd.py")]
+
+
+@pytest.fixture
+def bd_store(tmp_path, monkeypatch):
+    """Populate a fake bd store with a small dependency chain of beads."""
+    for i in range(5):
+        bead = get_valid_bead_json()
+        bead["id"] = f"bd-{i}"
+        bead["dependencies"] = [f"bd-{i - 1}"] if i else []
+        (tmp_path / f"bd-{i}.json").write_text(json.dumps(bead))
+    monkeypatch.setenv("FAKE_BD_DIR", str(tmp_path))
+    return tmp_path
+
+
+def read_bead(store: Path, bead_id: str) -> dict:
+    """Load a bead straight from the fake store."""
+    return json.loads((store / f"{bead_id}.json").read_text())
+
+
+def call_log(store: Path) -> list:
+    """Return the bd subcommands invoked so far."""
+    log = store / "calls.log"
+    return log.read_text().split() if log.exists() else []
+
+
+class TestParseBeads:
+    """Tests for parse_beads."""
+
+    def test_array_object_and_empty(self):
+        """Test arrays, single objects and empty output parse."""
+        bead = json.dumps(get_valid_bead_json()).encode()
+        assert len(parse_beads(b"[" + bead + b"," + bead + b"]")) == 2
+        assert parse_beads(bead)[0].id == "bd-a1b2c3"
+        assert parse_beads(b"\n") == []
+
+    def test_invalid_bead_raises(self):
+        """Test invalid beads raise ValidationError located by index."""
+        bad = get_valid_bead_json()
+        bad["priority"] = 9
+        with pytest.raises(ValidationError) as exc_info:
+            parse_beads(json.dumps([get_valid_bead_json(), bad]).encode())
+        assert exc_info.value.errors()[0]["loc"] == (1, "priority")
+
+
+class TestReads:
+    """Tests for batched reads."""
+
+    def test_show_many_batches_ids(self, bd_store):
+        """Test IDs are packed into ceil(n / batch_size) bd show calls."""
+        with BdClient(FAKE_BD, pool_size=2, batch_size=2) as client:
+            beads = client.show_many([f"bd-{i}" for i in (4, 0, 3, 1, 2, 0)])
+            assert list(beads) == ["bd-4", "bd-0", "bd-3", "bd-1", "bd-2"]
+            assert beads["bd-3"].dependencies == ["bd-2"]
+            assert client.calls == 3
+        assert call_log(bd_store) == ["show"] * 3
+
+    def test_show_missing_raises(self, bd_store):
+        """Test a missing bead raises BdCommandError."""
+        with BdClient(FAKE_BD) as client:
+            with pytest.raises(BdCommandError, match="issue not found"):
+                client.show("bd-missing")
+
+    def test_ready_and_list(self, bd_store):
+        """Test ready respects dependencies and list filters by status."""
+        bead = read_bead(bd_store, "bd-0")
+        bead["status"] = "closed"
+        (bd_store / "bd-0.json").write_text(json.dumps(bead))
+        with BdClient(FAKE_BD) as client:
+            assert [b.id for b in client.ready()] == ["bd-1"]
+            assert [b.id for b in client.list(status="closed")] == ["bd-0"]
+            assert len(client.list()) == 5
+
+
+class TestWrites:
+    """Tests for coalesced writes."""
+
+    def test_updates_coalesce_into_one_write(self, bd_store):
+        """Test several queued changes produce a single bd update per bead."""
+        client = BdClient(FAKE_BD)
+        client.update("bd-1", status="in_progress")
+        client.update("bd-1", metadata={"attempt_count": 1, "pr_url": "https://example.com/1"})
+        client.update("bd-1", metadata={"attempt_count": 2, "pr_url": None})
+        client.update("bd-1", status="closed")
+        client.update("bd-2", status="blocked")
+        assert client.pending == ["bd-1", "bd-2"]
+
+        results = client.flush()
+        client.close()
+
+        assert results["bd-1"].metadata.attempt_count == 2
+        assert results["bd-2"] is None
+        assert call_log(bd_store) == ["show", "update", "update"]
+        stored = read_bead(bd_store, "bd-1")
+        assert stored["status"] == "closed"
+        assert stored["metadata"]["attempt_count"] == 2
+        assert "pr_url" not in stored["metadata"]
+        assert stored["metadata"]["qa_agents"] == get_valid_bead_json()["metadata"]["qa_agents"]
+        assert read_bead(bd_store, "bd-2")["status"] == "blocked"
+        assert client.pending == []
+
+    def test_invalid_patch_writes_nothing(self, bd_store):
+        """Test a patch that would invalidate a bead raises before any write."""
+        client = BdClient(FAKE_BD)
+        client.update("bd-1", status="closed")
+        client.update("bd-2", metadata={"phase": "1.2"})
+        with pytest.raises(ValidationError):
+            client.flush()
+        client.close()
+        assert "update" not in call_log(bd_store)
+        assert read_bead(bd_store, "bd-1")["status"] == "open"
+
+    def test_context_manager_flushes(self, bd_store):
+        """Test leaving the context flushes queued updates."""
+        with BdClient(FAKE_BD) as client:
+            client.update("bd-3", status="in_progress")
+        assert read_bead(bd_store, "bd-3")["status"] == "in_progress"
+
+
+class TestSqliteReads:
+    """Tests for direct SQLite reads."""
+
+    def test_show_many_from_database(self, tmp_path):
+        """Test beads are assembled from issues, dependencies, labels and comments."""
+        bead = get_valid_bead_json()
+        db_path = tmp_path / "beads.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE issues (
+                id TEXT PRIMARY KEY, title TEXT, description TEXT, status TEXT,
+                priority INTEGER, issue_type TEXT, assignee TEXT, owner TEXT,
+                metadata TEXT, external_ref TEXT, created_at DATETIME,
+                updated_at DATETIME, closed_at DATETIME
+            );
+            CREATE TABLE dependencies (issue_id TEXT, depends_on_id TEXT);
+            CREATE TABLE labels (issue_id TEXT, label TEXT);
+            CREATE TABLE comments (
+                id INTEGER PRIMARY KEY, issue_id TEXT, author TEXT, text TEXT,
+                created_at DATETIME
+            );
+            """
+        )
+        conn.execute(
+            "INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?, NULL, ?, ?, NULL)",
+            (
+                bead["id"],
+                bead["title"],
+                bead["description"],
+                bead["status"],
+                bead["priority"],
+                bead["issue_type"],
+                bead["assignee"],
+                json.dumps(bead["metadata"]),
+                bead["created_at"],
+                bead["updated_at"],
+            ),
+        )
+        conn.execute("INSERT INTO dependencies VALUES (?, 'bd-dep')", (bead["id"],))
+        conn.execute("INSERT INTO labels VALUES (?, 'sprint-1-2')", (bead["id"],))
+        conn.execute(
+            "INSERT INTO comments (issue_id, author, text, created_at) VALUES (?, ?, ?, ?)",
+            (bead["id"], "qa", "looks good", "2026-02-07T11:00:00Z"),
+        )
+        conn.commit()
+        conn.close()
+
+        with BdClient(["false"], db_path=str(db_path)) as client:
+            loaded = client.show(bead["id"])
+            assert client.calls == 0
+            with pytest.raises(BdCommandError, match="bd-missing"):
+                client.show("bd-missing")
+        assert loaded.dependencies == ["bd-dep"]
+        assert loaded.labels == ["sprint-1-2"]
+        assert loaded.comments[0]["text"] == "looks good"
+        assert loaded.metadata.qa_agents[0].agent_path == bead["metadata"]["qa_agents"][0][
+            "agent_path"
+        ]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Unit tests for the closed-bead archive."""
+
+import json
+
+import pytest
+
+from bead_archive import ArchiveFormatError, ArchiveWriter, BeadArchive, archive_closed
+from bead_delta import canonical_json
+from bead_schema import Bead
+from tests.test_validator import get_valid_bead_json
+
+
+def make_bead(index, status="closed"):
+    data = get_valid_bead_json()
+    data["id"] = f"bd-{index:04d}"
+    data["status"] = status
+    data["description"] = f"Work item {index}\nwith a newline and ünïcode"
+    data["created_at"] = "2026-02-07T12:00:00+02:00"
+    return Bead.model_validate_json(json.dumps(data))
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / "closed.arc")
+
+
+class TestArchive:
+    """Tests for ArchiveWriter and BeadArchive."""
+
+    def test_round_trip_and_random_access(self, archive_path):
+        """Test every bead reads back equal, by ID and in bulk, across many blocks."""
+        beads = [make_bead(i) for i in range(200, 0, -1)]
+        with ArchiveWriter(archive_path, block_size=4096) as writer:
+            for bead in beads:
+                writer.add(bead)
+        with BeadArchive(archive_path) as archive:
+            assert len(archive) == 200 and archive.blocks > 10
+            for bead in beads[::17]:
+                assert archive.get(bead.id) == bead
+                assert archive.get_json(bead.id).decode() == canonical_json(bead)
+            assert list(archive) == beads
+            assert list(archive.ids()) == sorted(b.id for b in beads)
+            assert archive.get("bd-9999") is None
+            assert "bd-0001" in archive and "bd-0000" not in archive
+
+    def test_archive_closed_passes_live_beads(self, archive_path):
+        """Test only closed beads are archived and the rest stream through."""
+        beads = [make_bead(i, "closed" if i % 3 else "open") for i in range(30)]
+        with ArchiveWriter(archive_path) as writer:
+            live = list(archive_closed(beads, writer))
+        assert [b.id for b in live] == [b.id for b in beads if b.status != "closed"]
+        with BeadArchive(archive_path) as archive:
+            assert len(archive) == 20
+            assert all(bead.status == "closed" for bead in archive)
+
+    def test_empty_archive(self, archive_path):
+        """Test an archive with no beads opens and is empty."""
+        ArchiveWriter(archive_path).close()
+        with BeadArchive(archive_path) as archive:
+            assert len(archive) == 0 and list(archive) == [] and archive.get("bd-1") is None
+
+    def test_failed_write_leaves_no_file(self, archive_path, tmp_path):
+        """Test duplicates and exceptions abort without a partial archive."""
+        writer = ArchiveWriter(archive_path)
+        writer.add(make_bead(1))
+        writer.add(make_bead(1))
+        with pytest.raises(ValueError, match="duplicate"):
+            writer.close()
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(archive_path) as writer:
+                writer.add(make_bead(2))
+                raise RuntimeError("interrupted")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test non-archives raise ArchiveFormatError."""
+        path = tmp_path / "beads.jsonl"
+        path.write_bytes(b"{}\n" * 20)
+        with pytest.raises(ArchiveFormatError):
+            BeadArchive(str(path))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Unit tests for canonical bead serialization and delta export."""
+
+import io
+import json
+
+import pytest
+
+from bead_delta import (
+    HashSnapshot,
+    apply_delta,
+    bead_hash,
+    canonical_json,
+    export_delta,
+)
+from bead_schema import Bead
+from tests.test_validator import get_valid_bead_json
+
+
+def make_bead(bead_id="bd-1", **changes):
+    data = get_valid_bead_json()
+    data["id"] = bead_id
+    data.update(changes)
+    return Bead.model_validate_json(json.dumps(data))
+
+
+def export(beads, snapshot, **kwargs):
+    out = io.StringIO()
+    stats = export_delta(beads, snapshot, out, **kwargs)
+    return [json.loads(line) for line in out.getvalue().splitlines()], stats
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    with HashSnapshot(str(tmp_path / "snapshot.db")) as snapshot:
+        yield snapshot
+
+
+class TestCanonical:
+    """Tests for canonical_json and bead_hash."""
+
+    def test_stable_across_key_order_and_defaults(self):
+        """Test input key order and omitted defaults do not change the output."""
+        data = get_valid_bead_json()
+        shuffled = dict(reversed(list(data.items())))
+        shuffled["metadata"] = dict(reversed(list(data["metadata"].items())))
+        for key in ("closed_at", "comments", "external_ref", "owner"):
+            del shuffled[key]
+        a = Bead.model_validate_json(json.dumps(data))
+        b = Bead.model_validate_json(json.dumps(shuffled))
+        assert canonical_json(a) == canonical_json(b)
+        assert bead_hash(a) == bead_hash(b)
+
+    def test_datetimes_normalized_to_utc(self):
+        """Test the same instant in different offsets hashes the same."""
+        a = make_bead(created_at="2026-02-07T12:00:00+02:00")
+        b = make_bead(created_at="2026-02-07T10:00:00.000000Z")
+        assert bead_hash(a) == bead_hash(b)
+        assert '"created_at":"2026-02-07T10:00:00Z"' in canonical_json(a)
+
+    def test_matches_sorted_json_dump(self):
+        """Test the assembled text is plain sorted, compact JSON that validates back."""
+        bead = make_bead()
+        text = canonical_json(bead)
+        assert text == json.dumps(json.loads(text), sort_keys=True, separators=(",", ":"))
+        assert Bead.model_validate_json(text) == bead
+
+    def test_content_changes_hash(self):
+        """Test any field change changes the hash."""
+        assert bead_hash(make_bead()) != bead_hash(make_bead(title="Other"))
+
+
+class TestDelta:
+    """Tests for export_delta and apply_delta."""
+
+    def test_first_export_adds_everything(self, snapshot):
+        """Test an empty snapshot ships full beads, then nothing."""
+        beads = [make_bead(f"bd-{i}") for i in range(3)]
+        records, stats = export(beads, snapshot)
+        assert [r["op"] for r in records] == ["add"] * 3
+        assert stats.added == 3 and stats.delta_bytes > stats.full_bytes
+        records, stats = export(beads, snapshot)
+        assert records == [] and stats.unchanged == 3 and stats.delta_bytes == 0
+
+    def test_patch_carries_only_changed_subtrees(self, snapshot):
+        """Test a metadata change ships only that metadata field."""
+        export([make_bead("bd-1"), make_bead("bd-2")], snapshot)
+        changed = make_bead("bd-1")
+        changed = changed.model_copy(
+            update={"metadata": changed.metadata.model_copy(update={"attempt_count": 2})}
+        )
+        records, stats = export([changed, make_bead("bd-2")], snapshot)
+        assert records == [
+            {
+                "hash": bead_hash(changed),
+                "id": "bd-1",
+                "op": "patch",
+                "patch": {"metadata": {"attempt_count": 2}},
+            }
+        ]
+        assert (stats.patched, stats.unchanged) == (1, 1)
+
+    def test_round_trip_with_deletes(self, snapshot):
+        """Test a replica kept in sync by deltas equals the source."""
+        source = {f"bd-{i}": make_bead(f"bd-{i}") for i in range(4)}
+        replica = {}
+        lines, _ = export(source.values(), snapshot)
+        apply_delta(lines, replica)
+        source["bd-0"] = make_bead("bd-0", status="closed", closed_at="2026-02-08T10:00:00Z")
+        source["bd-9"] = make_bead("bd-9")
+        del source["bd-3"]
+        out = io.StringIO()
+        stats = export_delta(source.values(), snapshot, out)
+        assert (stats.added, stats.patched, stats.deleted) == (1, 1, 1)
+        assert apply_delta(out.getvalue().splitlines(), replica) == 3
+        assert replica == source
+
+    def test_commit_false_leaves_snapshot(self, snapshot):
+        """Test an uncommitted export is repeated next time."""
+        export([make_bead()], snapshot, commit=False)
+        records, _ = export([make_bead()], snapshot)
+        assert [r["op"] for r in records] == ["add"]
+
+    def test_partial_export_does_not_delete(self, snapshot):
+        """Test complete=False never emits deletions."""
+        export([make_bead("bd-1"), make_bead("bd-2")], snapshot)
+        records, stats = export([make_bead("bd-1")], snapshot, complete=False)
+        assert records == [] and stats.deleted == 0
+
+    def test_apply_rejects_hash_mismatch(self):
+        """Test a patch that does not reproduce the shipped hash is rejected."""
+        replica = {"bd-1": make_bead()}
+        record = {"hash": "0" * 32, "id": "bd-1", "op": "patch", "patch": {"priority": 2}}
+        with pytest.raises(ValueError, match="content hash"):
+            apply_delta([record], replica)
+        with pytest.raises(ValueError, match="unknown bead"):
+            apply_delta([dict(record, id="bd-x")], replica)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Unit tests for header-only bead parsing."""
+
+import json
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from bead_header import header_parser, header_type, parse_header, parse_headers
+from bead_schema import Bead
+from tests.test_validator import get_valid_bead_json
+
+
+def bead_json(**changes):
+    data = get_valid_bead_json()
+    data.update(changes)
+    return json.dumps(data)
+
+
+class TestHeader:
+    """Tests for header parsing."""
+
+    def test_default_projection_matches_bead(self):
+        """Test header fields equal the fully validated bead's."""
+        raw = bead_json(dependencies=["bd-0"])
+        bead = Bead.model_validate_json(raw)
+        header = parse_header(raw)
+        assert (header.id, header.status, header.priority, header.issue_type) == (
+            bead.id,
+            bead.status,
+            bead.priority,
+            bead.issue_type,
+        )
+        assert header.dependencies == ["bd-0"]
+        assert (header.metadata.phase, header.metadata.sprint) == ("1", "1.2")
+        assert not hasattr(header, "description")
+        assert not hasattr(header.metadata, "qa_agents")
+
+    def test_custom_projection_and_defaults(self):
+        """Test declared fields, including defaults for omitted ones."""
+        data = get_valid_bead_json()
+        del data["labels"]
+        del data["metadata"]["max_retry_attempts"]
+        header = parse_header(
+            json.dumps(data), ["id", "labels", "metadata.dev_model", "metadata.max_retry_attempts"]
+        )
+        assert header.labels == []
+        assert header.metadata.dev_model == "sonnet"
+        assert header.metadata.max_retry_attempts == 3
+
+    def test_skipped_fields_are_not_validated(self):
+        """Test heavy fields outside the projection are skipped, even if malformed."""
+        data = json.loads(bead_json())
+        data["comments"] = "not a list"
+        data["metadata"]["dev_agent_executions"] = [{"huge": "x" * 10000}]
+        assert parse_header(json.dumps(data)).id == data["id"]
+
+    @pytest.mark.parametrize(
+        "changes, loc",
+        [
+            ({"status": "done"}, ("status",)),
+            ({"priority": 7}, ("priority",)),
+            ({"title": "   "}, ("title",)),
+        ],
+    )
+    def test_invalid_projected_fields_raise_pydantic_errors(self, changes, loc):
+        """Test rejected input gets the canonical ValidationError."""
+        fields = ["id", "status", "priority", "title"]
+        with pytest.raises(ValidationError) as exc_info:
+            parse_header(bead_json(**changes), fields)
+        assert exc_info.value.errors()[0]["loc"] == loc
+
+    def test_pydantic_only_input_still_parses(self):
+        """Test input only pydantic's parsers accept falls back to a header."""
+        raw = bead_json(created_at="2026-02-07T10:00Z")
+        header = parse_header(raw, ["id", "created_at"])
+        assert header.created_at == Bead.model_validate_json(raw).created_at
+
+    def test_many(self):
+        """Test `bd list` arrays, single objects and empty output."""
+        one = bead_json()
+        assert [h.id for h in parse_headers(f"[{one},{bead_json(id='bd-2')}]")] == [
+            json.loads(one)["id"],
+            "bd-2",
+        ]
+        assert len(parse_headers(one.encode())) == 1
+        assert parse_headers(b"  ") == []
+
+    def test_types_are_frozen_and_cached(self):
+        """Test headers are immutable, parsers cached and bad fields rejected."""
+        header = parse_header(bead_json())
+        with pytest.raises(AttributeError):
+            header.status = "closed"
+        assert header_parser() is header_parser()
+        assert isinstance(header, msgspec.Struct)
+        with pytest.raises(ValueError, match="unknown bead field: metadata.nope"):
+            header_type(["metadata.nope"])
+        with pytest.raises(ValueError, match="metadata.<field>"):
+            header_type(["metadata"])
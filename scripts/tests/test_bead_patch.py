@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Unit tests for patch-level bead validation."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from bead_patch import apply_merge_patch, apply_merge_patch_json, merge_patch
+from bead_schema import Bead, ScrumResult
+from tests.test_validator import get_valid_bead_json
+
+
+def get_dev_execution_json(attempt):
+    """Return DevExecution JSON for the given attempt."""
+    return {
+        "attempt": attempt,
+        "session_id": f"claude-dev-{attempt}",
+        "agent_path": ".claude/agents/backend-dev",
+        "model": "sonnet",
+        "started_at": "2026-02-07T10:00:00",
+        "completed_at": "2026-02-07T10:15:00",
+        "status": "completed",
+        "feedback_from_qa": None,
+    }
+
+
+def get_bead_with_history(count):
+    """Return a validated bead with `count` dev executions."""
+    bead_json = get_valid_bead_json()
+    bead_json["metadata"]["dev_agent_executions"] = [
+        get_dev_execution_json(i) for i in range(1, count + 1)
+    ]
+    return Bead.model_validate_json(json.dumps(bead_json)), bead_json
+
+
+def assert_matches_full_validation(bead_json, patch, patched):
+    """Assert the patched bead equals full validation of the merged JSON."""
+    expected = Bead.model_validate_json(json.dumps(merge_patch(bead_json, patch)))
+    assert patched == expected
+
+
+class TestMergePatch:
+    """Tests for RFC 7386 merge patch on plain JSON."""
+
+    def test_merge_semantics(self):
+        """Test recursive merge, null removal and array replacement."""
+        target = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1, 2]}
+        patch = {"a": None, "b": {"c": 5}, "e": [3], "f": {"g": None, "h": 1}}
+        assert merge_patch(target, patch) == {"b": {"c": 5, "d": 3}, "e": [3], "f": {"h": 1}}
+        assert target["a"] == 1
+
+
+class TestApplyMergePatch:
+    """Tests for apply_merge_patch."""
+
+    def test_status_change(self):
+        """Test a scalar change matches full validation and leaves input intact."""
+        bead, bead_json = get_bead_with_history(2)
+        patch = {"status": "in_progress", "metadata": {"pr_url": "https://github.com/o/r/pull/1"}}
+        patched = apply_merge_patch(bead, patch)
+        assert patched.status == "in_progress"
+        assert patched.metadata.pr_url == "https://github.com/o/r/pull/1"
+        assert bead.status == "open"
+        assert patched.metadata.dev_agent_executions[0] is bead.metadata.dev_agent_executions[0]
+        assert_matches_full_validation(bead_json, patch, patched)
+
+    def test_invalid_status_reports_full_path(self):
+        """Test errors keep field paths and messages from full validation."""
+        bead, _ = get_bead_with_history(0)
+        with pytest.raises(ValidationError) as exc_info:
+            apply_merge_patch(bead, {"status": "bogus", "metadata": {"dev_model": "gpt-4"}})
+        locs = {error["loc"] for error in exc_info.value.errors()}
+        assert locs == {("status",), ("metadata", "dev_model")}
+        assert "status must be one of" in str(exc_info.value)
+        assert "dev_model must be one of" in str(exc_info.value)
+
+    def test_datetime_strings_accepted(self):
+        """Test datetime fields accept JSON strings as in model_validate_json."""
+        bead, bead_json = get_bead_with_history(0)
+        patch = {"status": "closed", "closed_at": "2026-02-07T12:00:00"}
+        patched = apply_merge_patch(bead, patch)
+        assert patched.closed_at.hour == 12
+        assert_matches_full_validation(bead_json, patch, patched)
+
+    def test_replaced_history_reuses_prefix(self):
+        """Test a replaced list reuses unchanged entries and validates new ones."""
+        bead, bead_json = get_bead_with_history(3)
+        history = bead_json["metadata"]["dev_agent_executions"] + [get_dev_execution_json(4)]
+        patch = {"metadata": {"dev_agent_executions": history, "attempt_count": 4}}
+        patched = apply_merge_patch(bead, patch)
+        executions = patched.metadata.dev_agent_executions
+        assert len(executions) == 4
+        assert executions[2] is bead.metadata.dev_agent_executions[2]
+        assert_matches_full_validation(bead_json, patch, patched)
+
+    def test_append_execution(self):
+        """Test appending validates only the new entry."""
+        bead, _ = get_bead_with_history(5)
+        patched = apply_merge_patch(
+            bead,
+            {"metadata": {"attempt_count": 6}},
+            append={"metadata.dev_agent_executions": [get_dev_execution_json(6)]},
+        )
+        assert [e.attempt for e in patched.metadata.dev_agent_executions] == [1, 2, 3, 4, 5, 6]
+        assert len(bead.metadata.dev_agent_executions) == 5
+
+    def test_invalid_appended_entry_index(self):
+        """Test errors in appended entries report their final list index."""
+        bead, _ = get_bead_with_history(2)
+        bad = get_dev_execution_json(0)
+        with pytest.raises(ValidationError) as exc_info:
+            apply_merge_patch(bead, {}, append={"metadata.dev_agent_executions": [bad]})
+        error = exc_info.value.errors()[0]
+        assert error["loc"] == ("metadata", "dev_agent_executions", 2, "attempt")
+        assert "attempt must be >= 1" in error["msg"]
+
+    def test_null_removes_optional_and_rejects_required(self):
+        """Test null resets optional fields and reports missing required ones."""
+        bead, _ = get_bead_with_history(0)
+        bead = apply_merge_patch(bead, {"metadata": {"pr_number": 7}})
+        assert apply_merge_patch(bead, {"metadata": {"pr_number": None}}).metadata.pr_number is None
+        with pytest.raises(ValidationError) as exc_info:
+            apply_merge_patch(bead, {"metadata": {"phase": None}})
+        assert exc_info.value.errors()[0]["loc"] == ("metadata", "phase")
+        assert exc_info.value.errors()[0]["type"] == "missing"
+
+    def test_nested_scrum_result(self):
+        """Test creating and then patching a nested optional model."""
+        bead, bead_json = get_bead_with_history(0)
+        scrum = {
+            "bead_id": "bd-a1b2c3",
+            "success": True,
+            "bead_updated": True,
+            "attempt_count": 1,
+            "qa_results": [{"agent_path": "qa", "status": "pass", "message": "ok"}],
+            "fatal": False,
+        }
+        patch = {"metadata": {"scrum_result": scrum}}
+        patched = apply_merge_patch(bead, patch)
+        assert isinstance(patched.metadata.scrum_result, ScrumResult)
+        assert_matches_full_validation(bead_json, patch, patched)
+
+        with pytest.raises(ValidationError) as exc_info:
+            apply_merge_patch(patched, {"metadata": {"scrum_result": {"attempt_count": -1}}})
+        assert exc_info.value.errors()[0]["loc"] == ("metadata", "scrum_result", "attempt_count")
+
+    def test_strict_types(self):
+        """Test strict mode is preserved (no string-to-int coercion)."""
+        bead, _ = get_bead_with_history(0)
+        with pytest.raises(ValidationError):
+            apply_merge_patch_json(bead, '{"priority": "1"}')
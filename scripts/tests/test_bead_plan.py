@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Unit tests for bead loading and stage-duration models."""
+
+import io
+import json
+import math
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from bead_plan import DurationModel, LogNormal, StageModel, load_beads
+from bead_schema import Bead
+from tests.test_validator import get_valid_bead_json
+
+
+def bead_with_history(dev_minutes, qa_results):
+    """Return a Bead with one dev and one QA execution per attempt."""
+    data = get_valid_bead_json()
+    for attempt, (minutes, status) in enumerate(zip(dev_minutes, qa_results), 1):
+        start = f"2026-02-07T{9 + attempt:02d}:00:00Z"
+        dev_end = f"2026-02-07T{9 + attempt:02d}:{minutes:02d}:00Z"
+        data["metadata"]["dev_agent_executions"].append(
+            {
+                "attempt": attempt,
+                "session_id": f"dev-{attempt}",
+                "agent_path": ".claude/agents/backend-dev",
+                "model": "sonnet",
+                "started_at": start,
+                "completed_at": dev_end,
+                "status": "completed",
+            }
+        )
+        data["metadata"]["qa_agent_executions"].append(
+            {
+                "attempt": attempt,
+                "session_id": f"qa-{attempt}",
+                "agent_path": ".claude/agents/qa-unit-tests",
+                "model": "haiku",
+                "started_at": dev_end,
+                "completed_at": f"2026-02-07T{9 + attempt:02d}:{minutes + 5:02d}:00Z",
+                "status": status,
+                "message": status,
+            }
+        )
+    return Bead.model_validate_json(json.dumps(data))
+
+
+class TestDistributions:
+    """Tests for duration models."""
+
+    def test_lognormal_fit_and_sample(self):
+        """Test fitting recovers parameters and sampling is reproducible."""
+        dist = LogNormal.fit([math.e, math.e**3])
+        assert dist.mu == pytest.approx(2.0)
+        assert dist.sigma == pytest.approx(1.0)
+        assert LogNormal.fit([60.0]).sigma == 0.0
+        assert LogNormal.from_median(600).median == pytest.approx(600)
+        assert dist.sample(random.Random(1)) == dist.sample(random.Random(1))
+        with pytest.raises(ValueError):
+            LogNormal.fit([0.0])
+
+    def test_stage_model_retries(self):
+        """Test an always-failing stage exhausts attempts and fails."""
+        stage = StageModel(LogNormal.from_median(10, 0), LogNormal.from_median(5, 0), 1.0)
+        assert stage.sample(3, random.Random(0)) == (pytest.approx(45), 3, False)
+        stage = StageModel(stage.dev, stage.qa, 0.0)
+        assert stage.sample(3, random.Random(0)) == (pytest.approx(15), 1, True)
+
+    def test_fit_from_history(self):
+        """Test dev/QA durations and failure rate are fitted per issue type."""
+        beads = [bead_with_history([10, 20], ["fail", "pass"]), bead_with_history([20], ["pass"])]
+        model = DurationModel.fit(beads)
+        stage = model.for_type("beads-ralph-work")
+        log_mean = (math.log(600) + 2 * math.log(1200)) / 3
+        assert stage.dev.median == pytest.approx(math.exp(log_mean))
+        assert stage.qa.median == pytest.approx(300)
+        assert stage.fail_rate == pytest.approx(1 / 3)
+        assert model.for_type("beads-ralph-merge") is model.default
+
+
+class TestLoadBeads:
+    """Tests for load_beads."""
+
+    def test_file_and_stdin(self, tmp_path, monkeypatch):
+        """Test a JSON array is read from a file or, without a path, stdin."""
+        raw = json.dumps([get_valid_bead_json()])
+        path = tmp_path / "plan.json"
+        path.write_text(raw)
+        assert [bead.id for bead in load_beads(str(path))] == ["bd-a1b2c3"]
+        monkeypatch.setattr("sys.stdin", io.StringIO(raw))
+        assert [bead.id for bead in load_beads(None)] == ["bd-a1b2c3"]
+
+    def test_invalid_bead(self, tmp_path):
+        """Test an invalid bead raises ValidationError."""
+        data = get_valid_bead_json()
+        data["priority"] = 9
+        path = tmp_path / "plan.json"
+        path.write_text(json.dumps([data]))
+        with pytest.raises(ValidationError, match="priority must be between 0 and 4"):
+            load_beads(str(path))
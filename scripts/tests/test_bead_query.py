@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Unit tests for the in-memory bead query engine."""
+
+import json
+
+import pytest
+
+from bead_query import BeadIndex, last_qa_status
+from bead_schema import Bead, ExecutionHistoryRef
+from tests.test_validator import get_valid_bead_json
+
+
+def make_bead(index, status="open", issue_type="beads-ralph-work", phase="1", qa=None, **extra):
+    data = get_valid_bead_json()
+    data.update(id=f"bd-{index:03d}", status=status, issue_type=issue_type, **extra)
+    data["priority"] = index % 5
+    data["labels"] = [f"phase-{phase}"] + (["urgent"] if index % 2 else [])
+    data["metadata"]["phase"] = phase
+    data["metadata"]["sprint"] = f"{phase}.1"
+    if qa is not None:
+        data["metadata"]["qa_agent_executions"] = [
+            {
+                "attempt": n + 1,
+                "session_id": f"qa-{n}",
+                "agent_path": ".claude/agents/qa-unit-tests",
+                "model": "haiku",
+                "started_at": "2026-02-07T10:00:00Z",
+                "completed_at": "2026-02-07T10:05:00Z",
+                "status": status_,
+                "message": "ok",
+            }
+            for n, status_ in enumerate(qa)
+        ]
+    return Bead.model_validate_json(json.dumps(data))
+
+
+@pytest.fixture
+def index():
+    beads = [make_bead(i, phase="3a" if i < 10 else "2") for i in range(30)]
+    beads += [
+        make_bead(100, issue_type="beads-ralph-merge", phase="3a", qa=["pass", "fail"]),
+        make_bead(101, issue_type="beads-ralph-merge", phase="3a", qa=["fail", "pass"]),
+        make_bead(102, status="closed", issue_type="beads-ralph-merge", phase="3a", qa=["fail"]),
+    ]
+    return BeadIndex(beads)
+
+
+def ids(beads):
+    return [bead.id for bead in beads]
+
+
+class TestBeadIndex:
+    """Tests for BeadIndex."""
+
+    def test_selective_query(self, index):
+        """Test the motivating query: open merge beads in phase 3a that failed QA."""
+        found = index.query(
+            status="open", issue_type="beads-ralph-merge", phase="3a", last_qa_status="fail"
+        )
+        assert ids(found) == ["bd-100"]
+
+    def test_any_of_labels_and_counts(self, index):
+        """Test collection filters, label membership and count."""
+        assert index.count(phase="3a") == 13
+        assert index.count(priority=[0, 1]) == 14
+        assert index.count(labels="urgent", phase="2") == 10
+        assert index.count(last_qa_status=None) == 30
+        assert index.count() == len(index) == 33
+
+    def test_sort_limit_where(self, index):
+        """Test sorting, top-k limits and residual predicates."""
+        top = index.query(phase="3a", sort="priority", descending=True, limit=3)
+        assert [bead.priority for bead in top] == [4, 4, 3]
+        assert ids(index.query(phase="3a", limit=2)) == ["bd-000", "bd-001"]
+        odd = index.query(where=lambda bead: bead.id.endswith("7"), phase="2")
+        assert ids(odd) == ["bd-017", "bd-027"]
+        assert index.query(sort="closed_at")[0].id == "bd-000"
+
+    def test_sort_mixes_naive_and_aware_datetimes(self):
+        """Test naive datetimes sort as UTC next to aware ones, with and without a limit."""
+        index = BeadIndex(
+            [
+                make_bead(1, created_at="2026-02-07T12:00:00"),
+                make_bead(2, created_at="2026-02-07T11:00:00Z"),
+                make_bead(3, created_at="2026-02-07T12:30:00+01:00"),
+                make_bead(
+                    4,
+                    status="closed",
+                    created_at="2026-02-07T11:30:00",
+                    closed_at="2026-02-07T13:00:00Z",
+                ),
+            ]
+        )
+        assert ids(index.query(sort="created_at")) == ["bd-002", "bd-003", "bd-004", "bd-001"]
+        assert ids(index.query(sort="created_at", descending=True, limit=2)) == [
+            "bd-001",
+            "bd-004",
+        ]
+        assert ids(index.query(sort="closed_at", limit=1)) == ["bd-004"]
+
+    def test_upsert_and_remove_maintain_indexes(self, index):
+        """Test updates move beads between index entries and removal drops them."""
+        index.upsert(make_bead(100, status="closed", issue_type="beads-ralph-merge", phase="3a"))
+        assert index.count(status="open", issue_type="beads-ralph-merge") == 1
+        assert index.count(last_qa_status="fail") == 1
+        assert index.get("bd-100").status == "closed"
+        assert index.remove("bd-101").id == "bd-101"
+        assert index.remove("bd-101") is None
+        assert ids(index.query(issue_type="beads-ralph-merge")) == ["bd-100", "bd-102"]
+        assert "pass" not in index.values("last_qa_status")
+
+    def test_unknown_fields_rejected(self, index):
+        """Test unindexed filter and sort fields raise ValueError."""
+        with pytest.raises(ValueError, match="cannot filter on title"):
+            index.query(title="x")
+        with pytest.raises(ValueError, match="cannot sort on title"):
+            index.query(sort="title")
+
+    def test_last_qa_status_from_history_ref(self):
+        """Test the out-of-line history summary is used when no executions are inline."""
+        bead = make_bead(1)
+        ref = ExecutionHistoryRef(store="history.db", qa_execution_count=2, last_qa_status="stop")
+        metadata = bead.metadata.model_copy(update={"execution_history": ref})
+        assert last_qa_status(bead.model_copy(update={"metadata": metadata})) == "stop"
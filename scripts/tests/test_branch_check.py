@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Unit tests for the bulk branch-reference checker."""
+
+import json
+import subprocess
+
+import pytest
+
+from bead_schema import Bead
+from branch_check import (
+    MISSING,
+    PENDING,
+    PRESENT,
+    check_branches,
+    check_repo,
+    format_report,
+    list_branches,
+    resolve_branches,
+)
+from git_utils import GitCommandError, run_git
+from tests.test_validator import get_valid_bead_json
+
+
+def make_bead(bead_id, branch, deps=(), merges=None, source="main", status="open"):
+    """Return a work bead, or a merge bead when `merges` is given."""
+    data = get_valid_bead_json()
+    data.update(id=bead_id, dependencies=list(deps), status=status)
+    if status == "closed":
+        data["closed_at"] = data["updated_at"]
+    data["metadata"]["branch"] = branch
+    data["metadata"]["source_branch"] = source
+    if merges is not None:
+        data["issue_type"] = "beads-ralph-merge"
+        data["metadata"]["branches_to_merge"] = merges
+    return Bead.model_validate_json(json.dumps(data))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A clone whose origin has `main` and `sprint/1-1-api`, plus a local-only branch."""
+    origin = tmp_path / "origin"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(origin)], check=True)
+    (origin / "README").write_text("hello\n")
+    git = ["git", "-C", str(origin), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+    run_git(str(origin), ["branch", "sprint/1-1-api"])
+    clone = tmp_path / "repo"
+    subprocess.run(["git", "clone", "-q", str(origin), str(clone)], check=True)
+    run_git(str(clone), ["branch", "sprint/1-1-local"])
+    return str(clone)
+
+
+class TestListBranches:
+    """Tests for list_branches."""
+
+    def test_local_and_remote_branches(self, repo):
+        """Test heads and remote branches are merged and HEAD symrefs dropped."""
+        assert list_branches(repo) == {"main", "sprint/1-1-api", "sprint/1-1-local"}
+        assert list_branches(repo, remotes=()) == {"main", "sprint/1-1-local"}
+
+    def test_resolve_prefers_local_branches(self, repo):
+        """Test commits are resolved and a local branch shadows the remote one."""
+        run_git(repo, ["branch", "-f", "sprint/1-1-api", "sprint/1-1-local"])
+        commits = resolve_branches(repo)
+        assert commits["main"] == run_git(repo, ["rev-parse", "origin/main"])
+        assert commits["sprint/1-1-api"] == run_git(repo, ["rev-parse", "sprint/1-1-local"])
+
+    def test_not_a_repository(self, tmp_path):
+        """Test git failures surface as GitCommandError."""
+        with pytest.raises(GitCommandError):
+            list_branches(str(tmp_path))
+
+
+class TestCheckBranches:
+    """Tests for check_branches."""
+
+    def test_classification_follows_dependency_dag(self):
+        """Test present, pending (direct and transitive) and missing references."""
+        beads = [
+            make_bead("bd-a", "sprint/1-2a"),
+            make_bead("bd-b", "sprint/1-2b", deps=["bd-a"]),
+            make_bead("bd-c", "sprint/1-2c"),
+            make_bead(
+                "bd-m",
+                "sprint/1-3",
+                deps=["bd-b"],
+                merges=["sprint/1-1-api", "sprint/1-2a", "sprint/1-2b", "sprint/1-2c"],
+            ),
+        ]
+        report = check_branches(beads, {"main", "sprint/1-1-api"})
+        merge_refs = {ref.branch: ref for ref in report.refs if ref.bead_id == "bd-m"}
+        assert merge_refs["sprint/1-1-api"].status == PRESENT
+        assert (merge_refs["sprint/1-2b"].status, merge_refs["sprint/1-2b"].producer) == (
+            PENDING,
+            "bd-b",
+        )
+        assert (merge_refs["sprint/1-2a"].status, merge_refs["sprint/1-2a"].producer) == (
+            PENDING,
+            "bd-a",
+        )
+        assert merge_refs["sprint/1-2c"].status == MISSING
+        assert "bd-m does not depend on" in merge_refs["sprint/1-2c"].reason
+        assert [ref.branch for ref in report.missing] == ["sprint/1-2c"]
+
+    def test_typos_closed_producers_and_source_branches(self):
+        """Test unknown names get a suggestion and closed producers count as missing."""
+        beads = [
+            make_bead("bd-a", "sprint/1-2a", status="closed"),
+            make_bead("bd-b", "sprint/1-2b", deps=["bd-a"], source="sprint/1-2a"),
+            make_bead("bd-m", "sprint/1-3", deps=["bd-a"], merges=["sprint/1-2-a", "main"]),
+        ]
+        report = check_branches(beads, {"main", "sprint/1-2"})
+        missing = {(ref.bead_id, ref.branch): ref for ref in report.missing}
+        assert "bd-a is closed" in missing[("bd-b", "sprint/1-2a")].reason
+        assert "did you mean sprint/1-2a?" in missing[("bd-m", "sprint/1-2-a")].reason
+        assert all(ref.bead_id != "bd-a" for ref in report.refs)
+        assert any(ref.bead_id == "bd-a" for ref in check_branches(beads, set(), True).refs)
+
+    def test_work_beads_only_check_source_branch(self):
+        """Test branches_to_merge is only read from merge beads."""
+        bead = make_bead("bd-a", "sprint/1-1")
+        bead.metadata.branches_to_merge = ["nope"]
+        report = check_branches([bead], {"main"})
+        assert [(ref.field, ref.status) for ref in report.refs] == [("source_branch", PRESENT)]
+
+
+def test_check_repo_and_report(repo):
+    """Test the end-to-end check against a repository and its rendering."""
+    beads = [
+        make_bead("bd-a", "sprint/1-2a"),
+        make_bead("bd-m", "sprint/1-3", deps=["bd-a"], merges=["sprint/1-1-api", "sprint/1-2a"]),
+        make_bead("bd-x", "sprint/1-4", merges=["sprint/1-1-apj"]),
+    ]
+    report = check_repo(beads, repo)
+    text = format_report(report, show_pending=True)
+    assert text.splitlines()[0] == "6 branch references: 4 present, 1 pending, 1 missing"
+    assert "missing bd-x branches_to_merge: sprint/1-1-apj" in text
+    assert "pending bd-m branches_to_merge: sprint/1-2a (from bd-a)" in text
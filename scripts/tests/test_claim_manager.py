@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Unit and stress tests for the lease-based claim manager."""
+
+import multiprocessing
+import os
+import sqlite3
+import time
+
+import pytest
+
+from claim_manager import ClaimManager, Heartbeat, LeaseLostError
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(tmp_path, clock):
+    with ClaimManager(str(tmp_path / "claims.db"), ttl=30, clock=clock) as manager:
+        yield manager
+
+
+class TestClaims:
+    """Tests for claim, renew and release."""
+
+    def test_claim_is_exclusive(self, manager):
+        """Test a second owner cannot claim a held bead."""
+        lease = manager.claim("bd-1", "sm-a")
+        assert lease.token == 1
+        assert lease.expires_at == 1030
+        assert manager.claim("bd-1", "sm-b") is None
+        assert manager.holder("bd-1") == lease
+        assert manager.claim("bd-2", "sm-b").owner == "sm-b"
+
+    def test_release_then_reclaim_increments_token(self, manager):
+        """Test a released bead can be claimed again with a new fencing token."""
+        first = manager.claim("bd-1", "sm-a")
+        assert manager.release(first)
+        assert not manager.release(first)
+        assert manager.holder("bd-1") is None
+        second = manager.claim("bd-1", "sm-b")
+        assert second.token == 2
+
+    def test_renew_extends_lease(self, manager, clock):
+        """Test heartbeats keep a lease alive past its original TTL."""
+        lease = manager.claim("bd-1", "sm-a")
+        clock.now += 20
+        lease = manager.renew(lease)
+        clock.now += 20
+        assert manager.claim("bd-1", "sm-b") is None
+        assert lease.expires_at == 1050
+
+    def test_expired_lease_is_taken_over(self, manager, clock):
+        """Test a crashed session's lease expires and its stale handle is fenced."""
+        stale = manager.claim("bd-1", "sm-crashed")
+        clock.now += 31
+        assert manager.holder("bd-1") is None
+        fresh = manager.claim("bd-1", "sm-b")
+        assert fresh.token == stale.token + 1
+        with pytest.raises(LeaseLostError):
+            manager.renew(stale)
+        assert not manager.release(stale)
+        assert manager.holder("bd-1") == fresh
+
+    def test_reclaim_expired(self, manager, clock):
+        """Test expired leases are reported and released once."""
+        manager.claim("bd-1", "sm-a", ttl=5)
+        live = manager.claim("bd-2", "sm-b", ttl=60)
+        clock.now += 10
+        (expired,) = manager.reclaim_expired()
+        assert (expired.bead_id, expired.owner) == ("bd-1", "sm-a")
+        assert manager.reclaim_expired() == []
+        assert manager.holder("bd-2") == live
+
+    def test_shared_between_connections(self, tmp_path, clock):
+        """Test two managers on one file see each other's claims."""
+        path = str(tmp_path / "claims.db")
+        with ClaimManager(path, clock=clock) as a, ClaimManager(path, clock=clock) as b:
+            assert a.claim("bd-1", "sm-a") is not None
+            assert b.claim("bd-1", "sm-b") is None
+
+    def test_invalid_ttl(self, tmp_path, manager):
+        """Test a non-positive TTL is rejected, including explicit per-lease zeros."""
+        with pytest.raises(ValueError):
+            ClaimManager(str(tmp_path / "other.db"), ttl=0)
+        with pytest.raises(ValueError, match="ttl must be > 0"):
+            manager.claim("bd-1", "sm-a", ttl=0)
+        lease = manager.claim("bd-1", "sm-a", ttl=5)
+        assert lease.expires_at - lease.acquired_at == 5
+        with pytest.raises(ValueError, match="ttl must be > 0"):
+            manager.renew(lease, ttl=0.0)
+
+
+class TestHeartbeat:
+    """Tests for the background heartbeat."""
+
+    def test_heartbeat_renews_and_detects_loss(self, tmp_path):
+        """Test the heartbeat renews a live lease and flags a lost one."""
+        with ClaimManager(str(tmp_path / "claims.db"), ttl=0.3) as manager:
+            lease = manager.claim("bd-1", "sm-a")
+            with Heartbeat(manager, lease, interval=0.05) as heartbeat:
+                time.sleep(0.5)
+                assert heartbeat.lease.expires_at > lease.expires_at
+                assert not heartbeat.lost.is_set()
+            manager.release(heartbeat.lease)
+            manager.claim("bd-1", "sm-b")
+            heartbeat = Heartbeat(manager, heartbeat.lease, interval=0.01).start()
+            assert heartbeat.lost.wait(2)
+            heartbeat.stop()
+
+    def test_database_errors_retry_until_expiry(self, manager, clock, monkeypatch):
+        """Test a failing store keeps the heartbeat retrying, then flags loss at expiry."""
+        lease = manager.claim("bd-1", "sm-a")
+
+        def failing_renew(lease):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(manager, "renew", failing_renew)
+        with Heartbeat(manager, lease, interval=0.01) as heartbeat:
+            assert not heartbeat.lost.wait(0.1)
+            assert isinstance(heartbeat.error, sqlite3.OperationalError)
+            clock.now = lease.expires_at
+            assert heartbeat.lost.wait(2)
+
+
+def _stress_worker(path, marker_dir, owner, beads, iterations, results):
+    """Claim, hold, renew and release beads; count detected double claims."""
+    manager = ClaimManager(path, ttl=30)
+    claimed = doubles = 0
+    tokens = []
+    for i in range(iterations):
+        bead_id = beads[i % len(beads)]
+        lease = manager.claim(bead_id, owner)
+        if lease is None:
+            continue
+        marker = os.path.join(marker_dir, bead_id)
+        try:
+            fd = os.open(marker, os.O_CREAT | os.O_EXCL)
+        except FileExistsError:
+            doubles += 1
+            continue
+        os.close(fd)
+        lease = manager.renew(lease)
+        os.unlink(marker)
+        manager.release(lease)
+        claimed += 1
+        tokens.append((bead_id, lease.token))
+    manager.close()
+    results.put((claimed, doubles, tokens))
+
+
+def test_stress_no_double_claims(tmp_path):
+    """Test many processes contending for few beads never share a claim."""
+    path = str(tmp_path / "claims.db")
+    ClaimManager(path).close()
+    beads = [f"bd-{i}" for i in range(4)]
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=_stress_worker,
+            args=(path, str(tmp_path), f"sm-{n}", beads, 150, results),
+        )
+        for n in range(6)
+    ]
+    for worker in workers:
+        worker.start()
+    outcomes = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    assert sum(doubles for _, doubles, _ in outcomes) == 0
+    tokens = [token for _, _, worker_tokens in outcomes for token in worker_tokens]
+    assert len(tokens) == len(set(tokens))
+    assert len(tokens) == sum(claimed for claimed, _, _ in outcomes) > 0
+    with ClaimManager(path) as manager:
+        assert all(manager.holder(bead_id) is None for bead_id in beads)
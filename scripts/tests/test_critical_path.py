@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Unit tests for critical-path analysis."""
+
+import json
+
+import pytest
+
+from bead_plan import DurationModel, LogNormal, StageModel
+from bead_schema import Bead
+from critical_path import (
+    analyze,
+    estimate_durations,
+    expected_duration,
+    observed_duration,
+    split_candidates,
+)
+from tests.test_validator import get_valid_bead_json
+
+
+def make_bead(bead_id, deps=(), sprint="1.1", dev_minutes=None):
+    """Return a Bead with optional single-attempt dev and QA history."""
+    data = get_valid_bead_json()
+    data["id"] = bead_id
+    data["dependencies"] = list(deps)
+    data["metadata"]["phase"] = sprint.split(".")[0]
+    data["metadata"]["sprint"] = sprint
+    if dev_minutes is not None:
+        base = {"attempt": 1, "session_id": "s", "agent_path": "a", "model": "sonnet"}
+        data["metadata"]["dev_agent_executions"] = [
+            dict(
+                base,
+                started_at="2026-02-07T10:00:00Z",
+                completed_at=f"2026-02-07T10:{dev_minutes:02d}:00Z",
+                status="completed",
+            )
+        ]
+        data["metadata"]["qa_agent_executions"] = [
+            dict(
+                base,
+                started_at="2026-02-07T11:00:00Z",
+                completed_at="2026-02-07T11:05:00Z",
+                status="pass",
+                message="ok",
+            )
+        ]
+    return Bead.model_validate_json(json.dumps(data))
+
+
+@pytest.fixture
+def diamond():
+    """a -> (b, c) -> d with b on the long branch."""
+    beads = [
+        make_bead("a"),
+        make_bead("b", ["a"]),
+        make_bead("c", ["a"]),
+        make_bead("d", ["b", "c"]),
+    ]
+    return beads, {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0}
+
+
+class TestDurations:
+    """Tests for duration weighting."""
+
+    def test_observed_and_estimated(self):
+        """Test history is summed and missing history is estimated."""
+        with_history = make_bead("a", dev_minutes=20)
+        without = make_bead("b")
+        assert observed_duration(with_history) == 25 * 60
+        assert observed_duration(without) is None
+        durations, estimated = estimate_durations([with_history, without])
+        assert estimated == {"b"}
+        # Fitted from the only history: 20m dev + 5m QA, never failing
+        assert durations["b"] == pytest.approx(25 * 60)
+
+    def test_expected_duration_counts_retries(self):
+        """Test expected attempts follow the truncated geometric series."""
+        stage = StageModel(LogNormal.from_median(60, 0), LogNormal.from_median(30, 0), 0.5)
+        assert expected_duration(stage, 3) == pytest.approx(90 * 1.75)
+        durations, _ = estimate_durations([make_bead("a")], DurationModel(default=stage))
+        assert durations["a"] == pytest.approx(90 * 1.75)
+
+
+class TestAnalyze:
+    """Tests for analyze."""
+
+    def test_diamond(self, diamond):
+        """Test path, makespan and slack on a diamond."""
+        beads, durations = diamond
+        analysis = analyze(beads, durations)
+        assert analysis.makespan == 7
+        assert analysis.path == ["a", "b", "d"]
+        assert analysis.slack == {"a": 0, "b": 0, "c": 3, "d": 0}
+        assert analysis.critical() == ["a", "b", "d"]
+        assert analysis.earliest_start["d"] == 6
+
+    def test_external_dependencies_and_empty_plan(self):
+        """Test dependencies outside the plan are ignored."""
+        analysis = analyze([make_bead("a", ["closed-elsewhere"])], {"a": 2.0})
+        assert analysis.path == ["a"]
+        assert analyze([], {}).makespan == 0
+
+    def test_cycle_raises(self):
+        """Test a dependency cycle is reported."""
+        beads = [make_bead("a", ["b"]), make_bead("b", ["a"]), make_bead("c")]
+        with pytest.raises(ValueError, match="cycle among beads: a, b"):
+            analyze(beads, dict.fromkeys("abc", 1.0))
+
+    def test_linear_chain_scales(self):
+        """Test a long chain is analysed without recursion limits."""
+        beads = [make_bead("b0")] + [make_bead(f"b{i}", [f"b{i - 1}"]) for i in range(1, 5000)]
+        analysis = analyze(beads, {bead.id: 1.0 for bead in beads})
+        assert analysis.makespan == 5000
+        assert len(analysis.path) == 5000
+
+
+class TestSplitCandidates:
+    """Tests for split_candidates."""
+
+    def test_ranks_sprint_with_internal_chain(self):
+        """Test the sprint whose internal chain is critical ranks first."""
+        beads = [
+            make_bead("a1", sprint="1.1"),
+            make_bead("b1", ["a1"], sprint="1.2"),
+            make_bead("b2", ["b1"], sprint="1.2"),
+            make_bead("b3", ["b2"], sprint="1.2"),
+            make_bead("c1", ["b3"], sprint="1.3"),
+            make_bead("c2", ["c1"], sprint="1.3"),
+        ]
+        durations = {"a1": 1.0, "b1": 4.0, "b2": 4.0, "b3": 2.0, "c1": 1.0, "c2": 1.0}
+        analysis = analyze(beads, durations)
+        candidates = split_candidates(beads, analysis)
+        assert [c.group for c in candidates] == ["1.2", "1.3"]
+        assert candidates[0].critical_beads == ["b1", "b2", "b3"]
+        # Split, b3 waits only for a1, so c1 can start at 3 instead of 11
+        assert candidates[0].gain_bound == 8
+        assert candidates[0].gain == 8
+        assert candidates[1].gain == 1
+
+    def test_gain_limited_by_parallel_paths(self, diamond):
+        """Test the exact gain accounts for the next-longest path."""
+        beads, durations = diamond
+        beads.append(make_bead("e", ["a"], sprint="1.2"))
+        durations["e"] = 5.5
+        analysis = analyze(beads, durations)
+        (candidate,) = split_candidates(beads, analysis)
+        assert candidate.critical_beads == ["a", "b", "d"]
+        assert candidate.gain_bound == 6
+        # e (sprint 1.2) still needs a: 1 + 5.5 = 6.5
+        assert candidate.gain == pytest.approx(0.5)
+        (phase,) = split_candidates(beads, analysis, by="phase")
+        assert phase.gain == pytest.approx(1.5)
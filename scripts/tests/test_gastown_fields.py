@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Unit tests for the gastown description-field parser."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bead_schema import Bead
+from gastown_fields import (
+    ENUM_VALUES,
+    FIELD_TYPES,
+    GastownFields,
+    parse_beads,
+    parse_description,
+    parse_descriptions,
+)
+from tests.test_validator import get_valid_bead_json
+
+SCHEMA = Path(__file__).resolve().parents[2] / "schemas" / "extensions" / "gastown-v0.5.0.yaml"
+
+AGENT = """Agent gt:polecat-main
+
+role_type: polecat
+rig: main
+agent_state: working
+hook_bead: bd-abc123
+cleanup_status: clean
+active_mr: bd-def456
+notification_level: normal
+"""
+
+
+class TestParseDescription:
+    """Tests for parse_description."""
+
+    def test_example_encoding(self):
+        """Test the schema's example agent description."""
+        fields = parse_description(AGENT)
+        assert fields.role_type == "polecat"
+        assert fields.rig == "main"
+        assert fields.hook_bead == "bd-abc123"
+        assert fields.notification_level == "normal"
+        assert fields.invalid == {}
+
+    def test_typed_values(self):
+        """Test ints, bools and lists convert; timestamps keep their colons."""
+        fields = parse_description(
+            "retry_count: 3\nno_merge: true\npaused: No\ncapabilities: merge, review ,\n"
+            "attached_at: 2026-02-07T10:00:00Z\n"
+        )
+        assert (fields.retry_count, fields.no_merge, fields.paused) == (3, True, False)
+        assert fields.capabilities == ["merge", "review"]
+        assert fields.attached_at == "2026-02-07T10:00:00Z"
+
+    def test_mixed_human_text(self):
+        """Test prose, unknown keys, indentation and key prefixes are handled."""
+        text = (
+            "Rig: ignored because keys are lowercase\n"
+            "Note: the reason: field below is gastown's\n"
+            "  reason: flaky CI on main   \r\n"
+            "rigging: not the rig key\n"
+            "see rig: inline mentions are not fields\n"
+            "rig_name: alpha\n"
+        )
+        fields = parse_description(text)
+        assert fields.reason == "flaky CI on main"
+        assert fields.rig is None
+        assert fields.rig_name == "alpha"
+
+    def test_invalid_and_unset_values(self):
+        """Test bad values go to `invalid`; empty, null and repeated keys resolve."""
+        fields = parse_description(
+            "severity: urgent\nmax_size: lots\nhook_bead: null\nactive_mr:\n"
+            "worker: a\nworker: b\nagent_state: bogus\nagent_state: done\n"
+        )
+        assert fields.invalid == {"severity": "urgent", "max_size": "lots"}
+        assert (fields.severity, fields.hook_bead, fields.active_mr) == (None, None, None)
+        assert (fields.worker, fields.agent_state) == ("b", "done")
+
+    def test_no_fields(self):
+        """Test plain descriptions give an empty model."""
+        assert parse_description("Implement user authentication.") == GastownFields()
+        assert parse_description("") == GastownFields()
+
+
+class TestBulk:
+    """Tests for the bulk APIs."""
+
+    def test_parse_descriptions_and_beads(self):
+        """Test order is preserved and beads are keyed by ID."""
+        assert [f.rig for f in parse_descriptions([AGENT, "x", "rig: b"])] == ["main", None, "b"]
+        data = get_valid_bead_json()
+        data["description"] = AGENT
+        bead = Bead.model_validate_json(json.dumps(data))
+        assert parse_beads([bead])[bead.id].role_type == "polecat"
+
+
+def test_fields_match_schema():
+    """Test the model covers every description-encoded field in the gastown schema."""
+    yaml = pytest.importorskip("yaml")
+    schema = yaml.safe_load(SCHEMA.read_text())
+    kinds = {"string": str, "int": int, "bool": bool}
+    for group, fields in schema.items():
+        if not group.endswith("_fields"):
+            continue
+        for name, spec in fields.items():
+            assert name in FIELD_TYPES, name
+            if spec["type"] in kinds:
+                assert FIELD_TYPES[name] is kinds[spec["type"]], name
+            if "values" in spec:
+                assert ENUM_VALUES[name] == spec["values"], name
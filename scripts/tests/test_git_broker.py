@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Unit and stress tests for the git operation broker."""
+
+import fcntl
+import subprocess
+import threading
+
+import pytest
+
+from git_broker import GitBroker, is_read_only
+from git_utils import GitCommandError, run_git
+
+
+def init_repo(path, branch="main"):
+    subprocess.run(["git", "init", "-q", "-b", branch, str(path)], check=True)
+    (path / "README").write_text("hello\n")
+    git = ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A clone of a local `origin` with branches main and dev."""
+    origin = tmp_path / "origin"
+    init_repo(origin)
+    run_git(str(origin), ["branch", "dev"])
+    clone = tmp_path / "repo"
+    subprocess.run(["git", "clone", "-q", str(origin), str(clone)], check=True)
+    return str(clone)
+
+
+@pytest.fixture
+def broker(repo):
+    with GitBroker(repo) as broker:
+        yield broker
+
+
+class TestGitBroker:
+    """Tests for GitBroker."""
+
+    def test_read_only_classification(self):
+        """Test lock-free commands are recognised."""
+        assert is_read_only(["rev-parse", "HEAD"])
+        assert not is_read_only(["worktree", "add", "x"])
+        assert not is_read_only([])
+
+    def test_run_read_and_write(self, broker, repo):
+        """Test read and write commands both return their output."""
+        broker.run(["branch", "topic"]).result()
+        assert broker.run(["rev-parse", "--abbrev-ref", "topic"]).result() == "topic"
+        with pytest.raises(GitCommandError):
+            broker.run(["branch", "topic"]).result()
+
+    def test_branch_creations_batch(self, broker, repo):
+        """Test branches queued behind the lock are created in one transaction."""
+        with open(broker.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            first = broker.create_branch("warmup", "HEAD")
+            # The writer now waits on the lock; later creations queue up
+            futures = [broker.create_branch(f"sprint/{i}", "origin/main") for i in range(10)]
+            futures.append(broker.create_branch("bad", "no-such-ref"))
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        first.result()
+        for future in futures[:-1]:
+            future.result()
+        with pytest.raises(GitCommandError):
+            futures[-1].result()
+        assert broker.batched >= 10
+        refs = run_git(repo, ["for-each-ref", "--format=%(refname)", "refs/heads/sprint"])
+        assert len(refs.splitlines()) == 10
+
+    def test_fetch_batches_refspecs(self, broker, repo, tmp_path):
+        """Test concurrent fetches of several refs share one git fetch."""
+        origin = str(tmp_path / "origin")
+        run_git(origin, ["branch", "feature"])
+        with open(broker.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            first = broker.run(["tag", "t1"])
+            futures = [
+                broker.fetch("origin", f"{name}:refs/remotes/origin/{name}")
+                for name in ("main", "dev", "feature")
+            ]
+            commands = broker.commands
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        first.result()
+        for future in futures:
+            future.result()
+        assert broker.commands - commands == 2
+        assert run_git(repo, ["rev-parse", "origin/feature"])
+
+    def test_resolve(self, broker, repo):
+        """Test ref lookups, including missing refs and prefix-only matches."""
+        head = run_git(repo, ["rev-parse", "HEAD"])
+        futures = [broker.resolve(ref) for ref in ("refs/heads/main", "refs/heads", "refs/x")]
+        assert [future.result() for future in futures] == [head, None, None]
+
+    def test_worktree_add_remove(self, broker, repo, tmp_path):
+        """Test worktrees are added on a branch and removed."""
+        path = str(tmp_path / "wt")
+        broker.create_branch("sprint/1", "HEAD").result()
+        broker.worktree_add(path, "sprint/1").result()
+        assert run_git(path, ["rev-parse", "--abbrev-ref", "HEAD"]) == "sprint/1"
+        broker.worktree_remove(path).result()
+        assert path not in run_git(repo, ["worktree", "list"])
+
+
+def test_stress_no_lock_failures(repo, tmp_path):
+    """Test dozens of concurrent sessions complete with zero git failures."""
+    errors = []
+
+    def session(broker, n):
+        try:
+            broker.fetch("origin", "main:refs/remotes/origin/main").result()
+            broker.create_branch(f"s/{n}", "origin/main").result()
+            path = str(tmp_path / f"wt-{n}")
+            broker.worktree_add(path, f"s/{n}").result()
+            assert broker.resolve(f"refs/heads/s/{n}").result()
+            broker.run(["tag", f"done-{n}"]).result()
+            broker.worktree_remove(path).result()
+        except Exception as exc:  # collected for the assertion below
+            errors.append(exc)
+
+    # Two brokers on one repo serialize through the shared lock file
+    with GitBroker(repo) as a, GitBroker(repo) as b:
+        threads = [threading.Thread(target=session, args=((a, b)[n % 2], n)) for n in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert a.batched + b.batched > 0
+    assert errors == []
+    tags = run_git(repo, ["tag", "--list", "done-*"]).splitlines()
+    assert len(tags) == 32
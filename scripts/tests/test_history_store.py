@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Unit tests for the out-of-line execution history store."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from bead_schema import Bead, DevExecution, ExecutionHistoryRef, QAExecution
+from history_store import DEV_CODEC, QA_CODEC, HistoryStore
+from tests.test_validator import get_valid_bead_json
+
+
+def make_dev(attempt, status="completed"):
+    """Return a DevExecution for the given attempt."""
+    start = datetime(2026, 2, 7, 10, 0, 0) + timedelta(minutes=20 * attempt)
+    return DevExecution(
+        attempt=attempt,
+        session_id=f"claude-dev-{attempt}",
+        agent_path=".claude/agents/backend-dev",
+        model="sonnet",
+        started_at=start,
+        completed_at=start + timedelta(minutes=10),
+        status=status,
+        feedback_from_qa=None if attempt == 1 else "fix tests",
+    )
+
+
+def make_qa(attempt, status="fail"):
+    """Return a QAExecution for the given attempt."""
+    start = datetime(2026, 2, 7, 10, 0, 0, tzinfo=timezone.utc) + timedelta(minutes=20 * attempt)
+    return QAExecution(
+        attempt=attempt,
+        session_id=f"claude-qa-{attempt}",
+        agent_path=".claude/agents/qa-unit-tests",
+        model="haiku",
+        started_at=start,
+        completed_at=start + timedelta(minutes=3),
+        status=status,
+        message="done",
+    )
+
+
+def make_bead(attempts):
+    """Return a bead with `attempts` inline dev/QA executions and comments."""
+    bead_json = get_valid_bead_json()
+    bead = Bead.model_validate_json(json.dumps(bead_json))
+    metadata = bead.metadata.model_copy(
+        update={
+            "dev_agent_executions": [make_dev(i) for i in range(1, attempts + 1)],
+            "qa_agent_executions": [make_qa(i) for i in range(1, attempts + 1)],
+            "attempt_count": attempts,
+        }
+    )
+    comments = [{"author": "qa", "text": f"attempt {i} failed"} for i in range(attempts)]
+    return bead.model_copy(update={"metadata": metadata, "comments": comments})
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Open a history store in a temporary directory."""
+    with HistoryStore(str(tmp_path / "history.db")) as history:
+        yield history
+
+
+class TestRecordCodec:
+    """Tests for the compact record encoding."""
+
+    def test_round_trip(self):
+        """Test records decode to equal models, including timezones."""
+        for execution, codec in [(make_dev(1), DEV_CODEC), (make_qa(2), QA_CODEC)]:
+            assert codec.decode(codec.encode(execution)) == execution
+
+    def test_positional_and_trimmed(self):
+        """Test records omit keys and trailing defaults."""
+        record = json.loads(DEV_CODEC.encode(make_dev(1)))
+        assert isinstance(record, list)
+        assert len(record) == 7  # feedback_from_qa (None) trimmed
+        assert len(json.loads(QA_CODEC.encode(make_qa(1)))) == 8  # empty details trimmed
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore."""
+
+    def test_append_and_stream(self, store):
+        """Test entries stream back in append order, lazily and with offsets."""
+        store.append_dev_executions("bd-1", [make_dev(1), make_dev(2)])
+        store.append_dev_executions("bd-1", [make_dev(3)])
+        store.append_dev_executions("bd-2", [make_dev(1)])
+        stream = store.iter_dev_executions("bd-1")
+        assert next(stream).attempt == 1
+        assert [e.attempt for e in stream] == [2, 3]
+        assert [e.attempt for e in store.iter_dev_executions("bd-1", after=2)] == [3]
+        assert list(store.iter_qa_executions("bd-1")) == []
+
+    def test_summary(self, store):
+        """Test summary counts and last statuses."""
+        store.append_dev_executions("bd-1", [make_dev(1), make_dev(2, status="failed")])
+        store.append_qa_executions("bd-1", [make_qa(1, status="pass")])
+        summary = store.summary("bd-1")
+        assert summary.dev_execution_count == 2
+        assert summary.qa_execution_count == 1
+        assert summary.last_attempt == 2
+        assert summary.last_dev_status == "failed"
+        assert summary.last_qa_status == "pass"
+        assert summary.store == store.path
+
+    def test_summary_follows_highest_attempt(self, store):
+        """Test last attempt and statuses come from the highest attempt, not the last append."""
+        store.append_dev_executions("bd-1", [make_dev(3), make_dev(1, status="timeout")])
+        store.append_qa_executions(
+            "bd-1", [make_qa(3, status="fail"), make_qa(3, status="pass"), make_qa(1)]
+        )
+        summary = store.summary("bd-1")
+        assert (summary.last_attempt, summary.last_dev_status) == (3, "completed")
+        assert summary.last_qa_status == "pass"
+        assert (summary.dev_execution_count, summary.qa_execution_count) == (2, 3)
+        empty = store.summary("bd-2")
+        assert (empty.last_attempt, empty.last_dev_status, empty.last_qa_status) == (0, None, None)
+
+    def test_offload_keeps_bead_size_constant(self, store):
+        """Test offloaded beads are the same size regardless of attempt count."""
+        small = store.offload(make_bead(10).model_copy(update={"id": "bd-small"}))
+        large = store.offload(make_bead(90).model_copy(update={"id": "bd-large"}))
+        assert small.metadata.dev_agent_executions == []
+        assert large.comments == []
+        assert large.metadata.execution_history.dev_execution_count == 90
+        assert len(small.model_dump_json()) == len(large.model_dump_json())
+        # Offloaded beads still pass full validation
+        Bead.model_validate_json(large.model_dump_json())
+
+    def test_offload_then_hydrate(self, store):
+        """Test repeated offloads append, and hydrate restores full history."""
+        original = make_bead(3)
+        offloaded = store.offload(original)
+        pending = offloaded.metadata.model_copy(update={"dev_agent_executions": [make_dev(4)]})
+        offloaded = store.offload(offloaded.model_copy(update={"metadata": pending}))
+        assert offloaded.metadata.execution_history.dev_execution_count == 4
+
+        hydrated = store.hydrate(offloaded)
+        assert [e.attempt for e in hydrated.metadata.dev_agent_executions] == [1, 2, 3, 4]
+        assert hydrated.metadata.qa_agent_executions == original.metadata.qa_agent_executions
+        assert hydrated.comments == original.comments
+        assert hydrated.metadata.execution_history is None
+
+    def test_persistence(self, tmp_path):
+        """Test history survives reopening the store."""
+        path = str(tmp_path / "history.db")
+        with HistoryStore(path) as history:
+            history.append_comments("bd-1", [{"text": "hello"}])
+        with HistoryStore(path) as history:
+            assert list(history.iter_comments("bd-1")) == [{"text": "hello"}]
+
+
+class TestExecutionHistoryRef:
+    """Tests for the ExecutionHistoryRef model."""
+
+    def test_invalid_counts_and_status(self):
+        """Test negative counts and unknown statuses are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            ExecutionHistoryRef(store="h.db", dev_execution_count=-1, last_qa_status="ok")
+        assert "history counts must be >= 0" in str(exc_info.value)
+        assert "last_qa_status must be one of" in str(exc_info.value)
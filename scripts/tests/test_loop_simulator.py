@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Unit tests for the ralph-loop discrete-event simulator."""
+
+import pytest
+
+from bead_plan import DurationModel
+from loop_simulator import SimBead, Work, sample_work, simulate_waves, sweep
+
+
+def fixed(durations, failures=()):
+    """Deterministic work: bead ID -> duration, failing the given IDs."""
+    return {
+        bead_id: Work(duration, 1, bead_id not in failures)
+        for bead_id, duration in durations.items()
+    }
+
+
+class TestWaveSimulation:
+    """Tests for simulate_waves."""
+
+    def test_wave_barrier_delays_ready_bead(self):
+        """Test a bead unblocked early still waits for the whole wave."""
+        beads = [SimBead("a"), SimBead("b"), SimBead("c", dependencies=("b",))]
+        result = simulate_waves(beads, fixed({"a": 10, "b": 1, "c": 1}), concurrency=2)
+        assert result.makespan == 11
+        assert result.max_wait == 9
+        assert result.utilization == pytest.approx(12 / 22)
+        assert result.completed == 3
+
+    def test_concurrency_one_is_serial(self):
+        """Test a single session runs everything back to back."""
+        beads = [SimBead(x) for x in "abcd"]
+        result = simulate_waves(beads, fixed(dict(zip("abcd", [1, 2, 3, 4]))), 1, 0.5)
+        assert result.makespan == 12
+        assert result.utilization == 1.0
+
+    def test_failure_blocks_dependents(self):
+        """Test beads downstream of a failed bead are never launched."""
+        beads = [SimBead("a"), SimBead("b", ("a",)), SimBead("c", ("b",)), SimBead("d", ("x",))]
+        result = simulate_waves(beads, fixed(dict.fromkeys("abcd", 1), {"a"}), 4)
+        assert (result.completed, result.failed, result.blocked) == (1, 1, 2)
+
+    def test_per_sprint_stats(self):
+        """Test sprint spans and waits are reported."""
+        beads = [
+            SimBead("a", sprint="1.1"),
+            SimBead("b", sprint="1.1"),
+            SimBead("c", ("a", "b"), sprint="1.2"),
+        ]
+        result = simulate_waves(beads, fixed({"a": 2, "b": 4, "c": 3}), 1)
+        assert result.sprints["1.1"].span == 6
+        assert result.sprints["1.1"].mean_wait == 1
+        assert result.sprints["1.2"].start == 6
+
+    def test_sweep_uses_shared_work(self):
+        """Test more sessions never lengthen makespan on identical work."""
+        beads = [SimBead(f"b{i}", (f"b{i - 5}",) if i >= 5 else ()) for i in range(50)]
+        work = sample_work(beads, DurationModel(), seed=3)
+        results = sweep(beads, work, [1, 2, 4, 8])
+        makespans = [r.makespan for r in results]
+        assert makespans == sorted(makespans, reverse=True)
+        assert results[0].makespan == pytest.approx(sum(w.duration for w in work.values()))
+
+    def test_invalid_concurrency(self):
+        """Test concurrency below one is rejected."""
+        with pytest.raises(ValueError):
+            simulate_waves([SimBead("a")], fixed({"a": 1}), 0)
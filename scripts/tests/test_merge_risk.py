@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Unit tests for merge-conflict risk prediction."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import branch_check
+import merge_risk
+from bd_client import BdClient
+from bead_schema import Bead
+from git_utils import run_git
+from merge_risk import analyze, format_analysis, merge_order, overlap_matrix, write_risks
+from tests.test_validator import get_merge_bead_json
+
+FAKE_BD = [sys.executable, str(Path(__file__).resolve().parent / "fake_bd.py")]
+
+
+def commit(repo, files, message):
+    """Write `files` ({path: text}) and commit them."""
+    for path, text in files.items():
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text(text)
+    git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-qm", message], check=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Parallel track branches off `main`; `main` moves on after they fork."""
+    path = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    commit(path, {"src/api.py": "0\n", "src/db.py": "0\n", "README": "0\n"}, "init")
+    tracks = {
+        "track/3a": {"src/api.py": "a\n", "src/auth.py": "a\n"},
+        "track/3b": {"src/api.py": "b\n", "src/db.py": "b\n"},
+        "track/3c": {"src/db.py": "c\n"},
+        "track/3d": {"docs/guide.md": "d\n"},
+    }
+    for branch, files in tracks.items():
+        run_git(str(path), ["checkout", "-q", "-b", branch, "main"])
+        commit(path, files, branch)
+    run_git(str(path), ["checkout", "-q", "main"])
+    commit(path, {"README": "1\n"}, "main moves on")
+    run_git(str(path), ["checkout", "-q", "--orphan", "unrelated"])
+    commit(path, {"other": "x\n"}, "unrelated history")
+    run_git(str(path), ["checkout", "-q", "main"])
+    return str(path)
+
+
+def make_merge_bead(bead_id, branches, status="open"):
+    """Return a merge bead merging `branches` into main."""
+    data = get_merge_bead_json()
+    data.update(id=bead_id, status=status)
+    if status == "closed":
+        data["closed_at"] = data["updated_at"]
+    data["metadata"]["branches_to_merge"] = branches
+    return Bead.model_validate_json(json.dumps(data))
+
+
+class TestOrdering:
+    """Tests for the overlap matrix and merge order."""
+
+    def test_overlap_matrix(self):
+        """Test shared-file counts, with files changed on the diagonal."""
+        assert overlap_matrix([{"a", "b"}, {"b", "c"}, set()]) == [[2, 1, 0], [1, 2, 0], [0, 0, 0]]
+
+    def test_order_puts_independent_branches_first(self):
+        """Test a path a-b-c merges a and c before b (one conflicting merge, not two)."""
+        overlap = overlap_matrix([{"x"}, {"x", "y"}, {"y"}])
+        assert merge_order(overlap) == [0, 2, 1]
+        assert merge_order([]) == []
+
+
+class TestAnalyze:
+    """Tests for analyze against a local repository."""
+
+    def test_overlap_order_and_risk(self, repo):
+        """Test changed files are taken against the merge base, not main's tip."""
+        beads = [make_merge_bead("bd-m", ["track/3a", "track/3b", "track/3c", "track/3d"])]
+        [analysis] = analyze(beads, repo)
+        assert analysis.files[0] == {"src/api.py", "src/auth.py"}
+        assert analysis.conflicting_pairs == [
+            ("track/3a", "track/3b"),
+            ("track/3b", "track/3c"),
+        ]
+        assert analysis.order == ["track/3d", "track/3a", "track/3c", "track/3b"]
+        assert analysis.conflicting_merges == 1
+        risk = analysis.risk()
+        assert risk.score == pytest.approx(1 / 3)
+        assert (risk.conflicting_pairs, risk.overlapping_file_count) == (2, 2)
+        assert risk.overlapping_files == ["src/api.py", "src/db.py"]
+        assert risk.target_commit == run_git(repo, ["rev-parse", "main"])
+        assert "track/3a x track/3b: 1 shared files" in format_analysis(analysis)
+
+    def test_unresolved_branches_and_skipped_beads(self, repo):
+        """Test missing and unrelated branches are skipped; closed beads are not analyzed."""
+        beads = [
+            make_merge_bead("bd-m", ["track/3a", "track/nope", "unrelated"]),
+            make_merge_bead("bd-done", ["track/3a"], status="closed"),
+        ]
+        [analysis] = analyze(beads, repo)
+        assert analysis.branches == ["track/3a"]
+        assert analysis.unresolved == {
+            "track/nope": "not in the repository",
+            "unrelated": "no common history with main",
+        }
+        assert analysis.risk().score == 0.0
+
+    def test_git_calls_do_not_grow_with_beads(self, repo, monkeypatch):
+        """Test many merge beads still cost three git calls."""
+        calls = []
+
+        def counting_run_git(cwd, args, **kwargs):
+            calls.append(args[0])
+            return run_git(cwd, args, **kwargs)
+
+        monkeypatch.setattr(merge_risk, "run_git", counting_run_git)
+        monkeypatch.setattr(branch_check, "run_git", counting_run_git)
+        branches = ["track/3a", "track/3b", "track/3c", "track/3d"]
+        beads = [make_merge_bead(f"bd-{i}", branches[i % 2 :]) for i in range(50)]
+        assert len(analyze(beads, repo)) == 50
+        assert calls == ["for-each-ref", "rev-parse", "diff-tree"]
+
+
+def test_write_risks(repo, tmp_path, monkeypatch):
+    """Test predictions are stored in metadata.merge_risk through bd."""
+    bead = make_merge_bead("bd-m", ["track/3a", "track/3b"])
+    (tmp_path / "bd-m.json").write_text(bead.model_dump_json())
+    monkeypatch.setenv("FAKE_BD_DIR", str(tmp_path))
+    with BdClient(bd_command=FAKE_BD) as client:
+        write_risks(client, analyze([bead], repo))
+    stored = Bead.model_validate_json((tmp_path / "bd-m.json").read_text())
+    assert stored.metadata.merge_risk.score == 1.0
+    assert stored.metadata.merge_risk.merge_order == ["track/3a", "track/3b"]
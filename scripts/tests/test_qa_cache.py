@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Unit tests for the QA result cache."""
+
+import json
+import subprocess
+
+import pytest
+
+from bead_schema import QAAgent, QAExecution
+from git_utils import GitCommandError
+from qa_cache import QACache, cache_key, tree_hash
+from tests.test_validator import get_valid_bead_json
+from validation_metrics import MetricsRegistry, ValidationMetrics
+
+
+def make_agent(**changes):
+    """Return the fixture bead's QA agent with optional field changes."""
+    data = get_valid_bead_json()["metadata"]["qa_agents"][0]
+    data.update(changes)
+    return QAAgent.model_validate(data)
+
+
+def make_execution(status="pass", attempt=1):
+    """Return a QA execution for the fixture agent."""
+    data = {
+        "attempt": attempt,
+        "session_id": f"qa-{attempt}",
+        "agent_path": ".claude/agents/qa-unit-tests",
+        "model": "haiku",
+        "started_at": "2026-02-07T10:00:00Z",
+        "completed_at": "2026-02-07T10:05:00Z",
+        "status": status,
+        "message": "ok",
+        "details": {"coverage_percent": 91.5},
+    }
+    return QAExecution.model_validate_json(json.dumps(data))
+
+
+@pytest.fixture
+def worktree(tmp_path):
+    """A git repo with one committed file."""
+    path = tmp_path / "wt"
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    (path / "app.py").write_text("print('hi')\n")
+    (path / ".gitignore").write_text("*.log\n")
+    git = ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    metrics = ValidationMetrics(MetricsRegistry())
+    with QACache(str(tmp_path / "qa.db"), flaky_agents=["flaky"], metrics=metrics) as cache:
+        yield cache
+
+
+class TestTreeHash:
+    """Tests for tree_hash."""
+
+    def test_tracks_uncommitted_changes(self, worktree):
+        """Test edits and new files change the hash, ignored files do not."""
+        clean = tree_hash(str(worktree))
+        assert clean == tree_hash(str(worktree))
+        (worktree / "debug.log").write_text("noise")
+        assert tree_hash(str(worktree)) == clean
+        (worktree / "app.py").write_text("print('bye')\n")
+        edited = tree_hash(str(worktree))
+        assert edited != clean
+        (worktree / "new.py").write_text("")
+        assert tree_hash(str(worktree)) not in (clean, edited)
+        (worktree / "new.py").unlink()
+        (worktree / "app.py").write_text("print('hi')\n")
+        assert tree_hash(str(worktree)) == clean
+
+    def test_real_index_untouched(self, worktree):
+        """Test hashing does not stage anything in the worktree."""
+        (worktree / "new.py").write_text("")
+        tree_hash(str(worktree))
+        status = subprocess.run(
+            ["git", "-C", str(worktree), "status", "--porcelain"], capture_output=True, text=True
+        ).stdout
+        assert status == "?? new.py\n"
+
+    def test_not_a_repo(self, tmp_path):
+        """Test a non-repository raises GitCommandError."""
+        with pytest.raises(GitCommandError):
+            tree_hash(str(tmp_path))
+
+
+class TestQACache:
+    """Tests for QACache."""
+
+    def test_hit_relabels_attempt(self, cache):
+        """Test a hit returns the stored execution for the current attempt."""
+        agent = make_agent()
+        assert cache.get("tree1", agent, attempt=1) is None
+        assert cache.put("tree1", agent, make_execution())
+        hit = cache.get("tree1", agent, attempt=2)
+        assert hit.attempt == 2
+        assert hit.session_id == "qa-1"
+        assert hit.details == {"coverage_percent": 91.5}
+        assert cache.metrics.cache_hit_ratio("qa") == 0.5
+
+    def test_key_components(self, cache):
+        """Test the tree, prompt, model and output schema are all part of the key."""
+        agent = make_agent()
+        cache.put("tree1", agent, make_execution())
+        assert cache.get("tree2", agent, 1) is None
+        assert cache.get("tree1", make_agent(prompt="Run pytest -x."), 1) is None
+        assert cache.get("tree1", make_agent(model="sonnet"), 1) is None
+        schema = dict(agent.output_schema, required=["status"])
+        assert cache.get("tree1", make_agent(output_schema=schema), 1) is None
+        assert cache_key("t", agent) == cache_key("t", make_agent())
+
+    def test_flaky_and_stop_not_cached(self, cache):
+        """Test flaky agents and stop results always re-run."""
+        flaky = make_agent(agent_path="flaky")
+        assert not cache.put("tree1", flaky, make_execution())
+        assert cache.get("tree1", flaky, 1) is None
+        assert not cache.put("tree1", make_agent(), make_execution("stop"))
+        assert cache.get("tree1", make_agent(), 1) is None
+
+    def test_run(self, cache):
+        """Test run executes once per key."""
+        calls = []
+
+        def execute(agent):
+            calls.append(agent.agent_path)
+            return make_execution("fail")
+
+        agent = make_agent()
+        first, cached = cache.run("tree1", agent, 1, execute)
+        assert (first.status, cached) == ("fail", False)
+        second, cached = cache.run("tree1", agent, 2, execute)
+        assert (second.attempt, cached) == (2, True)
+        assert calls == [agent.agent_path]
+
+    def test_evict_older_than(self, cache):
+        """Test stale entries are evicted."""
+        cache.put("tree1", make_agent(), make_execution())
+        assert cache.evict_older_than(3600) == 0
+        assert cache.evict_older_than(-1) == 1
+        assert cache.get("tree1", make_agent(), 1) is None
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Unit tests for the streaming fenced-JSON result extractor."""
+
+import io
+import json
+
+import pytest
+
+from bead_schema import ScrumResult
+from result_extractor import (
+    FencedJsonScanner,
+    ResultExtractionError,
+    extract_result,
+    parse_qa_output,
+    parse_scrum_output,
+    repair_json,
+    scan,
+)
+
+SCRUM = {
+    "bead_id": "bd-a1b2c3",
+    "success": True,
+    "pr_url": "https://github.com/org/repo/pull/42",
+    "pr_number": 42,
+    "bead_updated": True,
+    "attempt_count": 1,
+    "qa_results": [{"agent_path": "qa", "status": "pass", "message": "ok"}],
+    "error": None,
+    "fatal": False,
+}
+
+
+def fenced(value):
+    text = value if isinstance(value, str) else json.dumps(value, indent=2)
+    return f"```json\n{text}\n```\n"
+
+
+def transcript(*blocks, noise=2000):
+    """Agent-like output with `noise` lines of chatter around each block."""
+    chatter = "".join(f"step {i}: editing src/module_{i}.py\n" for i in range(noise))
+    return chatter + "".join(block + chatter for block in blocks)
+
+
+class TestScanner:
+    """Tests for FencedJsonScanner."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_chunk_boundaries(self, chunk_size):
+        """Test blocks are found whatever the chunking."""
+        text = transcript(fenced({"a": 1}), fenced({"b": [1, 2]}), noise=5) + "```json\n```\n"
+        data = text.encode()
+        scanner = FencedJsonScanner(keep=None)
+        for start in range(0, len(data), chunk_size):
+            scanner.feed(data[start : start + chunk_size])
+        blocks = scanner.close()
+        assert [json.loads(b.text or b"null") for b in blocks] == [{"a": 1}, {"b": [1, 2]}, None]
+        assert all(b.complete for b in blocks)
+
+    def test_other_fences_and_languages_ignored(self):
+        """Test ```python and ```jsonc fences are not results."""
+        text = "```python\nprint({})\n```\n```jsonc\n{// c\n}\n```\n" + fenced({"ok": True})
+        assert [b.text for b in scan(text)] == [b'{\n  "ok": true\n}']
+
+    def test_keep_and_truncated_block(self):
+        """Test only the last `keep` blocks are retained and a cut-off block is incomplete."""
+        text = fenced({"n": 1}) + fenced({"n": 2}) + '```json\n{"n": 3'
+        blocks = scan(text, keep=2)
+        assert [b.complete for b in blocks] == [True, False]
+        assert blocks[-1].text == b'{"n": 3'
+
+    def test_oversized_block_skipped(self):
+        """Test a runaway block does not grow memory without bound."""
+        scanner = FencedJsonScanner(max_block_bytes=100)
+        scanner.feed(fenced({"big": "x" * 500}).encode() + fenced({"small": 1}).encode())
+        assert [b.text for b in scanner.close()] == [b'{\n  "small": 1\n}']
+        assert scanner.skipped == 1
+
+
+class TestRepair:
+    """Tests for repair_json."""
+
+    @pytest.mark.parametrize(
+        "broken, expected",
+        [
+            ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}),
+            ('{"a": {"b": [1, 2', {"a": {"b": [1, 2]}}),
+            ('{"message": "cut off', {"message": "cut off"}),
+            ('{"message": "escaped \\', {"message": "escaped "}),
+            ('{"a": "}, ]", "b": [1,', {"a": "}, ]", "b": [1]}),
+        ],
+    )
+    def test_repairs(self, broken, expected):
+        """Test trailing commas and truncated closers are repaired."""
+        assert json.loads(repair_json(broken)) == expected
+
+    def test_bounded(self):
+        """Test valid input is left alone and deep truncation is not repaired."""
+        assert repair_json('{"a": 1}') is None
+        assert repair_json("[" * 100) is None
+
+
+class TestExtract:
+    """Tests for extract_result and the agent parsers."""
+
+    def test_scrum_result_from_stream(self):
+        """Test the last block validates into ScrumResult from a file object."""
+        stream = io.BytesIO(transcript(fenced({"draft": True}), fenced(SCRUM)).encode())
+        result = parse_scrum_output(stream)
+        assert isinstance(result, ScrumResult)
+        assert result.pr_number == 42
+
+    def test_falls_back_to_earlier_valid_block(self):
+        """Test an invalid last block falls back to the previous usable one."""
+        result = extract_result(fenced(SCRUM) + fenced({"bead_id": 1}), ScrumResult)
+        assert result.bead_id == "bd-a1b2c3"
+
+    def test_repaired_truncated_output(self):
+        """Test output cut off after the last field still validates."""
+        text = fenced(SCRUM)
+        truncated = text[: text.rindex("}")].rstrip() + ","
+        assert parse_scrum_output(truncated).fatal is False
+
+    def test_no_result(self):
+        """Test outputs without a usable block raise ResultExtractionError."""
+        with pytest.raises(ResultExtractionError, match="no ```json block"):
+            parse_scrum_output("all done!")
+        with pytest.raises(ResultExtractionError, match="ScrumResult"):
+            parse_scrum_output(fenced({"success": "yes"}))
+
+    def test_qa_output(self):
+        """Test QA output gets its agent_path and invalid output becomes a fail."""
+        result = parse_qa_output(fenced({"status": "pass", "message": "12 passed"}), "qa-tests")
+        assert (result.agent_path, result.status) == ("qa-tests", "pass")
+        failed = parse_qa_output("I could not run the tests.", "qa-tests")
+        assert failed.status == "fail"
+        assert failed.message == "QA agent returned invalid output format"
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Unit tests for the append-only run ledger."""
+
+import json
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from bd_client import BdClient
+from bead_schema import Bead, DevExecution, QAResult, ScrumResult
+from claim_manager import Lease
+from run_ledger import RunLedger, RunState, format_state, reopen_interrupted
+from tests.test_validator import get_valid_bead_json
+
+FAKE_BD = [sys.executable, str(Path(__file__).resolve().parent / "fake_bd.py")]
+
+
+def make_dev(attempt, status="completed"):
+    """Return a finished DevExecution for the given attempt."""
+    start = datetime(2026, 2, 7, 10, 0, 0) + timedelta(minutes=20 * attempt)
+    return DevExecution(
+        attempt=attempt,
+        session_id=f"claude-dev-{attempt}",
+        agent_path=".claude/agents/backend-dev",
+        model="sonnet",
+        started_at=start,
+        completed_at=start + timedelta(minutes=10),
+        status=status,
+    )
+
+
+def run_bead(ledger, bead_id, attempts=1, close=True):
+    """Record a bead's life: claim, dev/QA attempts, scrum result and status."""
+    lease = Lease(bead_id, "sm-1", 1, 0.0, 60.0)
+    ledger.record_claim(lease)
+    ledger.record_status(bead_id, "in_progress")
+    for attempt in range(1, attempts + 1):
+        ledger.record_dev_start(bead_id, attempt, f"claude-dev-{attempt}")
+        ledger.record_dev_end(bead_id, make_dev(attempt))
+        status = "pass" if attempt == attempts else "fail"
+        ledger.record_qa_result(bead_id, QAResult(agent_path="qa", status=status, message=""))
+    ledger.record_scrum_result(
+        ScrumResult(
+            bead_id=bead_id, success=True, bead_updated=True, attempt_count=attempts, fatal=False
+        )
+    )
+    ledger.record_release(lease)
+    if close:
+        ledger.record_status(bead_id, "closed")
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Ledger database path."""
+    return str(tmp_path / "ledger.db")
+
+
+class TestRunState:
+    """Tests for folding events into state."""
+
+    def test_in_flight_state(self, path):
+        """Test claims, attempts, QA results and interrupted beads."""
+        with RunLedger(path) as ledger:
+            run_bead(ledger, "bd-done")
+            run_bead(ledger, "bd-review", attempts=2, close=False)
+            ledger.record_claim(Lease("bd-crash", "sm-2", 3, 0.0, 60.0))
+            ledger.record_status("bd-crash", "in_progress")
+            ledger.record_dev_start("bd-crash", 1, "claude-dev-9")
+            state = ledger.state
+        assert set(state.beads) == {"bd-review", "bd-crash"}
+        review = state.beads["bd-review"]
+        assert (review.attempt, review.last_dev_status, review.owner) == (2, "completed", None)
+        assert review.qa_results == {"qa": "pass"}
+        assert review.scrum_result["success"] is True
+        crash = state.beads["bd-crash"]
+        assert (crash.owner, crash.token, crash.dev_session_id) == ("sm-2", 3, "claude-dev-9")
+        assert [bead.bead_id for bead in state.interrupted()] == ["bd-crash", "bd-review"]
+        text = format_state(state)
+        assert text.splitlines()[0] == "2 beads in flight after event 21, 2 interrupted"
+        assert "* bd-crash: in_progress, attempt 1, dev running (claude-dev-9)" in text
+
+    def test_stale_release_and_reopen(self, path):
+        """Test a release with an old token is ignored and reopening clears the attempt."""
+        with RunLedger(path) as ledger:
+            ledger.record_claim(Lease("bd-a", "sm-1", 1, 0.0, 60.0))
+            ledger.record_claim(Lease("bd-a", "sm-2", 2, 0.0, 60.0))
+            ledger.record_release(Lease("bd-a", "sm-1", 1, 0.0, 60.0))
+            ledger.record_dev_start("bd-a", 1, "claude-dev-1")
+            assert ledger.state.beads["bd-a"].owner == "sm-2"
+            ledger.record_status("bd-a", "open")
+            bead = ledger.state.beads["bd-a"]
+            assert (bead.owner, bead.dev_session_id, bead.interrupted) == (None, None, False)
+            with pytest.raises(ValueError, match="status must be one of"):
+                ledger.record_status("bd-a", "done")
+
+    def test_snapshot_encoding_round_trips(self, path):
+        """Test RunState survives dumps/loads."""
+        with RunLedger(path) as ledger:
+            run_bead(ledger, "bd-a", attempts=2, close=False)
+            state = ledger.state
+        assert RunState.loads(state.dumps()) == state
+
+
+class TestRecovery:
+    """Tests for snapshot plus tail recovery."""
+
+    def test_recovery_replays_only_the_tail(self, path):
+        """Test a reopened ledger replays fewer than snapshot_every events."""
+        with RunLedger(path, snapshot_every=50) as ledger:
+            for i in range(40):
+                run_bead(ledger, f"bd-{i:03d}", close=i % 10 != 0)
+            expected = ledger.state
+        assert expected.seq == 40 * 8 - 4
+        with RunLedger(path, snapshot_every=50) as ledger:
+            assert ledger.state == expected
+            assert ledger.recovered_events == expected.seq % 50
+            ledger.snapshot()
+        with RunLedger(path, snapshot_every=50) as ledger:
+            assert (ledger.state, ledger.recovered_events) == (expected, 0)
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM snapshots").fetchone() == (1,)
+            assert conn.execute("SELECT COUNT(*) FROM events").fetchone() == (expected.seq,)
+
+    def test_snapshot_holds_only_open_beads(self, path):
+        """Test snapshot size follows beads in flight, not run length."""
+        with RunLedger(path, snapshot_every=10) as ledger:
+            for i in range(100):
+                run_bead(ledger, f"bd-{i:03d}")
+            run_bead(ledger, "bd-open", close=False)
+            ledger.snapshot()
+        with sqlite3.connect(path) as conn:
+            (state,) = conn.execute("SELECT state FROM snapshots").fetchone()
+        assert [bead["bead_id"] for bead in json.loads(state)["beads"]] == ["bd-open"]
+
+    def test_writers_see_each_others_events(self, path):
+        """Test a second writer's events are applied before the next append."""
+        with RunLedger(path) as first, RunLedger(path) as second:
+            first.record_status("bd-a", "in_progress")
+            second.record_dev_start("bd-a", 1, "claude-dev-1")
+            assert first.refresh().beads["bd-a"].dev_session_id == "claude-dev-1"
+            first.record_status("bd-b", "in_progress")
+            assert second.refresh().seq == first.state.seq == 3
+            assert [e.kind for e in first.iter_events(after=1)] == ["dev_start", "status"]
+
+    def test_failed_append_leaves_state_unchanged(self, path, monkeypatch):
+        """Test an event whose snapshot write fails is rolled back from memory too."""
+        with RunLedger(path, snapshot_every=2) as ledger:
+            ledger.record_status("bd-a", "in_progress")
+
+            def failing_snapshot():
+                raise sqlite3.OperationalError("disk full")
+
+            monkeypatch.setattr(ledger, "_write_snapshot", failing_snapshot)
+            with pytest.raises(sqlite3.OperationalError):
+                ledger.record_dev_start("bd-a", 1, "claude-dev-1")
+            assert ledger.state.seq == 1
+            assert ledger.state.beads["bd-a"].dev_session_id is None
+
+
+def test_reopen_interrupted(path, tmp_path, monkeypatch):
+    """Test interrupted beads are reopened through bd and recorded."""
+    data = get_valid_bead_json()
+    data.update(id="bd-crash", status="in_progress")
+    (tmp_path / "bd-crash.json").write_text(json.dumps(data))
+    monkeypatch.setenv("FAKE_BD_DIR", str(tmp_path))
+    with RunLedger(path) as ledger:
+        ledger.record_status("bd-crash", "in_progress")
+        ledger.record_dev_start("bd-crash", 1, "claude-dev-1")
+        with BdClient(bd_command=FAKE_BD) as client:
+            assert reopen_interrupted(ledger, client) == ["bd-crash"]
+        assert ledger.state.interrupted() == []
+    stored = Bead.model_validate_json((tmp_path / "bd-crash.json").read_text())
+    assert stored.status == "open"
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Unit tests for the barrier-free bead scheduler."""
+
+import json
+
+import pytest
+
+from bead_schema import Bead
+from loop_simulator import SimBead, Work, simulate_eager, simulate_waves
+from scheduler import Scheduler
+from tests.test_validator import get_valid_bead_json
+
+
+class TestOrdering:
+    """Tests for ready-set ordering."""
+
+    def test_priority_then_rank_then_submission(self):
+        """Test lower priority value wins, then longer remaining path, then FIFO."""
+        scheduler = Scheduler(max_sessions=1)
+        scheduler.submit("low", priority=3, rank=100)
+        scheduler.submit("short", priority=1, rank=1)
+        scheduler.submit("long", priority=1, rank=5)
+        scheduler.submit("long-2", priority=1, rank=5)
+        order = []
+        while not scheduler.finished:
+            (bead_id,) = scheduler.dispatch()
+            order.append(bead_id)
+            scheduler.complete(bead_id)
+        assert order == ["long", "long-2", "short", "low"]
+
+    def test_submit_beads_uses_bead_fields(self):
+        """Test validated beads contribute priority, model and dependencies."""
+        data = get_valid_bead_json()
+        first = Bead.model_validate_json(json.dumps(dict(data, id="a", priority=3)))
+        second = Bead.model_validate_json(
+            json.dumps(dict(data, id="b", priority=0, dependencies=["a"]))
+        )
+        scheduler = Scheduler(max_sessions=4)
+        scheduler.submit_beads([second, first], ranks={"a": 2.0})
+        assert scheduler.dispatch() == ["a"]
+        assert scheduler.state("b") == "pending"
+
+
+class TestDependencies:
+    """Tests for dependency-driven dispatch."""
+
+    def test_dispatch_as_soon_as_dependencies_close(self):
+        """Test a bead dispatches without waiting for unrelated work."""
+        scheduler = Scheduler(max_sessions=3)
+        scheduler.submit_many(
+            [
+                ("slow", (), 2, "sonnet", 0.0),
+                ("a", (), 2, "sonnet", 0.0),
+                ("b", ("a",), 2, "sonnet", 0.0),
+                ("c", ("a", "b"), 2, "sonnet", 0.0),
+            ]
+        )
+        assert scheduler.dispatch() == ["slow", "a"]
+        assert scheduler.complete("a") == ["b"]
+        assert scheduler.dispatch() == ["b"]
+        assert scheduler.complete("b") == ["c"]
+        assert scheduler.dispatch() == ["c"]
+        assert scheduler.state("slow") == "running"
+
+    def test_unknown_dependencies_are_closed(self):
+        """Test dependencies outside the scheduler do not block."""
+        scheduler = Scheduler(max_sessions=1)
+        scheduler.submit("a", dependencies=["closed-elsewhere"])
+        assert scheduler.dispatch() == ["a"]
+
+    def test_failure_blocks_dependents(self):
+        """Test a failed bead leaves its dependents blocked."""
+        scheduler = Scheduler(max_sessions=2)
+        scheduler.submit_many([("a", (), 2, "sonnet", 0.0), ("b", ("a",), 2, "sonnet", 0.0)])
+        scheduler.dispatch()
+        assert scheduler.complete("a", success=False) == []
+        assert scheduler.finished
+        assert scheduler.blocked() == {"b"}
+        assert scheduler.state("a") == "failed"
+
+    def test_invalid_calls(self):
+        """Test bad submissions and completions raise ValueError."""
+        scheduler = Scheduler(max_sessions=1)
+        scheduler.submit("a")
+        with pytest.raises(ValueError, match="already submitted"):
+            scheduler.submit("a")
+        with pytest.raises(ValueError, match="model must be one of"):
+            scheduler.submit("b", model="gpt")
+        with pytest.raises(ValueError, match="not running"):
+            scheduler.complete("a")
+        with pytest.raises(ValueError):
+            Scheduler(max_sessions=0)
+        with pytest.raises(ValueError):
+            Scheduler(max_sessions=1, model_caps={"opus": 0})
+
+
+class TestCaps:
+    """Tests for global and per-model caps."""
+
+    def test_model_cap_does_not_block_other_models(self):
+        """Test a capped model is skipped while other models still dispatch."""
+        scheduler = Scheduler(max_sessions=3, model_caps={"opus": 1})
+        scheduler.submit_many(
+            [
+                ("o1", (), 0, "opus", 0.0),
+                ("o2", (), 0, "opus", 0.0),
+                ("s1", (), 2, "sonnet", 0.0),
+                ("s2", (), 2, "sonnet", 0.0),
+            ]
+        )
+        assert scheduler.dispatch() == ["o1", "s1", "s2"]
+        assert scheduler.dispatch() == []
+        scheduler.complete("s1")
+        assert scheduler.dispatch() == []
+        scheduler.complete("o1")
+        assert scheduler.dispatch() == ["o2"]
+
+    def test_dispatch_limit(self):
+        """Test limit caps one dispatch call."""
+        scheduler = Scheduler(max_sessions=4)
+        for bead_id in "abc":
+            scheduler.submit(bead_id)
+        assert scheduler.dispatch(limit=2) == ["a", "b"]
+        assert scheduler.running == 2
+        assert scheduler.ready == 1
+
+
+class TestSimulation:
+    """Tests for the eager policy in the loop simulator."""
+
+    def test_eager_beats_wave_on_straggler(self):
+        """Test a straggler no longer holds back unrelated ready work."""
+        beads = [SimBead("slow"), SimBead("a"), SimBead("b", ("a",)), SimBead("c", ("b",))]
+        work = {
+            bead_id: Work(duration, 1, True)
+            for bead_id, duration in {"slow": 10, "a": 1, "b": 1, "c": 1}.items()
+        }
+        wave = simulate_waves(beads, work, 2)
+        eager = simulate_eager(beads, work, 2)
+        assert wave.makespan == 12
+        assert eager.makespan == 10
+        assert eager.max_wait == 0
+        assert eager.utilization > wave.utilization
+
+    def test_eager_respects_model_caps(self):
+        """Test per-model caps serialize beads of a capped model."""
+        beads = [SimBead(f"o{i}", dev_model="opus") for i in range(3)]
+        work = {bead.id: Work(1.0, 1, True) for bead in beads}
+        assert simulate_eager(beads, work, 3, model_caps={"opus": 1}).makespan == 3
+        assert simulate_eager(beads, work, 3).makespan == 1
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Conformance tests: exported JSON Schema versus the pydantic models."""
+
+import copy
+import json
+import re
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+
+import schema_export
+from schema_export import (
+    DATETIME_PATTERN,
+    EXPORTED_MODELS,
+    SCHEMA_VERSION,
+    load_schema,
+    stale_files,
+    version_dir,
+)
+from tests.test_validation_engine import (
+    BAD_VALUES,
+    OUTPUT_SCHEMAS,
+    SCRUM_RESULT,
+    generate_corpus,
+    iter_paths,
+    make_seed_beads,
+    pydantic_accepts,
+    set_path,
+)
+
+jsonschema = pytest.importorskip("jsonschema")
+
+DATETIME = TypeAdapter(datetime, config=ConfigDict(strict=True))
+
+
+def schema_validator(model_name):
+    """A draft 2020-12 validator for the cached schema of a model."""
+    schema = load_schema(model_name)
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
+def is_datetime_error(error):
+    """True if a schema error comes from a date-time pattern (possibly under anyOf)."""
+    if error.validator == "anyOf":
+        return any(is_datetime_error(child) for child in error.context)
+    return error.validator == "pattern" and error.schema.get("format") == "date-time"
+
+
+def assert_conforms(validator, model_name, payload):
+    """
+    Assert the schema makes pydantic's decision.
+
+    JSON is decoded with Decimal floats so `1.0` is not an integer. The
+    schema must never accept what pydantic rejects; it may reject a
+    document pydantic accepts only because of a datetime notation outside
+    DATETIME_PATTERN (e.g. unix timestamps as strings).
+    """
+    expected = pydantic_accepts(model_name, payload)
+    instance = json.loads(payload, parse_float=Decimal)
+    if validator.is_valid(instance) != expected:
+        assert expected, f"schema accepted invalid input: {payload}"
+        errors = list(validator.iter_errors(instance))
+        assert all(is_datetime_error(error) for error in errors), payload
+
+
+class TestCache:
+    """Tests for the versioned schema cache."""
+
+    def test_cached_schemas_are_current(self):
+        """Test the committed schemas match a fresh export (run schema_export.py)."""
+        assert stale_files() == []
+        manifest = json.loads((version_dir() / schema_export.MANIFEST).read_text())
+        assert manifest["version"] == SCHEMA_VERSION
+        assert set(manifest["schemas"]) == set(EXPORTED_MODELS)
+        assert load_schema("Bead")["$id"] == f"urn:beads-ralph:schema:{SCHEMA_VERSION}:Bead"
+
+    def test_export_only_rewrites_changed_files(self, tmp_path):
+        """Test a second export writes nothing and a damaged file is restored."""
+        assert len(schema_export.export(tmp_path)) == len(EXPORTED_MODELS) + 1
+        assert schema_export.export(tmp_path) == []
+        path = version_dir(tmp_path) / EXPORTED_MODELS["QAResult"]
+        path.write_text("{}")
+        assert stale_files(tmp_path) == [EXPORTED_MODELS["QAResult"]]
+        assert schema_export.export(tmp_path) == [EXPORTED_MODELS["QAResult"]]
+
+    def test_registry_references_cache(self):
+        """Test registry.yaml points at the current version's directory."""
+        registry = schema_export.SCHEMA_DIR.parent.parent / "registry.yaml"
+        assert f"schemas/compiled/json-schema/v{SCHEMA_VERSION}/" in registry.read_text()
+
+
+class TestConformance:
+    """Accept/reject conformance between the schema and pydantic."""
+
+    def test_bead_corpus(self):
+        """Test schema decisions match pydantic on the mutated bead corpus."""
+        validator = schema_validator("Bead")
+        corpus = generate_corpus(3000, seed=2)
+        accepted = 0
+        for doc in corpus:
+            payload = json.dumps(doc)
+            assert_conforms(validator, "Bead", payload)
+            accepted += validator.is_valid(json.loads(payload, parse_float=Decimal))
+        assert 3 <= accepted < len(corpus) // 2
+
+    @pytest.mark.parametrize(
+        "model_name,seed_doc",
+        [
+            ("BeadMetadata", make_seed_beads()[2]["metadata"]),
+            ("BeadMetadata", make_seed_beads()[1]["metadata"]),
+            ("ScrumResult", SCRUM_RESULT),
+            ("QAResult", SCRUM_RESULT["qa_results"][0]),
+        ],
+    )
+    def test_submodel_mutations(self, model_name, seed_doc):
+        """Test conformance for each exported submodel with single-field mutations."""
+        validator = schema_validator(model_name)
+        assert validator.is_valid(seed_doc)
+        for path in [p for p in iter_paths(seed_doc) if p]:
+            values = BAD_VALUES + [...]
+            if path[-1] == "output_schema":
+                values = values + OUTPUT_SCHEMAS
+            for value in values:
+                doc = copy.deepcopy(seed_doc)
+                set_path(doc, path, copy.deepcopy(value))
+                assert_conforms(validator, model_name, json.dumps(doc))
+
+    @pytest.mark.parametrize(
+        "status",
+        [
+            {"enum": []},
+            {"enum": ""},
+            {"enum": "pass"},
+            {"enum": {"pass": 1, "fail": 2}},
+            {"enum": {"maybe": 1}},
+            {"enum": [["pass"]]},
+            {"enum": None},
+            {"type": "string"},
+            "status",
+            "no-enums",
+            ["pass", "enum"],
+            [],
+            None,
+            3,
+        ],
+    )
+    def test_output_schema_status_shapes(self, status):
+        """Test every shape the QA output_schema validator sees for `status`."""
+        validator = schema_validator("BeadMetadata")
+        doc = make_seed_beads()[0]["metadata"]
+        doc["qa_agents"][0]["output_schema"] = {"properties": {"status": status, "message": {}}}
+        assert_conforms(validator, "BeadMetadata", json.dumps(doc))
+        expected = pydantic_accepts("BeadMetadata", json.dumps(doc))
+        assert validator.is_valid(doc) == expected
+
+    @pytest.mark.parametrize("title", ["x", " x ", "\u3000", "\t\n", "\x1c", "\u200b", "\xa0a"])
+    def test_titles(self, title):
+        """Test blank titles are whitespace by Python's definition."""
+        validator = schema_validator("Bead")
+        doc = make_seed_beads()[0]
+        doc["title"] = title
+        assert validator.is_valid(doc) == pydantic_accepts("Bead", json.dumps(doc))
+
+    def test_integral_floats_are_a_known_gap(self):
+        """Test `1.0` for an integer is accepted by the schema but not by pydantic."""
+        validator = schema_validator("Bead")
+        doc = make_seed_beads()[0]
+        doc["priority"] = 1.0
+        assert validator.is_valid(doc)
+        assert not pydantic_accepts("Bead", json.dumps(doc))
+
+
+class TestDatetimePattern:
+    """Tests for DATETIME_PATTERN against pydantic's datetime parser."""
+
+    @staticmethod
+    def pydantic_parses(text):
+        """True if pydantic's strict datetime accepts the JSON string."""
+        try:
+            DATETIME.validate_json(json.dumps(text))
+            return True
+        except ValidationError:
+            return False
+
+    @pytest.mark.parametrize("year", [1, 4, 100, 1900, 2000, 2024, 2026, 2100, 2400, 9999])
+    def test_calendar_is_exact(self, year):
+        """Test every month/day combination of leap and non-leap years."""
+        for month in range(1, 13):
+            for day in range(1, 32):
+                text = f"{year:04d}-{month:02d}-{day:02d}T12:30:00Z"
+                matches = re.search(DATETIME_PATTERN, text) is not None
+                assert matches == self.pydantic_parses(text), text
+
+    def test_pattern_never_accepts_what_pydantic_rejects(self):
+        """Test times, fractions, offsets and malformed strings."""
+        samples = [
+            "2026-02-07T10:00:00", "2026-02-07t10:00:00z", "2026-02-07T23:59:59.123456+05:30",
+            "2026-02-07T10:00:00-00:00", "2026-02-07T24:00:00", "2026-02-07T10:60:00",
+            "2026-02-07T10:00:60", "2026-02-07T10:00:00.", "2026-02-07T10:00:00+24:00",
+            "0000-01-01T00:00:00", "2026-2-07T10:00:00", "2026-02-07", "2026-02-07T10:00",
+            "1700000000", "", "x2026-02-07T10:00:00", "2026-02-07T10:00:00Zx",
+        ]
+        for text in samples:
+            if re.search(DATETIME_PATTERN, text):
+                assert self.pydantic_parses(text), text
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Differential tests: msgspec engine versus pydantic models."""
+
+import copy
+import json
+import random
+import re
+import subprocess
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from tests.test_validator import get_merge_bead_json, get_valid_bead_json
+
+msgspec = pytest.importorskip("msgspec")
+
+import bead_schema_msgspec  # noqa: E402
+import bead_schema_native  # noqa: E402
+from validation_engine import MODEL_NAMES, get_validator, pydantic_model  # noqa: E402
+
+
+DEV_EXECUTION = {
+    "attempt": 1,
+    "session_id": "claude-dev-1",
+    "agent_path": ".claude/agents/backend-dev",
+    "model": "sonnet",
+    "started_at": "2026-02-07T10:00:00",
+    "completed_at": "2026-02-07T10:15:00Z",
+    "status": "completed",
+    "feedback_from_qa": None,
+}
+
+QA_EXECUTION = {
+    "attempt": 1,
+    "session_id": "claude-qa-1",
+    "agent_path": ".claude/agents/qa-unit-tests",
+    "model": "haiku",
+    "started_at": "2026-02-07T10:16:00+00:00",
+    "completed_at": "2026-02-07T10:18:00",
+    "status": "fail",
+    "message": "2 tests failed",
+    "details": {"failed": ["test_a", "test_b"]},
+}
+
+SCRUM_RESULT = {
+    "bead_id": "bd-a1b2c3",
+    "success": True,
+    "pr_url": "https://github.com/org/repo/pull/42",
+    "pr_number": 42,
+    "bead_updated": True,
+    "attempt_count": 2,
+    "qa_results": [{"agent_path": "qa", "status": "pass", "message": "ok", "details": {}}],
+    "error": None,
+    "fatal": False,
+}
+
+MERGE_RISK = {
+    "score": 0.5,
+    "conflicting_pairs": 1,
+    "overlapping_file_count": 1,
+    "overlapping_files": ["src/api.py"],
+    "merge_order": ["main/1-2b-user-profile", "main/1-2a-auth-api"],
+    "target_commit": None,
+}
+
+# Replacement values covering wrong types, bounds, enums and formats.
+# Datetime formats accepted only by pydantic are exercised separately.
+BAD_VALUES = [
+    None, "", "   ", "x", "1", 0, -1, 1, 4, 5, 1.0, 1.5, True, False, [], [""], {},
+    {"a": 1}, "gpt-4", "pass", "done", "1.2", "3a", "3a.2b", "1.", "A1",
+    "2026-02-07T10:00:00", "2026-02-07", "2026-02-30T10:00:00", "not-a-date",
+    "beads-ralph-merge", "beads-ralph-scrum-master", "1\n",
+]
+
+OUTPUT_SCHEMAS = [
+    {"properties": {"status": {"enum": ["pass"]}, "message": {}}},
+    {"properties": {"status": {"enum": ["pass", "maybe"]}, "message": {}}},
+    {"properties": {"status": {}}},
+    {"properties": {"message": {}}},
+    {"properties": {"status": "enum", "message": {}}},
+    {"properties": []},
+    {},
+]
+
+
+def iter_paths(value, path=()):
+    """Yield every path (tuple of keys/indexes) inside a JSON value."""
+    yield path
+    if isinstance(value, dict):
+        for key, child in value.items():
+            yield from iter_paths(child, path + (key,))
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield from iter_paths(child, path + (index,))
+
+
+def set_path(doc, path, value):
+    """Replace (or delete, for value=...) the value at `path`."""
+    parent = doc
+    for key in path[:-1]:
+        parent = parent[key]
+    if value is ... and isinstance(parent, dict):
+        del parent[path[-1]]
+    elif value is not ...:
+        parent[path[-1]] = value
+
+
+def make_seed_beads():
+    """Return valid seed beads with histories and nested results."""
+    work = get_valid_bead_json()
+    work["metadata"]["dev_agent_executions"] = [DEV_EXECUTION, dict(DEV_EXECUTION, attempt=2)]
+    work["metadata"]["qa_agent_executions"] = [QA_EXECUTION]
+    work["metadata"]["scrum_result"] = SCRUM_RESULT
+    work["metadata"]["execution_history"] = {"store": "h.db", "last_qa_status": "fail"}
+    work["comments"] = [{"author": "qa", "text": "fix"}]
+    merge = get_merge_bead_json()
+    merge["metadata"]["merge_risk"] = MERGE_RISK
+    return [get_valid_bead_json(), merge, work]
+
+
+def generate_corpus(count, seed=0):
+    """Generate valid beads plus randomly mutated (mostly invalid) variants."""
+    rng = random.Random(seed)
+    seeds = make_seed_beads()
+    corpus = [copy.deepcopy(bead) for bead in seeds]
+    for _ in range(count):
+        doc = copy.deepcopy(rng.choice(seeds))
+        for _ in range(rng.randint(1, 3)):
+            paths = [p for p in iter_paths(doc) if p]
+            path = rng.choice(paths)
+            roll = rng.random()
+            if roll < 0.15:
+                set_path(doc, path, ...)
+            elif roll < 0.25 and path[-1] == "output_schema":
+                set_path(doc, path, copy.deepcopy(rng.choice(OUTPUT_SCHEMAS)))
+            else:
+                set_path(doc, path, copy.deepcopy(rng.choice(BAD_VALUES)))
+        if rng.random() < 0.1:
+            doc["unexpected_field"] = 1
+        corpus.append(doc)
+    return corpus
+
+
+def pydantic_accepts(model_name, payload):
+    """Return True if pydantic accepts the payload."""
+    try:
+        pydantic_model(model_name).model_validate_json(payload)
+        return True
+    except (ValidationError, TypeError, AttributeError):
+        return False
+
+
+def msgspec_accepts(model_name, payload):
+    """Return True if the raw msgspec Struct decoder accepts the payload."""
+    struct_type = getattr(bead_schema_msgspec, model_name)
+    try:
+        msgspec.json.decode(payload, type=struct_type)
+        return True
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return False
+
+
+def engine_accepts(model_name, payload):
+    """Return True if the msgspec engine (with pydantic fallback) accepts."""
+    try:
+        get_validator(model_name, "msgspec")(payload)
+        return True
+    except (ValidationError, TypeError, AttributeError):
+        return False
+
+
+def native_accepts(model_name, payload):
+    """Return True if the raw native-constraint model accepts the payload."""
+    try:
+        getattr(bead_schema_native, model_name).model_validate_json(payload)
+        return True
+    except (ValidationError, TypeError, AttributeError):
+        return False
+
+
+def assert_parity(model_name, payload):
+    """
+    Assert the engines make the same decision.
+
+    The native models must agree exactly. The raw msgspec decoder must
+    never be more permissive than pydantic; where it is stricter, the only
+    allowed cause is a datetime string that pydantic's parser accepts
+    (e.g. unix timestamps as strings).
+    """
+    expected = pydantic_accepts(model_name, payload)
+    # Same parsers as pydantic, so the native models must agree exactly
+    assert native_accepts(model_name, payload) == expected, payload
+    assert engine_accepts(model_name, payload) == expected, payload
+    if msgspec_accepts(model_name, payload) != expected:
+        assert expected, f"msgspec accepted invalid input: {payload}"
+        struct_type = getattr(bead_schema_msgspec, model_name)
+        with pytest.raises(msgspec.ValidationError, match="RFC3339 encoded datetime"):
+            msgspec.json.decode(payload, type=struct_type)
+
+
+class TestDifferentialParity:
+    """Accept/reject parity between the engines on generated corpora."""
+
+    def test_bead_corpus_parity(self):
+        """Test engine decisions match pydantic on a mutated corpus."""
+        corpus = generate_corpus(3000, seed=1)
+        accepted = 0
+        for doc in corpus:
+            payload = json.dumps(doc)
+            assert_parity("Bead", payload)
+            accepted += pydantic_accepts("Bead", payload)
+        # The corpus must exercise both outcomes
+        assert 3 <= accepted < len(corpus) // 2
+
+    @pytest.mark.parametrize(
+        "model_name,seed_doc",
+        [
+            ("DevExecution", DEV_EXECUTION),
+            ("QAExecution", QA_EXECUTION),
+            ("ScrumResult", SCRUM_RESULT),
+            ("QAResult", SCRUM_RESULT["qa_results"][0]),
+            ("MergeRisk", MERGE_RISK),
+        ],
+    )
+    def test_submodel_parity(self, model_name, seed_doc):
+        """Test parity for each nested model with single-field mutations."""
+        for path in [p for p in iter_paths(seed_doc) if p]:
+            for value in BAD_VALUES + [...]:
+                doc = copy.deepcopy(seed_doc)
+                set_path(doc, path, copy.deepcopy(value))
+                assert_parity(model_name, json.dumps(doc))
+
+    def test_non_object_documents(self):
+        """Test malformed and non-object JSON is rejected by both."""
+        for payload in ["", "[]", "null", "{", '"bead"', "{}"]:
+            for model_name in MODEL_NAMES:
+                assert not msgspec_accepts(model_name, payload)
+                assert not pydantic_accepts(model_name, payload)
+
+
+class TestEngineSelection:
+    """Tests for get_validator and the CLI flag."""
+
+    def test_engines_agree_on_valid_bead(self):
+        """Test both engines return equivalent data for a valid bead."""
+        payload = json.dumps(make_seed_beads()[2])
+        from_pydantic = get_validator("Bead", "pydantic")(payload)
+        from_msgspec = get_validator("Bead", "msgspec")(payload)
+        assert isinstance(from_msgspec, bead_schema_msgspec.Bead)
+        assert msgspec.to_builtins(from_msgspec) == from_pydantic.model_dump(mode="json")
+
+    def test_msgspec_rejection_raises_pydantic_errors(self):
+        """Test msgspec engine errors match the pydantic engine's."""
+        doc = get_valid_bead_json()
+        doc["metadata"]["dev_model"] = "gpt-4"
+        with pytest.raises(ValidationError) as exc_info:
+            get_validator("Bead", "msgspec")(json.dumps(doc))
+        assert "dev_model must be one of" in str(exc_info.value)
+
+    def test_native_engine_matches_pydantic(self):
+        """Test native models return the same data and rejections the same errors."""
+        payload = json.dumps(make_seed_beads()[1])
+        bead = get_validator("Bead", "native")(payload)
+        assert isinstance(bead, bead_schema_native.Bead)
+        assert bead.model_dump() == get_validator("Bead", "pydantic")(payload).model_dump()
+        doc = get_valid_bead_json()
+        doc["priority"] = 7
+        doc["metadata"]["phase"] = "1.2"
+        doc["metadata"]["qa_agents"] = []
+        errors = []
+        for engine in ("pydantic", "native"):
+            with pytest.raises(ValidationError) as exc_info:
+                get_validator("Bead", engine)(json.dumps(doc))
+            errors.append(exc_info.value.errors(include_url=False, include_context=False))
+        assert errors[0] == errors[1]
+        assert [e["type"] for e in errors[1]] == ["value_error"] * 3
+
+    def test_native_title_pattern_is_strip(self):
+        """Test the native title pattern rejects exactly the titles str.strip() empties."""
+        pattern = re.compile(bead_schema_native.NON_BLANK)
+        for code in range(sys.maxunicode + 1):
+            char = chr(code)
+            assert (pattern.search(char) is None) == (not char.strip()), hex(code)
+
+    def test_lenient_datetime_falls_back(self):
+        """Test formats only pydantic accepts are still accepted."""
+        doc = get_valid_bead_json()
+        doc["created_at"] = "2026-02-07T10:00"
+        payload = json.dumps(doc)
+        assert not msgspec_accepts("Bead", payload)
+        bead = get_validator("Bead", "msgspec")(payload)
+        assert bead.created_at.minute == 0
+
+    def test_unknown_engine(self):
+        """Test unknown engine names are rejected."""
+        with pytest.raises(ValueError):
+            get_validator("Bead", "fast")
+
+    def test_cli_engine_flag(self):
+        """Test the validator CLI accepts --engine msgspec."""
+        bad = get_valid_bead_json()
+        bad["priority"] = 9
+        for doc, returncode in [(get_valid_bead_json(), 0), (bad, 1)]:
+            result = subprocess.run(
+                ["python3", "scripts/validate-bead-schema.py", "--engine", "msgspec"],
+                input=json.dumps(doc),
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == returncode
+        assert "priority must be between 0 and 4" in result.stderr
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Unit tests for validation metrics."""
+
+import json
+import subprocess
+import tempfile
+import urllib.request
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from bead_schema import Bead, ScrumResult
+from tests.test_validator import get_valid_bead_json
+from validation_metrics import (
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    ValidationMetrics,
+    start_http_server,
+)
+
+
+class TestMetricTypes:
+    """Tests for counter/histogram rendering."""
+
+    def test_counter_render(self):
+        """Test counter renders HELP, TYPE and labelled samples."""
+        counter = Counter("things_total", "Things counted.", ("kind",))
+        counter.inc("a")
+        counter.inc("a", amount=2)
+        counter.inc('b"x')
+        text = counter.render()
+        assert "# HELP things_total Things counted." in text
+        assert "# TYPE things_total counter" in text
+        assert 'things_total{kind="a"} 3' in text
+        assert 'things_total{kind="b\\"x"} 1' in text
+
+    def test_counter_rejects_negative(self):
+        """Test counters cannot decrease."""
+        with pytest.raises(ValueError):
+            Counter("c_total", "c").inc(amount=-1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram buckets, sum and count."""
+        hist = Histogram("lat_seconds", "Latency.", ("model",), buckets=(0.1, 1.0))
+        hist.observe(0.05, "Bead")
+        hist.observe(0.5, "Bead")
+        hist.observe(5.0, "Bead")
+        text = hist.render()
+        assert 'lat_seconds_bucket{model="Bead",le="0.1"} 1' in text
+        assert 'lat_seconds_bucket{model="Bead",le="1.0"} 2' in text
+        assert 'lat_seconds_bucket{model="Bead",le="+Inf"} 3' in text
+        assert 'lat_seconds_sum{model="Bead"} 5.55' in text
+        assert 'lat_seconds_count{model="Bead"} 3' in text
+
+    def test_registry_reuses_and_rejects_conflicts(self):
+        """Test re-registering returns the same metric; conflicts raise."""
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "x", ("a",))
+        assert registry.counter("x_total", "x", ("a",)) is first
+        with pytest.raises(ValueError):
+            registry.gauge("x_total", "x", ("a",))
+
+
+class TestValidationMetrics:
+    """Tests for instrumented validation."""
+
+    def test_valid_bead_recorded(self):
+        """Test a valid bead increments the valid outcome, latency and bytes."""
+        metrics = ValidationMetrics()
+        payload = json.dumps(get_valid_bead_json())
+        bead = metrics.validate_json(Bead, payload)
+        assert bead.id == "bd-a1b2c3"
+        assert metrics.validations.get("Bead", "valid") == 1
+        assert metrics.latency.get_count("Bead") == 1
+        assert metrics.bytes_processed.get("Bead") == len(payload)
+
+    def test_bytes_counts_utf8_for_text(self):
+        """Test str input is counted in encoded bytes, not characters."""
+        metrics = ValidationMetrics()
+        bead_json = get_valid_bead_json()
+        bead_json["title"] = "Résumé 文字"
+        payload = json.dumps(bead_json, ensure_ascii=False)
+        metrics.validate_json(Bead, payload)
+        metrics.validate_json(Bead, payload.encode())
+        assert len(payload.encode()) > len(payload)
+        assert metrics.bytes_processed.get("Bead") == 2 * len(payload.encode())
+
+    def test_invalid_bead_records_error_types(self):
+        """Test invalid input records outcome and each pydantic error type."""
+        metrics = ValidationMetrics()
+        bead_json = get_valid_bead_json()
+        bead_json["priority"] = 10
+        del bead_json["title"]
+        with pytest.raises(ValidationError):
+            metrics.validate_json(Bead, json.dumps(bead_json))
+        assert metrics.validations.get("Bead", "invalid") == 1
+        assert metrics.errors.get("Bead", "value_error") == 1
+        assert metrics.errors.get("Bead", "missing") == 1
+
+    def test_per_model_labels(self):
+        """Test metrics are labelled by model class name."""
+        metrics = ValidationMetrics()
+        with pytest.raises(ValidationError):
+            metrics.validate_json(ScrumResult, "{}")
+        text = metrics.registry.render()
+        assert 'beads_ralph_validations_total{model="ScrumResult",outcome="invalid"} 1' in text
+
+    def test_cache_hit_ratio(self):
+        """Test cache hit/miss counters and ratio."""
+        metrics = ValidationMetrics()
+        assert metrics.cache_hit_ratio("qa") == 0.0
+        metrics.record_cache("qa", hit=True)
+        metrics.record_cache("qa", hit=True)
+        metrics.record_cache("qa", hit=False)
+        assert metrics.cache_hit_ratio("qa") == pytest.approx(2 / 3)
+
+
+class TestExposition:
+    """Tests for file and HTTP exposition."""
+
+    def test_write_textfile(self):
+        """Test metrics are written atomically to a file."""
+        metrics = ValidationMetrics()
+        metrics.record_validation("Bead", "valid", 0.001, 100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "validation.prom"
+            metrics.registry.write_textfile(str(path))
+            text = path.read_text()
+            assert 'beads_ralph_validations_total{model="Bead",outcome="valid"} 1' in text
+            assert [p.name for p in Path(tmp).iterdir()] == ["validation.prom"]
+
+    def test_http_endpoint(self):
+        """Test /metrics serves the registry."""
+        metrics = ValidationMetrics()
+        metrics.record_validation("QAExecution", "valid", 0.001)
+        server = start_http_server(metrics.registry, port=0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                body = response.read().decode("utf-8")
+            assert 'model="QAExecution"' in body
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_cli_metrics_file(self):
+        """Test validator CLI writes metrics with --metrics-file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            metrics_path = Path(tmp) / "validation.prom"
+            result = subprocess.run(
+                ["python3", "scripts/validate-bead-schema.py", "--metrics-file", str(metrics_path)],
+                input=json.dumps(get_valid_bead_json()),
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0
+            assert 'outcome="valid"} 1' in metrics_path.read_text()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Unit tests for the pre-warmed worktree pool, against local git repos."""
+
+import os
+import subprocess
+
+import pytest
+
+from git_utils import run_git
+from worktree_pool import BUSY, FINISHED, IDLE, WorktreePool, disk_usage
+
+
+class FakeClock:
+    """Clock advancing one second per call."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repo with a `main` branch holding a 1000-byte file."""
+    path = tmp_path / "repo"
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    (path / "data.txt").write_text("x" * 1000)
+    (path / ".gitignore").write_text("build/\n")
+    subprocess.run(["git", "-C", str(path), "add", "."], check=True)
+    git = ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "commit", "-qm", "init"], check=True)
+    return str(path)
+
+
+def make_pool(repo, tmp_path, **kwargs):
+    return WorktreePool(repo, str(tmp_path / "pool"), "main", clock=FakeClock(), **kwargs)
+
+
+def current_branch(path):
+    return run_git(path, ["rev-parse", "--abbrev-ref", "HEAD"])
+
+
+class TestWorktreePool:
+    """Tests for WorktreePool."""
+
+    def test_warm_and_acquire(self, repo, tmp_path):
+        """Test acquire hands out a pre-warmed worktree on a new branch."""
+        pool = make_pool(repo, tmp_path, size=2)
+        assert pool.warm() == 2
+        assert pool.warm() == 0
+        wt = pool.acquire("sprint/1-1-auth")
+        assert wt.state == BUSY
+        assert current_branch(wt.path) == "sprint/1-1-auth"
+        assert (pool.count(IDLE), pool.count(BUSY)) == (1, 1)
+        # Linked worktrees share the main repository's object store
+        common = run_git(wt.path, ["rev-parse", "--path-format=absolute", "--git-common-dir"])
+        assert common == os.path.join(repo, ".git")
+
+    def test_acquire_resets_and_keeps_ignored(self, repo, tmp_path):
+        """Test a reused worktree is reset, keeping ignored build caches."""
+        pool = make_pool(repo, tmp_path, size=1)
+        pool.warm()
+        wt = pool.acquire("feature")
+        with open(os.path.join(wt.path, "data.txt"), "w") as out:
+            out.write("dirty")
+        open(os.path.join(wt.path, "scratch.py"), "w").close()
+        os.makedirs(os.path.join(wt.path, "build"))
+        open(os.path.join(wt.path, "build", "cache"), "w").close()
+        pool.release(wt, keep=False)
+        again = pool.acquire("other")
+        assert again.path == wt.path
+        assert open(os.path.join(again.path, "data.txt")).read() == "x" * 1000
+        assert not os.path.exists(os.path.join(again.path, "scratch.py"))
+        assert os.path.exists(os.path.join(again.path, "build", "cache"))
+
+    def test_finished_worktree_reused_for_same_branch(self, repo, tmp_path):
+        """Test a retry of a branch gets its finished worktree back with commits."""
+        pool = make_pool(repo, tmp_path, size=1)
+        pool.warm()
+        wt = pool.acquire("feature")
+        open(os.path.join(wt.path, "new.txt"), "w").close()
+        run_git(wt.path, ["add", "new.txt"])
+        run_git(wt.path, ["-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "c"])
+        pool.release(wt)
+        assert wt.state == FINISHED
+        again = pool.acquire("feature")
+        assert again.path == wt.path
+        assert os.path.exists(os.path.join(again.path, "new.txt"))
+        with pytest.raises(ValueError, match="busy"):
+            pool.acquire("feature")
+
+    def test_cold_create_and_move(self, repo, tmp_path):
+        """Test an empty pool creates a worktree and moves it to the bead's path."""
+        pool = make_pool(repo, tmp_path, size=0)
+        target = str(tmp_path / "worktrees" / "main" / "1-2-api")
+        wt = pool.acquire("sprint/1-2-api", path=target)
+        assert wt.path == target
+        assert current_branch(target) == "sprint/1-2-api"
+
+    def test_disk_budget_evicts_lru_finished(self, repo, tmp_path):
+        """Test the budget evicts least recently used finished worktrees first."""
+        pool = make_pool(repo, tmp_path, size=0, disk_budget=2500)
+        first = pool.acquire("a")
+        second = pool.acquire("b")
+        assert pool.release(first) == []
+        assert pool.release(second) == []
+        third = pool.acquire("c")
+        assert third.path == first.path
+        with open(os.path.join(third.path, "big.bin"), "w") as out:
+            out.write("y" * 1000)
+        assert pool.release(third) == [second.path]
+        assert not os.path.exists(second.path)
+        assert pool.disk_used == disk_usage(third.path) <= 2500
+
+    def test_warm_respects_budget_and_restart_adopts(self, repo, tmp_path):
+        """Test warming stops at the budget and a new pool adopts existing worktrees."""
+        pool = make_pool(repo, tmp_path, size=5, disk_budget=2500)
+        assert pool.warm() == 2
+        busy = pool.acquire("x")
+        pool.release(busy)
+        reopened = make_pool(repo, tmp_path, size=5, disk_budget=2500)
+        assert (reopened.count(IDLE), reopened.count(FINISHED)) == (1, 1)
+        assert reopened.acquire("x").path == busy.path
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """CLI tool to validate beads-ralph bead JSON against pydantic schema."""
 
+import argparse
 import sys
 from pathlib import Path
 
 from pydantic import ValidationError
 
-from bead_schema import Bead
+from validation_engine import DEFAULT_ENGINE, ENGINES, get_validator
+from validation_metrics import REGISTRY, VALIDATION_METRICS
 
 
 def format_validation_errors(exc: ValidationError) -> str:
@@ -24,12 +26,13 @@ def format_validation_errors(exc: ValidationError) -> str:
     return "\n".join(lines)
 
 
-def validate_bead_from_file(file_path: str) -> bool:
+def validate_bead_from_file(file_path: str, engine: str = DEFAULT_ENGINE) -> bool:
     """
     Validate bead JSON from file.
 
     Args:
         file_path: Path to JSON file
+        engine: Validation engine (pydantic, native or msgspec)
 
     Returns:
         True if valid, False if invalid
@@ -38,8 +41,8 @@ def validate_bead_from_file(file_path: str) -> bool:
         with open(file_path, "r") as f:
             json_content = f.read()
 
-        # Parse using pydantic
-        Bead.model_validate_json(json_content)
+        # Parse with the selected engine (recorded in validation metrics)
+        VALIDATION_METRICS.validate_with("Bead", get_validator("Bead", engine), json_content)
         print("✓ Valid bead")
         return True
 
@@ -54,18 +57,21 @@ def validate_bead_from_file(file_path: str) -> bool:
         return False
 
 
-def validate_bead_from_stdin() -> bool:
+def validate_bead_from_stdin(engine: str = DEFAULT_ENGINE) -> bool:
     """
     Validate bead JSON from stdin.
 
+    Args:
+        engine: Validation engine (pydantic, native or msgspec)
+
     Returns:
         True if valid, False if invalid
     """
     try:
         json_content = sys.stdin.read()
 
-        # Parse using pydantic
-        Bead.model_validate_json(json_content)
+        # Parse with the selected engine (recorded in validation metrics)
+        VALIDATION_METRICS.validate_with("Bead", get_validator("Bead", engine), json_content)
         print("✓ Valid bead")
         return True
 
@@ -77,15 +83,37 @@ def validate_bead_from_stdin() -> bool:
         return False
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "file", nargs="?", help="Bead JSON file (reads stdin if omitted)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help="Validation engine (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Write Prometheus text-format validation metrics to this path",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
+    args = parse_args()
+    if args.file:
         # File input
-        file_path = sys.argv[1]
-        is_valid = validate_bead_from_file(file_path)
+        is_valid = validate_bead_from_file(args.file, args.engine)
     else:
         # Stdin input
-        is_valid = validate_bead_from_stdin()
+        is_valid = validate_bead_from_stdin(args.engine)
+
+    if args.metrics_file:
+        REGISTRY.write_textfile(args.metrics_file)
 
     sys.exit(0 if is_valid else 1)
 
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Selectable validation engines for beads-ralph JSON.
+
+Three engines accept and reject exactly the same documents:
+
+- `pydantic` (default) - the models in `bead_schema.py`
+- `native` - the pydantic mirrors in `bead_schema_native.py`, whose rules
+  are pydantic-core constraints instead of Python field validators
+- `msgspec` - the Struct mirrors in `bead_schema_msgspec.py`, decoded in C
+
+The native and msgspec engines are fast paths for the common case.
+Anything they reject is re-validated with `bead_schema`, which is
+authoritative: callers get the same `ValidationError` (field paths and
+messages) as with the pydantic engine, and inputs only pydantic's more
+lenient parsers accept (e.g. datetimes without seconds) are still
+accepted by the msgspec engine.
+"""
+
+from typing import Any, Callable, Dict, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+import bead_schema
+
+
+ENGINES = ("pydantic", "native", "msgspec")
+DEFAULT_ENGINE = "pydantic"
+
+MODEL_NAMES = (
+    "Bead",
+    "BeadMetadata",
+    "QAAgent",
+    "DevExecution",
+    "QAExecution",
+    "QAResult",
+    "ScrumResult",
+    "ExecutionHistoryRef",
+    "MergeRisk",
+)
+
+Validator = Callable[[Union[str, bytes]], Any]
+
+_validators: Dict[Tuple[str, str], Validator] = {}
+
+
+def pydantic_model(model_name: str) -> Type[BaseModel]:
+    """Return the pydantic model class for a model name."""
+    if model_name not in MODEL_NAMES:
+        raise ValueError(f"model must be one of {list(MODEL_NAMES)}, got: {model_name}")
+    return getattr(bead_schema, model_name)
+
+
+def _msgspec_validator(model_name: str) -> Validator:
+    try:
+        import msgspec
+
+        import bead_schema_msgspec
+    except ImportError as e:
+        raise RuntimeError(
+            "msgspec engine requires the msgspec package (pip install msgspec)"
+        ) from e
+
+    struct_type = getattr(bead_schema_msgspec, model_name)
+    decoder = msgspec.json.Decoder(struct_type)
+    fallback = pydantic_model(model_name)
+    fast_errors = (msgspec.ValidationError, msgspec.DecodeError)
+
+    def validate(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except fast_errors:
+            # Authoritative check; raises the canonical ValidationError
+            result = fallback.model_validate_json(data)
+        return msgspec.convert(result.model_dump(), struct_type)
+
+    return validate
+
+
+def _native_validator(model_name: str) -> Validator:
+    import bead_schema_native
+
+    native = getattr(bead_schema_native, model_name).model_validate_json
+    fallback = pydantic_model(model_name).model_validate_json
+
+    def validate(data: Union[str, bytes]) -> Any:
+        try:
+            return native(data)
+        except ValidationError:
+            # Constraint errors read differently; raise the canonical ones
+            return fallback(data)
+
+    return validate
+
+
+def get_validator(model_name: str = "Bead", engine: str = DEFAULT_ENGINE) -> Validator:
+    """
+    Return a function validating JSON text into the given model.
+
+    Args:
+        model_name: One of MODEL_NAMES
+        engine: One of ENGINES
+
+    Returns:
+        Callable taking JSON str/bytes and returning the validated object
+        (a `bead_schema` or `bead_schema_native` model, or a msgspec
+        Struct, depending on the engine)
+    """
+    key = (model_name, engine)
+    validator = _validators.get(key)
+    if validator is not None:
+        return validator
+    if engine == "pydantic":
+        validator = pydantic_model(model_name).model_validate_json
+    elif engine == "native":
+        validator = _native_validator(model_name)
+    elif engine == "msgspec":
+        validator = _msgspec_validator(model_name)
+    else:
+        raise ValueError(f"engine must be one of {list(ENGINES)}, got: {engine}")
+    _validators[key] = validator
+    return validator
+
+
+def validate_json(
+    data: Union[str, bytes], model_name: str = "Bead", engine: str = DEFAULT_ENGINE
+) -> Any:
+    """
+    Validate JSON text with the selected engine.
+
+    Raises:
+        ValidationError: If the data is invalid (from pydantic, for both engines)
+    """
+    return get_validator(model_name, engine)(data)
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""Prometheus-style metrics for beads-ralph schema validation."""
+
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Latency buckets in seconds (10us .. 1s), tuned for single-bead validation
+DEFAULT_LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    1.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label pairs as {a="x",b="y"}, or an empty string."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping integers free of a trailing .0."""
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class for a labelled metric family."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        lock: Optional[threading.Lock] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = lock if lock is not None else threading.Lock()
+
+    def samples(self) -> List[str]:
+        """Return exposition lines for this metric (without HELP/TYPE)."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render this metric family in Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        lock: Optional[threading.Lock] = None,
+    ):
+        super().__init__(name, documentation, labelnames, lock)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increment the counter for the given label values."""
+        if amount < 0:
+            raise ValueError("counter can only be incremented by amount >= 0")
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def _inc_unlocked(self, label_values: Tuple[str, ...], amount: float) -> None:
+        # Caller holds self._lock
+        values = self._values
+        values[label_values] = values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        lock: Optional[threading.Lock] = None,
+    ):
+        super().__init__(name, documentation, labelnames, lock)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *label_values: str) -> None:
+        """Set the gauge for the given label values."""
+        with self._lock:
+            self._values[label_values] = float(value)
+
+    def get(self, *label_values: str) -> float:
+        """Return the current value for the given label values."""
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram (cumulative buckets are computed at render time)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        lock: Optional[threading.Lock] = None,
+    ):
+        super().__init__(name, documentation, labelnames, lock)
+        if list(buckets) != sorted(buckets):
+            raise ValueError("histogram buckets must be sorted")
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation for the given label values."""
+        with self._lock:
+            self._observe_unlocked(label_values, value)
+
+    def _observe_unlocked(self, label_values: Tuple[str, ...], value: float) -> None:
+        # Caller holds self._lock
+        state = self._values.get(label_values)
+        if state is None:
+            state = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self._values[label_values] = state
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def get_count(self, *label_values: str) -> int:
+        """Return the number of observations for the given label values."""
+        state = self._values.get(label_values)
+        return state[2] if state else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(state[0]), state[1], state[2]))
+                for key, state in self._values.items()
+            )
+        lines = []
+        bucket_names = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(bucket_names, key + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric already registered: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        lock: Optional[threading.Lock] = None,
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames, lock))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        lock: Optional[threading.Lock] = None,
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames, lock))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        lock: Optional[threading.Lock] = None,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets, lock))
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+    def write_textfile(self, path: str) -> None:
+        """
+        Atomically write metrics to a file (node_exporter textfile collector style).
+
+        Args:
+            path: Destination file path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+class ValidationMetrics:
+    """Standard validation metrics: outcomes, error types, latency, bytes, cache."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        # One lock for the per-validation metrics so recording costs one acquire
+        self._lock = threading.Lock()
+        self.validations = self.registry.counter(
+            "beads_ralph_validations_total",
+            "Validations performed by model and outcome (valid/invalid/error).",
+            ("model", "outcome"),
+            lock=self._lock,
+        )
+        self.errors = self.registry.counter(
+            "beads_ralph_validation_errors_total",
+            "Validation errors by model and pydantic error type.",
+            ("model", "error_type"),
+            lock=self._lock,
+        )
+        self.latency = self.registry.histogram(
+            "beads_ralph_validation_duration_seconds",
+            "Validation latency by model.",
+            ("model",),
+            lock=self._lock,
+        )
+        self.bytes_processed = self.registry.counter(
+            "beads_ralph_validation_bytes_total",
+            "Bytes of JSON input processed by model.",
+            ("model",),
+            lock=self._lock,
+        )
+        self.cache_requests = self.registry.counter(
+            "beads_ralph_cache_requests_total",
+            "Cache lookups by cache name and result (hit/miss).",
+            ("cache", "result"),
+        )
+
+    def record_validation(
+        self,
+        model: str,
+        outcome: str,
+        seconds: float,
+        nbytes: int = 0,
+        error_types: Sequence[str] = (),
+    ) -> None:
+        """Record one validation attempt."""
+        model_key = (model,)
+        with self._lock:
+            self.validations._inc_unlocked((model, outcome), 1.0)
+            self.latency._observe_unlocked(model_key, seconds)
+            if nbytes:
+                self.bytes_processed._inc_unlocked(model_key, nbytes)
+            for error_type in error_types:
+                self.errors._inc_unlocked((model, error_type), 1.0)
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Record one cache lookup."""
+        self.cache_requests.inc(cache, "hit" if hit else "miss")
+
+    def cache_hit_ratio(self, cache: str) -> float:
+        """Return the hit ratio for a cache, or 0.0 if it was never queried."""
+        hits = self.cache_requests.get(cache, "hit")
+        total = hits + self.cache_requests.get(cache, "miss")
+        return hits / total if total else 0.0
+
+    def validate_json(self, model: Type[ModelT], data: Union[str, bytes]) -> ModelT:
+        """
+        Validate JSON into a pydantic model and record metrics.
+
+        Args:
+            model: Pydantic model class (e.g. Bead, ScrumResult, QAExecution)
+            data: Raw JSON text
+
+        Returns:
+            Validated model instance
+
+        Raises:
+            ValidationError: If data does not match the schema
+        """
+        return self.validate_with(model.__name__, model.model_validate_json, data)
+
+    def validate_with(
+        self, name: str, validate: Callable[[Union[str, bytes]], Any], data: Union[str, bytes]
+    ) -> Any:
+        """
+        Run any JSON validator (e.g. from validation_engine) and record metrics.
+
+        Args:
+            name: Model name used as the metric label
+            validate: Callable taking JSON text and returning the validated object
+            data: Raw JSON text
+
+        Returns:
+            Whatever `validate` returns
+        """
+        nbytes = len(data.encode()) if isinstance(data, str) else len(data)
+        start = time.perf_counter()
+        try:
+            result = validate(data)
+        except ValidationError as e:
+            self.record_validation(
+                name,
+                "invalid",
+                time.perf_counter() - start,
+                nbytes,
+                [error["type"] for error in e.errors()],
+            )
+            raise
+        except Exception:
+            self.record_validation(name, "error", time.perf_counter() - start, nbytes)
+            raise
+        self.record_validation(name, "valid", time.perf_counter() - start, nbytes)
+        return result
+
+
+# Process-wide default registry and validation metrics
+REGISTRY = MetricsRegistry()
+VALIDATION_METRICS = ValidationMetrics(REGISTRY)
+
+
+def start_http_server(
+    registry: MetricsRegistry = REGISTRY, port: int = 9464, addr: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve /metrics from a daemon thread for long-running processes.
+
+    Args:
+        registry: Registry to expose
+        port: TCP port (0 picks a free port)
+        addr: Bind address (localhost by default)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Pre-warmed pool of linked git worktrees with a disk budget.
+
+Creating each bead's `worktree_path` from scratch (corner cases 4.1 and
+4.3) checks out the whole tree on every scrum-master start. The pool
+instead keeps linked worktrees of one repository, which share its object
+store, in three states:
+
+- idle: pre-created and detached at `source_branch`, ready to hand out
+- busy: handed out for a bead's `branch`
+- finished: released but kept for inspection, reused or evicted later
+
+`acquire` resets a worktree to the bead's branch (an existing finished
+worktree on that branch first, then an idle one, then the least recently
+used finished one) and only falls back to a cold `git worktree add` when
+none is available. Whenever the pool's working-tree bytes exceed
+`disk_budget`, finished worktrees are removed least recently used first,
+then idle ones; busy worktrees are never touched.
+
+The pool is owned by one orchestrator process. On start it adopts the
+worktrees already under `pool_dir`, so a restart keeps its warm state.
+"""
+
+import itertools
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from git_utils import GitCommandError, run_git
+
+IDLE = "idle"
+BUSY = "busy"
+FINISHED = "finished"
+
+
+@dataclass
+class Worktree:
+    """One linked worktree managed by the pool."""
+
+    path: str
+    branch: Optional[str]
+    state: str
+    last_used: float
+    size: int = 0
+
+
+def disk_usage(path: str) -> int:
+    """Bytes of regular files under a worktree, excluding its `.git` link."""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        if root == path:
+            dirs[:] = [d for d in dirs if d != ".git"]
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                continue
+    return total
+
+
+class WorktreePool:
+    """Hands out pre-created worktrees of one repository."""
+
+    def __init__(
+        self,
+        repo: str,
+        pool_dir: str,
+        source_branch: str,
+        size: int = 4,
+        disk_budget: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open a pool, adopting worktrees already under `pool_dir`.
+
+        Args:
+            repo: Path of the main repository (or any of its worktrees)
+            pool_dir: Directory new worktrees are created in
+            source_branch: Branch idle worktrees are checked out at and new
+                bead branches start from
+            size: Idle worktrees `warm` keeps ready
+            disk_budget: Maximum working-tree bytes across the pool (None: no limit)
+            clock: Time source for least-recently-used ordering
+        """
+        if size < 0:
+            raise ValueError("size must be >= 0")
+        self.repo = os.path.abspath(repo)
+        self.pool_dir = os.path.realpath(pool_dir)
+        self.source_branch = source_branch
+        self.size = size
+        self.disk_budget = disk_budget
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._worktrees: Dict[str, Worktree] = {}
+        self._names = itertools.count()
+        os.makedirs(self.pool_dir, exist_ok=True)
+        run_git(self.repo, ["worktree", "prune"])
+        self._adopt()
+
+    def _adopt(self) -> None:
+        entries = run_git(self.repo, ["worktree", "list", "--porcelain"]).split("\n\n")
+        for entry in entries:
+            fields = dict(line.partition(" ")[::2] for line in entry.splitlines())
+            path = fields.get("worktree", "")
+            if os.path.dirname(path) != self.pool_dir:
+                continue
+            branch = fields.get("branch", "").replace("refs/heads/", "", 1) or None
+            self._worktrees[path] = Worktree(
+                path,
+                branch,
+                FINISHED if branch else IDLE,
+                os.path.getmtime(path),
+                disk_usage(path),
+            )
+
+    # Inspection
+
+    @property
+    def worktrees(self) -> List[Worktree]:
+        """All managed worktrees."""
+        with self._lock:
+            return list(self._worktrees.values())
+
+    def count(self, state: str) -> int:
+        """Number of worktrees in a state."""
+        with self._lock:
+            return sum(1 for wt in self._worktrees.values() if wt.state == state)
+
+    @property
+    def disk_used(self) -> int:
+        """Working-tree bytes across the pool (as last measured)."""
+        with self._lock:
+            return sum(wt.size for wt in self._worktrees.values())
+
+    # Creation and eviction
+
+    def _new_path(self) -> str:
+        while True:
+            path = os.path.join(self.pool_dir, f"wt-{next(self._names):04d}")
+            if path not in self._worktrees and not os.path.exists(path):
+                return path
+
+    def _create(self) -> Worktree:
+        """Add a detached worktree at `source_branch` (outside the lock)."""
+        path = self._new_path()
+        run_git(self.repo, ["worktree", "add", "--quiet", "--detach", path, self.source_branch])
+        return Worktree(path, None, IDLE, self.clock(), disk_usage(path))
+
+    def _remove(self, worktree: Worktree) -> None:
+        run_git(self.repo, ["worktree", "remove", "--force", worktree.path])
+
+    def _evict_locked(self) -> List[Worktree]:
+        """Pick finished, then idle, worktrees to drop until within budget."""
+        if self.disk_budget is None:
+            return []
+        used = sum(wt.size for wt in self._worktrees.values())
+        victims = []
+        for state in (FINISHED, IDLE):
+            candidates = sorted(
+                (wt for wt in self._worktrees.values() if wt.state == state),
+                key=lambda wt: wt.last_used,
+            )
+            for wt in candidates:
+                if used <= self.disk_budget:
+                    return victims
+                used -= wt.size
+                victims.append(self._worktrees.pop(wt.path))
+        return victims
+
+    def enforce_budget(self) -> List[str]:
+        """Evict worktrees until within the disk budget; return removed paths."""
+        with self._lock:
+            victims = self._evict_locked()
+        for wt in victims:
+            self._remove(wt)
+        return [wt.path for wt in victims]
+
+    def warm(self) -> int:
+        """
+        Create idle worktrees until `size` are ready or the budget is reached.
+
+        Returns:
+            Number of worktrees created
+        """
+        created = 0
+        while True:
+            with self._lock:
+                idle = sum(1 for wt in self._worktrees.values() if wt.state == IDLE)
+                used = sum(wt.size for wt in self._worktrees.values())
+                sizes = [wt.size for wt in self._worktrees.values() if wt.size]
+            estimate = max(sizes) if sizes else 0
+            if idle >= self.size:
+                return created
+            if self.disk_budget is not None and used + estimate > self.disk_budget:
+                return created
+            wt = self._create()
+            with self._lock:
+                self._worktrees[wt.path] = wt
+            created += 1
+
+    # Handing out
+
+    def _pick_locked(self, branch: str) -> Optional[Worktree]:
+        by_state: Dict[str, List[Worktree]] = {IDLE: [], FINISHED: []}
+        for wt in self._worktrees.values():
+            if wt.branch == branch and wt.state != IDLE:
+                if wt.state == BUSY:
+                    raise ValueError(f"branch {branch} is checked out in busy {wt.path}")
+                return wt
+            if wt.state in by_state:
+                by_state[wt.state].append(wt)
+        for state in (IDLE, FINISHED):
+            if by_state[state]:
+                return min(by_state[state], key=lambda wt: wt.last_used)
+        return None
+
+    def _branch_exists(self, branch: str) -> bool:
+        try:
+            run_git(self.repo, ["rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"])
+        except GitCommandError:
+            return False
+        return True
+
+    def acquire(self, branch: str, path: Optional[str] = None) -> Worktree:
+        """
+        Hand out a worktree checked out on `branch`.
+
+        An existing branch is checked out as is; a new one is created from
+        `source_branch`. Tracked changes are reset and untracked files
+        removed (ignored files such as build caches are kept).
+
+        Args:
+            branch: The bead's `branch`
+            path: Move the worktree here (e.g. the bead's `worktree_path`);
+                worktrees outside `pool_dir` are not re-adopted on restart
+
+        Returns:
+            The busy worktree
+        """
+        with self._lock:
+            wt = self._pick_locked(branch)
+            if wt is not None:
+                wt.state = BUSY
+        if wt is None:
+            wt = self._create()
+            wt.state = BUSY
+            with self._lock:
+                self._worktrees[wt.path] = wt
+        try:
+            if wt.branch != branch:
+                start = branch if self._branch_exists(branch) else self.source_branch
+                run_git(wt.path, ["checkout", "--quiet", "--force", "-B", branch, start])
+            else:
+                run_git(wt.path, ["reset", "--quiet", "--hard"])
+            run_git(wt.path, ["clean", "--quiet", "-fd"])
+            if path is not None and os.path.abspath(path) != wt.path:
+                target = os.path.abspath(path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                run_git(self.repo, ["worktree", "move", wt.path, target])
+                with self._lock:
+                    del self._worktrees[wt.path]
+                    wt.path = target
+                    self._worktrees[target] = wt
+        except GitCommandError:
+            with self._lock:
+                wt.state = FINISHED
+                wt.branch = None
+            raise
+        wt.branch = branch
+        wt.last_used = self.clock()
+        return wt
+
+    def release(self, worktree: Worktree, keep: bool = True) -> List[str]:
+        """
+        Return a busy worktree to the pool.
+
+        Args:
+            worktree: Worktree from `acquire`
+            keep: Keep it on its branch for inspection (finished); if False,
+                detach it at `source_branch` so it is idle again
+
+        Returns:
+            Paths evicted to stay within the disk budget
+        """
+        if worktree.state != BUSY:
+            raise ValueError(f"worktree is not busy: {worktree.path}")
+        if not keep:
+            run_git(
+                worktree.path, ["checkout", "--quiet", "--force", "--detach", self.source_branch]
+            )
+            run_git(worktree.path, ["clean", "--quiet", "-fd"])
+        size = disk_usage(worktree.path)
+        with self._lock:
+            worktree.size = size
+            worktree.last_used = self.clock()
+            if keep:
+                worktree.state = FINISHED
+            else:
+                worktree.state = IDLE
+                worktree.branch = None
+        return self.enforce_budget()